@@ -35,6 +35,7 @@ from engine import ModelEngine
 from engine.core.exceptions import StrategyError, ValidationError
 from engine.core.config import config
 from engine.core.universes import get_universe, list_universes
+from engine.core.portfolio_backtester import PORTFOLIO_RANK_METRICS
 
 # ── Paths (mirror gui/config.py) ──────────────────────────────────────────────
 WORKSPACE_DIR = config.STRATEGIES_FOLDER
@@ -239,7 +240,20 @@ def cmd_features(engine: ModelEngine, args) -> None:
     shows the feature ID, a one-line description, and its default parameter
     values (list-type params show the first option as the default).
     With --json, emits the raw list of feature dicts.
+    With --profile STRATEGY, computes that strategy's features instead and
+    prints a per-feature cost report (see _profile_features).
+    With --reindex, regenerates the registry index the listing is served from.
     """
+    if args.reindex:
+        from engine.core.features.registry import INDEX_PATH, write_feature_index
+        n = write_feature_index()
+        print(f"Indexed {n} features -> {INDEX_PATH}")
+        return
+
+    if args.profile:
+        _profile_features(engine, args)
+        return
+
     features = engine.get_available_features()
 
     if args.json:
@@ -265,6 +279,60 @@ def cmd_features(engine: ModelEngine, args) -> None:
                 print(f"    {'':22}  Defaults: {param_str}")
 
 
+def _profile_features(engine: ModelEngine, args) -> None:
+    """
+    Time every feature in a strategy's manifest over real cached data.
+
+    Runs the FeatureOrchestrator once per ticker with a shared
+    FeatureProfiler (memory tracing on), then prints calls, dependency
+    cache hits, wall time, peak allocations and output size per feature.
+    Tickers default to SPY when neither --tickers nor --universe is given.
+    """
+    from engine.core.features.features import (
+        FeatureProfiler, compute_all_features, format_profile_report,
+    )
+
+    cfg = engine.get_strategy_config(args.profile)
+    features_config = cfg.get("features", [])
+    if not features_config:
+        print(f"Strategy '{args.profile}' has no features to profile.")
+        return
+
+    tickers = _resolve_tickers(args) if (args.tickers or args.universe) else ["SPY"]
+    start_dt, end_dt = _resolve_dates(args.start, args.end, default_lookback_days=1825)
+    broker = engine._broker
+
+    _header(
+        f"FEATURE PROFILE  |  {args.profile}  |  {', '.join(tickers[:5])}"
+        + (f" (+{len(tickers)-5} more)" if len(tickers) > 5 else "")
+        + f"  |  {args.interval}\n"
+        f"{start_dt.date()} -> {end_dt.date()}"
+    )
+
+    profiler = FeatureProfiler(track_memory=True)
+    profiler.start()
+    n_bars = 0
+    try:
+        for ticker in tickers:
+            df = broker.get_data(ticker, args.interval, start_dt, end_dt)
+            if df.empty:
+                print(f"  Warning: no data for {ticker}, skipping.")
+                continue
+            compute_all_features(df, features_config, dtype=cfg.get("dtype"), profiler=profiler)
+            n_bars += len(df)
+    finally:
+        profiler.stop()
+
+    summary = profiler.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2, default=str))
+        return
+
+    print(f"\n  {n_bars:,} bars profiled\n")
+    for line in format_profile_report(summary, f"FEATURE PROFILE: {args.profile}"):
+        print(line)
+
+
 def cmd_init(engine: ModelEngine, args) -> None:
     """
     Scaffold a new strategy workspace under WORKSPACE_DIR/<name>.
@@ -434,11 +502,31 @@ def cmd_backtest(engine: ModelEngine, args) -> None:
         f"{start_dt.date()} -> {end_dt.date()}  |  Capital: ${args.capital:,.0f}"
     )
 
+    cost_scenarios = None
+    if args.cost_bps:
+        cost_scenarios = {
+            "frictions":        [float(x) / 1e4 for x in args.cost_bps.split(",")],
+            "entry_thresholds": [None] + [float(x) for x in (args.thresholds or "").split(",") if x],
+            "spread":           args.spread if args.spread == "high_low" else float(args.spread or 0) / 1e4,
+            "slippage":         args.slippage_bps / 1e4,
+        }
+
+    walk_forward = None
+    if args.walk_forward:
+        walk_forward = {
+            "train_bars": args.train_bars,
+            "retrain_every": args.retrain_every,
+            "anchored": not args.rolling,
+        }
+
     callbacks = _make_callbacks()
     try:
         result = engine.run_backtest(
             args.strategy, tickers, timeframe, callbacks,
             starting_capital=args.capital,
+            executor=args.executor, max_workers=args.workers,
+            walk_forward=walk_forward,
+            cost_scenarios=cost_scenarios,
         )
     except Exception as e:
         if args.debug:
@@ -501,19 +589,34 @@ def cmd_backtest(engine: ModelEngine, args) -> None:
                 else:
                     _row(k, v)
 
-        # Trade log
-        trades = trade_logs.get(ticker, [])
-        if trades:
-            print(f"\n    Trade Log -- {len(trades)} trades (showing last 5)")
+        # Trade log (columnar: one list per field)
+        trades  = trade_logs.get(ticker, {})
+        n_trades = len(trades.get("entry_date", []))
+        if n_trades:
+            print(f"\n    Trade Log -- {n_trades} trades (showing last 5)")
             print(f"    {'Entry':<12}  {'Exit':<12}  {'Side':<6}  {'Return':>8}")
             print(f"    {'-'*48}")
-            for t in trades[-5:]:
-                entry = str(t.get("entry_date", ""))[:10]
-                exit_ = str(t.get("exit_date",  ""))[:10]
-                side  = str(t.get("side", ""))
-                ret   = t.get("trade_return", t.get("return"))
-                ret_s = f"{ret:+.2%}" if isinstance(ret, float) else str(ret or "--")
-                print(f"    {entry:<12}  {exit_:<12}  {side:<6}  {ret_s:>8}")
+            for entry, exit_, side, ret in list(zip(
+                trades["entry_date"], trades["exit_date"],
+                trades["direction"], trades["return_pct"],
+            ))[-5:]:
+                print(f"    {entry[:10]:<12}  {exit_[:10]:<12}  {side:<6}  {ret / 100:>+8.2%}")
+
+        # Cost sensitivity: Sharpe per position model (rows) and cost (columns)
+        surface = result.get("cost_surfaces", {}).get(ticker)
+        if surface:
+            frictions = list(dict.fromkeys(row["friction"] for row in surface))
+            print("\n    Cost Sensitivity -- Sharpe (total return)")
+            print(f"    {'Model':<14}" + "".join(f"  {f * 1e4:>13.0f}bp" for f in frictions))
+            print(f"    {'-' * (14 + 17 * len(frictions))}")
+            for start in range(0, len(surface), len(frictions)):
+                rows = surface[start:start + len(frictions)]
+                thr = rows[0]["entry_threshold"]
+                label = "continuous" if math.isnan(thr) else f"thresh {thr:g}"
+                cells = "".join(
+                    f"  {r['Sharpe Ratio']:>5.2f} ({r['Total Return (%)']:>+6.1f}%)" for r in rows
+                )
+                print(f"    {label:<14}{cells}")
 
 
 def cmd_train(engine: ModelEngine, args) -> None:
@@ -543,7 +646,10 @@ def cmd_train(engine: ModelEngine, args) -> None:
 
     callbacks = _make_callbacks()
     try:
-        result = engine.run_training(args.strategy, tickers, timeframe, callbacks)
+        result = engine.run_training(
+            args.strategy, tickers, timeframe, callbacks,
+            optimize=True if args.optimize else None, n_trials=args.trials,
+        )
     except Exception as e:
         if args.debug:
             traceback.print_exc()
@@ -595,6 +701,10 @@ def cmd_portfolio(engine: ModelEngine, args) -> None:
         "allow_short":           not args.no_short,
     }
 
+    if args.sweep:
+        _portfolio_sweep(engine, args, tickers, timeframe, config_dict)
+        return
+
     _header(
         f"PORTFOLIO  |  {args.strategy}  |  {', '.join(tickers[:5])}"
         + (f" (+{len(tickers)-5} more)" if len(tickers) > 5 else "")
@@ -746,6 +856,80 @@ def cmd_portfolio(engine: ModelEngine, args) -> None:
     print()
 
 
+def _portfolio_sweep(engine: ModelEngine, args, tickers: List[str],
+                     timeframe: dict, config_dict: dict) -> None:
+    """
+    Rank portfolio configs for `portfolio --sweep field=v1,v2 ...`.
+
+    Every combination of the swept values is applied on top of the other
+    portfolio flags. Data and signals are computed once and the configs are
+    scored over the same aligned arrays (see PortfolioBacktester.sweep).
+    """
+    grid: dict = {}
+    for item in args.sweep:
+        if "=" not in item:
+            print(f"Error: --sweep expects 'field=v1,v2,...', got: {item!r}")
+            sys.exit(1)
+        key, _, val = item.partition("=")
+        values = [_coerce(v.strip()) for v in val.split(",") if v.strip()]
+        grid[key.strip()] = [
+            {"true": True, "false": False}.get(v.lower(), v) if isinstance(v, str) else v
+            for v in values
+        ]
+
+    n_configs = 1
+    for values in grid.values():
+        n_configs *= len(values)
+    _header(
+        f"PORTFOLIO SWEEP  |  {args.strategy}  |  {len(tickers)} tickers  |  {args.interval}\n"
+        f"{timeframe['start'][:10]} -> {timeframe['end'][:10]}  |  "
+        f"{n_configs} configs  |  Rank: {args.rank_by}"
+    )
+
+    callbacks = _make_callbacks()
+    try:
+        result = engine.run_portfolio_sweep(
+            args.strategy, tickers, timeframe, callbacks, grid,
+            config_dict=config_dict, rank_by=args.rank_by,
+            executor=args.executor, max_workers=args.workers,
+        )
+    except Exception as e:
+        if args.debug:
+            traceback.print_exc()
+        else:
+            print(f"\n  FATAL: {e}")
+        sys.exit(1)
+
+    if result.get("cancelled"):
+        print("\n  Portfolio sweep was cancelled.")
+        return
+    rows = result.get("results", [])
+    if not rows:
+        print("\n  No results -- check that data exists for the given tickers/interval.")
+        return
+
+    n_show = args.top if args.top > 0 else len(rows)
+    _section(f"Ranked Configs  ({len(rows)} total, showing top {min(n_show, len(rows))})")
+    fields = list(grid)
+    widths = [max(len(f), 8) for f in fields]
+    hdr = (f"  {'#':>4}  {'Cfg':>4}  "
+           + "  ".join(f"{f:>{w}}" for f, w in zip(fields, widths))
+           + f"  {'Sharpe':>7}  {'CAGR%':>8}  {'MaxDD%':>8}  {'Return%':>9}  {'Trades':>6}")
+    print(hdr)
+    print(f"  {'-'*len(hdr.rstrip())}")
+    for rank, row in enumerate(rows[:n_show], 1):
+        cells = "  ".join(f"{str(row.get(f, '')):>{w}}" for f, w in zip(fields, widths))
+        print(
+            f"  {rank:>4}  {row['config']:>4}  {cells}  "
+            f"{row.get('Sharpe Ratio', float('nan')):>7.3f}  "
+            f"{row.get('CAGR (%)', float('nan')):>+8.2f}  "
+            f"{row.get('Max Drawdown (%)', float('nan')):>8.2f}  "
+            f"{row.get('Total Return (%)', float('nan')):>+9.2f}  "
+            f"{row.get('Total Trades', 0):>6}"
+        )
+    print()
+
+
 def cmd_signal(engine: ModelEngine, args) -> None:
     """
     Generate current signals for a strategy against one or more tickers.
@@ -881,6 +1065,61 @@ def cmd_data_info(engine: ModelEngine, args) -> None:
         print(f"  {row.ticker:<10}  {row.interval:<10}  {row.bars:>6}  {first:<12}  {last:<12}")
 
 
+def cmd_options_snapshot(engine: ModelEngine, args) -> None:
+    """
+    Record today's options-chain summary for each ticker into data/options.db.
+
+    yfinance serves only the live chain, so OptionsFlow history exists only
+    for days this command ran. Tickers already captured today are skipped
+    unless --force is given; downloads run concurrently (--workers).
+    """
+    from engine.core.data_broker.options_recorder import OptionsSnapshotRecorder
+
+    tickers  = _resolve_tickers(args)
+    recorder = OptionsSnapshotRecorder(max_workers=args.workers)
+    df       = recorder.record(tickers, force=args.force)
+
+    _header(f"Options Snapshots  ({len(df)} of {len(tickers)} tickers recorded)")
+    if df.empty:
+        print("  Nothing recorded (already captured today, or no options data).")
+        return
+    print(f"\n  {'Ticker':<10}  {'Date':<12}  {'P/C':>6}  {'Skew':>7}  {'IV TS':>6}  {'Volume':>10}")
+    print(f"  {'-'*58}")
+    for row in df.sort_values("ticker").itertuples():
+        print(f"  {row.ticker:<10}  {str(row.date)[:10]:<12}  {row.pcr:>6.2f}  "
+              f"{row.iv_skew:>7.3f}  {row.iv_ts:>6.2f}  {row.total_vol:>10,.0f}")
+
+
+def cmd_trends_fetch(engine: ModelEngine, args) -> None:
+    """
+    Fill data/trends.db with weekly Google Trends interest for each ticker.
+
+    GoogleTrends only queues missing history on a background thread, which a
+    short-lived backtest process exits before draining. This command fetches
+    in the foreground and persists after every stitched window, so a
+    rate-limited run resumes where it stopped. Stored keywords are skipped.
+    """
+    from engine.core.data_broker.trends_fetcher import get_trends_queue
+
+    tickers          = _resolve_tickers(args)
+    start_dt, end_dt = _resolve_dates(args.start, args.end, default_lookback_days=1825)
+    queue            = get_trends_queue()
+    stored           = queue.fill(tickers, start_dt, end_dt)
+
+    ok = sum(1 for weeks in stored.values() if weeks >= 0)
+    _header(f"Google Trends  ({ok} of {len(tickers)} keywords stored)")
+    print(f"\n  {'Keyword':<10}  {'Weeks':>6}  {'First':<12}  {'Last':<12}")
+    print(f"  {'-'*46}")
+    for keyword, weeks in stored.items():
+        if weeks < 0:
+            print(f"  {keyword:<10}  {'FAILED':>6}")
+            continue
+        series = queue.db.get_series(keyword)
+        first  = str(series.index[0])[:10]  if weeks else "?"
+        last   = str(series.index[-1])[:10] if weeks else "?"
+        print(f"  {keyword:<10}  {weeks:>6}  {first:<12}  {last:<12}")
+
+
 def cmd_validate(engine: ModelEngine, args) -> None:
     """
     Validate a strategy's model.py without running any data.
@@ -1196,8 +1435,9 @@ def cmd_trial_counts(engine: ModelEngine, args) -> None:
     if args.set:
         bc = getattr(args, "backtest_count", 0) or 0
         tc = getattr(args, "train_count",    0) or 0
-        set_counts(args.set, bc, tc)
-        print(f"[+] Set {args.set}: backtest={bc}, train={tc}, total={bc+tc}")
+        oc = getattr(args, "optimize_count", 0) or 0
+        set_counts(args.set, bc, tc, oc)
+        print(f"[+] Set {args.set}: backtest={bc}, train={tc}, optimize={oc}, total={bc+tc+oc}")
         return
 
     rows = get_all()
@@ -1208,13 +1448,13 @@ def cmd_trial_counts(engine: ModelEngine, args) -> None:
         return
 
     _header(f"Trial Counts  ({len(rows)} strategies)")
-    print(f"\n  {'Strategy':<30}  {'Backtests':>10}  {'Trains':>8}  {'Total':>7}  {'Last Run'}")
-    print(f"  {'-'*72}")
+    print(f"\n  {'Strategy':<30}  {'Backtests':>10}  {'Trains':>8}  {'HPO':>6}  {'Total':>7}  {'Last Run'}")
+    print(f"  {'-'*80}")
     for r in rows:
         last = str(r['last_run_at'] or '')[:19]
         print(
             f"  {r['strategy_name']:<30}  {r['backtest_count']:>10}  "
-            f"{r['train_count']:>8}  {r['total_count']:>7}  {last}"
+            f"{r['train_count']:>8}  {r['optimize_count']:>6}  {r['total_count']:>7}  {last}"
         )
 
 
@@ -1289,7 +1529,7 @@ def cmd_sensitivity(engine: ModelEngine, args) -> None:
             for ticker, df in datasets.items():
                 try:
                     sigs = backtester.run(df, params=params)
-                    m = Tearsheet.calculate_metrics(df, sigs)
+                    m = Tearsheet.calculate_metrics(df, sigs, metrics_level="fitness")
                     s = m.get("Sharpe Ratio", float("nan"))
                     if math.isfinite(s):
                         fold_sharpes.append(s)
@@ -1572,7 +1812,7 @@ def cmd_diagnose(engine: ModelEngine, args) -> None:
                     for sv in steps:
                         try:
                             sigs = backtester.run(df_sweep, params={**default_params, param_name: sv})
-                            m    = Tearsheet.calculate_metrics(df_sweep, sigs)
+                            m    = Tearsheet.calculate_metrics(df_sweep, sigs, metrics_level="fitness")
                             sharpes.append(m.get("Sharpe Ratio", float("nan")))
                         except Exception:
                             sharpes.append(float("nan"))
@@ -1644,6 +1884,85 @@ def cmd_diagnose(engine: ModelEngine, args) -> None:
     print()
 
 
+def cmd_robustness(engine: ModelEngine, args) -> None:
+    """
+    Resample a backtest's returns and print confidence intervals.
+
+    Backtests each ticker (or, with --portfolio, the whole basket through
+    the PortfolioBacktester) and runs the bootstrap / Monte Carlo methods
+    from engine.core.diagnostics.robustness on the result:
+
+      - block_bootstrap: stationary block bootstrap of bar returns
+      - trade_shuffle:   random reordering of round-trip trade returns
+      - noise:           bar returns plus volatility-scaled Gaussian noise
+
+    For Sharpe, max drawdown and CAGR it prints the observed value, the
+    confidence interval, and the observed value's percentile among paths.
+    """
+    from engine.core.diagnostics.robustness import ROBUSTNESS_METHODS
+
+    tickers   = _resolve_tickers(args)
+    start_dt, end_dt = _resolve_dates(args.start, args.end, default_lookback_days=1825)
+    timeframe = {
+        "start":    start_dt.isoformat(),
+        "end":      end_dt.isoformat(),
+        "interval": args.interval,
+    }
+    options = {
+        "methods":     ROBUSTNESS_METHODS if args.method == "all" else (args.method,),
+        "n_paths":     args.paths,
+        "confidence":  args.confidence,
+        "mean_block":  args.block,
+        "noise_scale": args.noise,
+        "seed":        args.seed,
+    }
+
+    _header(
+        f"ROBUSTNESS  |  {args.strategy}  |  {', '.join(tickers[:5])}"
+        + (f" (+{len(tickers)-5} more)" if len(tickers) > 5 else "")
+        + f"  |  {args.interval}\n"
+        f"{start_dt.date()} -> {end_dt.date()}  |  {args.paths:,} paths  |  "
+        f"{args.confidence:.0%} intervals" + ("  |  portfolio" if args.portfolio else "")
+    )
+
+    callbacks = _make_callbacks()
+    try:
+        if args.portfolio:
+            result = engine.run_portfolio_backtest(
+                args.strategy, tickers, timeframe, callbacks, robustness=options,
+            )
+            reports = {"Portfolio": result.get("robustness", {})} if "robustness" in result else {}
+        else:
+            result = engine.run_backtest(
+                args.strategy, tickers, timeframe, callbacks, robustness=options,
+            )
+            reports = result.get("robustness", {})
+    except Exception as e:
+        if args.debug:
+            traceback.print_exc()
+        else:
+            print(f"\n  FATAL: {e}")
+        sys.exit(1)
+
+    if result.get("cancelled"):
+        print("\n  Robustness run was cancelled.")
+        return
+    if not reports:
+        print("\n  No results -- check that data is available for the given tickers/interval.")
+        return
+
+    for name, report in reports.items():
+        _section(f"Robustness: {name}")
+        for method, res in report.items():
+            print(f"\n    {method}  ({res['n_obs']} obs, P(CAGR < 0) = {res['prob_loss']:.1%})")
+            print(f"    {'Metric':<20}  {'Observed':>10}  {'Lower':>10}  {'Upper':>10}  {'Pctl':>6}")
+            print(f"    {'-' * 64}")
+            for metric, s in res["metrics"].items():
+                print(f"    {metric:<20}  {s['point']:>10.3f}  {s['lower']:>10.3f}  "
+                      f"{s['upper']:>10.3f}  {s['percentile']:>5.1f}%")
+    print()
+
+
 # ── Shared renderer for nested result dicts ───────────────────────────────────
 
 def _render_result_dict(data: dict, indent: int = 4) -> None:
@@ -1687,6 +2006,7 @@ def build_parser() -> argparse.ArgumentParser:
 commands:
   list                    Show all strategies
   features                Show all available feature IDs and their default params
+                          (--profile <strategy> times that strategy's features)
   inspect  <strategy>     Show full strategy config
   init     <strategy>     Scaffold a new strategy workspace
   edit     <strategy>     Modify a strategy's manifest and sync workspace
@@ -1699,6 +2019,7 @@ commands:
   portfolio <strategy>    Run a multi-asset portfolio backtest (full tearsheet)
   train     <strategy>    Run hyperparameter optimisation / model training
   signal    <strategy>    Generate live signals
+  robustness <strategy>   Bootstrap / Monte Carlo confidence intervals for Sharpe, drawdown, CAGR
   ic        <strategy>    Unconditional IC analysis (gate check before construction)
   ic-surface <strategy>   Conditional IC surface across macro regime dimensions
 """,
@@ -1712,6 +2033,15 @@ commands:
     # features ────────────────────────────────────────────────────────────────
     p = sub.add_parser("features", help="Show all registered features")
     p.add_argument("--json", action="store_true")
+    p.add_argument("--profile",  metavar="STRATEGY",
+                   help="Profile the strategy's manifest features (time, memory, cache hits)")
+    p.add_argument("--tickers",  help="Comma-separated tickers for --profile (default: SPY)")
+    p.add_argument("--universe", help=f"Named universe for --profile. Available: {', '.join(list_universes())}")
+    p.add_argument("--interval", default="1d")
+    p.add_argument("--start",    help="Start date YYYY-MM-DD (default: 5 years ago)")
+    p.add_argument("--end",      help="End date   YYYY-MM-DD (default: today)")
+    p.add_argument("--reindex",  action="store_true",
+                   help="Regenerate engine/core/features/feature_index.json after adding or editing a feature")
 
     # inspect ─────────────────────────────────────────────────────────────────
     p = sub.add_parser("inspect", help="Show full config for a strategy")
@@ -1757,6 +2087,30 @@ commands:
     p.add_argument("--ticker",   help="Filter to a specific ticker")
     p.add_argument("--interval", help="Filter to a specific interval (e.g. 1d, 1h)")
 
+    # options-snapshot ────────────────────────────────────────────────────────
+    p = sub.add_parser("options-snapshot",
+                       help="Record today's options-chain summary per ticker (feeds OptionsFlow)")
+    p.add_argument("--tickers",
+                   help="Comma-separated ticker symbols (mutually exclusive with --universe)")
+    p.add_argument("--universe",
+                   help=f"Named universe to expand into tickers. "
+                        f"Available: {', '.join(list_universes())}")
+    p.add_argument("--workers", type=int, default=8,
+                   help="Concurrent chain downloads (default: 8)")
+    p.add_argument("--force",   action="store_true",
+                   help="Re-record tickers already captured today")
+
+    # trends-fetch ────────────────────────────────────────────────────────────
+    p = sub.add_parser("trends-fetch",
+                       help="Fetch weekly Google Trends history per ticker (feeds GoogleTrends)")
+    p.add_argument("--tickers",
+                   help="Comma-separated ticker symbols (mutually exclusive with --universe)")
+    p.add_argument("--universe",
+                   help=f"Named universe to expand into tickers. "
+                        f"Available: {', '.join(list_universes())}")
+    p.add_argument("--start",    help="Start date YYYY-MM-DD (default: 5 years ago)")
+    p.add_argument("--end",      help="End date   YYYY-MM-DD (default: today)")
+
     # validate ────────────────────────────────────────────────────────────────
     p = sub.add_parser("validate", help="Import-check model.py without running any data")
     p.add_argument("strategy")
@@ -1775,6 +2129,29 @@ commands:
     p.add_argument("--end",      help="End date   YYYY-MM-DD (default: today)")
     p.add_argument("--capital",  type=float, default=10_000.0,
                    help="Starting capital (default: 10000)")
+    p.add_argument("--executor", choices=["serial", "threads", "processes"],
+                   help="How tickers are spread across cores "
+                        "(default: BATCH_EXECUTOR env var, else serial)")
+    p.add_argument("--workers",  type=int,
+                   help="Pool size for --executor (default: CPU count)")
+    p.add_argument("--cost-bps",
+                   help="Comma-separated cost scenarios in bps, e.g. 5,10,20,50: "
+                        "adds a cost-sensitivity surface scored from the same signals")
+    p.add_argument("--thresholds",
+                   help="Comma-separated discrete entry thresholds for --cost-bps "
+                        "(the continuous model is always included)")
+    p.add_argument("--spread",
+                   help="Bid-ask spread for --cost-bps: bps, or high_low to estimate it per ticker")
+    p.add_argument("--slippage-bps", type=float, default=0.0,
+                   help="Volume-scaled slippage for --cost-bps, in bps at average volume (default: 0)")
+    p.add_argument("--walk-forward", action="store_true",
+                   help="Retrain on a fixed cadence and score only out-of-sample bars")
+    p.add_argument("--train-bars", type=int,
+                   help="Walk-forward training window in bars (default: half the history)")
+    p.add_argument("--retrain-every", type=int,
+                   help="Walk-forward retrain cadence in bars (default: 10 windows)")
+    p.add_argument("--rolling", action="store_true",
+                   help="Walk-forward with a rolling window instead of an expanding one")
     p.add_argument("--debug",    action="store_true",
                    help="Show full tracebacks on engine errors")
 
@@ -1789,6 +2166,11 @@ commands:
     p.add_argument("--interval", default="1d")
     p.add_argument("--start",    help="Start date YYYY-MM-DD (default: 1 year ago)")
     p.add_argument("--end",      help="End date   YYYY-MM-DD (default: today)")
+    p.add_argument("--optimize", action="store_true",
+                   help="Search parameter_bounds before training (default: manifest "
+                        "optimization.enabled)")
+    p.add_argument("--trials",   type=int,
+                   help="Trials for --optimize (default: manifest optimization.n_trials, else 50)")
     p.add_argument("--debug",    action="store_true",
                    help="Show full tracebacks on engine errors")
 
@@ -1826,6 +2208,19 @@ commands:
                    help="Min abs(signal change) to trigger a resize (default: 0.10, only active with --rebalance)")
     p.add_argument("--no-short",         action="store_true",
                    help="Disable short selling (long-only mode)")
+    p.add_argument("--sweep",            metavar="field=v1,v2", nargs="+",
+                   help="Rank every combination of PortfolioConfig values instead of a "
+                        "single run, e.g. --sweep max_positions=5,10,20 stop_loss_pct=0.03,0.05")
+    p.add_argument("--rank-by",          default="Sharpe Ratio",
+                   choices=list(PORTFOLIO_RANK_METRICS),
+                   help="Metric the --sweep table is ranked by (default: Sharpe Ratio)")
+    p.add_argument("--top",              type=int, default=20,
+                   help="Configs to show with --sweep; 0 for all (default: 20)")
+    p.add_argument("--executor",         choices=["serial", "threads", "processes"],
+                   help="How --sweep configs are spread across cores "
+                        "(default: BATCH_EXECUTOR env var, else serial)")
+    p.add_argument("--workers",          type=int,
+                   help="Pool size for --executor (default: CPU count)")
     p.add_argument("--trades",           type=int,   default=20,
                    help="Number of trades to print in the log (default: 20; 0 = all)")
     p.add_argument("--debug",            action="store_true",
@@ -1848,6 +2243,8 @@ commands:
                    help="Number of backtest runs to record (default: 0)")
     p.add_argument("--train-count",    type=int, default=0, dest="train_count",
                    help="Number of training runs to record (default: 0)")
+    p.add_argument("--optimize-count", type=int, default=0, dest="optimize_count",
+                   help="Number of hyperparameter-search trials to record (default: 0)")
 
     # sensitivity ─────────────────────────────────────────────────────────────
     p = sub.add_parser("sensitivity",
@@ -1892,6 +2289,36 @@ commands:
     p.add_argument("--sensitivity", action="store_true",
                    help="Include parameter sensitivity sweep (adds ~21 backtests)")
 
+    # robustness ──────────────────────────────────────────────────────────────
+    p = sub.add_parser("robustness",
+                       help="Bootstrap / Monte Carlo confidence intervals for backtest metrics")
+    p.add_argument("strategy")
+    p.add_argument("--tickers",
+                   help="Comma-separated tickers (mutually exclusive with --universe)")
+    p.add_argument("--universe",
+                   help=f"Named universe to expand into tickers. "
+                        f"Available: {', '.join(list_universes())}")
+    p.add_argument("--interval",    default="1d")
+    p.add_argument("--start",       help="Start date YYYY-MM-DD (default: 5 years ago)")
+    p.add_argument("--end",         help="End date   YYYY-MM-DD (default: today)")
+    p.add_argument("--method",      default="all",
+                   choices=["all", "block_bootstrap", "trade_shuffle", "noise"],
+                   help="Resampling method (default: all)")
+    p.add_argument("--paths",       type=int,   default=10_000,
+                   help="Resampled paths per method (default: 10000)")
+    p.add_argument("--confidence",  type=float, default=0.95,
+                   help="Two-sided interval level (default: 0.95)")
+    p.add_argument("--block",       type=float,
+                   help="Mean block length in bars for block_bootstrap (default: bars^(1/3))")
+    p.add_argument("--noise",       type=float, default=0.5,
+                   help="Noise std as a multiple of the return std (default: 0.5)")
+    p.add_argument("--seed",        type=int,
+                   help="Random seed for reproducible paths")
+    p.add_argument("--portfolio",   action="store_true",
+                   help="Resample the PortfolioBacktester result instead of each ticker")
+    p.add_argument("--debug",       action="store_true",
+                   help="Show full tracebacks on engine errors")
+
     # ic ──────────────────────────────────────────────────────────────────────
     p = sub.add_parser("ic",
                        help="Unconditional IC analysis — gate check before strategy construction")
@@ -1952,6 +2379,8 @@ _DISPATCH = {
     "show-context":     cmd_show_context,
     "show-model":       cmd_show_model,
     "data-info":        cmd_data_info,
+    "options-snapshot": cmd_options_snapshot,
+    "trends-fetch":     cmd_trends_fetch,
     "validate":         cmd_validate,
     "backtest":         cmd_backtest,
     "portfolio":        cmd_portfolio,
@@ -1961,6 +2390,7 @@ _DISPATCH = {
     "sensitivity":      cmd_sensitivity,
     "signal-stability": cmd_signal_stability,
     "diagnose":         cmd_diagnose,
+    "robustness":       cmd_robustness,
     "ic":               cmd_ic,
     "ic-surface":       cmd_ic_surface,
 }
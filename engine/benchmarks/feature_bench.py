@@ -0,0 +1,351 @@
+"""Performance harness for every feature in the registry.
+
+Runs each registered feature with its default parameters on synthetic OHLCV
+of increasing length, records wall time and peak traced memory, and compares
+the numbers against a stored JSON baseline so kernel changes can be judged
+by how much faster (or slower) they made things.
+
+Run from the repo root:
+    python -m engine.benchmarks.feature_bench                      # all sizes, compare to baseline
+    python -m engine.benchmarks.feature_bench --sizes 1000 10000 --features RSI KDE
+    python -m engine.benchmarks.feature_bench --save-baseline      # record a new baseline
+
+The process exits with status 1 when any feature regresses beyond the
+threshold, so the command can gate CI.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "feature_baseline.json")
+
+# Features in these categories pull reference data from the network (FRED,
+# yfinance, Google Trends, SEC) or need a real ticker, so synthetic bars say
+# nothing about their kernels. Opt in with --include-external.
+EXTERNAL_CATEGORIES = frozenset({"Macro", "Comparison", "Alternative", "Options"})
+
+# Below these absolute deltas measurement noise dominates; never flag as a regression.
+MIN_REGRESSION_MS = 2.0
+MIN_REGRESSION_BYTES = 256 * 1024
+
+
+def make_synthetic_ohlcv(n_bars: int, seed: int = 0, freq: str = "min") -> pd.DataFrame:
+    """Builds a reproducible random-walk OHLCV frame.
+
+    Minute bars keep a 1M-bar index inside pandas' Timestamp range and give
+    session-based features (VWAP) realistic intraday groupings.
+
+    Args:
+        n_bars: Number of rows.
+        seed: RNG seed, fixed so every run benchmarks identical data.
+        freq: Pandas offset alias for the index spacing.
+
+    Returns:
+        DataFrame with lowercase ``open/high/low/close/volume`` columns.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.001, n_bars)))
+    spread = np.abs(rng.normal(0.0, 0.002, n_bars)) * close
+    open_ = close * (1.0 + rng.normal(0.0, 0.0005, n_bars))
+    idx = pd.date_range("2000-01-03", periods=n_bars, freq=freq)
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "volume": rng.integers(1_000, 100_000, n_bars).astype(float),
+    }, index=idx)
+
+
+def default_params(feature) -> Dict[str, Any]:
+    """Resolves a feature's ``parameters`` to concrete defaults.
+
+    List-valued parameters (e.g. the ``normalize`` options) default to their
+    first entry, matching how the GUI and ``CLI.py features`` present them.
+    """
+    return {k: (v[0] if isinstance(v, list) else v) for k, v in feature.parameters.items()}
+
+
+def _time_once(feature, df: pd.DataFrame, params: Dict[str, Any]) -> float:
+    from engine.core.features.features import FeatureCache
+
+    t0 = time.perf_counter()
+    feature.compute(df, params, FeatureCache())
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def _peak_bytes(feature, df: pd.DataFrame, params: Dict[str, Any]) -> int:
+    from engine.core.features.features import FeatureCache
+
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        feature.compute(df, params, FeatureCache())
+        _, peak = tracemalloc.get_traced_memory()
+        return max(0, peak - start)
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    feature_ids: Optional[List[str]] = None,
+    repeat: int = 3,
+    max_seconds: float = 60.0,
+    include_external: bool = False,
+    on_result=None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Benchmarks registered features across data sizes.
+
+    Wall time is the best of ``repeat`` untraced runs (a single run at 100k
+    bars and above); peak memory comes from one extra run under
+    ``tracemalloc``. Once a feature takes longer than ``max_seconds`` at one
+    size, the larger sizes are skipped rather than run for minutes.
+
+    Args:
+        sizes: Bar counts to benchmark.
+        feature_ids: Registry IDs to run. Defaults to every registered feature
+            outside ``EXTERNAL_CATEGORIES``.
+        repeat: Timed repetitions per size (best-of).
+        max_seconds: Per-run budget that stops escalation to larger sizes.
+        include_external: Also run network-backed feature categories.
+        on_result: Optional ``callback(feature_id, n_bars, entry)`` fired
+            after each measurement, for progress output.
+
+    Returns:
+        ``{feature_id: {str(n_bars): {"ms", "peak_bytes", "status"}}}``
+        where status is ``"ok"``, ``"error: ..."`` or ``"skipped"``.
+    """
+    from engine.core.features.features import FEATURE_REGISTRY
+
+    sizes = sorted(int(s) for s in sizes)
+    if feature_ids is None:
+        feature_ids = [
+            meta["id"] for meta in FEATURE_REGISTRY.catalog()
+            if include_external or meta["category"] not in EXTERNAL_CATEGORIES
+        ]
+
+    frames = {n: make_synthetic_ohlcv(n) for n in sizes}
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    for fid in feature_ids:
+        if fid not in FEATURE_REGISTRY:
+            raise KeyError(f"Feature '{fid}' not found in registry.")
+        feature = FEATURE_REGISTRY[fid]()
+        params = default_params(feature)
+        results[fid] = {}
+        over_budget = False
+
+        for n in sizes:
+            if over_budget:
+                entry = {"ms": None, "peak_bytes": None, "status": "skipped"}
+            else:
+                df = frames[n]
+                try:
+                    reps = 1 if n >= 100_000 else max(1, repeat)
+                    ms = min(_time_once(feature, df, params) for _ in range(reps))
+                    entry = {
+                        "ms": round(ms, 3),
+                        "peak_bytes": _peak_bytes(feature, df, params),
+                        "status": "ok",
+                    }
+                    over_budget = ms / 1000.0 > max_seconds
+                except Exception as e:
+                    entry = {"ms": None, "peak_bytes": None, "status": f"error: {e}"}
+                    over_budget = True
+            results[fid][str(n)] = entry
+            if on_result is not None:
+                on_result(fid, n, entry)
+
+    return results
+
+
+def compare_to_baseline(
+    current: Dict[str, Dict[str, Dict[str, Any]]],
+    baseline: Dict[str, Dict[str, Dict[str, Any]]],
+    threshold: float = 0.25,
+    min_ms: float = MIN_REGRESSION_MS,
+    min_bytes: int = MIN_REGRESSION_BYTES,
+) -> List[Dict[str, Any]]:
+    """Lists the measurements that got worse than the baseline allows.
+
+    A regression needs both a relative increase above ``threshold`` and an
+    absolute increase above the noise floor (``min_ms`` for time,
+    ``min_bytes`` for peak memory). Entries missing on either side or not
+    ``"ok"`` are ignored.
+
+    Args:
+        current: Output of ``run_benchmarks``.
+        baseline: A previously saved ``run_benchmarks`` result.
+        threshold: Allowed fractional increase (0.25 = 25% slower).
+        min_ms: Absolute noise floor for time regressions.
+        min_bytes: Absolute noise floor for memory regressions.
+
+    Returns:
+        One dict per regression with ``feature``, ``bars``, ``metric``,
+        ``baseline``, ``current`` and ``ratio``.
+    """
+    regressions: List[Dict[str, Any]] = []
+    for fid, by_size in current.items():
+        for size, entry in by_size.items():
+            ref = baseline.get(fid, {}).get(size)
+            if not ref or entry.get("status") != "ok" or ref.get("status") != "ok":
+                continue
+
+            cur_ms, ref_ms = entry["ms"], ref["ms"]
+            if ref_ms and cur_ms > ref_ms * (1.0 + threshold) and cur_ms - ref_ms > min_ms:
+                regressions.append({
+                    "feature": fid, "bars": int(size), "metric": "ms",
+                    "baseline": ref_ms, "current": cur_ms, "ratio": cur_ms / ref_ms,
+                })
+
+            cur_mem, ref_mem = entry["peak_bytes"], ref["peak_bytes"]
+            if ref_mem and cur_mem > ref_mem * (1.0 + threshold) and cur_mem - ref_mem > min_bytes:
+                regressions.append({
+                    "feature": fid, "bars": int(size), "metric": "peak_bytes",
+                    "baseline": ref_mem, "current": cur_mem, "ratio": cur_mem / ref_mem,
+                })
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Reads a baseline file; returns an empty dict when it does not exist."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f).get("results", {})
+
+
+def _machine_info() -> Dict[str, Any]:
+    """Describes the host, since timings only compare on the same hardware."""
+    cpu = platform.processor() or platform.machine()
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpu = next((line.split(":", 1)[1].strip() for line in f
+                        if line.startswith("model name")), cpu)
+    except OSError:
+        pass
+    return {"platform": platform.platform(), "processor": cpu, "cpu_count": os.cpu_count()}
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+    """Writes results as the new baseline, merged over any existing entries.
+
+    Merging lets a partial run (``--features RSI``) refresh just those rows
+    without discarding the rest of the baseline.
+    """
+    merged = load_baseline(path)
+    for fid, by_size in results.items():
+        merged.setdefault(fid, {}).update(by_size)
+    payload = {
+        "machine": _machine_info(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "results": merged,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def _format_table(results: Dict[str, Dict[str, Dict[str, Any]]], sizes: List[int]) -> List[str]:
+    lines = [f"  {'Feature':<22}" + "".join(f"{n:>18,}" for n in sizes)]
+    lines.append("  " + "-" * (22 + 18 * len(sizes)))
+    for fid, by_size in results.items():
+        cells = []
+        for n in sizes:
+            entry = by_size.get(str(n), {})
+            if entry.get("status") == "ok":
+                cells.append(f"{entry['ms']:>9.1f}ms {entry['peak_bytes'] / 1e6:>5.1f}M")
+            elif entry.get("status") == "skipped":
+                cells.append("skipped")
+            else:
+                cells.append("error")
+        lines.append(f"  {fid[:22]:<22}" + "".join(f"{c:>18}" for c in cells))
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m engine.benchmarks.feature_bench",
+        description="Benchmark every registered feature across synthetic data sizes.",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Bar counts (default: 1000 10000 100000 1000000)")
+    parser.add_argument("--features", nargs="+", metavar="ID",
+                        help="Registry IDs to run (default: all non-external features)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Best-of repetitions below 100k bars (default: 3)")
+    parser.add_argument("--max-seconds", type=float, default=60.0, dest="max_seconds",
+                        help="Skip larger sizes once a run exceeds this (default: 60)")
+    parser.add_argument("--include-external", action="store_true", dest="include_external",
+                        help="Also run network-backed categories (Macro, Comparison, ...)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Baseline JSON path (default: engine/benchmarks/feature_baseline.json)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed fractional regression (default: 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", dest="save_baseline",
+                        help="Write these results to the baseline file instead of comparing")
+    parser.add_argument("--json", action="store_true", help="Emit raw results as JSON")
+    args = parser.parse_args(argv)
+
+    def _progress(fid, n, entry):
+        if not args.json:
+            status = f"{entry['ms']:.1f} ms" if entry["status"] == "ok" else entry["status"]
+            print(f"  {fid:<22} {n:>10,} bars  {status}", flush=True)
+
+    results = run_benchmarks(
+        sizes=args.sizes,
+        feature_ids=args.features,
+        repeat=args.repeat,
+        max_seconds=args.max_seconds,
+        include_external=args.include_external,
+        on_result=_progress,
+    )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print()
+        print("\n".join(_format_table(results, sorted(args.sizes))))
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\n  Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"\n  No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, threshold=args.threshold)
+    if not regressions:
+        print(f"\n  No regressions beyond {args.threshold:.0%} against {args.baseline}")
+        return 0
+
+    print(f"\n  {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+    for r in regressions:
+        print(
+            f"    {r['feature']:<22} {r['bars']:>10,} bars  {r['metric']:<10} "
+            f"{r['baseline']:>12,.1f} -> {r['current']:>12,.1f}  ({r['ratio']:.2f}x)"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
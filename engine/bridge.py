@@ -12,22 +12,26 @@ import json
 import logging
 import zipfile
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
-from engine.core.data_broker.data_broker import DataBroker
-from engine.core.data_broker.database import Database
 from engine.core.features.base import FEATURE_REGISTRY
-from engine.core.features.features import load_features
 from engine.core.workspace import WorkspaceManager
 from engine.core.backtester import LocalBacktester
 from engine.core.bundler import Bundler
 from engine.core.metrics import Tearsheet
+from engine.core.diagnostics.robustness import (
+    inputs_from_portfolio, inputs_from_tearsheet, robustness_report,
+)
 from engine.core.exceptions import StrategyError, ValidationError
 
 _REQUIRED_MANIFEST_KEYS = {"features", "hyperparameters", "parameter_bounds"}
 
+# Most rows of the portfolio position heatmap sent to the GUI.
+_HEATMAP_MAX_BARS = 800
+
 
 class _CallbackLogHandler(logging.Handler):
     """Forwards engine log records to a GUI callback.
@@ -66,9 +70,20 @@ class ModelEngine:
 
     def __init__(self, workspace_dir: str, db_path: str):
         self.workspace_dir = os.path.normpath(workspace_dir)
-        load_features()
-        self._broker = DataBroker()
-        self._broker.db = Database(db_path)
+        self._db_path = db_path
+        self._broker_instance = None
+
+    @property
+    def _broker(self):
+        # Built on first use: the data layer pulls in yfinance, requests_cache
+        # and SQLAlchemy, which commands like `list` never touch.
+        if self._broker_instance is None:
+            from engine.core.data_broker.data_broker import DataBroker
+            from engine.core.data_broker.database import Database
+
+            self._broker_instance = DataBroker()
+            self._broker_instance.db = Database(self._db_path)
+        return self._broker_instance
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -96,6 +111,15 @@ class ModelEngine:
     def _parse_dt(value: str) -> datetime:
         return datetime.fromisoformat(value)
 
+    @staticmethod
+    def _batch_progress(callbacks: dict, lo: int, hi: int):
+        """Maps run_batch per-ticker completions onto the [lo, hi] progress band."""
+        def _on_result(ticker: str, signals: pd.Series, done: int, total: int):
+            callbacks["on_progress"](
+                lo + int(done / max(total, 1) * (hi - lo)), f"Signals {done}/{total}: {ticker}"
+            )
+        return _on_result
+
     # ------------------------------------------------------------------
     # Strategy & Workspace Management
     # ------------------------------------------------------------------
@@ -247,16 +271,16 @@ class ModelEngine:
         return self._broker.db.get_all_tickers()
 
     def get_available_features(self) -> List[dict]:
+        # Served from the registry index so listing never imports feature modules.
         result = []
-        for feature_id, feature_cls in FEATURE_REGISTRY.items():
-            instance = feature_cls()
+        for meta in FEATURE_REGISTRY.catalog():
             result.append(
                 {
-                    "id": feature_id,
-                    "name": instance.name,
-                    "description": instance.description,
-                    "category": instance.category,
-                    "params": instance.parameters,
+                    "id": meta["id"],
+                    "name": meta["name"],
+                    "description": meta["description"],
+                    "category": meta["category"],
+                    "params": meta["parameters"],
                 }
             )
         return result
@@ -266,7 +290,11 @@ class ModelEngine:
     # ------------------------------------------------------------------
 
     def run_backtest(self, strategy_name: str, assets: List[str], timeframe: dict, callbacks: dict,
-                     starting_capital: float = 10_000.0) -> dict:
+                     starting_capital: float = 10_000.0, executor: Optional[str] = None,
+                     max_workers: Optional[int] = None,
+                     walk_forward: Optional[dict] = None,
+                     robustness: Optional[dict] = None,
+                     cost_scenarios: Optional[dict] = None) -> dict:
         strategy_dir = self._strategy_dir(strategy_name)
         start = self._parse_dt(timeframe["start"])
         end = self._parse_dt(timeframe["end"])
@@ -289,11 +317,32 @@ class ModelEngine:
             callbacks["on_progress"](100, "No data available.")
             return {"metrics": {}, "equity_curves": {}}
 
-        callbacks["on_progress"](50, "Running vectorized backtest…")
-        callbacks["on_log"]("[Backtest] Executing strategy batch")
-
         backtester = LocalBacktester(strategy_dir)
-        batch_signals = backtester.run_batch(datasets)
+        if walk_forward is not None:
+            # Tickers run one after another; each spreads its retrain windows
+            # across the pool instead.
+            callbacks["on_log"]("[Backtest] Executing walk-forward retraining")
+            batch_signals = {}
+            for i, (ticker, df) in enumerate(datasets.items()):
+                if callbacks["is_cancelled"]():
+                    return {"cancelled": True, "metrics": {}, "equity_curves": {}}
+                callbacks["on_progress"](
+                    40 + int(i / len(datasets) * 35), f"Walk-forward {ticker}…"
+                )
+                try:
+                    batch_signals[ticker] = backtester.run_walk_forward(
+                        df, executor=executor, max_workers=max_workers, **walk_forward
+                    )
+                except StrategyError as e:
+                    callbacks["on_log"](f"[Backtest] {ticker}: {e}")
+                    batch_signals[ticker] = pd.Series(dtype=float)
+        else:
+            callbacks["on_progress"](40, "Running vectorized backtest…")
+            callbacks["on_log"]("[Backtest] Executing strategy batch")
+            batch_signals = backtester.run_batch(
+                datasets, executor=executor, max_workers=max_workers,
+                on_result=self._batch_progress(callbacks, 40, 75),
+            )
 
         metrics_out: dict = {}
         equity_out: dict = {}
@@ -301,6 +350,8 @@ class ModelEngine:
         bh_portfolio_out: dict = {}
         trade_log_out: dict = {}
         signals_out: dict = {}
+        robustness_out: dict = {}
+        cost_surface_out: dict = {}
         n_done = len(batch_signals)
 
         for j, (ticker, signals) in enumerate(batch_signals.items()):
@@ -308,7 +359,7 @@ class ModelEngine:
                 break
 
             callbacks["on_progress"](
-                50 + int(j / max(n_done, 1) * 48), f"Scoring {ticker}…"
+                75 + int(j / max(n_done, 1) * 23), f"Scoring {ticker}…"
             )
 
             if signals.empty:
@@ -341,27 +392,44 @@ class ModelEngine:
             bh_portfolio_out[ticker] = _downsample(bh_portfolio)
             signals_out[ticker] = batch_signals[ticker]
 
-            # Trade log: convert Timestamps to strings for JSON
-            if not trade_log.empty:
-                tl = trade_log.copy()
-                for col in ('entry_date', 'exit_date'):
-                    if col in tl.columns:
-                        tl[col] = tl[col].astype(str)
-                trade_log_out[ticker] = tl.to_dict('records')
-            else:
-                trade_log_out[ticker] = []
+            # Trade log: one JSON-ready list per column (dates as strings)
+            trade_log_out[ticker] = Tearsheet.trade_log_columns(trade_log)
+
+            if robustness is not None:
+                returns, trades = inputs_from_tearsheet(
+                    {"equity_curve": equity_curve, "trade_log": trade_log}
+                )
+                robustness_out[ticker] = robustness_report(returns, trades, **robustness)
+
+            if cost_scenarios is not None:
+                # Reuses the signals above; "spreads" maps tickers to their own
+                # spread model and overrides the shared "spread".
+                scenario = {k: v for k, v in cost_scenarios.items() if k != "spreads"}
+                spreads = cost_scenarios.get("spreads") or {}
+                if ticker in spreads:
+                    scenario["spread"] = spreads[ticker]
+                cost_surface_out[ticker] = Tearsheet.calculate_cost_surface(
+                    datasets[ticker], signals, **scenario
+                ).to_dict("records")
 
         callbacks["on_progress"](100, "Backtest complete.")
-        return {
+        result = {
             "metrics": metrics_out,
             "equity_curves": equity_out,
             "portfolios": portfolio_out,
             "bh_portfolios": bh_portfolio_out,
             "trade_logs": trade_log_out,
             "signals": signals_out,
+            "feature_profile": backtester.feature_profile,
         }
+        if robustness is not None:
+            result["robustness"] = robustness_out
+        if cost_scenarios is not None:
+            result["cost_surfaces"] = cost_surface_out
+        return result
 
-    def run_training(self, strategy_name: str, assets: List[str], timeframe: dict, callbacks: dict) -> dict:
+    def run_training(self, strategy_name: str, assets: List[str], timeframe: dict, callbacks: dict,
+                     optimize: Optional[bool] = None, n_trials: Optional[int] = None) -> dict:
         if callbacks["is_cancelled"]():
             return {"cancelled": True}
 
@@ -384,6 +452,8 @@ class ModelEngine:
                 start=timeframe.get("start"),
                 end=timeframe.get("end"),
             ),
+            optimize=optimize,
+            n_trials=n_trials,
         )
 
         # Mirror 'model-engine' logger records into the GUI log panel for
@@ -480,6 +550,7 @@ class ModelEngine:
         timeframe:     dict,
         callbacks:     dict,
         config_dict:   dict = None,
+        robustness:    Optional[dict] = None,
     ) -> dict:
         """
         Run a multi-asset portfolio simulation.
@@ -494,49 +565,31 @@ class ModelEngine:
             timeframe:     Dict with 'start', 'end', 'interval'.
             callbacks:     Standard engine callbacks dict.
             config_dict:   Optional PortfolioConfig field overrides.
+            robustness:    Optional ``robustness_report`` options. When set,
+                           the result gains a ``robustness`` section.
 
         Returns:
-            Dict with keys: metrics, equity_curve, position_weights,
-            trade_log, per_ticker_contribution.
+            Dict with keys: metrics, equity_curve, position_weights (heatmap
+            ``{"index", "tickers", "weights"}`` of the tickers ever held),
+            position_events (entry/resize/exit records), trade_log,
+            per_ticker_contribution.
         """
         from engine.core.portfolio_backtester import PortfolioBacktester, PortfolioConfig
 
-        strategy_dir = self._strategy_dir(strategy_name)
-        start        = self._parse_dt(timeframe["start"])
-        end          = self._parse_dt(timeframe["end"])
-        interval     = timeframe.get("interval", "1d")
-
         cfg_fields   = config_dict or {}
         config       = PortfolioConfig(**{
             k: v for k, v in cfg_fields.items()
             if k in PortfolioConfig.__dataclass_fields__
         })
 
-        # --- Fetch data ---------------------------------------------------
-        datasets: dict = {}
-        n = len(assets)
-        for i, ticker in enumerate(assets):
-            if callbacks["is_cancelled"]():
-                return {"cancelled": True}
-            callbacks["on_progress"](int(i / n * 35), f"Fetching {ticker}…")
-            callbacks["on_log"](f"[Portfolio] Fetching {ticker} ({interval})")
-            df = self._broker.get_data(ticker, interval, start, end)
-            if not df.empty:
-                datasets[ticker] = df
-
+        inputs = self._portfolio_inputs(strategy_name, assets, timeframe, callbacks)
+        if inputs is None:
+            return {"cancelled": True}
+        datasets, all_signals = inputs
         if not datasets:
             callbacks["on_progress"](100, "No data available.")
             return {"metrics": {}, "equity_curve": [], "position_weights": {},
-                    "trade_log": [], "per_ticker_contribution": {}}
-
-        # --- Generate signals ---------------------------------------------
-        callbacks["on_progress"](40, "Running signal batch…")
-        callbacks["on_log"]("[Portfolio] Computing signals for all tickers")
-        backtester   = LocalBacktester(strategy_dir)
-        all_signals  = backtester.run_batch(datasets)
-
-        if callbacks["is_cancelled"]():
-            return {"cancelled": True}
+                    "position_events": [], "trade_log": [], "per_ticker_contribution": {}}
 
         # --- Portfolio simulation -----------------------------------------
         callbacks["on_progress"](60, "Simulating portfolio…")
@@ -553,11 +606,25 @@ class ModelEngine:
         eq  = result.get("equity_curve", pd.Series(dtype=float))
         eq_out = _downsample(eq, 1500)
 
-        # position_weights: keep as raw pd.Series — heatmap builds from them
+        # Positions: the event log as-is, plus a heatmap of the tickers ever
+        # held densified on at most _HEATMAP_MAX_BARS rows.
+        positions = result.get("positions")
         pw_out: dict = {}
-        for t, series in result.get("position_weights", {}).items():
-            if not series.empty:
-                pw_out[t] = series  # pd.Series; GUI downsamples as needed
+        events_out: list = []
+        if positions is not None and len(positions.bars):
+            held = sorted(positions.held_tickers)
+            weights = positions.weights(
+                tickers=held, step=max(1, len(positions.index) // _HEATMAP_MAX_BARS)
+            )
+            pw_out = {
+                "index":   [str(t) for t in weights.index],
+                "tickers": held,
+                "weights": np.round(weights.to_numpy(), 4).tolist(),
+            }
+            events = positions.events()
+            events["date"] = events["date"].astype(str)
+            events["shares"] = events["shares"].round(4)
+            events_out = events.to_dict("records")
 
         # trade log
         tdf = result.get("trade_log", pd.DataFrame())
@@ -570,15 +637,133 @@ class ModelEngine:
         else:
             trade_log_out = []
 
-        callbacks["on_progress"](100, "Portfolio simulation complete.")
-        return {
+        out = {
             "metrics":                 result.get("metrics", {}),
             "equity_curve":            eq_out,
             "position_weights":        pw_out,
+            "position_events":         events_out,
             "trade_log":               trade_log_out,
             "per_ticker_contribution": result.get("per_ticker_contribution", {}),
             "starting_capital":        config.starting_capital,
         }
+        if robustness is not None and not eq.empty:
+            callbacks["on_progress"](90, "Resampling returns…")
+            returns, trades = inputs_from_portfolio(result, config.starting_capital)
+            out["robustness"] = robustness_report(returns, trades, **robustness)
+
+        callbacks["on_progress"](100, "Portfolio simulation complete.")
+        return out
+
+    def run_portfolio_sweep(
+        self,
+        strategy_name: str,
+        assets:        List[str],
+        timeframe:     dict,
+        callbacks:     dict,
+        grid:          Dict[str, list],
+        config_dict:   dict = None,
+        rank_by:       str = "Sharpe Ratio",
+        executor:      Optional[str] = None,
+        max_workers:   Optional[int] = None,
+    ) -> dict:
+        """
+        Rank PortfolioConfig variants over one universe.
+
+        Data and signals are computed once, as for ``run_portfolio_backtest``;
+        ``PortfolioBacktester.sweep`` then aligns them once and scores every
+        combination of ``grid`` values applied on top of ``config_dict``.
+
+        Args:
+            strategy_name: Name of the strategy workspace.
+            assets:        List of ticker symbols.
+            timeframe:     Dict with 'start', 'end', 'interval'.
+            callbacks:     Standard engine callbacks dict.
+            grid:          ``{PortfolioConfig field: [values]}`` to sweep.
+            config_dict:   Optional PortfolioConfig overrides shared by all runs.
+            rank_by:       Metric to rank by (``PORTFOLIO_RANK_METRICS``).
+            executor:      ``"serial"``, ``"threads"`` or ``"processes"``.
+            max_workers:   Pool size.
+
+        Returns:
+            Dict with ``results`` (one record per config, best first, with its
+            ``config`` number, the swept fields and the metrics), ``rank_by``
+            and ``n_configs``.
+        """
+        from engine.core.portfolio_backtester import (
+            PortfolioBacktester, PortfolioConfig, portfolio_config_grid,
+        )
+
+        base = PortfolioConfig(**{
+            k: v for k, v in (config_dict or {}).items()
+            if k in PortfolioConfig.__dataclass_fields__
+        })
+        configs = portfolio_config_grid(grid, base)
+
+        inputs = self._portfolio_inputs(strategy_name, assets, timeframe, callbacks)
+        if inputs is None:
+            return {"cancelled": True}
+        datasets, all_signals = inputs
+        if not datasets:
+            callbacks["on_progress"](100, "No data available.")
+            return {"results": [], "rank_by": rank_by, "n_configs": len(configs)}
+
+        callbacks["on_progress"](60, f"Sweeping {len(configs)} portfolio configs…")
+        callbacks["on_log"](f"[Portfolio] Sweeping {len(configs)} configs")
+
+        def _on_progress(done: int, total: int) -> None:
+            callbacks["on_progress"](60 + int(done / total * 39), f"Config {done}/{total}")
+
+        table = PortfolioBacktester().sweep(
+            datasets, all_signals, configs, rank_by=rank_by,
+            executor=executor, max_workers=max_workers, on_progress=_on_progress,
+        )
+        callbacks["on_progress"](100, "Portfolio sweep complete.")
+        return {
+            "results":   table.reset_index().to_dict("records"),
+            "rank_by":   rank_by,
+            "n_configs": len(configs),
+        }
+
+    def _portfolio_inputs(
+        self, strategy_name: str, assets: List[str], timeframe: dict, callbacks: dict
+    ) -> Optional[tuple]:
+        """Fetches data and runs the signal batch for a portfolio run.
+
+        Returns:
+            ``(datasets, all_signals)`` (empty when no ticker has data), or
+            None if the job was cancelled.
+        """
+        strategy_dir = self._strategy_dir(strategy_name)
+        start        = self._parse_dt(timeframe["start"])
+        end          = self._parse_dt(timeframe["end"])
+        interval     = timeframe.get("interval", "1d")
+
+        # --- Fetch data ---------------------------------------------------
+        datasets: dict = {}
+        n = len(assets)
+        for i, ticker in enumerate(assets):
+            if callbacks["is_cancelled"]():
+                return None
+            callbacks["on_progress"](int(i / n * 35), f"Fetching {ticker}…")
+            callbacks["on_log"](f"[Portfolio] Fetching {ticker} ({interval})")
+            df = self._broker.get_data(ticker, interval, start, end)
+            if not df.empty:
+                datasets[ticker] = df
+
+        if not datasets:
+            return {}, {}
+
+        # --- Generate signals ---------------------------------------------
+        callbacks["on_progress"](40, "Running signal batch…")
+        callbacks["on_log"]("[Portfolio] Computing signals for all tickers")
+        backtester   = LocalBacktester(strategy_dir)
+        all_signals  = backtester.run_batch(
+            datasets, on_result=self._batch_progress(callbacks, 40, 60)
+        )
+
+        if callbacks["is_cancelled"]():
+            return None
+        return datasets, all_signals
 
     def generate_signals(self, strategy_name: str, assets: List[str], callbacks: dict) -> dict:
         strategy_dir = self._strategy_dir(strategy_name)
@@ -609,7 +794,9 @@ class ModelEngine:
         callbacks["on_log"]("[Signal] Running feature DAG and model")
 
         backtester = LocalBacktester(strategy_dir)
-        batch_signals = backtester.run_batch(datasets)
+        batch_signals = backtester.run_batch(
+            datasets, on_result=self._batch_progress(callbacks, 60, 95)
+        )
 
         out: dict = {}
         for ticker, signals in batch_signals.items():
@@ -1,16 +1,24 @@
 import inspect
 import json
+import hashlib
 import importlib.util
 import sys
 import os
 import pandas as pd
+import heapq
 import itertools
-from typing import List, Dict, Any, Optional, Tuple
+import math
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple, Union
 import numpy as np
 
-from .features.features import compute_all_features
+from .features.features import compute_all_features, FeatureProfiler
 from .ml_bridge.orchestrator import MLBridge
 from .ml_bridge.artifact_manager import ArtifactManager
+from .config import config
 from .logger import logger
 from .exceptions import StrategyError
 
@@ -18,6 +26,23 @@ from .exceptions import StrategyError
 # Tearsheet — formerly engine/core/metrics.py
 # ---------------------------------------------------------------------------
 
+# Trade-log columns, in display order.
+TRADE_LOG_COLUMNS = [
+    'entry_date', 'exit_date', 'direction',
+    'entry_price', 'exit_price', 'return_pct', 'bars_held',
+]
+
+# How much calculate_metrics computes:
+#   fitness  - Total Return, CAGR and Sharpe from one NumPy equity pass
+#   standard - every scalar metric, no time-series objects
+#   full     - scalars plus equity curve, portfolios and trade log
+METRICS_LEVELS = ("fitness", "standard", "full")
+
+# Default friction scenarios of calculate_cost_surface (5, 10, 20, 50 bps).
+COST_SCENARIO_FRICTIONS = (0.0005, 0.001, 0.002, 0.005)
+# Named spread models accepted by calculate_cost_surface.
+SPREAD_MODELS = ("high_low",)
+
 class Tearsheet:
     """
     Translates raw signals into trading reality.
@@ -29,6 +54,12 @@ class Tearsheet:
         signals to real -1/0/+1 positions, tracks a dollar portfolio, and
         builds a per-trade log so callers can visualize exactly where money
         went.
+
+    calculate_metrics_batch() scores many signal vectors on one price series
+    at once and returns the scalar metrics as a table.
+
+    Both take a ``metrics_level`` (see METRICS_LEVELS) so optimiser loops can
+    pay only for the metrics they rank by.
     """
 
     @staticmethod
@@ -39,6 +70,7 @@ class Tearsheet:
         starting_capital: float = 10_000.0,
         entry_threshold: float = 0.2,
         n_trials: int = 1,
+        metrics_level: str = "full",
     ) -> Dict[str, Any]:
         """
         Calculates performance metrics using a T+1 execution model.
@@ -53,15 +85,28 @@ class Tearsheet:
             starting_capital: Dollar amount for the discrete portfolio simulation.
             entry_threshold: Minimum absolute signal magnitude to open a position
                 in the discrete simulation (default 0.2 = 20% conviction).
+            n_trials: Trial count passed to the Deflated Sharpe Ratio.
+            metrics_level: ``"fitness"`` returns only Total Return, CAGR and
+                Sharpe, computed with NumPy (no DSR, no discrete simulation).
+                ``"standard"`` returns every scalar metric but none of the
+                time-series objects. ``"full"`` (default) returns everything.
 
         Returns:
-            Dict containing scalar metrics plus three time-series objects:
+            Dict containing scalar metrics plus, at the ``full`` level, four
+            time-series objects:
               - ``equity_curve`` (pd.Series): normalised growth index from 1.0
                 (used by the optimiser as a smooth fitness surface).
               - ``portfolio`` (pd.Series): dollar value of the discrete portfolio.
               - ``bh_portfolio`` (pd.Series): buy-and-hold dollar benchmark.
               - ``trade_log`` (pd.DataFrame): one row per discrete round trip.
+
+        Raises:
+            ValueError: If ``metrics_level`` is not one of METRICS_LEVELS.
         """
+        Tearsheet._check_metrics_level(metrics_level)
+        if metrics_level == "fitness":
+            return Tearsheet._fitness_metrics(df, signals, friction)
+
         # ------------------------------------------------------------------
         # 1. Continuous signal model (optimiser fitness)
         # ------------------------------------------------------------------
@@ -84,20 +129,7 @@ class Tearsheet:
         total_return = (equity_curve.iloc[-1] - 1) * 100
         total_trades_continuous = int((trades_mask > 0).sum())
 
-        # Use median bar duration x bar count so CPCV non-contiguous training
-        # folds don't inflate `days` by spanning the full calendar range of
-        # the dataset (which would include gaps belonging to validation groups).
-        # Use pandas Timedelta arithmetic instead of astype(int64), since
-        # pandas 2.x DatetimeIndex can have non-ns resolution and int64 casts
-        # would return seconds/micros and collapse `days` to zero.
-        if len(df.index) > 1:
-            diffs_sec = (
-                df.index.to_series().diff().dropna().dt.total_seconds()
-            )
-            median_bar_sec = float(diffs_sec.median()) if not diffs_sec.empty else 0.0
-            days = max(int(median_bar_sec * len(equity_curve) / 86400), 1)
-        else:
-            days = 1
+        days = Tearsheet._days_spanned(df.index, len(equity_curve))
         end_equity = float(equity_curve.iloc[-1])
         if end_equity > 0 and days > 0:
             log_eq = np.log(end_equity) if np.isfinite(end_equity) else np.inf
@@ -141,6 +173,35 @@ class Tearsheet:
         win_rate_decimal = win_rate / 100
         expectancy = (win_rate_decimal * avg_win) + ((1 - win_rate_decimal) * avg_loss)
 
+        metrics = {
+            # Growth
+            "Total Return (%)":    round(total_return, 2),
+            "CAGR (%)":            round(cagr, 2),
+            # Risk / quality
+            "Sharpe Ratio":        round(sharpe, 2),
+            "Deflated Sharpe Ratio": round(dsr_val, 4) if np.isfinite(dsr_val) else float("nan"),
+            "Sortino Ratio":       round(sortino, 2),
+            "Calmar Ratio":        round(calmar, 2),
+            "Max Drawdown (%)":    round(max_drawdown, 2),
+            # Trade mechanics
+            "Win Rate (%)":        round(win_rate, 2),
+            "Avg Win (%)":         round(avg_win, 4),
+            "Avg Loss (%)":        round(avg_loss, 4),
+            "Expectancy (%)":      round(expectancy, 4),
+            "Profit Factor":       round(profit_factor, 2),
+            "Total Trades":        total_trades_continuous,
+        }
+
+        if metrics_level == "standard":
+            sig = signals.to_numpy(dtype=float)
+            position = np.where(sig >= entry_threshold, 1.0, np.where(sig <= -entry_threshold, -1.0, 0.0))
+            n_discrete, discrete_win_rate = Tearsheet._discrete_trade_stats(
+                position[None, :], signals.index, df
+            )
+            metrics["Discrete Trades"] = int(n_discrete[0])
+            metrics["Discrete Win Rate (%)"] = round(float(discrete_win_rate[0]), 2)
+            return metrics
+
         # ------------------------------------------------------------------
         # 2. Discrete position simulation (dollar portfolio)
         # ------------------------------------------------------------------
@@ -172,22 +233,7 @@ class Tearsheet:
         )
 
         return {
-            # Growth
-            "Total Return (%)":    round(total_return, 2),
-            "CAGR (%)":            round(cagr, 2),
-            # Risk / quality
-            "Sharpe Ratio":        round(sharpe, 2),
-            "Deflated Sharpe Ratio": round(dsr_val, 4) if np.isfinite(dsr_val) else float("nan"),
-            "Sortino Ratio":       round(sortino, 2),
-            "Calmar Ratio":        round(calmar, 2),
-            "Max Drawdown (%)":    round(max_drawdown, 2),
-            # Trade mechanics
-            "Win Rate (%)":        round(win_rate, 2),
-            "Avg Win (%)":         round(avg_win, 4),
-            "Avg Loss (%)":        round(avg_loss, 4),
-            "Expectancy (%)":      round(expectancy, 4),
-            "Profit Factor":       round(profit_factor, 2),
-            "Total Trades":        total_trades_continuous,
+            **metrics,
             # Discrete simulation results
             "Discrete Trades":     total_trades_discrete,
             "Discrete Win Rate (%)": round(discrete_win_rate, 2),
@@ -198,6 +244,459 @@ class Tearsheet:
             "trade_log":           trade_log,
         }
 
+    @staticmethod
+    def _days_spanned(index: pd.Index, n_bars: int) -> int:
+        """
+        Calendar days covered by ``n_bars`` bars of ``index``'s typical spacing.
+
+        Uses median bar duration x bar count so CPCV non-contiguous training
+        folds don't inflate `days` by spanning the full calendar range of
+        the dataset (which would include gaps belonging to validation groups).
+        Uses pandas Timedelta arithmetic instead of astype(int64), since
+        pandas 2.x DatetimeIndex can have non-ns resolution and int64 casts
+        would return seconds/micros and collapse `days` to zero.
+        """
+        if len(index) > 1:
+            diffs_sec = index.to_series().diff().dropna().dt.total_seconds()
+            median_bar_sec = float(diffs_sec.median()) if not diffs_sec.empty else 0.0
+            return max(int(median_bar_sec * n_bars / 86400), 1)
+        return 1
+
+    @staticmethod
+    def _check_metrics_level(metrics_level: str) -> None:
+        if metrics_level not in METRICS_LEVELS:
+            raise ValueError(
+                f"metrics_level must be one of {METRICS_LEVELS}, got {metrics_level!r}"
+            )
+
+    @staticmethod
+    def _forward_returns(df: pd.DataFrame, index: pd.Index) -> np.ndarray:
+        """
+        T+1 bar returns (open[T+1] -> open[T+2]) aligned to ``index``.
+
+        NumPy equivalent of ``df['open'].pct_change().shift(-2).reindex(index)``
+        clipped to [-0.5, 0.5], without the intermediate Series.
+        """
+        opens = df['open'].to_numpy(dtype=float)
+        fwd = np.full(len(opens), np.nan)
+        if len(opens) > 2:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fwd[:-2] = opens[2:] / opens[1:-1] - 1
+        fwd = np.clip(fwd, -0.5, 0.5)
+        if index.equals(df.index):
+            return fwd
+        locs = df.index.get_indexer(index)
+        return np.where(locs >= 0, fwd[np.maximum(locs, 0)], np.nan)
+
+    @staticmethod
+    def _equity_kernel(
+        S: np.ndarray, r: np.ndarray, friction: Union[float, np.ndarray], days: int
+    ) -> Dict[str, np.ndarray]:
+        """
+        Continuous-model returns, equity and fitness scalars for a signal matrix.
+
+        Args:
+            S: Signals, shape (variants, bars).
+            r: Forward returns from ``_forward_returns``, shape (bars,).
+            friction: Cost per unit of signal change — a scalar, or an array
+                broadcastable to ``S`` (e.g. scenarios x bars for the cost
+                surface).
+            days: Calendar span from ``_days_spanned``.
+
+        Returns:
+            Dict of arrays: ``strat``, ``valid`` and ``equity`` (variants x bars)
+            and per-variant ``trades_mask``, ``total_return``, ``cagr``,
+            ``mean``, ``volatility`` and ``sharpe``. Reductions skip NaN bars
+            exactly as the pandas reductions in ``calculate_metrics`` do.
+        """
+        diff = np.zeros_like(S)
+        diff[:, 1:] = S[:, 1:] - S[:, :-1]
+        trades_mask = np.nan_to_num(np.abs(diff), nan=0.0)
+        strat = S * r[None, :] - trades_mask * friction
+        valid = ~np.isnan(strat)
+        equity = np.cumprod(1 + np.where(valid, strat, 0.0), axis=1)
+
+        end_equity = equity[:, -1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_eq = np.where(np.isfinite(end_equity), np.log(np.maximum(end_equity, 1e-300)), np.inf)
+            exponent = np.clip(log_eq * (365.25 / days), -10.0, 10.0)
+            cagr = np.where(end_equity > 0, (np.exp(exponent) - 1) * 100, -100.0)
+
+            count = valid.sum(axis=1)
+            mean = np.where(valid, strat, 0.0).sum(axis=1) / count
+            dev = np.where(valid, strat - mean[:, None], 0.0)
+            volatility = np.sqrt((dev ** 2).sum(axis=1) / (count - 1)) * np.sqrt(252)
+            sharpe = np.where(volatility > 0, mean * 252 / volatility, 0.0)
+
+        return {
+            "strat":        strat,
+            "valid":        valid,
+            "equity":       equity,
+            "trades_mask":  trades_mask,
+            "total_return": (end_equity - 1) * 100,
+            "cagr":         cagr,
+            "mean":         mean,
+            "volatility":   volatility,
+            "sharpe":       sharpe,
+        }
+
+    @staticmethod
+    def _fitness_metrics(df: pd.DataFrame, signals: pd.Series, friction: float) -> Dict[str, float]:
+        """Total Return, CAGR and Sharpe for one signal series (``fitness`` level)."""
+        k = Tearsheet._equity_kernel(
+            signals.to_numpy(dtype=float)[None, :],
+            Tearsheet._forward_returns(df, signals.index),
+            friction,
+            Tearsheet._days_spanned(df.index, len(signals)),
+        )
+        return {
+            "Total Return (%)": round(float(k["total_return"][0]), 2),
+            "CAGR (%)":         round(float(k["cagr"][0]), 2),
+            "Sharpe Ratio":     round(float(k["sharpe"][0]), 2),
+        }
+
+    @staticmethod
+    def _discrete_trade_stats(
+        position: np.ndarray, index: pd.Index, df: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Discrete trade count and win rate per row of a position matrix.
+
+        Applies the run-length encoding of ``_build_trade_log`` to every row
+        at once and keeps only the counts, so no trade log is materialised.
+
+        Args:
+            position: Discrete positions (-1/0/+1), shape (variants, bars).
+            index: Bar index of ``position``'s columns (a subset of df.index).
+            df: OHLCV DataFrame supplying opens and the final close.
+
+        Returns:
+            Tuple of (trade counts, win rates in percent), one entry per row.
+        """
+        n_var, n_sig = position.shape
+        opens = df['open'].to_numpy(dtype=float)
+        n_bars = len(opens)
+        last_close = float(df['close'].iloc[-1])
+        locs = df.index.get_indexer(index)
+
+        starts = np.zeros_like(position, dtype=bool)
+        starts[:, 0] = position[:, 0] != 0
+        starts[:, 1:] = position[:, 1:] != position[:, :-1]
+        # next_start[v, t]: first run start strictly after bar t (n_sig if none).
+        start_at = np.where(starts, np.arange(n_sig)[None, :], n_sig)
+        next_start = np.full_like(start_at, n_sig)
+        next_start[:, :-1] = np.minimum.accumulate(start_at[:, :0:-1], axis=1)[:, ::-1]
+
+        var, bar = np.nonzero(starts & (position != 0))
+        entry_sig = locs[bar]
+        nxt = next_start[var, bar]
+        exit_sig = np.where(nxt < n_sig, locs[np.minimum(nxt, n_sig - 1)], -1)
+        keep = (entry_sig >= 0) & (entry_sig + 1 < n_bars)
+        entry_price = opens[np.where(keep, entry_sig + 1, 0)]
+        exit_at_open = (exit_sig >= 0) & (exit_sig + 1 < n_bars)
+        exit_price = np.where(exit_at_open, opens[np.where(exit_at_open, exit_sig + 1, 0)], last_close)
+        keep &= entry_price > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            trade_ret = (exit_price - entry_price) / entry_price * position[var, bar] * 100
+        counts = np.bincount(var[keep], minlength=n_var)
+        wins = np.bincount(var[keep], weights=np.round(trade_ret[keep], 4) > 0, minlength=n_var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            win_rate = np.where(counts > 0, wins / counts * 100, 0.0)
+        return counts, win_rate
+
+    @staticmethod
+    def calculate_metrics_batch(
+        df: pd.DataFrame,
+        signals: Union[pd.DataFrame, np.ndarray],
+        friction: float = 0.001,
+        entry_threshold: float = 0.2,
+        n_trials: int = 1,
+        index: Optional[pd.Index] = None,
+        names: Optional[List[str]] = None,
+        metrics_level: str = "standard",
+    ) -> pd.DataFrame:
+        """
+        Scores many signal vectors against one price series in a single pass.
+
+        Equivalent to calling ``calculate_metrics`` once per variant and keeping
+        the scalar metrics, but the T+1 return series, bar-duration span and
+        DSR benchmark are computed once and every metric is evaluated on the
+        whole (variants x bars) matrix with broadcasting.
+
+        Args:
+            df: OHLCV DataFrame shared by every variant.
+            signals: Either a DataFrame with one column per variant (indexed by
+                bar), or a 2-D array of shape (variants, bars).
+            friction: Round-trip transaction cost per trade (default 10 bps).
+            entry_threshold: Minimum |signal| for the discrete simulation.
+            n_trials: Trial count passed to the Deflated Sharpe Ratio.
+            index: Bar index for an ndarray ``signals`` (default ``df.index``).
+            names: Variant labels for an ndarray ``signals`` (default 0..V-1).
+            metrics_level: ``"fitness"`` for Total Return, CAGR and Sharpe
+                only. ``"standard"`` and ``"full"`` both give every scalar
+                metric (the batch never returns time-series objects).
+
+        Returns:
+            DataFrame with one row per variant and one column per scalar
+            metric, in the same order and rounding as ``calculate_metrics``.
+        """
+        Tearsheet._check_metrics_level(metrics_level)
+        if isinstance(signals, pd.DataFrame):
+            index = signals.index
+            names = list(signals.columns)
+            S = signals.to_numpy(dtype=float).T
+        else:
+            S = np.atleast_2d(np.asarray(signals, dtype=float))
+            index = df.index if index is None else index
+            names = list(range(S.shape[0])) if names is None else list(names)
+        if S.shape[1] != len(index):
+            raise ValueError(
+                f"signals have {S.shape[1]} bars but the index has {len(index)}"
+            )
+
+        # Shared across variants: T+1 returns, annualisation span, DSR inputs.
+        r = Tearsheet._forward_returns(df, index)
+        days = Tearsheet._days_spanned(df.index, len(index))
+
+        # ------------------------------------------------------------------
+        # Continuous model, all variants at once
+        # ------------------------------------------------------------------
+        k = Tearsheet._equity_kernel(S, r, friction, days)
+        total_return, cagr, sharpe = k["total_return"], k["cagr"], k["sharpe"]
+        variant_index = pd.Index(names, name="variant")
+        if metrics_level == "fitness":
+            return pd.DataFrame({
+                "Total Return (%)": [round(float(v), 2) for v in total_return],
+                "CAGR (%)":         [round(float(v), 2) for v in cagr],
+                "Sharpe Ratio":     [round(float(v), 2) for v in sharpe],
+            }, index=variant_index)
+
+        strat, valid, equity, mean = k["strat"], k["valid"], k["equity"], k["mean"]
+        trades_mask = k["trades_mask"]
+
+        def _mean(mask):
+            count = mask.sum(axis=1)
+            total = np.where(mask, strat, 0.0).sum(axis=1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return total / count, count
+
+        def _std(mask, mean):
+            count = mask.sum(axis=1)
+            dev = np.where(mask, strat - mean[:, None], 0.0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.sqrt((dev ** 2).sum(axis=1) / (count - 1))
+
+        total_trades = (trades_mask > 0).sum(axis=1)
+
+        is_trade = trades_mask > 0
+        n_trade = is_trade.sum(axis=1)
+        trade_win = is_trade & valid & (strat > 0)
+        trade_loss = is_trade & valid & (strat < 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            win_rate = np.where(n_trade > 0, trade_win.sum(axis=1) / n_trade * 100, 0.0)
+
+        pos_mask, neg_mask = valid & (strat > 0), valid & (strat < 0)
+        gains = np.where(pos_mask, strat, 0.0).sum(axis=1)
+        losses = np.abs(np.where(neg_mask, strat, 0.0).sum(axis=1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            profit_factor = np.where(losses > 0, gains / losses, np.inf)
+
+        rolling_max = np.maximum.accumulate(equity, axis=1)
+        max_drawdown = ((equity - rolling_max) / rolling_max).min(axis=1) * 100
+
+        from .diagnostics.dsr import compute_dsr_batch
+        dsr = compute_dsr_batch(strat, n_trials)
+
+        down_mean, n_down = _mean(neg_mask)
+        downside_vol = np.where(n_down > 0, _std(neg_mask, down_mean) * np.sqrt(252), 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sortino = np.where(downside_vol > 0, mean * 252 / downside_vol, 0.0)
+            calmar = np.where(max_drawdown != 0, cagr / np.abs(max_drawdown), 0.0)
+
+        win_mean, n_win = _mean(trade_win)
+        loss_mean, n_loss = _mean(trade_loss)
+        avg_win = np.where(n_win > 0, win_mean * 100, 0.0)
+        avg_loss = np.where(n_loss > 0, loss_mean * 100, 0.0)
+        expectancy = (win_rate / 100) * avg_win + (1 - win_rate / 100) * avg_loss
+
+        # ------------------------------------------------------------------
+        # Discrete simulation: trade counts and win rate per variant
+        # ------------------------------------------------------------------
+        position = np.where(S >= entry_threshold, 1.0, np.where(S <= -entry_threshold, -1.0, 0.0))
+        discrete_trades, discrete_win_rate = Tearsheet._discrete_trade_stats(position, index, df)
+
+        rows = []
+        for i in range(len(S)):
+            rows.append({
+                "Total Return (%)":      round(float(total_return[i]), 2),
+                "CAGR (%)":              round(float(cagr[i]), 2),
+                "Sharpe Ratio":          round(float(sharpe[i]), 2),
+                "Deflated Sharpe Ratio": round(float(dsr[i]), 4) if np.isfinite(dsr[i]) else float("nan"),
+                "Sortino Ratio":         round(float(sortino[i]), 2),
+                "Calmar Ratio":          round(float(calmar[i]), 2),
+                "Max Drawdown (%)":      round(float(max_drawdown[i]), 2),
+                "Win Rate (%)":          round(float(win_rate[i]), 2),
+                "Avg Win (%)":           round(float(avg_win[i]), 4),
+                "Avg Loss (%)":          round(float(avg_loss[i]), 4),
+                "Expectancy (%)":        round(float(expectancy[i]), 4),
+                "Profit Factor":         round(float(profit_factor[i]), 2),
+                "Total Trades":          int(total_trades[i]),
+                "Discrete Trades":       int(discrete_trades[i]),
+                "Discrete Win Rate (%)": round(float(discrete_win_rate[i]), 2),
+            })
+        return pd.DataFrame(rows, index=variant_index)
+
+    @staticmethod
+    def calculate_cost_surface(
+        df: pd.DataFrame,
+        signals: pd.Series,
+        frictions: Sequence[float] = COST_SCENARIO_FRICTIONS,
+        entry_thresholds: Sequence[Optional[float]] = (None,),
+        spread: Union[float, pd.Series, str] = 0.0,
+        slippage: float = 0.0,
+        volume_window: int = 20,
+    ) -> pd.DataFrame:
+        """
+        Scores one signal series under a grid of cost and threshold scenarios.
+
+        Signals and T+1 returns are computed once; every (entry threshold,
+        friction) pair becomes a row of one (scenarios x bars) matrix scored by
+        the same kernel as ``calculate_metrics_batch``, so the surface costs a
+        single vectorized pass instead of one backtest per scenario.
+
+        The cost of each unit of position change executed at bar T+1 is::
+
+            friction + spread[T+1] / 2 + slippage * sqrt(ADV[T+1] / volume[T+1])
+
+        where ADV is the trailing ``volume_window``-bar mean volume, so thin
+        bars cost more to trade. The impact ratio is capped at 100 (10x
+        ``slippage``); bars without volume pay ``slippage``.
+
+        Args:
+            df: OHLCV DataFrame with lowercase column names.
+            signals: Conviction signals in [-1.0, 1.0].
+            frictions: Flat cost per unit of position change, one scenario each
+                (default 5, 10, 20 and 50 bps).
+            entry_thresholds: Position models, one scenario each. ``None`` is
+                the continuous model of ``calculate_metrics``; a number is the
+                discrete -1/0/+1 simulation at that entry threshold.
+            spread: Bid-ask spread as a fraction of price: a constant, a
+                per-bar Series, or ``"high_low"`` to estimate it from the bars
+                with ``Tearsheet.high_low_spread``.
+            slippage: Volume-scaled slippage per unit traded at average volume.
+            volume_window: ADV window for ``slippage``.
+
+        Returns:
+            DataFrame with one row per scenario: ``entry_threshold`` (NaN for
+            the continuous model), ``friction``, Total Return, CAGR, Sharpe and
+            Max Drawdown (rounded as in ``calculate_metrics``), ``Trades``
+            (bars with a position change) and ``Avg Cost (bps)`` per unit traded.
+
+        Raises:
+            ValueError: On an unknown spread model.
+        """
+        index = signals.index
+        r = Tearsheet._forward_returns(df, index)
+        days = Tearsheet._days_spanned(df.index, len(index))
+        base_cost = Tearsheet._execution_costs(df, index, spread, slippage, volume_window)
+
+        sig = signals.to_numpy(dtype=float)
+        models = []
+        for threshold in entry_thresholds:
+            if threshold is None:
+                models.append(sig)
+            else:
+                models.append(np.where(sig >= threshold, 1.0, np.where(sig <= -threshold, -1.0, 0.0)))
+        frictions = np.asarray(frictions, dtype=float)
+        n_f = len(frictions)
+
+        # Row (m, f) = position model m under friction scenario f.
+        S = np.repeat(np.vstack(models), n_f, axis=0)
+        cost = frictions[:, None] + base_cost[None, :]
+        k = Tearsheet._equity_kernel(S, r, np.tile(cost, (len(models), 1)), days)
+        equity = k["equity"]
+        rolling_max = np.maximum.accumulate(equity, axis=1)
+        max_drawdown = ((equity - rolling_max) / rolling_max).min(axis=1) * 100
+        turnover = k["trades_mask"]
+        traded = turnover.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_cost = np.where(
+                traded > 0, (turnover * np.tile(cost, (len(models), 1))).sum(axis=1) / traded * 1e4, 0.0
+            )
+
+        rows = []
+        for i in range(len(S)):
+            threshold = entry_thresholds[i // n_f]
+            rows.append({
+                "entry_threshold":  float("nan") if threshold is None else float(threshold),
+                "friction":         float(frictions[i % n_f]),
+                "Total Return (%)": round(float(k["total_return"][i]), 2),
+                "CAGR (%)":         round(float(k["cagr"][i]), 2),
+                "Sharpe Ratio":     round(float(k["sharpe"][i]), 2),
+                "Max Drawdown (%)": round(float(max_drawdown[i]), 2),
+                "Trades":           int((turnover[i] > 0).sum()),
+                "Avg Cost (bps)":   round(float(avg_cost[i]), 2),
+            })
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def high_low_spread(df: pd.DataFrame, window: int = 20) -> pd.Series:
+        """
+        Corwin-Schultz (2012) bid-ask spread estimate from daily highs and lows.
+
+        Compares the high/low range of two consecutive bars with that of the
+        pair combined: volatility scales with the horizon, the spread does not.
+        Negative two-bar estimates are set to zero before the trailing
+        ``window``-bar mean.
+
+        Returns:
+            Spread as a fraction of price, indexed like ``df``.
+        """
+        high = df['high'].astype(float)
+        low = df['low'].astype(float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            hl = np.log(high / low) ** 2
+            beta = hl + hl.shift(1)
+            gamma = np.log(
+                np.maximum(high, high.shift(1)) / np.minimum(low, low.shift(1))
+            ) ** 2
+            k = 3 - 2 * np.sqrt(2)
+            alpha = (np.sqrt(2 * beta) - np.sqrt(beta)) / k - np.sqrt(gamma / k)
+            spread = 2 * (np.exp(alpha) - 1) / (1 + np.exp(alpha))
+        return spread.clip(lower=0.0).rolling(window, min_periods=1).mean()
+
+    @staticmethod
+    def _execution_costs(
+        df: pd.DataFrame,
+        index: pd.Index,
+        spread: Union[float, pd.Series, str],
+        slippage: float,
+        volume_window: int,
+    ) -> np.ndarray:
+        """Per-bar spread and slippage cost of trading at bar T+1, aligned to ``index``."""
+        if isinstance(spread, str):
+            if spread not in SPREAD_MODELS:
+                raise ValueError(f"spread must be a number, a Series or one of {SPREAD_MODELS}, got {spread!r}")
+            spread = Tearsheet.high_low_spread(df)
+        if isinstance(spread, pd.Series):
+            half_spread = spread.reindex(df.index).ffill().fillna(0.0).to_numpy(dtype=float) / 2
+        else:
+            half_spread = np.full(len(df), float(spread) / 2)
+
+        cost = half_spread
+        if slippage and 'volume' in df.columns:
+            volume = df['volume'].astype(float)
+            adv = volume.rolling(volume_window, min_periods=1).mean()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = (adv / volume).to_numpy()
+            ratio = np.where(np.isfinite(ratio), np.minimum(ratio, 100.0), 1.0)
+            cost = cost + slippage * np.sqrt(ratio)
+
+        # A signal at bar T trades at T+1; the last bar has no T+1 and keeps its own.
+        executed = np.append(cost[1:], cost[-1:])
+        locs = df.index.get_indexer(index)
+        return np.nan_to_num(np.where(locs >= 0, executed[np.maximum(locs, 0)], np.nan), nan=0.0)
+
     @staticmethod
     def _build_trade_log(position: pd.Series, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -207,6 +706,10 @@ class Tearsheet:
         position first appears to the bar where it ends.  Entry and exit prices
         use bar opens (T+1 execution model).
 
+        Runs are found in one pass by run-length encoding the position: every
+        bar where the value changes starts a run, non-zero runs are trades, and
+        each trade's exit signal is the start of the next run.
+
         Args:
             position: Discrete positions series (-1.0, 0.0, 1.0).
             df: OHLCV DataFrame aligned to the same index as position.
@@ -215,75 +718,87 @@ class Tearsheet:
             DataFrame with columns: entry_date, exit_date, direction,
             entry_price, exit_price, return_pct, bars_held.
         """
-        empty = pd.DataFrame(columns=[
-            'entry_date', 'exit_date', 'direction',
-            'entry_price', 'exit_price', 'return_pct', 'bars_held',
-        ])
+        empty = pd.DataFrame(columns=TRADE_LOG_COLUMNS)
 
         if position.empty or (position == 0).all():
             return empty
 
-        opens = df['open']
-        closes = df['close']
-
-        # Every bar where the position value changes (entry, exit, or flip).
-        pos_change = position.diff().fillna(position.iloc[0]) != 0
-        # Entry bars: position changes AND the new value is non-zero.
-        entry_bars = position.index[pos_change & (position != 0)].tolist()
+        pos = position.to_numpy(dtype=float)
+        opens = df['open'].to_numpy(dtype=float)
+        n_bars = len(opens)
+        last_close = float(df['close'].iloc[-1])
 
-        if not entry_bars:
+        # Run starts: first bar (if in a position) and every change of value.
+        starts = np.flatnonzero(np.r_[pos[0] != 0, pos[1:] != pos[:-1]])
+        entries = starts[pos[starts] != 0]
+        if entries.size == 0:
             return empty
 
-        trades = []
-        for entry_bar in entry_bars:
-            direction = int(position.loc[entry_bar])
-
-            # Subsequent bars where the position changes again (exit or flip).
-            subsequent = position.index[
-                (position.index > entry_bar) & (position.diff().fillna(0) != 0)
-            ]
-            exit_signal_bar = subsequent[0] if len(subsequent) > 0 else None
-
-            # Entry price = open of the bar after the signal bar (T+1 execution).
-            entry_loc = opens.index.get_loc(entry_bar)
-            if entry_loc + 1 >= len(opens):
-                continue  # signal fires on the last bar — no room to enter
-            actual_entry_date = opens.index[entry_loc + 1]
-            entry_price = float(opens.iloc[entry_loc + 1])
-
-            # Exit price = open of the bar after the exit-signal bar, or last close.
-            if exit_signal_bar is not None:
-                exit_loc = opens.index.get_loc(exit_signal_bar)
-                if exit_loc + 1 < len(opens):
-                    actual_exit_date = opens.index[exit_loc + 1]
-                    exit_price = float(opens.iloc[exit_loc + 1])
-                else:
-                    actual_exit_date = opens.index[-1]
-                    exit_price = float(closes.iloc[-1])
-            else:
-                actual_exit_date = opens.index[-1]
-                exit_price = float(closes.iloc[-1])
-
-            if entry_price <= 0:
-                continue
+        # Map signal bars onto df rows (position may be a slice of df).
+        locs = df.index.get_indexer(position.index)
+        entry_sig = locs[entries]
+        # The next run start after each entry is its exit signal (exit or flip).
+        nxt = np.searchsorted(starts, entries, side='right')
+        has_exit = nxt < len(starts)
+        exit_sig = np.where(has_exit, locs[starts[np.minimum(nxt, len(starts) - 1)]], -1)
+
+        # Entry = open of the bar after the signal bar (T+1 execution).
+        keep = (entry_sig >= 0) & (entry_sig + 1 < n_bars)
+        entry_loc = entry_sig + 1
+        # Exit = open of the bar after the exit-signal bar, or the last close.
+        exit_at_open = has_exit & (exit_sig >= 0) & (exit_sig + 1 < n_bars)
+        exit_loc = np.where(exit_at_open, exit_sig + 1, n_bars - 1)
+
+        entry_loc, exit_loc, exit_at_open = entry_loc[keep], exit_loc[keep], exit_at_open[keep]
+        direction = pos[entries[keep]]
+        entry_price = opens[entry_loc]
+        exit_price = np.where(exit_at_open, opens[np.minimum(exit_loc, n_bars - 1)], last_close)
+
+        valid = entry_price > 0
+        if not valid.any():
+            return empty
+        entry_loc, exit_loc, direction = entry_loc[valid], exit_loc[valid], direction[valid]
+        entry_price, exit_price = entry_price[valid], exit_price[valid]
+
+        return_pct = (exit_price - entry_price) / entry_price * direction * 100
+        # Built-in round() (not np.round) keeps values bit-identical to the
+        # per-trade formatting callers have always received.
+        dates = df.index
+        return pd.DataFrame({
+            'entry_date':  dates[entry_loc],
+            'exit_date':   dates[exit_loc],
+            'direction':   np.where(direction == 1, 'LONG', 'SHORT').astype(object),
+            'entry_price': [round(v, 4) for v in entry_price.tolist()],
+            'exit_price':  [round(v, 4) for v in exit_price.tolist()],
+            'return_pct':  [round(v, 4) for v in return_pct.tolist()],
+            'bars_held':   np.maximum(1, exit_loc - entry_loc).astype(np.int64),
+        })
 
-            return_pct = (exit_price - entry_price) / entry_price * direction * 100
+    @staticmethod
+    def trade_log_columns(trade_log: pd.DataFrame) -> Dict[str, list]:
+        """
+        Converts a trade log to a compact, JSON-ready columnar dict.
 
-            entry_iloc = opens.index.get_loc(actual_entry_date)
-            exit_iloc = opens.index.get_loc(actual_exit_date)
-            bars_held = max(1, exit_iloc - entry_iloc)
+        One list per column (dates as strings) instead of one dict per trade,
+        so long logs serialise without repeating every key for every row.
 
-            trades.append({
-                'entry_date':   actual_entry_date,
-                'exit_date':    actual_exit_date,
-                'direction':    'LONG' if direction == 1 else 'SHORT',
-                'entry_price':  round(entry_price, 4),
-                'exit_price':   round(exit_price, 4),
-                'return_pct':   round(return_pct, 4),
-                'bars_held':    bars_held,
-            })
+        Args:
+            trade_log: DataFrame returned by ``_build_trade_log``.
 
-        return pd.DataFrame(trades) if trades else empty
+        Returns:
+            Dict mapping each of ``TRADE_LOG_COLUMNS`` to a list of values.
+            Every list is empty when there are no trades.
+        """
+        if trade_log.empty:
+            return {col: [] for col in TRADE_LOG_COLUMNS}
+        out = {}
+        for col in TRADE_LOG_COLUMNS:
+            values = trade_log[col]
+            if col in ('entry_date', 'exit_date'):
+                out[col] = values.astype(str).tolist()
+            else:
+                out[col] = values.tolist()
+        return out
 
     @staticmethod
     def print_summary(metrics: Dict[str, Any]):
@@ -302,6 +817,21 @@ class Tearsheet:
 # LocalBacktester
 # ---------------------------------------------------------------------------
 
+# Imported strategy classes per strategy directory, tagged with the
+# (mtime_ns, size) of model.py and context.py they were loaded from. Editing
+# either file changes the stamp and forces a fresh import.
+_strategy_class_cache: Dict[str, Tuple[Tuple, type, Optional[type]]] = {}
+_strategy_class_lock = threading.Lock()
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 class LocalBacktester:
     """
     Handles the local execution and testing of user-defined strategy models.
@@ -331,10 +861,28 @@ class LocalBacktester:
             logger.error(f"Failed to load manifest at {self.manifest_path}: {e}", exc_info=True)
             raise StrategyError(f"Missing or invalid manifest in {self.strategy_dir}")
 
+        # Per-feature cost summary of the most recent run / batch / sweep
+        # (see FeatureProfiler.summary); surfaced in result payloads.
+        self.feature_profile: Dict[str, Any] = {}
+
+        # Window layout of the most recent run_walk_forward call.
+        self.walk_forward_windows: pd.DataFrame = pd.DataFrame()
+
+        # run() memo: purged, normalized feature frames keyed by data
+        # fingerprint and feature config, evicted least-recently-used first
+        # once they exceed config.FEATURE_CACHE_MB.
+        self._feature_cache: "OrderedDict[Tuple[str, str], Tuple[pd.DataFrame, Any, Dict[str, Any], int]]" = OrderedDict()
+        self._feature_cache_lock = threading.Lock()
+
     def _load_user_model_and_context(self) -> Tuple[type, Optional[type]]:
         """
         Dynamically imports the user-defined model and context classes.
 
+        The classes are cached per strategy directory for as long as
+        ``model.py`` and ``context.py`` are unchanged on disk (mtime and size),
+        so repeated runs in one process import the strategy once. Edits to
+        other modules the strategy imports are not tracked.
+
         Returns:
             Tuple[type, Optional[type]]:
                 - model_class (type): The uninstantiated user SignalModel subclass.
@@ -349,6 +897,12 @@ class LocalBacktester:
         if not os.path.exists(model_path):
             raise StrategyError(f"model.py not found in {self.strategy_dir}")
 
+        stamp = (_file_stamp(model_path), _file_stamp(context_module_path))
+        with _strategy_class_lock:
+            cached = _strategy_class_cache.get(self.strategy_dir)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+
         try:
             # Import context first
             context_module_name = f"user_context_{os.path.basename(self.strategy_dir)}"
@@ -379,6 +933,8 @@ class LocalBacktester:
             for obj_name in dir(module):
                 obj = getattr(module, obj_name)
                 if isinstance(obj, type) and issubclass(obj, SignalModel) and obj is not SignalModel:
+                    with _strategy_class_lock:
+                        _strategy_class_cache[self.strategy_dir] = (stamp, obj, context_class)
                     return obj, context_class
 
             raise StrategyError(f"No valid SignalModel subclass found in {model_path}")
@@ -433,14 +989,116 @@ class LocalBacktester:
         """
         if not self.manifest.get("regime_aware", False):
             return None
+        return self._fit_regime_context(df, self.manifest.get("regime_detector", "vix_adx"))
+
+    @staticmethod
+    def _fit_regime_context(df: pd.DataFrame, detector_name: str, fit_bars: Optional[int] = None):
+        """Runs the regime orchestrator on df, fitting on its first ``fit_bars`` rows.
+
+        Returns None if regime detection fails.
+        """
         try:
             from .regime.orchestrator import RegimeOrchestrator
-            detector_name = self.manifest.get("regime_detector", "vix_adx")
-            return RegimeOrchestrator().build_context(df, detector_name)
+            return RegimeOrchestrator().build_context(df, detector_name, fit_bars=fit_bars)
         except Exception as e:
             logger.warning(f"Regime detection failed, continuing without: {e}")
             return None
 
+    def _feature_cache_key(self, raw_data: pd.DataFrame) -> Tuple[str, str]:
+        """Fingerprints raw_data (values, index, columns) and the feature config."""
+        data_hash = hashlib.sha1(
+            pd.util.hash_pandas_object(raw_data, index=True).to_numpy().tobytes()
+        )
+        data_hash.update(repr(list(raw_data.columns)).encode())
+        config_key = json.dumps(
+            {
+                "features": self.manifest.get("features", []),
+                "dtype": self.manifest.get("dtype"),
+                "training": self.manifest.get("training", {}),
+                "regime_aware": self.manifest.get("regime_aware", False),
+                "regime_detector": self.manifest.get("regime_detector"),
+            },
+            sort_keys=True, default=str,
+        )
+        return data_hash.hexdigest(), config_key
+
+    def _record_profile(self, profiler: FeatureProfiler) -> None:
+        """Stores the profiler's summary in ``feature_profile`` and logs its report."""
+        self.feature_profile = profiler.summary()
+        profiler.log_report()
+
+    def _compute_features(self, raw_data: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+        """Runs the manifest's feature pipeline over ``raw_data`` under a fresh profiler.
+
+        Returns:
+            Tuple[pd.DataFrame, int]: The full feature frame and its warmup length.
+        """
+        profiler = FeatureProfiler()
+        df_full, l_max = compute_all_features(
+            raw_data, self.manifest.get('features', []), dtype=self.manifest.get("dtype"),
+            profiler=profiler,
+        )
+        self._record_profile(profiler)
+        return df_full, l_max
+
+    def _prepare_features(self, raw_data: pd.DataFrame) -> Tuple[pd.DataFrame, Any]:
+        """Computes the purged, normalized feature frame and regime context for run().
+
+        Results are memoized (see ``config.FEATURE_CACHE_MB``), so runs that
+        only change hyperparameters reuse the frame. Callers get a shallow
+        copy: under copy-on-write a model that adds or overwrites columns
+        cannot alter the cached frame.
+
+        Returns:
+            Tuple of ``(df_clean, regime_context)``.
+        """
+        budget = config.FEATURE_CACHE_MB * 1024 * 1024
+        key = self._feature_cache_key(raw_data) if budget > 0 else None
+        if key is not None:
+            with self._feature_cache_lock:
+                hit = self._feature_cache.get(key)
+                if hit is not None:
+                    self._feature_cache.move_to_end(key)
+            if hit is not None:
+                df_clean, regime_context, self.feature_profile, _ = hit
+                return df_clean.copy(deep=False), regime_context
+
+        features_config = self.manifest.get('features', [])
+
+        # Universal Feature Calculation
+        df_full, l_max = self._compute_features(raw_data)
+
+        # Universal Warmup Purge (Protects both ML and Rule-Based from NaN lookbacks).
+        # No .copy(): under pandas copy-on-write the slice shares df_full's
+        # buffers and only the columns later written to are duplicated.
+        df_clean = df_full.iloc[l_max:]
+
+        # Match any price normalization applied during training
+        training_cfg = self.manifest.get("training", {})
+        price_norm = training_cfg.get("price_normalization", "none")
+        if price_norm != "none":
+            df_clean = MLBridge.apply_price_normalization(
+                df_clean,
+                price_norm,
+                ffd_d=float(training_cfg.get("ffd_d", 0.4)),
+                ffd_window=int(training_cfg.get("ffd_window", 10)),
+            )
+
+        feature_ids = [f['id'] for f in features_config]
+        self._audit_nans(df_clean, feature_ids)
+
+        regime_context = self._build_regime_context(df_clean)
+
+        if key is not None:
+            nbytes = int(df_clean.memory_usage(index=True).sum())
+            with self._feature_cache_lock:
+                self._feature_cache[key] = (df_clean, regime_context, self.feature_profile, nbytes)
+                # The newest frame is always kept, even when it alone exceeds the budget.
+                while (len(self._feature_cache) > 1
+                       and sum(e[3] for e in self._feature_cache.values()) > budget):
+                    self._feature_cache.popitem(last=False)
+        return df_clean.copy(deep=False), regime_context
+
     def run(
         self,
         raw_data: pd.DataFrame,
@@ -458,6 +1116,10 @@ class LocalBacktester:
         ``model.train()`` on the same data used for signal generation). This
         is the standard BACKTEST path.
 
+        The feature frame is memoized per data fingerprint, so repeated runs
+        on the same data that only change ``params`` go straight to
+        ``train()`` / ``generate_signals()``.
+
         Args:
             raw_data: The raw OHLCV market data with a ``DatetimeIndex``.
             params: Strategy hyperparameters. Defaults to the values in
@@ -476,29 +1138,7 @@ class LocalBacktester:
                 computation or modeling.
         """
         try:
-            features_config = self.manifest.get('features', [])
-
-            # Universal Feature Calculation
-            df_full, l_max = compute_all_features(raw_data, features_config)
-
-            # Universal Warmup Purge (Protects both ML and Rule-Based from NaN lookbacks)
-            df_clean = df_full.iloc[l_max:].copy()
-
-            # Match any price normalization applied during training
-            training_cfg = self.manifest.get("training", {})
-            price_norm = training_cfg.get("price_normalization", "none")
-            if price_norm != "none":
-                df_clean = MLBridge.apply_price_normalization(
-                    df_clean,
-                    price_norm,
-                    ffd_d=float(training_cfg.get("ffd_d", 0.4)),
-                    ffd_window=int(training_cfg.get("ffd_window", 10)),
-                )
-
-            feature_ids = [f['id'] for f in features_config]
-            self._audit_nans(df_clean, feature_ids)
-
-            regime_context = self._build_regime_context(df_clean)
+            df_clean, regime_context = self._prepare_features(raw_data)
 
             # Component Initialization
             model_class, context_class = self._load_user_model_and_context()
@@ -532,7 +1172,7 @@ class LocalBacktester:
                 # ML strategy without pre-trained artifacts: temporal split
                 # to prevent training and predicting on the same data.
                 split_point = int(len(df_clean) * 0.8)
-                df_train = df_clean.iloc[:split_point].copy()
+                df_train = df_clean.iloc[:split_point]
                 df_eval = df_clean  # generate signals on full range
 
                 feature_cols = [
@@ -542,11 +1182,12 @@ class LocalBacktester:
 
                 # Fit scaler on train split only
                 df_train_scaled, scaler = MLBridge.prepare_training_matrix(
-                    df_train, feature_cols, l_max=0
+                    df_train, feature_cols, l_max=0, dtype=self.manifest.get("dtype")
                 )
 
                 artifacts = model.train(df_train_scaled, context, hyperparams)
                 artifacts["system_scaler"] = scaler
+                artifacts["dtype"] = self.manifest.get("dtype")
 
                 # Apply saved scaler to full dataset for signal generation
                 df_eval = MLBridge.prepare_inference_matrix(
@@ -593,6 +1234,10 @@ class LocalBacktester:
 
         Returns:
             List[pd.Series]: A list of signal series, one for each parameter permutation.
+            Rank them with ``Tearsheet.calculate_metrics_batch(raw_data,
+            pd.concat(results, axis=1, ignore_index=True), metrics_level="fitness")``.
+            For large grids use ``run_sweep``, which scores as it goes and
+            keeps only the best permutations.
         """
         try:
             if param_bounds is None:
@@ -602,10 +1247,10 @@ class LocalBacktester:
                 return [self.run(raw_data)]
 
             features_config = self.manifest.get('features', [])
-            df_full, l_max = compute_all_features(raw_data, features_config)
+            df_full, l_max = self._compute_features(raw_data)
 
             # Apply Universal Warmup Purge
-            df_clean = df_full.iloc[l_max:].copy()
+            df_clean = df_full.iloc[l_max:]
 
             feature_ids = [f['id'] for f in features_config]
             self._audit_nans(df_clean, feature_ids)
@@ -635,32 +1280,638 @@ class LocalBacktester:
             logger.error(f"Grid search failed: {e}", exc_info=True)
             raise StrategyError(f"Grid search failed: {e}")
 
+    def run_sweep(
+        self,
+        raw_data: pd.DataFrame,
+        param_bounds: Optional[Dict[str, List[Any]]] = None,
+        top_k: int = 10,
+        rank_by: str = "Sharpe Ratio",
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        successive_halving: bool = False,
+        halving_eta: int = 3,
+        min_fraction: float = 0.25,
+        friction: float = 0.001,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Scores every parameter permutation and keeps only the best ones.
+
+        Unlike ``run_grid_search``, features are computed once and shared
+        read-only with every evaluation, each permutation is scored with the
+        ``fitness`` Tearsheet level, and only the ``top_k`` signal series are
+        held in memory. Permutations are independent, so they can be spread
+        over a thread or process pool (see ``run_batch``). Process workers
+        receive the feature matrix once, through the pool initializer.
+
+        With ``successive_halving`` every permutation is first evaluated on the
+        earliest ``min_fraction`` of the history. Only the best ``1 / halving_eta``
+        (never fewer than ``top_k``) advance to a history ``halving_eta`` times
+        longer, until the survivors run on the full history.
+
+        Args:
+            raw_data: The raw OHLCV market data.
+            param_bounds: Lists of values per parameter. Defaults to the bounds
+                in ``manifest.json``.
+            top_k: Number of full-history signal series to return.
+            rank_by: Fitness metric to rank by: ``"Sharpe Ratio"``,
+                ``"Total Return (%)"`` or ``"CAGR (%)"``.
+            executor: ``"serial"``, ``"threads"`` or ``"processes"``.
+                Defaults to ``config.BATCH_EXECUTOR``.
+            max_workers: Pool size (defaults as in ``run_batch``).
+            successive_halving: Prune weak permutations on shorter histories.
+            halving_eta: Pruning factor between rungs (>= 2).
+            min_fraction: History fraction used by the first rung.
+            friction: Transaction cost passed to the Tearsheet.
+            on_progress: Called as ``on_progress(done, total)`` after every
+                evaluation, ``total`` counting all rungs.
+
+        Returns:
+            Dict with:
+              - ``leaderboard`` (pd.DataFrame): one row per permutation with its
+                parameters, the fitness metrics from the last rung it reached
+                and ``bars`` (history length of that rung), best first.
+              - ``top_signals`` (List[pd.Series]): full-history signals of the
+                best ``top_k`` permutations, best first, named as in
+                ``run_grid_search``.
+              - ``n_permutations`` (int) and ``n_evaluations`` (int).
+
+        Raises:
+            ValueError: If ``rank_by``, ``executor`` or the halving settings
+                are invalid.
+            StrategyError: If features or the strategy cannot be loaded.
+        """
+        if rank_by not in SWEEP_RANK_METRICS:
+            raise ValueError(f"rank_by must be one of {SWEEP_RANK_METRICS}, got {rank_by!r}")
+        if successive_halving and (halving_eta < 2 or not 0 < min_fraction <= 1):
+            raise ValueError("successive halving needs halving_eta >= 2 and 0 < min_fraction <= 1")
+        top_k = max(1, int(top_k))
+
+        if param_bounds is None:
+            param_bounds = self.manifest.get('parameter_bounds', {})
+        if param_bounds:
+            keys = list(param_bounds.keys())
+            permutations = [dict(zip(keys, v)) for v in itertools.product(*param_bounds.values())]
+        else:
+            # Nothing to sweep: score the manifest defaults.
+            permutations = [dict(self.manifest.get('hyperparameters', {}))]
+        executor, workers = self._resolve_executor(executor, max_workers, len(permutations))
+
+        try:
+            features_config = self.manifest.get('features', [])
+            df_full, l_max = self._compute_features(raw_data)
+            df_clean = df_full.iloc[l_max:]
+            self._audit_nans(df_clean, [f['id'] for f in features_config])
+            model_class, context_class = self._load_user_model_and_context()
+        except Exception as e:
+            logger.error(f"Sweep setup failed: {e}", exc_info=True)
+            raise StrategyError(f"Sweep setup failed: {e}")
+
+        # Rung history lengths, shortest first; the last rung is always full.
+        n_total = len(df_clean)
+        rungs = [n_total]
+        if successive_halving:
+            frac = min_fraction
+            rungs = []
+            while frac < 1.0:
+                rungs.append(max(int(n_total * frac), 2))
+                frac *= halving_eta
+            rungs.append(n_total)
+        sizes, n = [], len(permutations)
+        for _ in rungs:
+            sizes.append(n)
+            n = max(math.ceil(n / halving_eta), min(top_k, n))
+        total_evals = sum(sizes)
+
+        logger.info(
+            f"Starting sweep across {len(permutations)} permutations "
+            f"({total_evals} evaluations, {executor}, rungs={rungs})."
+        )
+        strategy_name = os.path.basename(self.strategy_dir)
+        comp_mode = self.manifest.get('compression_mode', 'clip')
+        last_scores: Dict[int, Dict[str, Any]] = {}
+        rank_score: Dict[int, float] = {}
+        top: List[Tuple[float, int, pd.Series]] = []   # min-heap of the best full-history runs
+        done = 0
+        pool = None
+        try:
+            if executor == "threads":
+                pool = ThreadPoolExecutor(max_workers=workers)
+            elif executor == "processes":
+                pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_sweep_worker,
+                    initargs=(self.strategy_dir, df_clean, raw_data, comp_mode, friction),
+                )
+
+            survivors = list(range(len(permutations)))
+            for rung, n_bars in enumerate(rungs):
+                final = rung == len(rungs) - 1
+                if pool is None:
+                    outcomes = (
+                        self._score_permutation(
+                            i, permutations[i], n_bars, final, model_class, context_class,
+                            df_clean, raw_data, comp_mode, friction,
+                        )
+                        for i in survivors
+                    )
+                elif executor == "threads":
+                    outcomes = as_completed([
+                        pool.submit(self._score_permutation, i, permutations[i], n_bars,
+                                    final, model_class, context_class, df_clean, raw_data,
+                                    comp_mode, friction)
+                        for i in survivors
+                    ])
+                else:
+                    outcomes = as_completed([
+                        pool.submit(_run_sweep_worker, i, permutations[i], n_bars, final)
+                        for i in survivors
+                    ])
+
+                for outcome in outcomes:
+                    i, metrics, signals = outcome if isinstance(outcome, tuple) else outcome.result()
+                    score = metrics.get(rank_by, float("nan"))
+                    rank_score[i] = score if math.isfinite(score) else -math.inf
+                    last_scores[i] = {**metrics, "bars": n_bars}
+                    if signals is not None:
+                        param_str = ", ".join(f"{k}={v}" for k, v in permutations[i].items())
+                        signals.name = f"{strategy_name} ({param_str})"
+                        # Ties go to the earlier permutation (larger -i wins).
+                        entry = (rank_score[i], -i, signals)
+                        if len(top) < top_k:
+                            heapq.heappush(top, entry)
+                        elif entry[:2] > top[0][:2]:
+                            heapq.heapreplace(top, entry)
+                    done += 1
+                    if on_progress is not None:
+                        on_progress(done, total_evals)
+
+                if not final:
+                    ranked = sorted(survivors, key=lambda i: (-rank_score[i], i))
+                    survivors = sorted(ranked[:sizes[rung + 1]])
+                    logger.info(
+                        f"Sweep rung {rung + 1}/{len(rungs)} ({n_bars} bars): "
+                        f"{len(survivors)} of {len(ranked)} permutations advance."
+                    )
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        # Best first: furthest rung reached, then score, then permutation order.
+        order = sorted(last_scores, key=lambda i: (-last_scores[i]["bars"], -rank_score[i], i))
+        leaderboard = pd.DataFrame(
+            [{**permutations[i], **last_scores[i]} for i in order],
+            index=pd.Index(order, name="permutation"),
+        )
+        top_signals = [signals for _, _, signals in sorted(top, key=lambda e: (-e[0], -e[1]))]
+        return {
+            "leaderboard":    leaderboard,
+            "top_signals":    top_signals,
+            "n_permutations": len(permutations),
+            "n_evaluations":  done,
+        }
+
+    def _score_permutation(
+        self,
+        index: int,
+        params: Dict[str, Any],
+        n_bars: int,
+        keep_signals: bool,
+        model_class: type,
+        context_class: Optional[type],
+        df_clean: pd.DataFrame,
+        raw_data: pd.DataFrame,
+        comp_mode: str,
+        friction: float,
+    ) -> Tuple[int, Dict[str, float], Optional[pd.Series]]:
+        """Trains and scores one permutation on the first ``n_bars`` of df_clean.
+
+        Returns:
+            Tuple of (index, fitness metrics, signals). Signals are None unless
+            ``keep_signals``. A failing permutation is logged and scores NaN.
+        """
+        try:
+            df = df_clean.iloc[:n_bars]
+            model = model_class()
+            context = context_class() if context_class else None
+            artifacts = model.train(df, context, params)
+            signals = SignalValidator.validate_and_compress(
+                model.generate_signals(df, context, params, artifacts), df.index, comp_mode
+            )
+            metrics = Tearsheet.calculate_metrics(
+                raw_data, signals, friction=friction, metrics_level="fitness"
+            )
+            return index, metrics, signals if keep_signals else None
+        except Exception as e:
+            logger.warning(f"Sweep permutation {params} failed: {e}")
+            return index, {k: float("nan") for k in SWEEP_RANK_METRICS}, None
+
+    def run_walk_forward(
+        self,
+        raw_data: pd.DataFrame,
+        params: Optional[Dict[str, Any]] = None,
+        train_bars: Optional[int] = None,
+        retrain_every: Optional[int] = None,
+        anchored: bool = True,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> pd.Series:
+        """Backtests with periodic retraining and returns only out-of-sample signals.
+
+        The history after the warmup purge is cut into test blocks of
+        ``retrain_every`` bars, starting after the first ``train_bars``. Each
+        block's model is trained on the bars before it and then generates that
+        block's signals:
+
+        - anchored: train on everything from the first bar to the block start.
+        - rolling: train on the ``train_bars`` immediately before the block.
+
+        ML strategies get a scaler fitted on each training window and are fit
+        through ``build_labels`` + ``fit_model``, as in ``LocalTrainer``.
+        Labels are built from the training window alone, so they never see
+        the block they are scored on. Signal generation sees the
+        ``train_bars`` preceding the block as history; only the block's own
+        signals are kept. Regime-aware strategies get a regime context built
+        per window: the detector is fitted on the bars before the block and
+        labels the block causally, so no block is classified by a detector
+        that has seen later bars.
+
+        Features are computed once (and memoized like ``run()``). Windows are
+        independent, so they can run on a thread or process pool; process
+        workers receive the feature matrix once, through the pool initializer.
+        The window layout of the last call is kept in ``walk_forward_windows``.
+
+        Args:
+            raw_data: The raw OHLCV market data with a ``DatetimeIndex``.
+            params: Strategy hyperparameters. Defaults to the manifest values.
+            train_bars: Rolling window length, or the first window's length
+                when anchored. Defaults to half of the purged history.
+            retrain_every: Bars per out-of-sample block (the retrain cadence).
+                Defaults to a tenth of the out-of-sample span.
+            anchored: Expanding (True) or rolling (False) training windows.
+            executor: ``"serial"``, ``"threads"`` or ``"processes"``. Defaults
+                to ``config.BATCH_EXECUTOR``.
+            max_workers: Pool size. Defaults to ``config.BATCH_MAX_WORKERS``,
+                else the CPU count, capped at the number of windows.
+            on_progress: Called as ``on_progress(done, total)`` after every
+                window.
+
+        Returns:
+            Stitched out-of-sample signals, bounded to [-1.0, 1.0], indexed by
+            the bars after the first training window. Pass to
+            ``Tearsheet.calculate_metrics`` with the raw data.
+
+        Raises:
+            ValueError: If the window sizes are not positive or leave no
+                out-of-sample bars, or on an unknown executor.
+            StrategyError: If feature computation or any window fails.
+        """
+        hyperparams = params if params is not None else self.manifest.get('hyperparameters', {})
+        try:
+            df_clean, _ = self._prepare_features(raw_data)
+            model_class, context_class = self._load_user_model_and_context()
+        except Exception as e:
+            logger.error(f"Walk-forward setup failed: {e}", exc_info=True)
+            raise StrategyError(f"Walk-forward setup failed: {e}")
+
+        n = len(df_clean)
+        train_bars = int(train_bars) if train_bars is not None else n // 2
+        if train_bars < 1 or train_bars >= n:
+            raise ValueError(
+                f"train_bars must be in [1, {n - 1}] for {n} bars, got {train_bars}"
+            )
+        if retrain_every is None:
+            retrain_every = math.ceil((n - train_bars) / 10)
+        retrain_every = int(retrain_every)
+        if retrain_every < 1:
+            raise ValueError(f"retrain_every must be positive, got {retrain_every}")
+
+        # (train_start, test_start, test_end) positions into df_clean
+        windows = []
+        for test_lo in range(train_bars, n, retrain_every):
+            train_lo = 0 if anchored else test_lo - train_bars
+            windows.append((train_lo, test_lo, min(test_lo + retrain_every, n)))
+        index = df_clean.index
+        self.walk_forward_windows = pd.DataFrame(
+            [(index[a], index[b - 1], index[b], index[c - 1], b - a) for a, b, c in windows],
+            columns=["train_start", "train_end", "test_start", "test_end", "train_bars"],
+        )
+
+        is_ml = self.manifest.get("is_ml", False)
+        feature_cols = [
+            c for c in df_clean.columns
+            if c.lower() not in {"open", "high", "low", "close", "volume"}
+        ]
+        if is_ml:
+            # FFD is causal, so the non-stationary columns are transformed once
+            # on the whole frame rather than per window.
+            features_config = self.manifest.get('features', [])
+            ffd_columns = [
+                c for c in MLBridge.collect_non_stationary_columns(features_config)
+                if c in df_clean.columns
+            ]
+            if ffd_columns:
+                training_cfg = self.manifest.get("training", {})
+                df_clean = MLBridge.apply_ffd_to_dataframe(
+                    df_clean, ffd_columns,
+                    d=float(training_cfg.get("ffd_d", 0.4)),
+                    window=int(training_cfg.get("ffd_window", 10)),
+                )
+
+        regime_detector = (
+            self.manifest.get("regime_detector", "vix_adx")
+            if self.manifest.get("regime_aware", False) else None
+        )
+        executor, workers = self._resolve_executor(executor, max_workers, len(windows))
+        logger.info(
+            f"Walk-forward: {len(windows)} windows "
+            f"({'anchored' if anchored else 'rolling'}, train={train_bars}, "
+            f"retrain every {retrain_every} bars, {executor})."
+        )
+        shared = (df_clean, hyperparams, feature_cols, is_ml, train_bars,
+                  self.manifest.get('compression_mode', 'clip'),
+                  regime_detector, self.manifest.get("dtype"))
+
+        blocks: List[Optional[pd.Series]] = [None] * len(windows)
+        done = 0
+        pool = None
+        try:
+            if executor == "threads":
+                pool = ThreadPoolExecutor(max_workers=workers)
+                futures = {
+                    pool.submit(self._walk_forward_window, w, model_class, context_class, *shared): i
+                    for i, w in enumerate(windows)
+                }
+            elif executor == "processes":
+                pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_walk_forward_worker,
+                    initargs=(self.strategy_dir, shared),
+                )
+                futures = {pool.submit(_run_walk_forward_worker, w): i for i, w in enumerate(windows)}
+
+            outcomes = (
+                ((i, self._walk_forward_window(w, model_class, context_class, *shared))
+                 for i, w in enumerate(windows))
+                if pool is None
+                else ((futures[f], f.result()) for f in as_completed(futures))
+            )
+            for i, block in outcomes:
+                blocks[i] = block
+                done += 1
+                if on_progress is not None:
+                    on_progress(done, len(windows))
+        except Exception as e:
+            logger.error(f"Walk-forward failed: {e}", exc_info=True)
+            raise StrategyError(f"Walk-forward failed: {e}")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        return pd.concat(blocks)
+
+    @staticmethod
+    def _walk_forward_window(
+        window: Tuple[int, int, int],
+        model_class: type,
+        context_class: Optional[type],
+        df_clean: pd.DataFrame,
+        hyperparams: Dict[str, Any],
+        feature_cols: List[str],
+        is_ml: bool,
+        history_bars: int,
+        comp_mode: str,
+        regime_detector: Optional[str],
+        dtype: Optional[str],
+    ) -> pd.Series:
+        """Trains on one walk-forward window and returns its test block's signals."""
+        train_lo, test_lo, test_hi = window
+        history_lo = max(0, test_lo - history_bars)
+        df_train = df_clean.iloc[train_lo:test_lo]
+        df_signal = df_clean.iloc[history_lo:test_hi]
+
+        regime_context = None
+        if regime_detector is not None:
+            # Nothing past the block is visible, and the detector is fitted
+            # on the bars before it.
+            frame_lo = min(train_lo, history_lo)
+            regime_context = LocalBacktester._fit_regime_context(
+                df_clean.iloc[frame_lo:test_hi], regime_detector, fit_bars=test_lo - frame_lo
+            )
+            if regime_context is not None:
+                regime_context = regime_context.subset(df_signal.index)
+
+        model = model_class()
+        context = context_class() if context_class else None
+        if is_ml:
+            scaler = None
+            if feature_cols:
+                df_train, scaler = MLBridge.prepare_training_matrix(
+                    df_train, feature_cols, l_max=0, dtype=dtype
+                )
+                df_signal = MLBridge.prepare_inference_matrix(
+                    df_signal, feature_cols, l_max=0,
+                    artifacts={"system_scaler": scaler, "dtype": dtype},
+                )
+            y = model.build_labels(df_train, context, hyperparams)
+            if not isinstance(y, pd.Series):
+                raise StrategyError("build_labels must return a pandas Series aligned to df.index")
+            mask = y.notna()
+            artifacts = model.fit_model(
+                df_train.loc[mask, feature_cols], y.loc[mask].to_numpy(), hyperparams
+            )
+            if not isinstance(artifacts, dict):
+                raise StrategyError("fit_model must return a dict of artifacts")
+            artifacts["feature_cols"] = feature_cols
+            if scaler is not None:
+                artifacts["system_scaler"] = scaler
+                artifacts["dtype"] = dtype
+        else:
+            artifacts = model.train(df_train, context, hyperparams)
+
+        raw_signals = LocalBacktester._call_generate_signals(
+            model, df_signal, context, hyperparams, artifacts, regime_context
+        )
+        signals = SignalValidator.validate_and_compress(raw_signals, df_signal.index, comp_mode)
+        return signals.iloc[test_lo - history_lo:]
+
+    def _run_batch_ticker(
+        self,
+        ticker: str,
+        df_raw: pd.DataFrame,
+        model_class: type,
+        context_class: Optional[type],
+        hyperparams: Dict[str, Any],
+        batch_artifacts: Optional[Dict[str, Any]],
+    ) -> Tuple[str, pd.Series, List[Dict[str, Any]]]:
+        """Runs one independent ticker of a batch: features, model, signals.
+
+        Failures are logged and yield an empty Series so one bad asset never
+        sinks the batch.
+
+        Returns:
+            Tuple of (ticker, signals, feature-profiler records).
+        """
+        logger.info(f"Processing batch execution for {ticker}")
+        features_config = self.manifest.get('features', [])
+        feature_ids = [f['id'] for f in features_config]
+        is_ml = self.manifest.get("is_ml", False)
+        training_cfg = self.manifest.get("training", {})
+        price_norm = training_cfg.get("price_normalization", "none")
+        ffd_d_cfg = float(training_cfg.get("ffd_d", 0.4))
+        ffd_window_cfg = int(training_cfg.get("ffd_window", 10))
+        profiler = FeatureProfiler()
+        try:
+            df_full, l_max = compute_all_features(
+                df_raw, features_config, dtype=self.manifest.get("dtype"),
+                profiler=profiler,
+            )
+
+            # Apply Universal Warmup Purge
+            df_clean = df_full.iloc[l_max:]
+
+            # Match any price normalization applied during training
+            if price_norm != "none":
+                df_clean = MLBridge.apply_price_normalization(
+                    df_clean, price_norm,
+                    ffd_d=ffd_d_cfg, ffd_window=ffd_window_cfg,
+                )
+
+            self._audit_nans(df_clean, feature_ids)
+
+            regime_context = self._build_regime_context(df_clean)
+
+            # Instantiate fresh objects to prevent state leakage between assets
+            model = model_class()
+            context = context_class() if context_class else None
+
+            if batch_artifacts is not None:
+                # Inference mode
+                if is_ml:
+                    feature_cols = [
+                        c for c in df_clean.columns
+                        if c.lower() not in {"open", "high", "low", "close", "volume"}
+                    ]
+                    df_clean = MLBridge.prepare_inference_matrix(
+                        df_clean, feature_cols, l_max=0,
+                        artifacts=batch_artifacts,
+                    )
+                signals = self._call_generate_signals(
+                    model, df_clean, context, hyperparams, batch_artifacts,
+                    regime_context,
+                )
+            elif is_ml:
+                # ML without artifacts: temporal split to avoid
+                # training and predicting on the same data.
+                feature_cols = [
+                    c for c in df_clean.columns
+                    if c.lower() not in {"open", "high", "low", "close", "volume"}
+                ]
+                split_point = int(len(df_clean) * 0.8)
+                df_train = df_clean.iloc[:split_point]
+
+                df_train_scaled, scaler = MLBridge.prepare_training_matrix(
+                    df_train, feature_cols, l_max=0,
+                    dtype=self.manifest.get("dtype"),
+                )
+                inline_artifacts = model.train(
+                    df_train_scaled, context, hyperparams
+                )
+                inline_artifacts["system_scaler"] = scaler
+                inline_artifacts["dtype"] = self.manifest.get("dtype")
+
+                df_eval = MLBridge.prepare_inference_matrix(
+                    df_clean, feature_cols, l_max=0,
+                    artifacts=inline_artifacts,
+                )
+                signals = self._call_generate_signals(
+                    model, df_eval, context, hyperparams, inline_artifacts,
+                    regime_context,
+                )
+            else:
+                # Rule-based: no data leakage risk
+                inline_artifacts = model.train(df_clean, context, hyperparams)
+                signals = self._call_generate_signals(
+                    model, df_clean, context, hyperparams, inline_artifacts,
+                    regime_context,
+                )
+
+            return ticker, signals, profiler.records
+        except Exception as e:
+            logger.error(f"Batch execution failed for {ticker}: {e}", exc_info=True)
+            return ticker, pd.Series(dtype=float), profiler.records
+
+    @staticmethod
+    def _resolve_executor(
+        executor: Optional[str], max_workers: Optional[int], n_tasks: int
+    ) -> Tuple[str, int]:
+        """Validates the batch executor and sizes its pool.
+
+        Defaults come from ``config.BATCH_EXECUTOR`` / ``BATCH_MAX_WORKERS``.
+        A single task (or a single worker) always runs serially.
+        """
+        executor = (executor or config.BATCH_EXECUTOR).lower()
+        if executor not in BATCH_EXECUTORS:
+            raise ValueError(
+                f"executor must be one of {BATCH_EXECUTORS}, got {executor!r}"
+            )
+        workers = max_workers or config.BATCH_MAX_WORKERS or os.cpu_count() or 1
+        workers = max(1, min(int(workers), n_tasks))
+        if workers == 1:
+            executor = "serial"
+        return executor, workers
+
     def run_batch(
         self,
         datasets: Dict[str, pd.DataFrame],
         params: Optional[Dict[str, Any]] = None,
         artifacts: Optional[Dict[str, Any]] = None,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        on_result: Optional[Callable[[str, pd.Series, int, int], None]] = None,
     ) -> Dict[str, pd.Series]:
         """Executes a batch of backtests across multiple assets efficiently.
 
         When ``artifacts`` are provided, each asset is run in inference mode
         (no inline training, saved scaler applied for ML strategies).
 
+        Outside the cross-sectional path every ticker is independent, so they
+        can be spread over a thread or process pool. With ``"processes"``
+        each worker imports the strategy once and then serves many tickers.
+        Cross-sectional strategies always run in-process (one model call
+        sees the whole universe).
+
         Args:
             datasets: A dictionary mapping ticker symbols to their respective
                 raw OHLCV DataFrames.
             params: Strategy hyperparameters.
             artifacts: Pre-trained artifacts to use for all assets. When
                 ``None``, each asset trains inline or loads from disk.
+            executor: ``"serial"``, ``"threads"`` or ``"processes"``.
+                Defaults to ``config.BATCH_EXECUTOR``.
+            max_workers: Pool size. Defaults to ``config.BATCH_MAX_WORKERS``,
+                else the CPU count (never more than the number of tickers).
+            on_result: Called as ``on_result(ticker, signals, done, total)``
+                as each ticker finishes, in completion order.
 
         Returns:
-            A dictionary mapping ticker symbols to their generated signals.
+            A dictionary mapping ticker symbols to their generated signals,
+            in the order of ``datasets``.
+
+        Raises:
+            ValueError: If ``executor`` is not one of BATCH_EXECUTORS.
+            StrategyError: If the strategy cannot be loaded or the batch fails.
         """
         results = {}
         if not datasets:
             logger.warning("No datasets provided for batch backtest.")
             return results
 
+        executor, workers = self._resolve_executor(executor, max_workers, len(datasets))
+
         try:
             # Load the user's classes ONCE for the entire batch
             model_class, context_class = self._load_user_model_and_context()
@@ -682,13 +1933,19 @@ class LocalBacktester:
             ffd_d_cfg = float(training_cfg.get("ffd_d", 0.4))
             ffd_window_cfg = int(training_cfg.get("ffd_window", 10))
 
+            # One profiler for the whole batch so costs aggregate per job
+            profiler = FeatureProfiler()
+
             if self.manifest.get("cross_sectional", False):
                 # Phase 1: compute features for all tickers simultaneously
                 processed: Dict[str, pd.DataFrame] = {}
                 for ticker, df_raw in datasets.items():
                     try:
-                        df_full, l_max = compute_all_features(df_raw, features_config)
-                        df_clean = df_full.iloc[l_max:].copy()
+                        df_full, l_max = compute_all_features(
+                            df_raw, features_config, dtype=self.manifest.get("dtype"),
+                            profiler=profiler,
+                        )
+                        df_clean = df_full.iloc[l_max:]
                         if price_norm != "none":
                             df_clean = MLBridge.apply_price_normalization(
                                 df_clean, price_norm,
@@ -699,6 +1956,8 @@ class LocalBacktester:
                     except Exception as e:
                         logger.error(f"Feature computation failed for {ticker}: {e}", exc_info=True)
 
+                self._record_profile(profiler)
+
                 if not processed:
                     return results
 
@@ -728,83 +1987,49 @@ class LocalBacktester:
                             results[ticker] = pd.Series(dtype=float)
                 return results
 
-            for ticker, df_raw in datasets.items():
-                logger.info(f"Processing batch execution for {ticker}")
-                try:
-                    df_full, l_max = compute_all_features(df_raw, features_config)
-
-                    # Apply Universal Warmup Purge
-                    df_clean = df_full.iloc[l_max:].copy()
-
-                    # Match any price normalization applied during training
-                    if price_norm != "none":
-                        df_clean = MLBridge.apply_price_normalization(
-                            df_clean, price_norm,
-                            ffd_d=ffd_d_cfg, ffd_window=ffd_window_cfg,
-                        )
-
-                    self._audit_nans(df_clean, feature_ids)
-
-                    regime_context = self._build_regime_context(df_clean)
+            run_kwargs = dict(hyperparams=hyperparams, batch_artifacts=batch_artifacts)
+            total = len(datasets)
 
-                    # Instantiate fresh objects to prevent state leakage between assets
-                    model = model_class()
-                    context = context_class() if context_class else None
+            def _collect(ticker: str, signals: pd.Series, records: List[Dict[str, Any]]):
+                results[ticker] = signals
+                profiler.records.extend(records)
+                if on_result is not None:
+                    on_result(ticker, signals, len(results), total)
 
-                    if batch_artifacts is not None:
-                        # Inference mode
-                        if is_ml:
-                            feature_cols = [
-                                c for c in df_clean.columns
-                                if c.lower() not in {"open", "high", "low", "close", "volume"}
-                            ]
-                            df_clean = MLBridge.prepare_inference_matrix(
-                                df_clean, feature_cols, l_max=0,
-                                artifacts=batch_artifacts,
-                            )
-                        signals = self._call_generate_signals(
-                            model, df_clean, context, hyperparams, batch_artifacts,
-                            regime_context,
-                        )
-                    elif is_ml:
-                        # ML without artifacts: temporal split to avoid
-                        # training and predicting on the same data.
-                        feature_cols = [
-                            c for c in df_clean.columns
-                            if c.lower() not in {"open", "high", "low", "close", "volume"}
-                        ]
-                        split_point = int(len(df_clean) * 0.8)
-                        df_train = df_clean.iloc[:split_point].copy()
-
-                        df_train_scaled, scaler = MLBridge.prepare_training_matrix(
-                            df_train, feature_cols, l_max=0
-                        )
-                        inline_artifacts = model.train(
-                            df_train_scaled, context, hyperparams
-                        )
-                        inline_artifacts["system_scaler"] = scaler
-
-                        df_eval = MLBridge.prepare_inference_matrix(
-                            df_clean, feature_cols, l_max=0,
-                            artifacts=inline_artifacts,
-                        )
-                        signals = self._call_generate_signals(
-                            model, df_eval, context, hyperparams, inline_artifacts,
-                            regime_context,
-                        )
-                    else:
-                        # Rule-based: no data leakage risk
-                        inline_artifacts = model.train(df_clean, context, hyperparams)
-                        signals = self._call_generate_signals(
-                            model, df_clean, context, hyperparams, inline_artifacts,
-                            regime_context,
-                        )
-
-                    results[ticker] = signals
-                except Exception as e:
-                    logger.error(f"Batch execution failed for {ticker}: {e}", exc_info=True)
-                    results[ticker] = pd.Series(dtype=float)
+            if executor == "serial":
+                for ticker, df_raw in datasets.items():
+                    _collect(*self._run_batch_ticker(
+                        ticker, df_raw, model_class, context_class, **run_kwargs
+                    ))
+            elif executor == "threads":
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(self._run_batch_ticker, ticker, df_raw,
+                                    model_class, context_class, **run_kwargs)
+                        for ticker, df_raw in datasets.items()
+                    ]
+                    for future in as_completed(futures):
+                        _collect(*future.result())
+            else:
+                # Each worker imports the strategy once (initializer) and
+                # then serves any number of tickers. Spawned, not forked: the
+                # GUI and the trends/options fetchers keep threads alive.
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_batch_worker,
+                    initargs=(self.strategy_dir, hyperparams, batch_artifacts),
+                ) as pool:
+                    futures = [
+                        pool.submit(_run_batch_worker, ticker, df_raw)
+                        for ticker, df_raw in datasets.items()
+                    ]
+                    for future in as_completed(futures):
+                        _collect(*future.result())
 
+            # Completion order varies with the executor; report in input order.
+            results = {ticker: results[ticker] for ticker in datasets if ticker in results}
+            self._record_profile(profiler)
             return results
 
         except Exception as e:
@@ -812,6 +2037,74 @@ class LocalBacktester:
             raise StrategyError(f"Batch run failed: {e}")
 
 
+# Executors accepted by LocalBacktester.run_batch and run_sweep.
+BATCH_EXECUTORS = ("serial", "threads", "processes")
+
+# Fitness-level metrics a sweep can rank by.
+SWEEP_RANK_METRICS = ("Sharpe Ratio", "Total Return (%)", "CAGR (%)")
+
+# Per-process state for run_batch(executor="processes"): the backtester and
+# the strategy classes are loaded once by the pool initializer.
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_batch_worker(strategy_dir: str, hyperparams: Dict[str, Any],
+                       batch_artifacts: Optional[Dict[str, Any]]) -> None:
+    backtester = LocalBacktester(strategy_dir)
+    model_class, context_class = backtester._load_user_model_and_context()
+    _worker_state.update(
+        backtester=backtester,
+        model_class=model_class,
+        context_class=context_class,
+        hyperparams=hyperparams,
+        batch_artifacts=batch_artifacts,
+    )
+
+
+def _run_batch_worker(ticker: str, df_raw: pd.DataFrame) -> Tuple[str, pd.Series, List[Dict[str, Any]]]:
+    state = _worker_state
+    return state["backtester"]._run_batch_ticker(
+        ticker, df_raw, state["model_class"], state["context_class"],
+        hyperparams=state["hyperparams"], batch_artifacts=state["batch_artifacts"],
+    )
+
+
+def _init_sweep_worker(strategy_dir: str, df_clean: pd.DataFrame, raw_data: pd.DataFrame,
+                       comp_mode: str, friction: float) -> None:
+    backtester = LocalBacktester(strategy_dir)
+    model_class, context_class = backtester._load_user_model_and_context()
+    _worker_state.update(
+        backtester=backtester,
+        model_class=model_class,
+        context_class=context_class,
+        df_clean=df_clean,
+        raw_data=raw_data,
+        comp_mode=comp_mode,
+        friction=friction,
+    )
+
+
+def _run_sweep_worker(index: int, params: Dict[str, Any], n_bars: int,
+                      keep_signals: bool) -> Tuple[int, Dict[str, float], Optional[pd.Series]]:
+    state = _worker_state
+    return state["backtester"]._score_permutation(
+        index, params, n_bars, keep_signals, state["model_class"], state["context_class"],
+        state["df_clean"], state["raw_data"], state["comp_mode"], state["friction"],
+    )
+
+
+def _init_walk_forward_worker(strategy_dir: str, shared: Tuple) -> None:
+    model_class, context_class = LocalBacktester(strategy_dir)._load_user_model_and_context()
+    _worker_state.update(model_class=model_class, context_class=context_class, shared=shared)
+
+
+def _run_walk_forward_worker(window: Tuple[int, int, int]) -> pd.Series:
+    state = _worker_state
+    return LocalBacktester._walk_forward_window(
+        window, state["model_class"], state["context_class"], *state["shared"]
+    )
+
+
 # ---------------------------------------------------------------------------
 # SignalValidator
 # ---------------------------------------------------------------------------
@@ -32,6 +32,26 @@ class Config:
     DATA_DIR = os.getenv("DATA_DIR", os.path.join(REPO_ROOT, "data"))
     DB_PATH = os.getenv("DB_PATH", os.path.join(DATA_DIR, "stocks.db"))
     LOG_DIR = os.getenv("LOG_DIR", os.path.join(ENGINE_ROOT, "logs"))
+
+    # Upper bound on memory held by the shared reference-series cache (SPY, VIX, ...)
+    REFERENCE_CACHE_MB = int(os.getenv("REFERENCE_CACHE_MB", 128))
+
+    # Budget for each LocalBacktester's memo of purged feature frames (0 disables it)
+    FEATURE_CACHE_MB = int(os.getenv("FEATURE_CACHE_MB", 256))
+
+    # Persisted Google Trends history and the minimum spacing between requests
+    TRENDS_DB_PATH = os.getenv("TRENDS_DB_PATH", os.path.join(DATA_DIR, "trends.db"))
+    TRENDS_MIN_INTERVAL = float(os.getenv("TRENDS_MIN_INTERVAL", 5.0))
+
+    # Daily options-chain summaries written by the snapshot recorder
+    OPTIONS_DB_PATH = os.getenv("OPTIONS_DB_PATH", os.path.join(DATA_DIR, "options.db"))
+
+    # How LocalBacktester.run_batch spreads independent tickers: serial | threads | processes
+    BATCH_EXECUTOR = os.getenv("BATCH_EXECUTOR", "serial")
+    BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", 0)) or None
+
+    # Optuna storage for hyperparameter studies (trials persist across runs)
+    OPTIMIZATION_DB_PATH = os.getenv("OPTIMIZATION_DB_PATH", os.path.join(DATA_DIR, "optimization.db"))
     
     @property
     def api_url(self):
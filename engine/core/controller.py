@@ -7,7 +7,6 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from pydantic import BaseModel, Field
 
-from .data_broker.data_broker import DataBroker
 from .workspace import WorkspaceManager
 from .backtester import LocalBacktester
 from .metrics import Tearsheet
@@ -43,6 +42,14 @@ class JobPayload(BaseModel):
     timeframe: Timeframe = Field(default_factory=Timeframe)
     mode: ExecutionMode
     multi_asset_mode: MultiAssetMode = MultiAssetMode.BATCH
+    # TRAIN only: run the Phase A hyperparameter search before training.
+    # None defers to the manifest's optimization.enabled flag.
+    optimize: Optional[bool] = None
+    n_trials: Optional[int] = None
+    # BACKTEST only: walk-forward retraining instead of a single backtest.
+    # Keys are LocalBacktester.run_walk_forward arguments (train_bars,
+    # retrain_every, anchored, executor, max_workers).
+    walk_forward: Optional[Dict[str, Any]] = None
 
 class SignalModel(ABC):
     """Interface for user-defined trading strategies.
@@ -149,6 +156,8 @@ class ApplicationController:
     
     def __init__(self, strategies_dir: str = config.STRATEGIES_FOLDER):
         self.strategies_dir = strategies_dir
+        # Imported here so `import engine` doesn't load yfinance/SQLAlchemy.
+        from .data_broker.data_broker import DataBroker
         self.broker = DataBroker()
 
     def execute_job(self, payload: Union[dict, JobPayload]) -> Any:
@@ -191,7 +200,8 @@ class ApplicationController:
                 interval, 
                 payload.timeframe.start, 
                 payload.timeframe.end, 
-                multi_asset_mode
+                multi_asset_mode,
+                walk_forward=payload.walk_forward,
             )
         
         elif mode == ExecutionMode.TRAIN:
@@ -215,9 +225,42 @@ class ApplicationController:
         else:
             raise ValidationError(f"Unsupported execution mode: {mode}")
 
+    def _strategy_warmup(self, strat_path: str, include_feature_ffd: bool = False) -> Dict[str, int]:
+        """Sizes the history a strategy needs ahead of the requested window.
+
+        Returns:
+            dict: ``warmup`` -- bars to fetch before ``start`` (declared feature
+            warmups plus rows dropped by price normalization, and by feature
+            FFD when ``include_feature_ffd``); ``signal_history`` -- the
+            manifest's optional count of post-warmup bars SIGNAL_ONLY mode
+            keeps (0 when unset, meaning the full range).
+        """
+        from .features.features import resolve_warmup
+        from .ml_bridge.orchestrator import MLBridge
+
+        manifest_path = os.path.join(strat_path, "manifest.json")
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            features = manifest.get("features", [])
+            warmup = resolve_warmup(features) + MLBridge.normalization_warmup(
+                manifest.get("training"), features if include_feature_ffd else None
+            )
+            signal_history = int(manifest.get("signal_history") or 0)
+        except Exception as e:
+            logger.warning(f"Could not resolve warmup for {strat_path}: {e}. Fetching the requested range only.")
+            return {"warmup": 0, "signal_history": 0}
+        return {"warmup": warmup, "signal_history": max(signal_history, 0)}
+
     def _handle_backtest(self, strat_path: str, assets: List[str], interval: str,
-                         start: Optional[str], end: Optional[str], multi_asset_mode: MultiAssetMode):
-        """Executes the backtesting pipeline using batch processing."""
+                         start: Optional[str], end: Optional[str], multi_asset_mode: MultiAssetMode,
+                         walk_forward: Optional[Dict[str, Any]] = None):
+        """Executes the backtesting pipeline using batch processing.
+
+        With ``walk_forward``, each ticker is instead backtested by
+        ``LocalBacktester.run_walk_forward`` and scored on its stitched
+        out-of-sample signals.
+        """
         if len(assets) > 1 and multi_asset_mode == MultiAssetMode.PORTFOLIO:
             raise NotImplementedError("API PORTFOLIO mode is not implemented; use the CLI/GUI portfolio path.")
 
@@ -230,11 +273,15 @@ class ApplicationController:
         except Exception:
             pass
 
-        # Fetch all data upfront
+        # Fetch all data upfront, including the bars the features need to warm up
+        # so the first backtested bar is `start` itself.
+        warmup = self._strategy_warmup(strat_path)["warmup"]
         datasets = {}
         for ticker in assets:
             logger.info(f"Fetching data for {ticker} ({interval})")
-            df_raw = self.broker.get_data(ticker, interval, _parse_dt(start), _parse_dt(end))
+            df_raw = self.broker.get_data(
+                ticker, interval, _parse_dt(start), _parse_dt(end), warmup_bars=warmup
+            )
 
             if df_raw.empty:
                 logger.warning(f"No data available for {ticker} in requested range.")
@@ -248,7 +295,16 @@ class ApplicationController:
         # Run the backtester once for the entire batch
         try:
             backtester = LocalBacktester(strat_path)
-            batch_signals = backtester.run_batch(datasets)
+            if walk_forward is not None:
+                batch_signals = {}
+                for ticker, df in datasets.items():
+                    try:
+                        batch_signals[ticker] = backtester.run_walk_forward(df, **walk_forward)
+                    except StrategyError as e:
+                        logger.error(f"Walk-forward failed for {ticker}: {e}")
+                        batch_signals[ticker] = pd.Series(dtype=float)
+            else:
+                batch_signals = backtester.run_batch(datasets)
 
             # Calculate metrics for each completed run
             for ticker, signals in batch_signals.items():
@@ -256,11 +312,11 @@ class ApplicationController:
                     all_metrics[ticker] = {"error": "Execution failed during batch run"}
                     continue
                     
-                metrics = Tearsheet.calculate_metrics(datasets[ticker], signals, n_trials=n_trials)
-                # Store a copy without bulky time-series objects for the CLI summary
-                scalar_metrics = {k: v for k, v in metrics.items()
-                                  if k not in ("equity_curve", "portfolio", "bh_portfolio", "trade_log")}
-                all_metrics[ticker] = scalar_metrics
+                # Only the scalars are reported, so skip the time-series objects.
+                metrics = Tearsheet.calculate_metrics(
+                    datasets[ticker], signals, n_trials=n_trials, metrics_level="standard"
+                )
+                all_metrics[ticker] = metrics
                 Tearsheet.print_summary(metrics)
                 
         except Exception as e:
@@ -292,13 +348,15 @@ class ApplicationController:
         except Exception:
             pass
 
-        # Fetch data for every requested ticker
+        # Fetch data for every requested ticker, plus the warmup bars
+        warmup = self._strategy_warmup(strat_path, include_feature_ffd=True)["warmup"]
         datasets: Dict[str, pd.DataFrame] = {}
         for ticker in assets:
             logger.info(f"Fetching data for {ticker} ({interval})")
             df = self.broker.get_data(
                 ticker, interval,
                 _parse_dt(timeframe.start), _parse_dt(timeframe.end),
+                warmup_bars=warmup,
             )
             if df.empty:
                 logger.warning(f"No data available for {ticker}; skipping.")
@@ -319,7 +377,27 @@ class ApplicationController:
             raise StrategyError(f"Could not load manifest for {strat_path}") from e
 
         optimal_params = manifest.get("hyperparameters", {})
-        logger.info(f"Using manifest hyperparameters: {optimal_params}")
+        optimization = None
+        run_search = payload.optimize
+        if run_search is None:
+            run_search = bool(manifest.get("optimization", {}).get("enabled", False))
+
+        if run_search:
+            # Phase A: search parameter_bounds on CPCV folds
+            from .optimization.optimizer_core import OptimizerCore
+            try:
+                optimization = OptimizerCore(strat_path).optimize(
+                    datasets, n_trials=payload.n_trials
+                )
+            except (StrategyError, ValidationError):
+                raise
+            except Exception as e:
+                logger.error(f"Hyperparameter search failed: {e}", exc_info=True)
+                raise StrategyError(f"Hyperparameter search failed: {e}") from e
+            optimal_params = optimization["best_params"]
+            logger.info(f"Using optimized hyperparameters: {optimal_params}")
+        else:
+            logger.info(f"Using manifest hyperparameters: {optimal_params}")
 
         # Train with proper data splitting and validation
         try:
@@ -332,6 +410,10 @@ class ApplicationController:
             else:
                 results = trainer.run(datasets, params=optimal_params)
             results["optimal_params"] = optimal_params
+            if optimization is not None:
+                results["optimization"] = {
+                    k: v for k, v in optimization.items() if k != "best_params"
+                }
             return results
         except Exception as e:
             logger.error(f"Training failed: {e}", exc_info=True)
@@ -344,18 +426,24 @@ class ApplicationController:
         if isinstance(assets, str):
             assets = [assets]
 
-        # Fetch all data upfront
+        # Fetch all data upfront. Strategies that declare ``signal_history``
+        # only need that many bars past the warmup, so the features are
+        # computed on the minimal tail instead of the whole history.
+        sizing = self._strategy_warmup(strat_path)
+        tail = sizing["warmup"] + sizing["signal_history"] + 1 if sizing["signal_history"] else None
         datasets = {}
         results = {}
         
         for ticker in assets:
             logger.info(f"Fetching data to generate signals for {ticker}")
-            df_raw = self.broker.get_data(ticker, interval, _parse_dt(start), _parse_dt(end))
+            df_raw = self.broker.get_data(
+                ticker, interval, _parse_dt(start), _parse_dt(end), warmup_bars=sizing["warmup"]
+            )
 
             if df_raw.empty:
                 results[ticker] = {"error": "No data found"}
                 continue
-            datasets[ticker] = df_raw
+            datasets[ticker] = df_raw.iloc[-tail:] if tail else df_raw
 
         if not datasets:
             logger.warning("No datasets available for signal generation.")
@@ -19,15 +19,26 @@ class DataBroker:
     def _normalize_interval(self, interval: str) -> str:
         return self._INTERVAL_ALIASES.get(interval, interval)
 
+    # Approximate bars per trading day, used to turn a warmup bar count into a
+    # calendar offset for intraday fetches.
+    _BARS_PER_DAY: dict = {
+        '1m': 390, '2m': 195, '5m': 78, '15m': 26, '30m': 13,
+        '60m': 7, '1h': 7, '90m': 5, '4h': 2,
+    }
+
     def _get_padding(self, start_date: datetime, interval: str, periods: int = 200) -> datetime:
-        """Calculates rough calendar padding to ensure indicator warm-up."""
-        if interval == '1d':
-            return start_date - timedelta(days=periods * 1.4)
-        elif interval in ('1wk', '1w'):
-            return start_date - timedelta(weeks=periods)
-        elif interval == '4h':
-            return start_date - timedelta(days=(periods / 2))
-        return start_date
+        """Calculates a conservative calendar start covering ``periods`` bars before ``start_date``.
+
+        Assumes 252 trading days a year plus a few days of slack for holidays,
+        so the padded range holds at least ``periods`` bars.
+        """
+        if periods <= 0:
+            return start_date
+        interval = self._normalize_interval(interval)
+        if interval == '1wk':
+            return start_date - timedelta(weeks=periods + 1)
+        trading_days = -(-periods // self._BARS_PER_DAY.get(interval, 1))
+        return start_date - timedelta(days=int(trading_days * 365 / 252) + 5)
 
     def _get_db_bounds(self, ticker: str, interval: str) -> Tuple[Optional[datetime], Optional[datetime]]:
         with Session(self.db.engine) as session:
@@ -139,7 +150,7 @@ class DataBroker:
                 logger.error(f"[{ticker}] DB insert failed: {e}", exc_info=True)
 
     def get_data(self, ticker: str, interval: str, start: Optional[datetime] = None,
-                 end: Optional[datetime] = None) -> pd.DataFrame:
+                 end: Optional[datetime] = None, warmup_bars: int = 0) -> pd.DataFrame:
         """
         Primary interface for the strategy engine and GUI.
 
@@ -158,6 +169,11 @@ class DataBroker:
 
         For intraday intervals `start` is clamped to Yahoo Finance's hard
         per-interval lookback limits.
+
+        ``warmup_bars`` prepends exactly that many stored bars before `start`
+        (fewer if the history is shorter), so feature warmups are satisfied
+        without computing on the rest of the history. Pass the strategy's
+        ``resolve_warmup`` figure.
         """
         interval = self._normalize_interval(interval)
 
@@ -171,13 +187,15 @@ class DataBroker:
         # Clamp intraday start dates to Yahoo Finance's hard per-interval limits
         max_lookback = self._YF_MAX_HISTORY.get(interval)
         if max_lookback is not None:
+            earliest_allowed = end - max_lookback
             if start is None:
-                start = end - max_lookback
+                start = earliest_allowed
             else:
-                earliest_allowed = end - max_lookback
-                if start < earliest_allowed:
-                    start = earliest_allowed
+                start = max(start, earliest_allowed)
             requested_start = start  # intraday: clamped start is the effective requested start
+            if warmup_bars > 0:
+                # Reach back far enough to store the warmup bars too.
+                start = max(self._get_padding(start, interval, warmup_bars), earliest_allowed)
         else:
             # Daily / weekly: always store full history in the DB,
             # but retain the original requested_start for filtering the query.
@@ -193,6 +211,7 @@ class DataBroker:
             )
             if not df.empty:
                 df.set_index('timestamp', inplace=True)
+                df = self._trim_warmup(df, requested_start, warmup_bars)
             return df
 
         db_min, db_max = self._get_db_bounds(ticker, interval)
@@ -242,7 +261,19 @@ class DataBroker:
                 OHLCV.interval == interval,
             ]
             if requested_start is not None:
-                where_clauses.append(OHLCV.timestamp >= requested_start)
+                lower = requested_start
+                if warmup_bars > 0:
+                    # Timestamp of the warmup_bars-th stored bar before start.
+                    lower = session.execute(
+                        select(OHLCV.timestamp)
+                        .where(OHLCV.ticker == ticker, OHLCV.interval == interval,
+                               OHLCV.timestamp < requested_start)
+                        .order_by(OHLCV.timestamp.desc())
+                        .offset(warmup_bars - 1)
+                        .limit(1)
+                    ).scalar()
+                if lower is not None:
+                    where_clauses.append(OHLCV.timestamp >= lower)
             if requested_end is not None:
                 where_clauses.append(OHLCV.timestamp <= requested_end)
 
@@ -253,3 +284,15 @@ class DataBroker:
                 df_final.index = pd.to_datetime(df_final.index)
 
         return df_final[['open', 'high', 'low', 'close', 'volume']]
+
+    @staticmethod
+    def _trim_warmup(df: pd.DataFrame, start: Optional[datetime], warmup_bars: int) -> pd.DataFrame:
+        """Keeps the bars from `start` onward plus ``warmup_bars`` bars before it."""
+        if start is None:
+            return df
+        start = pd.Timestamp(start)
+        tz = getattr(df.index, "tz", None)
+        if tz is not None and start.tz is None:
+            start = start.tz_localize(tz)
+        first = int(df.index.searchsorted(start))
+        return df.iloc[max(first - warmup_bars, 0):]
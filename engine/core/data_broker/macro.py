@@ -0,0 +1,233 @@
+"""Process-wide cache of FRED macro series, fetched in batches and aligned as one frame.
+
+Macro series are shared by every asset in a run, so fetching and aligning
+them once per ticker (and once per feature) is wasted work. ``MacroSeriesCache``
+keeps each raw FRED series in memory with the date range it covers, fetches
+any missing series concurrently in one batch, and aligns a whole list of
+series onto a price index with a single forward-fill pass. The derived
+level / 5-bar ROC / rolling z-score block is memoized per (series, index),
+so tickers sharing a calendar reuse it outright.
+
+Use the shared instance:
+
+    from engine.core.data_broker.macro import get_macro_series
+
+    block = get_macro_series().transformed(["NFCI", "T10Y2Y"], df.index)
+    block["zscore"]["NFCI"]
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .fetcher import DataFetcher
+from .reference import _naive
+from ..logger import data_logger as logger
+
+# Rolling z-score used by every FRED feature.
+ZSCORE_WINDOW = 252
+ZSCORE_MIN_PERIODS = 63
+ROC_PERIODS = 5
+
+# Concurrent FRED requests per batch.
+_MAX_WORKERS = 8
+# Aligned/transformed blocks kept for reuse across tickers.
+_BLOCK_CACHE_SIZE = 16
+# Seconds before a series whose fetch came back empty is requested again.
+_RETRY_COOLDOWN = 300.0
+
+
+class MacroSeriesCache:
+    """Thread-safe in-memory cache of raw FRED series plus aligned blocks.
+
+    Each series is stored with the [start, end] range it was fetched for. A
+    request outside that range refetches the series over the union of both,
+    so a batch of tickers with different histories converges on one fetch.
+
+    ``fetch_macro_data`` returns an empty frame on any failure (timeout, HTTP
+    error, no API key, unknown series), so an empty result never counts as
+    coverage and never replaces data already held. The series is instead not
+    re-requested for ``retry_cooldown`` seconds, which keeps one outage from
+    costing a request per asset without pinning the series to NaN for the
+    life of the process.
+
+    Args:
+        fetcher_factory (callable, optional): Zero-argument callable returning
+            an object with ``fetch_macro_data(series_id, start, end)``.
+            Defaults to DataFetcher.
+        retry_cooldown (float): Seconds to wait before retrying a series
+            whose last fetch came back empty.
+    """
+
+    def __init__(self, fetcher_factory: Optional[Callable[[], DataFetcher]] = None,
+                 retry_cooldown: float = _RETRY_COOLDOWN):
+        self._fetcher_factory = fetcher_factory or DataFetcher
+        self._fetcher = None
+        self._retry_cooldown = retry_cooldown
+        self._series: Dict[str, pd.Series] = {}
+        self._coverage: Dict[str, Tuple[pd.Timestamp, pd.Timestamp]] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._blocks: "OrderedDict[Hashable, Dict[str, pd.DataFrame]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Raw series
+    # ------------------------------------------------------------------
+
+    def _fetch_one(self, series_id: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.Series:
+        raw = self._fetcher.fetch_macro_data(
+            series_id, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+        )
+        if raw is None or raw.empty:
+            return pd.Series(dtype=float, name=series_id, index=pd.DatetimeIndex([]))
+        series = raw.set_index("date")["value"].astype(float).rename(series_id)
+        series.index = _naive(pd.DatetimeIndex(pd.to_datetime(series.index)))
+        return series[~series.index.duplicated(keep="last")].sort_index()
+
+    def _missing(self, series_ids: Iterable[str], start: pd.Timestamp,
+                 end: pd.Timestamp) -> Dict[str, Tuple[pd.Timestamp, pd.Timestamp]]:
+        todo = {}
+        now = time.monotonic()
+        for sid in series_ids:
+            failed_at = self._failed_at.get(sid)
+            if failed_at is not None and now - failed_at < self._retry_cooldown:
+                continue
+            covered = self._coverage.get(sid)
+            if covered is None:
+                todo[sid] = (start, end)
+            elif start < covered[0] or end > covered[1]:
+                todo[sid] = (min(start, covered[0]), max(end, covered[1]))
+        return todo
+
+    def frame(self, series_ids: Iterable[str], start, end) -> pd.DataFrame:
+        """Returns raw observations for ``series_ids`` over at least [start, end].
+
+        Missing series are fetched concurrently in one batch. The result has
+        one column per series (outer-joined on observation date) and is not
+        forward-filled.
+        """
+        series_ids = list(dict.fromkeys(series_ids))
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        start = start.tz_localize(None) if start.tz is not None else start
+        end = end.tz_localize(None) if end.tz is not None else end
+
+        with self._fetch_lock:
+            with self._lock:
+                todo = self._missing(series_ids, start, end)
+            if todo:
+                if self._fetcher is None:
+                    self._fetcher = self._fetcher_factory()
+                logger.debug(f"Fetching {len(todo)} FRED series: {', '.join(todo)}")
+                with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(todo))) as pool:
+                    futures = {sid: pool.submit(self._fetch_one, sid, *rng) for sid, rng in todo.items()}
+                    fetched = {sid: f.result() for sid, f in futures.items()}
+                with self._lock:
+                    for sid, series in fetched.items():
+                        if series.empty:
+                            logger.warning(f"FRED series {sid} returned no data; "
+                                           f"retrying after {self._retry_cooldown:.0f}s.")
+                            self._failed_at[sid] = time.monotonic()
+                            self._series.setdefault(sid, series)
+                            continue
+                        self._failed_at.pop(sid, None)
+                        self._series[sid] = series
+                        self._coverage[sid] = todo[sid]
+                    # Raw data changed: every derived block may be stale.
+                    self._blocks.clear()
+
+        with self._lock:
+            cols = {sid: self._series[sid] for sid in series_ids}
+        if not cols:
+            return pd.DataFrame(index=pd.DatetimeIndex([]))
+        return pd.concat(cols, axis=1).sort_index()
+
+    # ------------------------------------------------------------------
+    # Aligned blocks
+    # ------------------------------------------------------------------
+
+    def aligned(self, series_ids: Iterable[str], target_index: pd.DatetimeIndex) -> pd.DataFrame:
+        """Aligns ``series_ids`` onto ``target_index`` in one forward-fill pass.
+
+        Each bar sees the last observation at or before it; bars preceding a
+        series' first observation are NaN.
+        """
+        series_ids = list(dict.fromkeys(series_ids))
+        if len(target_index) == 0:
+            return pd.DataFrame(index=target_index, columns=series_ids, dtype=float)
+        naive_idx = _naive(pd.DatetimeIndex(target_index))
+        raw = self.frame(series_ids, naive_idx.min(), naive_idx.max())
+        block = raw.reindex(naive_idx.union(raw.index)).ffill().reindex(naive_idx)
+        block.index = target_index
+        return block.astype(float)
+
+    @staticmethod
+    def _index_key(index: pd.DatetimeIndex) -> Hashable:
+        index = pd.DatetimeIndex(index)
+        values = _naive(index).asi8
+        return str(index.tz), len(values), hash(values.tobytes())
+
+    def transformed(self, series_ids: Iterable[str],
+                    target_index: pd.DatetimeIndex) -> Dict[str, pd.DataFrame]:
+        """Returns the level / ROC / z-score block for ``series_ids`` on ``target_index``.
+
+        All three are computed column-wise over the aligned frame in one
+        vectorized pass and memoized per (series, index), so every ticker on
+        the same calendar shares the result.
+
+        Returns:
+            dict: ``{"level", "roc5", "zscore"}`` -> DataFrame with one column
+            per series, indexed by ``target_index``.
+        """
+        series_ids = list(dict.fromkeys(series_ids))
+        key = (tuple(series_ids), self._index_key(target_index))
+        with self._lock:
+            if key in self._blocks:
+                self._blocks.move_to_end(key)
+                return self._blocks[key]
+
+        level = self.aligned(series_ids, target_index)
+        roll = level.rolling(ZSCORE_WINDOW, min_periods=ZSCORE_MIN_PERIODS)
+        std = roll.std()
+        block = {
+            "level": level,
+            "roc5": level.pct_change(ROC_PERIODS),
+            "zscore": (level - roll.mean()) / std.where(std != 0, np.nan),
+        }
+        with self._lock:
+            self._blocks[key] = block
+            while len(self._blocks) > _BLOCK_CACHE_SIZE:
+                self._blocks.popitem(last=False)
+        return block
+
+    def invalidate(self, series_id: Optional[str] = None) -> None:
+        """Drops one cached series (or everything) and all derived blocks."""
+        with self._lock:
+            if series_id is None:
+                self._series.clear()
+                self._coverage.clear()
+                self._failed_at.clear()
+            else:
+                self._series.pop(series_id, None)
+                self._coverage.pop(series_id, None)
+                self._failed_at.pop(series_id, None)
+            self._blocks.clear()
+
+    def __contains__(self, series_id: object) -> bool:
+        return series_id in self._series
+
+
+_MACRO_CACHE: Optional[MacroSeriesCache] = None
+
+
+def get_macro_series() -> MacroSeriesCache:
+    """Returns the process-wide macro-series cache, creating it on first use."""
+    global _MACRO_CACHE
+    if _MACRO_CACHE is None:
+        _MACRO_CACHE = MacroSeriesCache()
+    return _MACRO_CACHE
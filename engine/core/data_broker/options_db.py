@@ -0,0 +1,129 @@
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+import pandas as pd
+from sqlalchemy import (
+    create_engine, Column, String, Float, DateTime, Integer,
+    UniqueConstraint, text, event,
+)
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from ..config import config
+
+OptionsBase = declarative_base()
+
+# Summary columns recorded per (ticker, trading day).
+SNAPSHOT_FIELDS = [
+    "spot", "pcr", "iv_skew", "iv_ts", "atm_iv_short", "atm_iv_medium",
+    "put_vol", "call_vol", "total_vol",
+]
+
+
+class OptionsSnapshot(OptionsBase):
+    """End-of-run summary of one ticker's options chain on one trading day."""
+    __tablename__ = "options_snapshots"
+
+    id            = Column(Integer, primary_key=True)
+    ticker        = Column(String, index=True)
+    date          = Column(DateTime)   # trading day of the spot price used
+    captured_at   = Column(DateTime)   # UTC wall-clock time of the download
+    spot          = Column(Float)
+    pcr           = Column(Float)
+    iv_skew       = Column(Float)
+    iv_ts         = Column(Float)
+    atm_iv_short  = Column(Float)
+    atm_iv_medium = Column(Float)
+    put_vol       = Column(Float)
+    call_vol      = Column(Float)
+    total_vol     = Column(Float)
+    exp_short     = Column(String)
+    exp_medium    = Column(String)
+
+    __table_args__ = (
+        UniqueConstraint("ticker", "date", name="uq_options_ticker_date"),
+    )
+
+
+class OptionsDatabase:
+    """SQLite store for daily options-chain snapshots.
+
+    yfinance only serves the current chain, so history exists only for days
+    the recorder ran. A later snapshot on the same trading day replaces the
+    earlier one.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        db_path = db_path or config.OPTIONS_DB_PATH
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.engine = create_engine(f"sqlite:///{db_path}", poolclass=NullPool)
+        event.listen(self.engine, "connect", self._set_pragma)
+        OptionsBase.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+    @staticmethod
+    def _set_pragma(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL;")
+        cur.execute("PRAGMA synchronous=NORMAL;")
+        cur.close()
+
+    def save_snapshots(self, df: pd.DataFrame) -> None:
+        """Upserts snapshot rows (one per ticker and trading day)."""
+        if df.empty:
+            return
+        columns = ["ticker", "date", "captured_at", *SNAPSHOT_FIELDS, "exp_short", "exp_medium"]
+        frame = df.reindex(columns=columns)
+        records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        for row in records:
+            row["date"] = pd.Timestamp(row["date"]).normalize().to_pydatetime()
+            row["captured_at"] = pd.Timestamp(row["captured_at"]).to_pydatetime()
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(f"""
+                    INSERT OR REPLACE INTO options_snapshots ({", ".join(columns)})
+                    VALUES ({", ".join(":" + c for c in columns)})
+                """),
+                records,
+            )
+
+    def get_snapshots(self, ticker: str, start: Optional[datetime] = None,
+                      end: Optional[datetime] = None) -> pd.DataFrame:
+        """Returns ticker's snapshots in [start, end], indexed by trading day."""
+        query = (f"SELECT date, captured_at, {', '.join(SNAPSHOT_FIELDS)} "
+                 "FROM options_snapshots WHERE ticker = :ticker")
+        bind = {"ticker": ticker}
+        if start is not None:
+            query += " AND date >= :start"
+            bind["start"] = pd.Timestamp(start).normalize().to_pydatetime()
+        if end is not None:
+            query += " AND date <= :end"
+            bind["end"] = pd.Timestamp(end).to_pydatetime()
+        with self.engine.begin() as conn:
+            rows = conn.execute(text(query + " ORDER BY date"), bind).fetchall()
+
+        columns = ["date", "captured_at", *SNAPSHOT_FIELDS]
+        if not rows:
+            return pd.DataFrame(columns=columns[1:], index=pd.DatetimeIndex([], name="date"))
+        df = pd.DataFrame(rows, columns=columns)
+        df["date"] = pd.to_datetime(df["date"])
+        df["captured_at"] = pd.to_datetime(df["captured_at"])
+        df[SNAPSHOT_FIELDS] = df[SNAPSHOT_FIELDS].astype(float)
+        return df.set_index("date")
+
+    def last_captured(self, tickers: Iterable[str]) -> Dict[str, datetime]:
+        """Returns the latest captured_at per ticker (tickers never recorded are absent)."""
+        tickers = list(tickers)
+        if not tickers:
+            return {}
+        bind = {f"t{i}": t for i, t in enumerate(tickers)}
+        with self.engine.begin() as conn:
+            rows = conn.execute(
+                text(f"""
+                    SELECT ticker, MAX(captured_at) FROM options_snapshots
+                    WHERE ticker IN ({", ".join(":" + k for k in bind)})
+                    GROUP BY ticker
+                """),
+                bind,
+            ).fetchall()
+        return {t: pd.Timestamp(ts).to_pydatetime() for t, ts in rows if ts is not None}
@@ -0,0 +1,184 @@
+"""Daily options-chain snapshot recorder for the OptionsFlow feature.
+
+yfinance exposes only the live options chain, so a history of put/call
+ratios and implied-volatility shape has to be built up by recording it. The
+recorder downloads each ticker's ~30d and ~90d chains, reduces them to a
+handful of summary numbers, and upserts one row per ticker per trading day
+into ``OptionsDatabase``. A universe is recorded concurrently; tickers
+already captured today are skipped unless forced.
+
+Run it once a day (after the close for end-of-day values):
+
+    python CLI.py options-snapshot --universe DOW_30
+
+or from code:
+
+    from engine.core.data_broker.options_recorder import OptionsSnapshotRecorder
+
+    OptionsSnapshotRecorder().record(["AAPL", "MSFT"])
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .options_db import OptionsDatabase
+
+logger = logging.getLogger("model-engine.data.options_recorder")
+
+# Target days-to-expiry for the short and medium chains.
+SHORT_EXPIRY_DAYS = 30
+MEDIUM_EXPIRY_DAYS = 90
+# Concurrent chain downloads per recording run.
+_MAX_WORKERS = 8
+
+SnapshotFn = Callable[[str], Optional[Dict[str, Any]]]
+
+
+# ---------------------------------------------------------------------------
+# Chain summaries
+# ---------------------------------------------------------------------------
+
+def _atm_iv(chain: pd.DataFrame, spot: float) -> float:
+    if chain.empty:
+        return float("nan")
+    idx = (chain["strike"] - spot).abs().idxmin()
+    return float(chain.loc[idx, "impliedVolatility"])
+
+
+def _otm_put_iv(puts: pd.DataFrame, spot: float, delta_proxy: float = 0.95) -> float:
+    """Approximate 25-delta put IV as the put struck at spot * delta_proxy."""
+    if puts.empty:
+        return float("nan")
+    target = spot * delta_proxy
+    idx = (puts["strike"] - target).abs().idxmin()
+    return float(puts.loc[idx, "impliedVolatility"])
+
+
+def _nearest_expiry(expirations: Iterable[str], target_days: int, today: datetime) -> str:
+    return min(
+        expirations,
+        key=lambda e: abs((datetime.strptime(e, "%Y-%m-%d") - today).days - target_days),
+    )
+
+
+def summarize_chains(calls_s: pd.DataFrame, puts_s: pd.DataFrame,
+                     calls_m: pd.DataFrame, spot: float) -> Dict[str, float]:
+    """Reduces the short (~30d) and medium (~90d) chains to OptionsFlow inputs.
+
+    Returns:
+        dict: pcr (put/call volume), iv_skew (OTM put IV minus ATM IV),
+        iv_ts (short ATM IV / medium ATM IV), the two ATM IVs, and volumes.
+    """
+    put_vol  = float(puts_s["volume"].fillna(0).sum())
+    call_vol = float(calls_s["volume"].fillna(0).sum())
+    atm_short  = _atm_iv(calls_s, spot)
+    atm_medium = _atm_iv(calls_m, spot)
+    return {
+        "pcr":           put_vol / max(call_vol, 1.0),
+        "iv_skew":       _otm_put_iv(puts_s, spot) - _atm_iv(puts_s, spot),
+        "iv_ts":         atm_short / max(atm_medium, 1e-9),
+        "atm_iv_short":  atm_short,
+        "atm_iv_medium": atm_medium,
+        "put_vol":       put_vol,
+        "call_vol":      call_vol,
+        "total_vol":     put_vol + call_vol,
+    }
+
+
+def snapshot_ticker(ticker: str) -> Optional[Dict[str, Any]]:
+    """Downloads ticker's current chains from yfinance and summarizes them.
+
+    Returns None when the ticker has no listed options or no recent price.
+    """
+    import yfinance as yf
+
+    t = yf.Ticker(ticker)
+    hist = t.history(period="5d", auto_adjust=False)
+    expirations = t.options
+    if hist.empty or not expirations:
+        return None
+
+    spot = float(hist["Close"].iloc[-1])
+    trade_date = pd.Timestamp(hist.index[-1])
+    if trade_date.tz is not None:
+        trade_date = trade_date.tz_localize(None)
+
+    today = datetime.now()
+    exp_short  = _nearest_expiry(expirations, SHORT_EXPIRY_DAYS, today)
+    exp_medium = _nearest_expiry(expirations, MEDIUM_EXPIRY_DAYS, today)
+    chain_s = t.option_chain(exp_short)
+    chain_m = chain_s if exp_medium == exp_short else t.option_chain(exp_medium)
+
+    return {
+        "date":       trade_date.normalize(),
+        "spot":       spot,
+        "exp_short":  exp_short,
+        "exp_medium": exp_medium,
+        **summarize_chains(chain_s.calls, chain_s.puts, chain_m.calls, spot),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Recorder
+# ---------------------------------------------------------------------------
+
+class OptionsSnapshotRecorder:
+    """Records options snapshots for a list of tickers into OptionsDatabase.
+
+    Args:
+        db (OptionsDatabase, optional): Target store. Defaults to
+            ``config.OPTIONS_DB_PATH``.
+        snapshot_fn (callable, optional): ``snapshot_fn(ticker) -> dict | None``.
+            Defaults to ``snapshot_ticker`` (yfinance).
+        max_workers (int): Concurrent downloads.
+    """
+
+    def __init__(self, db: Optional[OptionsDatabase] = None,
+                 snapshot_fn: Optional[SnapshotFn] = None, max_workers: int = _MAX_WORKERS):
+        self.db = db or OptionsDatabase()
+        self._snapshot_fn = snapshot_fn or snapshot_ticker
+        self._max_workers = max(1, int(max_workers))
+
+    def _pending(self, tickers: List[str], force: bool) -> List[str]:
+        if force:
+            return tickers
+        today = datetime.now(timezone.utc).date()
+        captured = self.db.last_captured(tickers)
+        return [t for t in tickers if t not in captured or captured[t].date() < today]
+
+    def _snapshot(self, ticker: str) -> Optional[Dict[str, Any]]:
+        try:
+            snap = self._snapshot_fn(ticker)
+        except Exception as e:
+            logger.warning(f"Options snapshot failed for {ticker}: {e}")
+            return None
+        if not snap:
+            logger.info(f"No options data for {ticker}")
+            return None
+        return {"ticker": ticker, "captured_at": datetime.now(timezone.utc).replace(tzinfo=None), **snap}
+
+    def record(self, tickers: Iterable[str], force: bool = False) -> pd.DataFrame:
+        """Snapshots every ticker not yet captured today (all of them with force).
+
+        Returns:
+            pd.DataFrame: The rows written, one per ticker that produced a
+            snapshot. Failed or option-less tickers are logged and omitted.
+        """
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        todo = self._pending(tickers, force)
+        if len(todo) < len(tickers):
+            logger.info(f"Options snapshots: {len(tickers) - len(todo)} ticker(s) already recorded today")
+        if not todo:
+            return pd.DataFrame()
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(todo))) as pool:
+            rows = [r for r in pool.map(self._snapshot, todo) if r is not None]
+
+        df = pd.DataFrame(rows)
+        self.db.save_snapshots(df)
+        logger.info(f"Recorded options snapshots for {len(rows)}/{len(todo)} ticker(s)")
+        return df
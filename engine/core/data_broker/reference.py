@@ -0,0 +1,273 @@
+"""Process-wide cache of reference series (SPY, ^VIX, sector ETFs, ...).
+
+Benchmark tickers are read by many independent consumers -- comparison
+features, the regime orchestrator, strategy guards -- often once per asset in
+a batch run. ``ReferenceSeriesCache`` loads each (ticker, interval) through
+the DataBroker once, keeps the full history in memory under a byte budget
+(least-recently-used entries are evicted first), and serves date-range slices
+and series already aligned onto a caller's index.
+
+Use the shared instance:
+
+    from engine.core.data_broker.reference import get_reference_series
+
+    spy = get_reference_series().series("SPY", start="2020-01-01")
+    vix = get_reference_series().aligned("^VIX", df.index)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+import pandas as pd
+
+from .data_broker import DataBroker
+from ..config import config
+from ..logger import data_logger as logger
+
+_Key = Tuple[str, str]
+
+# Minimum age (seconds) before a frame that stops short of a requested date is
+# reloaded, so a series that legitimately ends early is not re-fetched per call.
+_REFRESH_AFTER = 900.0
+
+
+def _naive(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Drops timezone info so broker data (stored tz-naive) can be matched."""
+    if getattr(index, "tz", None) is not None:
+        return index.tz_localize(None)
+    return index
+
+
+def _naive_ts(value) -> Optional[pd.Timestamp]:
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    return ts.tz_localize(None) if ts.tz is not None else ts
+
+
+def align_to_index(series: pd.Series, target_index: pd.DatetimeIndex) -> pd.Series:
+    """Aligns ``series`` onto ``target_index`` using the last observation at or before each bar.
+
+    NaNs in the source are skipped rather than propagated, so a missing print
+    on one day carries the previous value forward. Only past observations are
+    used, which keeps the result free of lookahead. Target bars that precede
+    the series are NaN.
+
+    Args:
+        series (pd.Series): Source series with a DatetimeIndex.
+        target_index (pd.DatetimeIndex): Index to align onto; may be tz-aware.
+
+    Returns:
+        pd.Series: Float series indexed by ``target_index``.
+    """
+    source = series.dropna()
+    if source.empty or len(target_index) == 0:
+        return pd.Series(float("nan"), index=target_index, name=series.name, dtype=float)
+    source = source[~source.index.duplicated(keep="last")].sort_index()
+    source.index = _naive(pd.DatetimeIndex(source.index))
+    values = source.reindex(_naive(target_index), method="ffill").to_numpy(dtype=float)
+    return pd.Series(values, index=target_index, name=series.name)
+
+
+class ReferenceSeriesCache:
+    """Bounded, thread-safe in-memory cache of full-history reference OHLCV.
+
+    Each (ticker, interval) is loaded through the DataBroker once and served
+    from memory while it stays resident. When a caller asks for data past the
+    cached frame's last bar (``frame(end=...)`` or ``aligned``'s target index)
+    and the frame is older than ``refresh_after``, it is reloaded so a
+    long-running process picks up new bars. Empty results are cached under the
+    same rule, so an unknown ticker is not re-requested for every asset in a
+    batch; broker exceptions are not cached and propagate to the caller.
+
+    Args:
+        max_bytes (int, optional): Memory budget for cached frames. Defaults to
+            ``config.REFERENCE_CACHE_MB``. The most recently loaded frame is
+            always kept, even if it alone exceeds the budget.
+        broker_factory (callable, optional): Zero-argument callable returning
+            an object with ``get_data(ticker, interval)``. Defaults to DataBroker.
+        refresh_after (float): Seconds a frame must have been resident before
+            a request past its last bar triggers a reload. Defaults to 900.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None,
+                 broker_factory: Optional[Callable[[], DataBroker]] = None,
+                 refresh_after: float = _REFRESH_AFTER):
+        self.max_bytes = int(max_bytes if max_bytes is not None else config.REFERENCE_CACHE_MB * 1024 * 1024)
+        self._broker_factory = broker_factory or DataBroker
+        self._broker = None
+        self._frames: "OrderedDict[_Key, pd.DataFrame]" = OrderedDict()
+        self._sizes: Dict[_Key, int] = {}
+        self._loaded_at: Dict[_Key, float] = {}
+        self.refresh_after = float(refresh_after)
+        self._lock = threading.Lock()
+        self._loading: Dict[_Key, threading.Lock] = {}
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(ticker: str, interval: str) -> _Key:
+        interval = DataBroker._INTERVAL_ALIASES.get(interval, interval)
+        return str(ticker).upper(), interval
+
+    def _load(self, key: _Key) -> pd.DataFrame:
+        if self._broker is None:
+            self._broker = self._broker_factory()
+        ticker, interval = key
+        logger.debug(f"[{ticker}] Loading {interval} reference series.")
+        df = self._broker.get_data(ticker, interval)
+        if df is None or df.empty:
+            return pd.DataFrame(
+                columns=["open", "high", "low", "close", "volume"],
+                index=pd.DatetimeIndex([], name="timestamp"),
+                dtype=float,
+            )
+        df = df.rename(columns=str.lower)
+        df.index = _naive(pd.DatetimeIndex(df.index))
+        df = df[~df.index.duplicated(keep="last")].sort_index()
+        return df
+
+    def _store(self, key: _Key, df: pd.DataFrame) -> None:
+        self._frames[key] = df
+        self._frames.move_to_end(key)
+        self._sizes[key] = int(df.memory_usage(index=True).sum())
+        self._loaded_at[key] = time.monotonic()
+        while len(self._frames) > 1 and self.nbytes > self.max_bytes:
+            old_key, _ = self._frames.popitem(last=False)
+            self._sizes.pop(old_key, None)
+            self._loaded_at.pop(old_key, None)
+            logger.debug(f"[{old_key[0]}] Evicted {old_key[1]} reference series.")
+
+    def _fresh(self, key: _Key, until: Optional[pd.Timestamp]) -> bool:
+        """True if the cached frame for ``key`` can serve a request ending at ``until``."""
+        df = self._frames[key]
+        if until is None or (len(df) and until <= df.index[-1]):
+            return True
+        return time.monotonic() - self._loaded_at.get(key, 0.0) < self.refresh_after
+
+    def _get(self, ticker: str, interval: str,
+             until: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        key = self._key(ticker, interval)
+        with self._lock:
+            if key in self._frames and self._fresh(key, until):
+                self._frames.move_to_end(key)
+                return self._frames[key]
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        # Load outside the cache lock so other tickers stay readable; the
+        # per-key lock stops concurrent callers fetching the same series twice.
+        with key_lock:
+            with self._lock:
+                if key in self._frames and self._fresh(key, until):
+                    self._frames.move_to_end(key)
+                    return self._frames[key]
+                stale = self._frames.get(key)
+            if stale is not None:
+                last = stale.index[-1] if len(stale) else None
+                logger.info(f"[{key[0]}] Cached {key[1]} reference series ends at {last}, "
+                            f"before {until}; reloading.")
+            df = self._load(key)
+            with self._lock:
+                self._store(key, df)
+                self._loading.pop(key, None)
+            return df
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def frame(
+        self,
+        ticker: str,
+        interval: str = "1d",
+        start: Optional[Union[str, pd.Timestamp]] = None,
+        end: Optional[Union[str, pd.Timestamp]] = None,
+    ) -> pd.DataFrame:
+        """Returns lowercase OHLCV for ``ticker``, optionally sliced to [start, end].
+
+        Raises:
+            Exception: Whatever the broker raised if the series had to be loaded.
+        """
+        df = self._get(ticker, interval, _naive_ts(end))
+        if start is None and end is None:
+            return df
+        return df.loc[_naive_ts(start):_naive_ts(end)]
+
+    def series(
+        self,
+        ticker: str,
+        column: str = "close",
+        interval: str = "1d",
+        start: Optional[Union[str, pd.Timestamp]] = None,
+        end: Optional[Union[str, pd.Timestamp]] = None,
+    ) -> pd.Series:
+        """Returns one OHLCV column for ``ticker``, named after the ticker."""
+        df = self.frame(ticker, interval, start, end)
+        return df[column.lower()].rename(str(ticker).upper())
+
+    def aligned(
+        self,
+        tickers: Union[str, Iterable[str]],
+        target_index: pd.DatetimeIndex,
+        column: str = "close",
+        interval: str = "1d",
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """Returns reference values aligned onto ``target_index`` (see ``align_to_index``).
+
+        Args:
+            tickers (str | Iterable[str]): One ticker (returns a Series) or
+                several (returns a DataFrame with one column per ticker).
+            target_index (pd.DatetimeIndex): Index to align onto.
+            column (str): OHLCV column to align. Defaults to "close".
+            interval (str): Reference data interval. Defaults to "1d".
+        """
+        until = _naive_ts(target_index.max()) if len(target_index) else None
+
+        def _one(ticker: str) -> pd.Series:
+            df = self._get(ticker, interval, until)
+            return align_to_index(df[column.lower()].rename(str(ticker).upper()), target_index)
+
+        if isinstance(tickers, str):
+            return _one(tickers)
+        return pd.DataFrame({t: _one(t) for t in tickers}, index=target_index)
+
+    def invalidate(self, ticker: Optional[str] = None) -> None:
+        """Drops cached series for ``ticker`` (all intervals), or everything if None."""
+        with self._lock:
+            if ticker is None:
+                self._frames.clear()
+                self._sizes.clear()
+                self._loaded_at.clear()
+                return
+            for key in [k for k in self._frames if k[0] == str(ticker).upper()]:
+                del self._frames[key]
+                self._sizes.pop(key, None)
+                self._loaded_at.pop(key, None)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by cached frames."""
+        return sum(self._sizes.values())
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+        return self._key(*item) in self._frames
+
+
+_REFERENCE_CACHE: Optional[ReferenceSeriesCache] = None
+
+
+def get_reference_series() -> ReferenceSeriesCache:
+    """Returns the process-wide reference-series cache, creating it on first use."""
+    global _REFERENCE_CACHE
+    if _REFERENCE_CACHE is None:
+        _REFERENCE_CACHE = ReferenceSeriesCache()
+    return _REFERENCE_CACHE
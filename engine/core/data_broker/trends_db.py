@@ -0,0 +1,123 @@
+import os
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+import pandas as pd
+from sqlalchemy import (
+    create_engine, Column, String, Float, DateTime, Integer,
+    UniqueConstraint, text, event,
+)
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from ..config import config
+
+TrendsBase = declarative_base()
+
+
+class TrendsInterest(TrendsBase):
+    """One stitched weekly search-interest observation for a keyword."""
+    __tablename__ = "trends_interest"
+
+    id      = Column(Integer, primary_key=True)
+    keyword = Column(String, index=True)
+    date    = Column(DateTime)
+    value   = Column(Float)
+
+    __table_args__ = (
+        UniqueConstraint("keyword", "date", name="uq_trends_keyword_date"),
+    )
+
+
+class TrendsCoverage(TrendsBase):
+    """Date range already fetched for a keyword (including ranges with no data)."""
+    __tablename__ = "trends_coverage"
+
+    keyword    = Column(String, primary_key=True)
+    start      = Column(DateTime)
+    end        = Column(DateTime)
+    updated_at = Column(DateTime)
+
+
+class TrendsDatabase:
+    """SQLite store for stitched Google Trends histories.
+
+    Each keyword holds one weekly series on a single, self-consistent scale
+    (see ``trends_fetcher.stitch_windows``). Extending the history re-stitches
+    and rewrites the whole series, so values are only comparable within a
+    keyword, which is all the ratio/z-score features need.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        db_path = db_path or config.TRENDS_DB_PATH
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.engine = create_engine(f"sqlite:///{db_path}", poolclass=NullPool)
+        event.listen(self.engine, "connect", self._set_pragma)
+        TrendsBase.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+    @staticmethod
+    def _set_pragma(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL;")
+        cur.execute("PRAGMA synchronous=NORMAL;")
+        cur.close()
+
+    def get_coverage(self, keyword: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Returns the (start, end) range fetched for keyword, or (None, None)."""
+        session = self.Session()
+        try:
+            row = session.get(TrendsCoverage, keyword)
+            return (row.start, row.end) if row is not None else (None, None)
+        finally:
+            session.close()
+
+    def get_series(self, keyword: str, start: Optional[datetime] = None,
+                   end: Optional[datetime] = None) -> pd.Series:
+        """Returns the stored weekly series for keyword within [start, end]."""
+        query = "SELECT date, value FROM trends_interest WHERE keyword = :keyword"
+        bind = {"keyword": keyword}
+        if start is not None:
+            query += " AND date >= :start"
+            bind["start"] = pd.Timestamp(start).to_pydatetime()
+        if end is not None:
+            query += " AND date <= :end"
+            bind["end"] = pd.Timestamp(end).to_pydatetime()
+        with self.engine.begin() as conn:
+            rows = conn.execute(text(query + " ORDER BY date"), bind).fetchall()
+
+        if not rows:
+            return pd.Series(dtype=float, name=keyword, index=pd.DatetimeIndex([]))
+        dates, values = zip(*rows)
+        return pd.Series(values, index=pd.DatetimeIndex(pd.to_datetime(dates)),
+                         name=keyword, dtype=float)
+
+    def save_series(self, keyword: str, series: pd.Series,
+                    start: datetime, end: datetime) -> None:
+        """Replaces keyword's history with series and records [start, end] as covered."""
+        rows = [
+            {"keyword": keyword, "date": ts.to_pydatetime(), "value": float(v)}
+            for ts, v in series.dropna().items()
+        ]
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM trends_interest WHERE keyword = :keyword"),
+                         {"keyword": keyword})
+            if rows:
+                conn.execute(
+                    text("""
+                        INSERT INTO trends_interest (keyword, date, value)
+                        VALUES (:keyword, :date, :value)
+                    """),
+                    rows,
+                )
+            conn.execute(
+                text("""
+                    INSERT OR REPLACE INTO trends_coverage (keyword, start, "end", updated_at)
+                    VALUES (:keyword, :start, :end, :updated_at)
+                """),
+                {
+                    "keyword": keyword,
+                    "start": pd.Timestamp(start).to_pydatetime(),
+                    "end": pd.Timestamp(end).to_pydatetime(),
+                    "updated_at": datetime.now(timezone.utc),
+                },
+            )
@@ -0,0 +1,365 @@
+"""Google Trends fetcher with a persisted store and a rate-limited background queue.
+
+Google returns weekly interest only for ranges up to ~5 years, and every
+response is rescaled so its own maximum is 100. Long histories are therefore
+built from overlapping windows: each new window is rescaled onto the series
+accumulated so far by the median ratio over the weeks they share, and the
+stitched result is renormalised to a 0-100 range.
+
+Requests go through ``TrendsFetchQueue``, a single daemon thread that spaces
+calls at least ``config.TRENDS_MIN_INTERVAL`` seconds apart, backs off on
+failures, and writes each stitched window to ``TrendsDatabase`` as it lands.
+The GoogleTrends feature never blocks: it reads whatever is stored and queues
+the missing range for a later run. Short-lived processes (CLI backtests,
+spawned batch workers) usually exit before the daemon gets far, so fill the
+store up front with ``fill`` / ``CLI.py trends-fetch``.
+
+    from engine.core.data_broker.trends_fetcher import get_trends_queue
+
+    queue = get_trends_queue()
+    queue.request("AAPL", "2015-01-01", "2024-12-31")   # returns immediately
+    queue.join(timeout=60)                               # optional: wait for it
+    queue.db.get_series("AAPL")
+
+    queue.fill(["AAPL", "MSFT"], "2015-01-01", "2024-12-31")   # blocking
+"""
+
+import logging
+import queue as queue_mod
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import config
+from .trends_db import TrendsDatabase
+
+logger = logging.getLogger("model-engine.data.trends_fetcher")
+
+# Longest range Google still serves at weekly granularity, and the overlap
+# between consecutive windows used to link their scales.
+WINDOW_DAYS = 5 * 365 - 30
+OVERLAP_DAYS = 26 * 7
+# A stored range this close to the requested end counts as covered: Google
+# only publishes complete weeks.
+STALE_DAYS = 7
+# Attempts per window, and how long a keyword that exhausted them is left alone.
+MAX_RETRIES = 3
+FAILURE_COOLDOWN = 3600.0
+
+FetchFn = Callable[[str, pd.Timestamp, pd.Timestamp], pd.Series]
+
+
+def fetch_trends_window(keyword: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.Series:
+    """Fetches one window of Google Trends interest for keyword (US web search).
+
+    Raises on network or rate-limit errors so the queue can back off; an empty
+    Series means Google has no data for the keyword in this window.
+    """
+    from pytrends.request import TrendReq
+
+    pt = TrendReq(hl="en-US", tz=360, timeout=(10, 25))
+    timeframe = f"{start.strftime('%Y-%m-%d')} {end.strftime('%Y-%m-%d')}"
+    pt.build_payload([keyword], cat=0, timeframe=timeframe, geo="US", gprop="")
+    df = pt.interest_over_time()
+
+    if df.empty or keyword not in df.columns:
+        return pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+    series = df[keyword].astype(float)
+    series.index = pd.DatetimeIndex(pd.to_datetime(series.index))
+    if series.index.tz is not None:
+        series.index = series.index.tz_localize(None)
+    return series
+
+
+def plan_windows(start, end, window_days: int = WINDOW_DAYS,
+                 overlap_days: int = OVERLAP_DAYS) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Splits [start, end] into chronological windows that overlap by overlap_days."""
+    start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+    window, step = pd.Timedelta(days=window_days), pd.Timedelta(days=window_days - overlap_days)
+    windows = []
+    lo = start
+    while True:
+        hi = min(lo + window, end)
+        windows.append((lo, hi))
+        if hi >= end:
+            return windows
+        lo += step
+
+
+def stitch_windows(windows: List[pd.Series]) -> pd.Series:
+    """Chains independently normalised windows onto one scale.
+
+    Windows are linked in order: each is multiplied by the median ratio of the
+    accumulated series to the window over the dates both have positive values,
+    and only fills dates the accumulated series does not already have. A
+    window with no usable overlap is appended unscaled (with a warning). The
+    result is rescaled so its maximum is 100.
+    """
+    stitched = pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+    for window in windows:
+        window = window.dropna().astype(float)
+        if window.empty:
+            continue
+        window = window[~window.index.duplicated(keep="last")].sort_index()
+        if stitched.empty:
+            stitched = window
+            continue
+
+        common = stitched.index.intersection(window.index)
+        a, b = stitched.reindex(common), window.reindex(common)
+        usable = (a > 0) & (b > 0)
+        if usable.any():
+            scale = float(np.median(a[usable] / b[usable]))
+        else:
+            logger.warning(
+                f"Trends windows do not overlap on non-zero weeks "
+                f"({window.index.min():%Y-%m-%d}..{window.index.max():%Y-%m-%d}); appended unscaled"
+            )
+            scale = 1.0
+        stitched = stitched.combine_first(window * scale)
+
+    peak = stitched.max() if not stitched.empty else 0.0
+    if peak > 0:
+        stitched = stitched * (100.0 / peak)
+    return stitched
+
+
+class TrendsFetchQueue:
+    """Background, rate-limited fetcher that keeps TrendsDatabase up to date.
+
+    ``request`` is non-blocking: it returns at once and a single daemon thread
+    fetches the missing range later. Requests for a keyword already waiting in
+    the queue are merged into one job covering both ranges. Extensions overlap
+    the stored history by ``OVERLAP_DAYS`` so they are stitched onto its scale.
+
+    Args:
+        db (TrendsDatabase, optional): Store to read and write. Defaults to
+            ``config.TRENDS_DB_PATH``.
+        fetch_fn (callable, optional): ``fetch_fn(keyword, start, end) -> Series``
+            for a single window. Defaults to ``fetch_trends_window``.
+        min_interval (float, optional): Minimum seconds between requests to
+            Google. Defaults to ``config.TRENDS_MIN_INTERVAL``.
+    """
+
+    def __init__(self, db: Optional[TrendsDatabase] = None, fetch_fn: Optional[FetchFn] = None,
+                 min_interval: Optional[float] = None):
+        self.db = db or TrendsDatabase()
+        self._fetch_fn = fetch_fn or fetch_trends_window
+        self._min_interval = config.TRENDS_MIN_INTERVAL if min_interval is None else float(min_interval)
+        self._queue: "queue_mod.Queue[str]" = queue_mod.Queue()
+        self._pending: Dict[str, Tuple[pd.Timestamp, pd.Timestamp]] = {}
+        self._failed: Dict[str, float] = {}
+        self._last_request = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def is_covered(self, keyword: str, start, end) -> bool:
+        """True when the store already holds keyword over [start, end]."""
+        lo, hi = self.db.get_coverage(keyword)
+        if lo is None:
+            return False
+        return (pd.Timestamp(lo) <= pd.Timestamp(start)
+                and pd.Timestamp(hi) >= pd.Timestamp(end) - pd.Timedelta(days=STALE_DAYS))
+
+    def request(self, keyword: str, start, end) -> bool:
+        """Queues keyword over [start, end] unless it is already stored.
+
+        Returns:
+            bool: True if a fetch is queued or in progress for the range.
+        """
+        start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+        with self._lock:
+            if keyword in self._pending:
+                lo, hi = self._pending[keyword]
+                self._pending[keyword] = (min(lo, start), max(hi, end))
+                return True
+            failed_at = self._failed.get(keyword)
+            if failed_at is not None and time.monotonic() - failed_at < FAILURE_COOLDOWN:
+                return False
+        if self.is_covered(keyword, start, end):
+            return False
+
+        with self._lock:
+            if keyword in self._pending:
+                lo, hi = self._pending[keyword]
+                self._pending[keyword] = (min(lo, start), max(hi, end))
+                return True
+            self._pending[keyword] = (start, end)
+            self._ensure_worker()
+        self._queue.put(keyword)
+        logger.info(f"Queued Google Trends fetch for '{keyword}' "
+                    f"({start:%Y-%m-%d}..{end:%Y-%m-%d})")
+        return True
+
+    def __contains__(self, keyword: object) -> bool:
+        with self._lock:
+            return keyword in self._pending
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every queued fetch has finished, or ``timeout`` seconds pass.
+
+        Returns:
+            bool: True if the queue drained.
+        """
+        if timeout is None:
+            self._queue.join()
+            return True
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def fill(self, keywords: List[str], start, end) -> Dict[str, int]:
+        """Fetches each keyword over [start, end] in the calling thread.
+
+        The blocking counterpart to ``request`` for batch jobs: keywords that
+        are already stored are skipped, and a failure is logged and does not
+        stop the remaining keywords.
+
+        Returns:
+            Dict[str, int]: Weeks stored per keyword afterwards, -1 if its
+            fetch failed.
+        """
+        stored: Dict[str, int] = {}
+        for keyword in keywords:
+            try:
+                if not self.is_covered(keyword, start, end):
+                    self.fetch(keyword, start, end)
+                stored[keyword] = len(self.db.get_series(keyword))
+            except ImportError:
+                raise
+            except Exception as e:
+                logger.warning(f"Google Trends fetch failed for '{keyword}': {e}")
+                stored[keyword] = -1
+        return stored
+
+    def stop(self) -> None:
+        """Stops the worker after its current job."""
+        self._stop.set()
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def fetch(self, keyword: str, start, end) -> pd.Series:
+        """Fetches, stitches and stores keyword over [start, end] synchronously.
+
+        Only the part of the range not already stored is requested from
+        Google. Honours the rate limit and retries each window with
+        exponential backoff. The store is updated after every window, so an
+        interrupted fetch keeps the contiguous range it already has.
+        """
+        start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+        lo, hi = self.db.get_coverage(keyword)
+        overlap = pd.Timedelta(days=OVERLAP_DAYS)
+
+        # (window, coverage once it is stitched in), in fetch order.
+        if lo is None:
+            segments = []
+            plan = [(w, (start, w[1])) for w in plan_windows(start, end)]
+        else:
+            lo, hi = pd.Timestamp(lo), pd.Timestamp(hi)
+            # Link onto the stored history first so its scale anchors the
+            # result, then grow outwards from it in both directions.
+            segments = [self.db.get_series(keyword)]
+            plan = []
+            if end > hi:
+                plan += [(w, (lo, max(hi, w[1])))
+                         for w in plan_windows(max(hi - overlap, start), end)]
+            if start < lo:
+                top = max(end, hi)
+                plan += [(w, (w[0], top))
+                         for w in plan_windows(start, min(lo + overlap, end))[::-1]]
+
+        series = stitch_windows(segments)
+        for window, (covered_lo, covered_hi) in plan:
+            segments.append(self._fetch_window(keyword, *window))
+            series = stitch_windows(segments)
+            self.db.save_series(keyword, series, covered_lo, covered_hi)
+        logger.info(f"Stored {len(series)} weeks of Google Trends data for '{keyword}'")
+        return series
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._run, name="trends-fetch", daemon=True)
+            self._worker.start()
+
+    def _throttle(self) -> None:
+        wait = self._last_request + self._min_interval - time.monotonic()
+        if wait > 0:
+            self._stop.wait(wait)
+        self._last_request = time.monotonic()
+
+    def _fetch_window(self, keyword: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.Series:
+        for attempt in range(MAX_RETRIES):
+            self._throttle()
+            try:
+                return self._fetch_fn(keyword, start, end)
+            except ImportError:
+                raise
+            except Exception as e:
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                delay = max(self._min_interval, 1.0) * 2 ** (attempt + 1)
+                logger.warning(f"Google Trends request for '{keyword}' failed ({e}); "
+                               f"retrying in {delay:.0f}s")
+                self._stop.wait(delay)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            keyword = self._queue.get()
+            try:
+                if keyword is None:
+                    continue
+                with self._lock:
+                    start, end = self._pending[keyword]
+                try:
+                    self.fetch(keyword, start, end)
+                    with self._lock:
+                        self._failed.pop(keyword, None)
+                except ImportError:
+                    logger.error("pytrends not installed. Run: uv add pytrends")
+                    with self._lock:
+                        self._failed[keyword] = time.monotonic()
+                except Exception as e:
+                    logger.warning(f"Google Trends fetch failed for '{keyword}': {e}")
+                    with self._lock:
+                        self._failed[keyword] = time.monotonic()
+                finally:
+                    with self._lock:
+                        # A request widened the range mid-fetch: go round again.
+                        requeue = self._pending.get(keyword) != (start, end)
+                        if not requeue:
+                            self._pending.pop(keyword, None)
+                    if requeue:
+                        self._queue.put(keyword)
+            finally:
+                self._queue.task_done()
+
+
+_TRENDS_QUEUE: Optional[TrendsFetchQueue] = None
+
+
+def get_trends_queue() -> TrendsFetchQueue:
+    """Returns the process-wide trends queue, creating it on first use."""
+    global _TRENDS_QUEUE
+    if _TRENDS_QUEUE is None:
+        _TRENDS_QUEUE = TrendsFetchQueue()
+    return _TRENDS_QUEUE
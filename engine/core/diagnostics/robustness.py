@@ -0,0 +1,251 @@
+"""Bootstrap and Monte Carlo robustness of backtest results.
+
+A backtest yields one Sharpe, one drawdown and one CAGR. This module
+resamples the strategy's returns into thousands of alternative histories and
+reports where the observed numbers sit in their distribution:
+
+  block_bootstrap  stationary block bootstrap of bar returns (Politis &
+                   Romano 1994). Blocks of geometric mean length keep
+                   volatility clustering and short-range autocorrelation.
+  trade_shuffle    random reordering of the round-trip trade returns.
+                   Compounding makes Sharpe and CAGR order-invariant, so only
+                   the drawdown distribution moves: it shows how lucky the
+                   observed sequence of wins and losses was.
+  noise            bar returns plus Gaussian noise scaled to their own
+                   volatility, for sensitivity to small execution errors.
+
+Paths are generated and scored with NumPy in chunks sized to ``chunk_mb``,
+so 10k+ paths over long intraday histories run in bounded memory. Only the
+three scalars per path are kept.
+
+Inputs come from either backtester via ``inputs_from_tearsheet`` (full-level
+``Tearsheet.calculate_metrics`` output) or ``inputs_from_portfolio``
+(``PortfolioBacktester.run`` output).
+"""
+import math
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+ROBUSTNESS_METHODS = ("block_bootstrap", "trade_shuffle", "noise")
+ROBUSTNESS_METRICS = ("Sharpe Ratio", "Max Drawdown (%)", "CAGR (%)")
+
+# Working-memory budget per chunk of paths.
+DEFAULT_CHUNK_MB = 64
+# Float/int arrays of path length alive at once while scoring a chunk.
+_ARRAYS_PER_PATH = 8
+
+
+def stationary_bootstrap_indices(
+    n: int, n_paths: int, mean_block: float, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws stationary-bootstrap index paths.
+
+    Each bar starts a new block with probability ``1 / mean_block`` (the first
+    always does); a block starts at a uniform random bar and runs forward,
+    wrapping around the end of the sample.
+
+    Returns:
+        np.ndarray: Integer indices into the sample, shape ``(n_paths, n)``.
+    """
+    steps = np.arange(n)
+    new_block = rng.random((n_paths, n)) < 1.0 / max(mean_block, 1.0)
+    new_block[:, 0] = True
+    block_start = np.maximum.accumulate(np.where(new_block, steps, 0), axis=1)
+    starts = rng.integers(0, n, size=(n_paths, n))
+    origin = np.take_along_axis(starts, block_start, axis=1)
+    return (origin + steps - block_start) % n
+
+
+def path_metrics(R: np.ndarray, periods_per_year: float, days: int) -> Dict[str, np.ndarray]:
+    """Sharpe, max drawdown and CAGR for every row of a return matrix.
+
+    Uses the estimators of ``Tearsheet.calculate_metrics``: sample-std Sharpe
+    annualised by ``periods_per_year``, drawdown from the running peak of the
+    compounded curve, and CAGR over ``days`` with the exponent capped at ±10.
+
+    Returns:
+        dict: One array of length ``R.shape[0]`` per name in ROBUSTNESS_METRICS.
+    """
+    R = np.atleast_2d(R)
+    equity = np.cumprod(1.0 + R, axis=1)
+    peak = np.maximum.accumulate(equity, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_dd = ((equity - peak) / peak).min(axis=1) * 100
+        std = R.std(axis=1, ddof=1)
+        sharpe = np.where(std > 0, R.mean(axis=1) / std * math.sqrt(periods_per_year), 0.0)
+        end = equity[:, -1]
+        exponent = np.clip(np.log(np.maximum(end, 1e-300)) * (365.25 / days), -10.0, 10.0)
+        cagr = np.where(end > 0, (np.exp(exponent) - 1) * 100, -100.0)
+    return {"Sharpe Ratio": sharpe, "Max Drawdown (%)": max_dd, "CAGR (%)": cagr}
+
+
+def _days_spanned(index: pd.Index) -> int:
+    from ..backtester import Tearsheet
+    return Tearsheet._days_spanned(index, len(index))
+
+
+def inputs_from_tearsheet(metrics: Dict[str, Any]) -> Tuple[pd.Series, np.ndarray]:
+    """Bar and trade returns from a full-level ``Tearsheet.calculate_metrics`` result.
+
+    Returns:
+        Tuple of (continuous-model bar returns recovered from ``equity_curve``,
+        discrete trade returns as fractions from ``trade_log``).
+    """
+    equity = metrics["equity_curve"]
+    returns = equity.pct_change()
+    returns.iloc[0] = equity.iloc[0] - 1.0
+    trade_log = metrics.get("trade_log", pd.DataFrame())
+    trades = trade_log["return_pct"].to_numpy(dtype=float) / 100 if len(trade_log) else np.empty(0)
+    return returns, trades
+
+
+def inputs_from_portfolio(result: Dict[str, Any], starting_capital: float) -> Tuple[pd.Series, np.ndarray]:
+    """Bar and trade returns from a ``PortfolioBacktester.run`` result.
+
+    Trade returns are each round trip's P&L relative to the capital it
+    committed (``pnl / (shares * entry_price)``).
+    """
+    equity = result["equity_curve"]
+    returns = equity.pct_change()
+    returns.iloc[0] = equity.iloc[0] / starting_capital - 1.0
+    trade_log = result.get("trade_log", pd.DataFrame())
+    if len(trade_log):
+        committed = (trade_log["shares"] * trade_log["entry_price"]).to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            trades = trade_log["pnl"].to_numpy(dtype=float) / committed
+        trades = trades[np.isfinite(trades)]
+    else:
+        trades = np.empty(0)
+    return returns, trades
+
+
+def run_robustness(
+    returns: pd.Series,
+    trade_returns: Optional[Iterable[float]] = None,
+    method: str = "block_bootstrap",
+    n_paths: int = 10_000,
+    confidence: float = 0.95,
+    mean_block: Optional[float] = None,
+    noise_scale: float = 0.5,
+    seed: Optional[int] = None,
+    chunk_mb: float = DEFAULT_CHUNK_MB,
+) -> Dict[str, Any]:
+    """Resamples a strategy's returns and reports confidence intervals.
+
+    Args:
+        returns: Per-bar strategy returns with a ``DatetimeIndex``. NaN bars
+            are dropped. The index sets the calendar span used for CAGR.
+        trade_returns: Round-trip returns as fractions. Required for
+            ``trade_shuffle``.
+        method: One of ROBUSTNESS_METHODS.
+        n_paths: Number of resampled histories.
+        confidence: Two-sided interval level, e.g. 0.95 for the 2.5th-97.5th
+            percentiles.
+        mean_block: Mean block length in bars for ``block_bootstrap``.
+            Defaults to ``n ** (1/3)``.
+        noise_scale: Noise standard deviation for ``noise``, as a multiple of
+            the returns' own standard deviation.
+        seed: Seed for reproducible paths.
+        chunk_mb: Working-memory budget per chunk of paths.
+
+    Returns:
+        dict: ``method``, ``n_paths``, ``confidence``, ``n_obs``, ``metrics``
+        (per name in ROBUSTNESS_METRICS: ``point``, ``mean``, ``std``,
+        ``lower``, ``upper`` and ``percentile`` -- the share of paths at or
+        below the observed value), and ``prob_loss`` (share of paths with
+        negative CAGR).
+
+    Raises:
+        ValueError: On an unknown method, bad options, or too little data.
+    """
+    if method not in ROBUSTNESS_METHODS:
+        raise ValueError(f"method must be one of {ROBUSTNESS_METHODS}, got {method!r}")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    if n_paths < 1:
+        raise ValueError(f"n_paths must be positive, got {n_paths}")
+
+    returns = pd.Series(returns).dropna()
+    days = _days_spanned(returns.index)
+    if method == "trade_shuffle":
+        sample = np.asarray(list(trade_returns) if trade_returns is not None else [], dtype=float)
+        sample = sample[np.isfinite(sample)]
+        # Trade Sharpe is annualised by the trade rate over the same span.
+        periods_per_year = len(sample) * 365.25 / days
+    else:
+        sample = returns.to_numpy(dtype=float)
+        periods_per_year = 252
+    n = len(sample)
+    if n < 2:
+        raise ValueError(f"{method} needs at least 2 {'trades' if method == 'trade_shuffle' else 'bars'}, got {n}")
+    if mean_block is None:
+        mean_block = n ** (1 / 3)
+
+    rng = np.random.default_rng(seed)
+    sigma = float(sample.std(ddof=1))
+    chunk = max(1, int(chunk_mb * 2 ** 20 // (n * 8 * _ARRAYS_PER_PATH)))
+    scores = {name: np.empty(n_paths) for name in ROBUSTNESS_METRICS}
+    for lo in range(0, n_paths, chunk):
+        m = min(chunk, n_paths - lo)
+        if method == "block_bootstrap":
+            R = sample[stationary_bootstrap_indices(n, m, mean_block, rng)]
+        elif method == "trade_shuffle":
+            R = sample[rng.permuted(np.broadcast_to(np.arange(n), (m, n)), axis=1)]
+        else:
+            R = sample + rng.normal(0.0, noise_scale * sigma, size=(m, n))
+            # Keep noisy returns above -100% so compounding stays defined.
+            np.maximum(R, -0.99, out=R)
+        for name, values in path_metrics(R, periods_per_year, days).items():
+            scores[name][lo:lo + m] = values
+
+    point = path_metrics(sample[None, :], periods_per_year, days)
+    alpha = (1.0 - confidence) / 2
+    metrics = {}
+    for name in ROBUSTNESS_METRICS:
+        values = scores[name]
+        observed = float(point[name][0])
+        lower, upper = np.quantile(values, [alpha, 1.0 - alpha])
+        metrics[name] = {
+            "point":      round(observed, 4),
+            "mean":       round(float(values.mean()), 4),
+            "std":        round(float(values.std()), 4),
+            "lower":      round(float(lower), 4),
+            "upper":      round(float(upper), 4),
+            "percentile": round(float(
+                ((values <= observed) | np.isclose(values, observed)).mean() * 100
+            ), 2),
+        }
+
+    return {
+        "method":     method,
+        "n_paths":    int(n_paths),
+        "confidence": confidence,
+        "n_obs":      n,
+        "metrics":    metrics,
+        "prob_loss":  round(float((scores["CAGR (%)"] < 0).mean()), 4),
+    }
+
+
+def robustness_report(
+    returns: pd.Series,
+    trade_returns: Optional[Iterable[float]] = None,
+    methods: Iterable[str] = ROBUSTNESS_METHODS,
+    **options: Any,
+) -> Dict[str, Dict[str, Any]]:
+    """Runs ``run_robustness`` once per method; the result-payload section.
+
+    ``trade_shuffle`` is skipped when there are fewer than two trades.
+    Keyword options are passed to every run.
+
+    Returns:
+        dict: ``{method: run_robustness(...) result}``.
+    """
+    trades = np.asarray(list(trade_returns) if trade_returns is not None else [], dtype=float)
+    report = {}
+    for method in methods:
+        if method == "trade_shuffle" and len(trades) < 2:
+            continue
+        report[method] = run_robustness(returns, trades, method=method, **options)
+    return report
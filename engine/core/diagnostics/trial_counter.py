@@ -1,8 +1,10 @@
 """Persistent trial counter for strategy diagnostics.
 
 Every time a backtest or training job runs for a given strategy, the counter
-is incremented. The total count is consumed by the Deflated Sharpe Ratio
-calculation so that the expected-maximum-SR benchmark grows with each trial.
+is incremented. Hyperparameter searches add one per finished trial, since
+each trial is a configuration that was tried and discarded. The total count
+is consumed by the Deflated Sharpe Ratio calculation so that the
+expected-maximum-SR benchmark grows with each trial.
 """
 import sqlite3
 from datetime import datetime, timezone
@@ -10,6 +12,12 @@ from pathlib import Path
 
 _DB_PATH = Path(__file__).parents[3] / "data" / "diagnostics.db"
 
+_COLUMNS = {
+    "backtest": "backtest_count",
+    "train": "train_count",
+    "optimize": "optimize_count",
+}
+
 
 def _conn() -> sqlite3.Connection:
     _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -19,36 +27,43 @@ def _conn() -> sqlite3.Connection:
             strategy_name  TEXT    PRIMARY KEY,
             backtest_count INTEGER DEFAULT 0,
             train_count    INTEGER DEFAULT 0,
+            optimize_count INTEGER DEFAULT 0,
             last_run_at    TEXT
         )
     """)
+    # Databases created before optimize_count existed.
+    columns = {r[1] for r in conn.execute("PRAGMA table_info(trial_counts)")}
+    if "optimize_count" not in columns:
+        conn.execute(
+            "ALTER TABLE trial_counts ADD COLUMN optimize_count INTEGER DEFAULT 0"
+        )
     conn.commit()
     return conn
 
 
-def increment(strategy_name: str, mode: str) -> None:
-    """Increment backtest or train counter. mode: 'backtest' or 'train'."""
-    col = "backtest_count" if mode == "backtest" else "train_count"
+def increment(strategy_name: str, mode: str, n: int = 1) -> None:
+    """Increment a counter by n. mode: 'backtest', 'train' or 'optimize'."""
+    col = _COLUMNS.get(mode, "train_count")
     now = datetime.now(timezone.utc).isoformat()
     with _conn() as conn:
         conn.execute(
             f"""
             INSERT INTO trial_counts (strategy_name, {col}, last_run_at)
-            VALUES (?, 1, ?)
+            VALUES (?, ?, ?)
             ON CONFLICT(strategy_name) DO UPDATE SET
-                {col} = {col} + 1,
+                {col} = {col} + excluded.{col},
                 last_run_at = excluded.last_run_at
             """,
-            (strategy_name, now),
+            (strategy_name, int(n), now),
         )
 
 
 def get_total_trials(strategy_name: str) -> int:
-    """Return backtest_count + train_count. Returns 1 if never recorded."""
+    """Return backtest + train + optimize counts. Returns 1 if never recorded."""
     try:
         with _conn() as conn:
             row = conn.execute(
-                "SELECT backtest_count + train_count "
+                "SELECT backtest_count + train_count + optimize_count "
                 "FROM trial_counts WHERE strategy_name = ?",
                 (strategy_name,),
             ).fetchone()
@@ -62,8 +77,8 @@ def get_all() -> list:
     try:
         with _conn() as conn:
             rows = conn.execute(
-                "SELECT strategy_name, backtest_count, train_count, "
-                "backtest_count + train_count AS total, last_run_at "
+                "SELECT strategy_name, backtest_count, train_count, optimize_count, "
+                "backtest_count + train_count + optimize_count AS total, last_run_at "
                 "FROM trial_counts ORDER BY strategy_name"
             ).fetchall()
         return [
@@ -71,8 +86,9 @@ def get_all() -> list:
                 "strategy_name": r[0],
                 "backtest_count": r[1],
                 "train_count": r[2],
-                "total_count": r[3],
-                "last_run_at": r[4],
+                "optimize_count": r[3],
+                "total_count": r[4],
+                "last_run_at": r[5],
             }
             for r in rows
         ]
@@ -80,18 +96,21 @@ def get_all() -> list:
         return []
 
 
-def set_counts(strategy_name: str, backtest_count: int, train_count: int) -> None:
+def set_counts(strategy_name: str, backtest_count: int, train_count: int,
+               optimize_count: int = 0) -> None:
     """Directly set counts (for backfill or manual correction)."""
     now = datetime.now(timezone.utc).isoformat()
     with _conn() as conn:
         conn.execute(
             """
-            INSERT INTO trial_counts (strategy_name, backtest_count, train_count, last_run_at)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO trial_counts
+                (strategy_name, backtest_count, train_count, optimize_count, last_run_at)
+            VALUES (?, ?, ?, ?, ?)
             ON CONFLICT(strategy_name) DO UPDATE SET
                 backtest_count = excluded.backtest_count,
                 train_count    = excluded.train_count,
+                optimize_count = excluded.optimize_count,
                 last_run_at    = excluded.last_run_at
             """,
-            (strategy_name, backtest_count, train_count, now),
+            (strategy_name, backtest_count, train_count, optimize_count, now),
         )
@@ -1,7 +1,10 @@
 """Google Trends search-interest feature.
 
-Uses pytrends (rate-limited, ~1 req/sec). Data is weekly from Google Trends
-and forward-filled onto the daily price index.
+Data is weekly from Google Trends and forward-filled onto the daily price
+index. History is persisted in data/trends.db and fetched by a rate-limited
+background queue (see data_broker/trends_fetcher.py); compute() never waits
+on Google and returns NaN until the queued fetch has landed.
+Run ``CLI.py trends-fetch --universe ...`` before a backtest to fill the store.
 
 Install: uv add pytrends
 
@@ -19,50 +22,12 @@ zscore : 252-day z-score of the ratio
 """
 
 import logging
-import time
 from typing import Dict, Any, List
 import pandas as pd
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
 
 logger = logging.getLogger("model-engine.features.alternative.google_trends")
 
-# In-process cache keyed by (ticker, start, end)
-_trends_cache: Dict[str, pd.Series] = {}
-
-
-def _fetch_trends_raw(ticker: str, start: str, end: str) -> pd.Series:
-    """Fetches weekly Google Trends interest for ticker. Returns Series with DatetimeIndex."""
-    try:
-        from pytrends.request import TrendReq
-    except ImportError:
-        logger.error("pytrends not installed. Run: uv add pytrends")
-        return pd.Series(dtype=float)
-
-    cache_key = f"{ticker}|{start}|{end}"
-    if cache_key in _trends_cache:
-        return _trends_cache[cache_key]
-
-    try:
-        pt = TrendReq(hl="en-US", tz=360, timeout=(10, 25), retries=2, backoff_factor=0.5)
-        pt.build_payload([ticker], cat=0, timeframe=f"{start} {end}", geo="US", gprop="")
-        time.sleep(1.2)   # stay under Google's rate limit
-        df = pt.interest_over_time()
-
-        if df.empty or ticker not in df.columns:
-            return pd.Series(dtype=float)
-
-        series = df[ticker].astype(float)
-        if series.index.tz is not None:
-            series.index = series.index.tz_localize(None)
-        series.index = pd.to_datetime(series.index)
-
-        _trends_cache[cache_key] = series
-        return series
-
-    except Exception as e:
-        logger.warning(f"GoogleTrends fetch failed for {ticker}: {e}")
-        return pd.Series(dtype=float)
-
 
 @register_feature("GoogleTrends")
 class GoogleTrends(Feature):
@@ -72,7 +37,9 @@ class GoogleTrends(Feature):
     for retail-heavy names). The 8-week median normalises for secular trend changes
     in a ticker's search popularity.
 
-    Rate-limited and best suited for weekly-refreshed universes.
+    Reads only from the local trends store. A missing or stale range is queued
+    for the background fetcher and the outputs are NaN (or cover only the
+    stored part) until a later run picks the data up.
     """
 
     @property
@@ -101,6 +68,10 @@ class GoogleTrends(Feature):
             OutputSchema(name="zscore",  output_type=OutputType.LINE, pane=Pane.NEW),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # Rolling median of the daily-filled series, then a 252-bar z-score.
+        return int(params.get("median_window", 8)) * 7 - 1 + 251
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         ticker        = params.get("ticker", "")
         median_window = int(params.get("median_window", 8))
@@ -113,12 +84,21 @@ class GoogleTrends(Feature):
             logger.warning("GoogleTrends: 'ticker' param is required")
             return FeatureResult(data={col_ratio: nan, col_zscore: nan})
 
-        start = df.index.min().strftime("%Y-%m-%d")
-        end   = df.index.max().strftime("%Y-%m-%d")
-
-        raw = _fetch_trends_raw(ticker, start, end)
+        # One week of lead-in so the first bars have an observation to carry forward.
+        start = df.index.min() - pd.Timedelta(days=7)
+        end   = df.index.max()
+        if start.tz is not None:
+            start, end = start.tz_localize(None), end.tz_localize(None)
+
+        from ...data_broker.trends_fetcher import get_trends_queue
+        trends = get_trends_queue()
+        if trends.request(ticker, start, end):
+            logger.info(f"GoogleTrends: '{ticker}' not fully stored yet; fetch queued")
+        raw = trends.db.get_series(ticker, start, end)
         if raw.empty:
             return FeatureResult(data={col_ratio: nan, col_zscore: nan})
+        if df.index.tz is not None:
+            raw.index = raw.index.tz_localize(df.index.tz)
 
         # Forward-fill weekly data onto the daily price index
         aligned = raw.reindex(df.index.union(raw.index)).ffill().reindex(df.index)
@@ -71,6 +71,9 @@ class InsiderFlow(Feature):
             OutputSchema(name="cluster",        output_type=OutputType.MARKER, pane=Pane.NEW),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return int(params.get("window", 14)) - 1
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         ticker      = params.get("ticker", "")
         window      = int(params.get("window", 14))
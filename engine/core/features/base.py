@@ -7,16 +7,20 @@ used to build and compute financial indicators or features consistently.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any, Optional, Type, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, Type, TYPE_CHECKING
+import math
 import pandas as pd
 
+from .registry import FeatureRegistry
+
 if TYPE_CHECKING:
     from .features import FeatureCache
 
 # ---------------------------------------------------------------------------
 # Global Registry
 # ---------------------------------------------------------------------------
-FEATURE_REGISTRY: Dict[str, Type['Feature']] = {}
+# Resolves ids lazily from feature_index.json; see registry.py.
+FEATURE_REGISTRY: FeatureRegistry = FeatureRegistry()
 
 def register_feature(name: str):
     """Registers a Feature class into the global system registry.
@@ -36,6 +40,36 @@ def register_feature(name: str):
     return decorator
 
 
+# ---------------------------------------------------------------------------
+# Warmup helpers
+# ---------------------------------------------------------------------------
+# Rolling window used by Feature.normalize(method="z_score").
+Z_SCORE_WINDOW = 20
+
+# An adjust=False EMA counts as converged once its seed bar carries less than
+# this fraction of the weight.
+EMA_SEED_TOLERANCE = 0.01
+
+# Parameter names the default Feature.warmup treats as lookback lengths.
+LOOKBACK_KEYS = ("window", "period", "slow", "fast", "lookback")
+
+
+def ema_warmup(span: Optional[float] = None, alpha: Optional[float] = None) -> int:
+    """Bars an ``ewm(adjust=False)`` series needs before its seed stops mattering.
+
+    Pass either ``span`` (``alpha = 2 / (span + 1)``) or ``alpha`` directly
+    (Wilder smoothing uses ``alpha = 1 / period``).
+
+    Returns:
+        int: The smallest n with ``(1 - alpha) ** n <= EMA_SEED_TOLERANCE``.
+    """
+    if alpha is None:
+        alpha = 2.0 / (float(span) + 1.0)
+    if alpha >= 1.0:
+        return 0
+    return int(math.ceil(math.log(EMA_SEED_TOLERANCE) / math.log(1.0 - alpha)))
+
+
 # ---------------------------------------------------------------------------
 # Output Type System
 # ---------------------------------------------------------------------------
@@ -247,7 +281,63 @@ class Feature(ABC):
         """
         return []
 
-    def normalize(self, df: pd.DataFrame, series: pd.Series, method: str, window: int = 20) -> pd.Series:
+    def warmup(self, params: Dict[str, Any]) -> int:
+        """Declares how many leading bars this feature needs before its outputs are valid.
+
+        The count is measured on top of this feature's dependencies (see
+        ``dependencies``); the orchestrator adds the longest dependency warmup
+        to it. Rolling windows contribute ``window - 1``, shifts and diffs
+        their lag, EMAs ``ema_warmup(span)`` and z-score normalization
+        ``Z_SCORE_WINDOW - 1``. Cumulative or recursive outputs (OBV,
+        Supertrend) are defined after their warmup but still depend on where
+        the frame starts.
+
+        The default keeps the historical heuristic: the largest integer
+        parameter named like a lookback (``LOOKBACK_KEYS``) plus the
+        normalization warmup. Built-in features override it with an exact
+        figure.
+
+        Args:
+            params: The parameter dict that will be passed to ``compute``.
+
+        Returns:
+            int: Number of bars to purge before the first usable row.
+        """
+        lookback = 0
+        for k, v in params.items():
+            if k.lower() in LOOKBACK_KEYS and isinstance(v, (int, float)) and not isinstance(v, bool):
+                lookback = max(lookback, int(v))
+        return lookback + self.normalization_warmup(params)
+
+    def dependencies(self, params: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Lists the ``(feature_id, params)`` pairs this feature pulls from the cache.
+
+        Must mirror the ``cache.get_series`` calls made by ``compute`` so that
+        warmups compose. Defaults to no dependencies.
+        """
+        return []
+
+    @staticmethod
+    def normalization_warmup(params: Dict[str, Any]) -> int:
+        """Extra bars consumed by the ``normalize`` parameter (z-score only)."""
+        return Z_SCORE_WINDOW - 1 if params.get("normalize") == "z_score" else 0
+
+    @property
+    def pinned_dtype(self) -> Optional[str]:
+        """Declares a floating-point dtype this feature's outputs must keep.
+
+        When a manifest requests ``"dtype": "float32"`` the orchestrator casts
+        every feature output down to single precision. Features whose values
+        lose meaningful precision in float32 — cumulative sums such as OBV,
+        where late values dwarf the per-bar increments — override this to
+        return ``"float64"`` and are left untouched.
+
+        Returns:
+            Optional[str]: A numpy dtype name, or None to follow the manifest.
+        """
+        return None
+
+    def normalize(self, df: pd.DataFrame, series: pd.Series, method: str, window: int = Z_SCORE_WINDOW) -> pd.Series:
         """Systematically normalizes raw indicator data for downstream machine learning.
 
         Args:
@@ -291,6 +381,11 @@ class Feature(ABC):
         and is responsible for calculating the indicator series without mutating
         the input DataFrame. Intermediate computations should leverage the cache.
 
+        When called through the orchestrator, ``df`` is a read-only view: its
+        numpy buffers are shared with the engine's frame and marked
+        non-writeable, so there is no need to copy it defensively. Derive new
+        Series (``df["close"] * 2``) rather than writing into existing ones.
+
         Args:
             df (pd.DataFrame): The raw market data containing OHLCV columns.
             params (Dict[str, Any]): The hyperparameter dictionary for calculation.
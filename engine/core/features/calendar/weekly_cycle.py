@@ -28,6 +28,9 @@ class WeeklyCycle(Feature):
             OutputSchema(name="cos", output_type=OutputType.LINE, pane=Pane.NEW, y_range=(-1.0, 1.0)),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return 0
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         index = df.index
         if not isinstance(index, pd.DatetimeIndex):
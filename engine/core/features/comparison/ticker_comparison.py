@@ -3,10 +3,6 @@ import pandas as pd
 import numpy as np
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
 
-# Module-level cache: avoids re-fetching the same comparison ticker
-# across multiple assets in a batch run.  Keyed by (ticker, interval).
-_comp_cache: Dict[tuple, pd.DataFrame] = {}
-
 
 def _infer_interval(index: pd.DatetimeIndex) -> str:
     """Infer the data interval from the DataFrame's datetime index."""
@@ -67,6 +63,10 @@ class TickerComparison(Feature):
             "window": {"type": "int", "min": 5, "max": 252, "description": "Rolling window for correlation and beta"},
         }
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # One bar for returns, then rolling windows of ``window`` bars.
+        return int(params.get("window", 20))
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Optional[Any] = None) -> FeatureResult:
         compare_ticker = str(params.get("compare_ticker", "SPY")).upper()
         window = int(params.get("window", 20))
@@ -74,16 +74,11 @@ class TickerComparison(Feature):
         close_col = "Close" if "Close" in df.columns else "close"
         primary_close = df[close_col]
 
-        # Fetch comparison ticker data via the DataBroker (cached across batch calls)
-        from engine.core.data_broker import DataBroker
+        # Comparison ticker comes from the shared reference cache, so a batch
+        # run loads it once rather than once per asset.
+        from engine.core.data_broker.reference import get_reference_series
         interval = _infer_interval(df.index)
-        cache_key = (compare_ticker, interval)
-        if cache_key in _comp_cache:
-            comp_df = _comp_cache[cache_key]
-        else:
-            broker = DataBroker()
-            comp_df = broker.get_data(compare_ticker, interval)
-            _comp_cache[cache_key] = comp_df
+        comp_df = get_reference_series().frame(compare_ticker, interval, end=df.index.max())
 
         if comp_df.empty:
             # Return NaN series if comparison data unavailable
@@ -94,8 +89,7 @@ class TickerComparison(Feature):
             regime_col = self.generate_column_name("TICKER_COMPARE", params, "regime")
             return FeatureResult(data={ratio_col: nan_series, corr_col: nan_series, beta_col: nan_series, regime_col: nan_series})
 
-        comp_close_col = "Close" if "Close" in comp_df.columns else "close"
-        comp_close = comp_df[comp_close_col]
+        comp_close = comp_df["close"]
 
         # Align on shared dates
         primary_aligned, comp_aligned = primary_close.align(comp_close, join="inner")
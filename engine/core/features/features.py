@@ -4,34 +4,325 @@ This module manages the dynamic loading, dependency caching, and safe
 execution of computational features across a primary dataset.
 """
 
-import os
-import importlib
-import pkgutil
+import time
+import tracemalloc
+from contextlib import contextmanager
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from .base import FEATURE_REGISTRY, FeatureResult, Feature
 from ..logger import logger
 from ..exceptions import FeatureError, ValidationError
 
 def load_features():
-    """Dynamically loads and registers all feature modules.
-    
-    This function traverses the features directory, importing each module 
-    to trigger the `@register_feature` decorators, thereby populating the 
-    global feature registry. Base and utility modules are skipped to avoid 
-    circular dependencies.
+    """Eagerly imports and registers every feature module.
+
+    The registry resolves feature ids lazily from ``feature_index.json``, so
+    normal callers never need this. It remains for code that must see every
+    class at once (index generation, exhaustive interface tests).
     """
-    base_dir = os.path.dirname(__file__)
-    for loader, module_name, is_pkg in pkgutil.walk_packages([base_dir], prefix="engine.core.features."):
-        if not is_pkg:
-            if module_name.endswith(".base") or module_name.endswith(".features"):
-                continue
-            try:
-                importlib.import_module(module_name)
-            except Exception as e:
-                logger.error(f"Failed to load feature module {module_name}: {e}", exc_info=True)
+    FEATURE_REGISTRY.load_all()
+
+# Floating-point precisions a manifest may request via its top-level "dtype" key.
+SUPPORTED_DTYPES = ("float32", "float64")
+
+def resolve_dtype(dtype: Optional[Any]) -> Optional[np.dtype]:
+    """Validates a manifest-level dtype request.
+
+    Args:
+        dtype (Optional[Any]): A dtype name such as ``"float32"``, a numpy
+            dtype, or None.
+
+    Returns:
+        Optional[np.dtype]: The resolved numpy dtype, or None when no
+            dtype was requested (features keep whatever they emit).
+
+    Raises:
+        ValidationError: If the dtype is not one of ``SUPPORTED_DTYPES``.
+    """
+    if dtype is None:
+        return None
+    try:
+        resolved = np.dtype(dtype)
+    except TypeError:
+        raise ValidationError(f"Unsupported dtype '{dtype}'. Expected one of {SUPPORTED_DTYPES}.")
+    if resolved.name not in SUPPORTED_DTYPES:
+        raise ValidationError(f"Unsupported dtype '{dtype}'. Expected one of {SUPPORTED_DTYPES}.")
+    return resolved
+
+def _coerce_dtype(series: Any, feature: Feature, dtype: Optional[np.dtype]) -> Any:
+    """Casts a floating-point feature output to the requested dtype.
+
+    Integer, boolean and object outputs are returned unchanged, as are
+    outputs of features that pin their own precision via ``pinned_dtype``.
+    """
+    if dtype is None or not isinstance(series, pd.Series):
+        return series
+    target = np.dtype(feature.pinned_dtype) if feature.pinned_dtype else dtype
+    if not pd.api.types.is_float_dtype(series.dtype) or series.dtype == target:
+        return series
+    return series.astype(target)
+
+def read_only_view(df: pd.DataFrame) -> pd.DataFrame:
+    """Returns a frame sharing ``df``'s buffers with every numpy column marked non-writeable.
+
+    Features receive this view instead of the orchestrator's frame, so an
+    in-place write (``df.loc[...] = x``, ``df["close"].values[0] = x``,
+    ``np.log(col, out=...)``) raises numpy's "assignment destination is
+    read-only" error instead of silently corrupting shared data. Nothing is
+    copied: each column becomes a read-only view onto the original array.
+    Columns backed by pandas extension arrays are passed through as-is.
+
+    Args:
+        df (pd.DataFrame): The frame to protect.
+
+    Returns:
+        pd.DataFrame: A new frame with the same index and columns.
+    """
+    arrays = {}
+    for i, (_, col) in enumerate(df.items()):
+        if isinstance(col.dtype, np.dtype):
+            view = col.to_numpy().view()
+            view.flags.writeable = False
+            arrays[i] = view
+        else:
+            arrays[i] = col
+    view_df = pd.DataFrame(arrays, index=df.index, copy=False)
+    view_df.columns = df.columns
+    return view_df
+
+def _is_write_violation(error: ValueError) -> bool:
+    """True if ``error`` is numpy rejecting a write into a read-only buffer."""
+    message = str(error).lower()
+    return "read-only" in message or "not writable" in message or "not writeable" in message
+
+def _result_nbytes(result: Optional[FeatureResult]) -> int:
+    """Sums the memory held by a result's time-series and heatmap arrays."""
+    if result is None:
+        return 0
+    total = 0
+    for series in (result.data or {}).values():
+        if isinstance(series, pd.Series):
+            total += int(series.memory_usage(index=False))
+    for heatmap in (result.heatmaps or {}).values():
+        intensity = heatmap.get("intensity")
+        if isinstance(intensity, np.ndarray):
+            total += intensity.nbytes
+    return total
+
+def feature_warmup(feature_id: str, params: Optional[Dict[str, Any]] = None) -> int:
+    """Returns the bars ``feature_id`` needs before its outputs are valid.
+
+    Composes ``Feature.warmup`` through ``Feature.dependencies``: a feature's
+    total warmup is its own plus the longest total warmup among the cached
+    series it reads.
+
+    Args:
+        feature_id (str): Registered feature id.
+        params (Optional[Dict[str, Any]]): Parameters passed to ``compute``.
+
+    Returns:
+        int: Number of leading bars to purge.
+
+    Raises:
+        FeatureError: If the dependency graph contains a cycle.
+    """
+    return _feature_warmup(feature_id, dict(params or {}), ())
+
+
+def _feature_warmup(feature_id: str, params: Dict[str, Any], chain: tuple) -> int:
+    if feature_id in chain:
+        raise FeatureError(f"Circular feature dependency: {' -> '.join(chain + (feature_id,))}")
+    feature = FEATURE_REGISTRY[feature_id]()
+    upstream = [
+        _feature_warmup(dep_id, dict(dep_params), chain + (feature_id,))
+        for dep_id, dep_params in feature.dependencies(params)
+    ]
+    return max(0, int(feature.warmup(params))) + max(upstream, default=0)
 
-load_features()
+
+def resolve_warmup(feature_config: List[Dict[str, Any]]) -> int:
+    """Returns the longest warmup across a manifest's feature list.
+
+    This is the number of bars that must precede the first row a strategy
+    uses, and the figure the orchestrator reports as ``l_max``.
+    """
+    return max(
+        (feature_warmup(cfg.get("id"), cfg.get("params", {})) for cfg in feature_config),
+        default=0,
+    )
+
+
+class FeatureProfiler:
+    """Records the cost of every feature invocation within one job.
+
+    A single profiler is shared by every ``compute_features`` call of a job
+    (one per ticker in a batch), so the summary aggregates across assets.
+    Each record carries wall time, output size and — when ``track_memory``
+    is set — the peak bytes allocated while the feature ran, measured with
+    ``tracemalloc``. Dependency lookups served from ``FeatureCache`` are
+    recorded as zero-cost cache hits.
+
+    Wall time and allocations are inclusive: a feature that pulls an
+    uncached dependency through the cache is charged for it as well, and
+    the dependency also gets its own record.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        """Initializes an empty profile.
+
+        Args:
+            track_memory (bool, optional): Measure peak allocations with
+                ``tracemalloc``. Adds noticeable overhead, so it is off for
+                routine jobs. Defaults to False.
+        """
+        self.track_memory = track_memory
+        self.records: List[Dict[str, Any]] = []
+        self._peak_stack: List[int] = []
+        self._owns_trace = False
+
+    def start(self):
+        """Begins memory tracing if requested and not already active."""
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_trace = True
+
+    def stop(self):
+        """Stops memory tracing if this profiler started it."""
+        if self._owns_trace:
+            tracemalloc.stop()
+            self._owns_trace = False
+
+    @contextmanager
+    def measure(self, feature_id: str, key: str, source: str) -> Iterator[Dict[str, Any]]:
+        """Times one feature computation and appends its record.
+
+        Args:
+            feature_id (str): The registry ID being computed.
+            key (str): The cache key (feature ID plus parameters).
+            source (str): ``"orchestrator"`` for manifest entries, or
+                ``"dependency"`` for computations requested through the cache.
+
+        Yields:
+            Dict[str, Any]: The record being built; callers set
+                ``output_bytes`` once the result is available.
+        """
+        record = {
+            "feature": feature_id,
+            "key": key,
+            "source": source,
+            "cache_hit": False,
+            "wall_ms": 0.0,
+            "alloc_bytes": None,
+            "output_bytes": 0,
+        }
+        tracing = self.track_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._peak_stack:
+                # Bank the enclosing feature's peak so far before resetting
+                self._peak_stack[-1] = max(self._peak_stack[-1], peak)
+            tracemalloc.reset_peak()
+            self._peak_stack.append(current)
+            start_bytes = current
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_ms"] = (time.perf_counter() - t0) * 1000.0
+            if tracing:
+                peak = max(self._peak_stack.pop(), tracemalloc.get_traced_memory()[1])
+                record["alloc_bytes"] = max(0, peak - start_bytes)
+                if self._peak_stack:
+                    self._peak_stack[-1] = max(self._peak_stack[-1], peak)
+                tracemalloc.reset_peak()
+            self.records.append(record)
+
+    def record_hit(self, feature_id: str, key: str, series: Any = None):
+        """Records a dependency served from the cache without computation."""
+        nbytes = int(series.memory_usage(index=False)) if isinstance(series, pd.Series) else 0
+        self.records.append({
+            "feature": feature_id,
+            "key": key,
+            "source": "dependency",
+            "cache_hit": True,
+            "wall_ms": 0.0,
+            "alloc_bytes": None,
+            "output_bytes": nbytes,
+        })
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregates the records per feature ID.
+
+        Returns:
+            Dict[str, Any]: ``total_ms`` (wall time of manifest-level
+                computations), ``n_invocations``, ``n_cache_hits`` and a
+                ``features`` list sorted by descending wall time, one entry per
+                feature ID with ``calls``, ``cache_hits``, ``wall_ms``,
+                ``alloc_bytes`` (peak, None when untracked) and ``output_bytes``.
+        """
+        by_feature: Dict[str, Dict[str, Any]] = {}
+        for r in self.records:
+            agg = by_feature.setdefault(r["feature"], {
+                "feature": r["feature"],
+                "calls": 0,
+                "cache_hits": 0,
+                "wall_ms": 0.0,
+                "alloc_bytes": None,
+                "output_bytes": 0,
+            })
+            if r["cache_hit"]:
+                agg["cache_hits"] += 1
+                continue
+            agg["calls"] += 1
+            agg["wall_ms"] += r["wall_ms"]
+            agg["output_bytes"] += r["output_bytes"]
+            if r["alloc_bytes"] is not None:
+                agg["alloc_bytes"] = max(agg["alloc_bytes"] or 0, r["alloc_bytes"])
+
+        features = sorted(by_feature.values(), key=lambda a: -a["wall_ms"])
+        for agg in features:
+            agg["wall_ms"] = round(agg["wall_ms"], 3)
+        return {
+            "total_ms": round(sum(
+                r["wall_ms"] for r in self.records if r["source"] == "orchestrator"
+            ), 3),
+            "n_invocations": sum(1 for r in self.records if not r["cache_hit"]),
+            "n_cache_hits": sum(1 for r in self.records if r["cache_hit"]),
+            "features": features,
+        }
+
+    def log_report(self, title: str = "FEATURE PROFILE"):
+        """Logs the per-feature cost table."""
+        if not self.records:
+            return
+        lines = format_profile_report(self.summary(), title)
+        logger.info("\n%s", "\n".join(lines))
+
+def format_profile_report(summary: Dict[str, Any], title: str = "FEATURE PROFILE") -> List[str]:
+    """Renders a ``FeatureProfiler.summary()`` dict as fixed-width table lines."""
+    def _mb(n: Optional[int]) -> str:
+        return f"{n / 1e6:>9.2f}" if n is not None else f"{'N/A':>9}"
+
+    lines = ["=" * 78, f"{title:^78}", "=" * 78]
+    lines.append(
+        f"  {'Feature':<28} {'Calls':>6} {'Hits':>5} {'Wall ms':>11} "
+        f"{'Alloc MB':>9} {'Out MB':>9}"
+    )
+    lines.append("  " + "-" * 76)
+    for agg in summary.get("features", []):
+        lines.append(
+            f"  {agg['feature'][:28]:<28} {agg['calls']:>6} {agg['cache_hits']:>5} "
+            f"{agg['wall_ms']:>11.2f} {_mb(agg['alloc_bytes'])} {_mb(agg['output_bytes'])}"
+        )
+    lines.append("  " + "-" * 76)
+    lines.append(
+        f"  Total {summary.get('total_ms', 0.0):.2f} ms across "
+        f"{summary.get('n_invocations', 0)} computations, "
+        f"{summary.get('n_cache_hits', 0)} cache hits"
+    )
+    lines.append("=" * 78)
+    return lines
 
 class FeatureCache:
     """Manages in-memory caching of computed feature series.
@@ -40,9 +331,18 @@ class FeatureCache:
     averages) across multiple distinct features during an orchestration pass.
     """
     
-    def __init__(self):
-        """Initializes the empty dictionary used for memory storage."""
+    def __init__(self, dtype: Optional[Any] = None, profiler: Optional[FeatureProfiler] = None):
+        """Initializes the empty dictionary used for memory storage.
+
+        Args:
+            dtype (Optional[Any], optional): Floating-point dtype that computed
+                dependency series are stored in. Defaults to None (as emitted).
+            profiler (Optional[FeatureProfiler], optional): Receives a record for
+                every dependency computation and cache hit. Defaults to None.
+        """
         self._memory: Dict[str, pd.Series] = {}
+        self.dtype = resolve_dtype(dtype)
+        self.profiler = profiler
 
     def _generate_key(self, feature_id: str, params: Dict[str, Any]) -> str:
         """Generates a unique cache key based on feature ID and parameters.
@@ -77,6 +377,8 @@ class FeatureCache:
         key = self._generate_key(feature_id, params)
         
         if key in self._memory:
+            if self.profiler is not None:
+                self.profiler.record_hit(feature_id, key, self._memory[key])
             return self._memory[key]
             
         if feature_id not in FEATURE_REGISTRY:
@@ -87,9 +389,9 @@ class FeatureCache:
         
         initial_col_count = len(df.columns)
         try:
-            result: FeatureResult = feature_instance.compute(df, params, self)
+            result: FeatureResult = self._compute(feature_instance, feature_id, key, params, df)
         except ValueError as e:
-            if "read-only" in str(e).lower() or "not writable" in str(e).lower():
+            if _is_write_violation(e):
                 self._raise_memory_violation(feature_id, is_dependency=True)
             raise e
         except Exception as e:
@@ -104,6 +406,7 @@ class FeatureCache:
             
         primary_series = None
         for col_name, series in result.data.items():
+            series = _coerce_dtype(series, feature_instance, self.dtype)
             self._memory[col_name] = series
             if primary_series is None:
                 primary_series = series 
@@ -111,6 +414,16 @@ class FeatureCache:
         self._memory[key] = primary_series
         return primary_series
 
+    def _compute(self, feature_instance: Feature, feature_id: str, key: str,
+                 params: Dict[str, Any], df: pd.DataFrame) -> FeatureResult:
+        """Runs a dependency's compute, under the profiler when one is attached."""
+        if self.profiler is None:
+            return feature_instance.compute(df, params, self)
+        with self.profiler.measure(feature_id, key, "dependency") as record:
+            result = feature_instance.compute(df, params, self)
+            record["output_bytes"] = _result_nbytes(result)
+        return result
+
     def set_series(self, key: str, series: pd.Series):
         """Manually injects a computed series into the memory cache.
 
@@ -159,25 +472,41 @@ class FeatureOrchestrator:
             if feature_id not in FEATURE_REGISTRY:
                 raise ValidationError(f"Feature '{feature_id}' not found in registry.")
 
-    def compute_features(self, df: pd.DataFrame, feature_config: List[Dict[str, Any]]) -> tuple[pd.DataFrame, int]:
+    def compute_features(
+        self,
+        df: pd.DataFrame,
+        feature_config: List[Dict[str, Any]],
+        dtype: Optional[Any] = None,
+        profiler: Optional[FeatureProfiler] = None,
+    ) -> tuple[pd.DataFrame, int]:
         """Executes a batch computation of multiple features sequentially.
 
         This orchestrator iterates through a configuration of requested features, 
         instantiates them from the global registry, and manages a shared cache to 
-        optimize dependencies. It strictly enforces memory safety by ensuring no 
-        feature mutates the original dataset.
+        optimize dependencies. It strictly enforces memory safety: each feature
+        receives a zero-copy ``read_only_view`` of the dataset, so in-place writes
+        fail inside numpy, and adding columns to the view is rejected.
 
         Args:
             df (pd.DataFrame): The base OHLCV dataset. 
             feature_config (List[Dict[str, Any]]): A list of feature request payload 
                 dictionaries. Example: `[{"id": "RSI", "params": {"window": 14}}]`.
+            dtype (Optional[Any], optional): Floating-point dtype for feature
+                outputs (``"float32"`` or ``"float64"``), usually taken from the
+                manifest's top-level ``dtype`` key. Features that declare a
+                ``pinned_dtype`` keep it. Defaults to None (outputs as emitted).
+            profiler (Optional[FeatureProfiler], optional): Collects wall time,
+                allocations and output size for every feature invocation,
+                including dependency computations and cache hits. Pass the
+                same instance across a batch to aggregate per job.
+                Defaults to None.
 
         Returns:
             tuple:
                 - pd.DataFrame: A newly concatenated DataFrame containing the original 
                   OHLCV data alongside all newly computed feature columns.
-                - int: The maximum lookback window discovered across all feature 
-                  parameters, required for safe data truncation downstream.
+                - int: The longest declared warmup across all features (see
+                  ``resolve_warmup``), required for safe data truncation downstream.
 
         Raises:
             ValidationError: If configuration validation fails.
@@ -185,48 +514,55 @@ class FeatureOrchestrator:
                 if general computation fails.
         """
         self.validate_config(feature_config)
+        dtype = resolve_dtype(dtype)
 
         computed_features = {}
-        l_max = 0
-        lookback_keys = ["window", "period", "slow", "fast", "lookback"]
+        l_max = resolve_warmup(feature_config)
 
-        cache = FeatureCache()
+        cache = FeatureCache(dtype, profiler)
+        # Features only ever see a read-only view; it is rebuilt (without
+        # copying) whenever new columns are appended to ``df``.
+        view = read_only_view(df)
 
         for config in feature_config:
             feature_id = config.get("id")
             params = config.get("params", {})
 
-            for k, v in params.items():
-                if k.lower() in lookback_keys and isinstance(v, (int, float)):
-                    l_max = max(l_max, int(v))
-
             feature_cls = FEATURE_REGISTRY[feature_id]
             feature_instance = feature_cls()
 
-            initial_col_count = len(df.columns)
+            initial_col_count = len(view.columns)
             try:
-                result: FeatureResult = feature_instance.compute(df, params, cache)
+                if profiler is None:
+                    result: FeatureResult = feature_instance.compute(view, params, cache)
+                else:
+                    key = cache._generate_key(feature_id, params)
+                    with profiler.measure(feature_id, key, "orchestrator") as record:
+                        result = feature_instance.compute(view, params, cache)
+                        record["output_bytes"] = _result_nbytes(result)
             except ValueError as e:
-                if "read-only" in str(e).lower() or "not writable" in str(e).lower():
+                if _is_write_violation(e):
                     self._raise_memory_violation(feature_id)
                 raise e
             except Exception as e:
                 logger.error(f"Orchestrator failed to compute feature {feature_id}: {e}", exc_info=True)
                 raise FeatureError(f"Feature computation failed for {feature_id}")
 
-            if len(df.columns) != initial_col_count:
+            if len(view.columns) != initial_col_count:
                 self._raise_memory_violation(feature_id)
 
             if result.data:
                 new_cols = {}
                 for col_name, series in result.data.items():
                     if col_name not in computed_features:
+                        series = _coerce_dtype(series, feature_instance, dtype)
                         computed_features[col_name] = series
                         cache.set_series(col_name, series)
                         new_cols[col_name] = series
                 if new_cols:
                     df = pd.concat([df, pd.DataFrame(new_cols)], axis=1)
                     df = df.loc[:, ~df.columns.duplicated()]
+                    view = read_only_view(df)
 
         return df, l_max
 
@@ -248,14 +584,21 @@ class FeatureOrchestrator:
 
 orchestrator = FeatureOrchestrator()
 
-def compute_all_features(df: pd.DataFrame, feature_config: List[Dict[str, Any]]):
+def compute_all_features(
+    df: pd.DataFrame,
+    feature_config: List[Dict[str, Any]],
+    dtype: Optional[Any] = None,
+    profiler: Optional[FeatureProfiler] = None,
+):
     """Utility function wrapper for high-level feature batch computation.
 
     Args:
         df (pd.DataFrame): The base market dataset.
         feature_config (List[Dict[str, Any]]): The list of requested features.
+        dtype (Optional[Any], optional): Floating-point dtype for feature outputs.
+        profiler (Optional[FeatureProfiler], optional): Per-job cost recorder.
 
     Returns:
         tuple: See FeatureOrchestrator.compute_features for exact return types.
     """
-    return orchestrator.compute_features(df, feature_config)
+    return orchestrator.compute_features(df, feature_config, dtype=dtype, profiler=profiler)
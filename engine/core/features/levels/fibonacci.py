@@ -36,6 +36,10 @@ class FibonacciRetracement(Feature):
             "lookback": {"min": 0, "max": 1000, "step": 10},
         }
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # Levels are drawn from the trailing window at the last bar.
+        return 0
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         lookback = int(params.get("lookback", 0))
 
@@ -1,9 +1,54 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
-from sklearn.neighbors import KernelDensity
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
 
+# Gaussian tails beyond this many bandwidths contribute < 1e-4 of the peak.
+_KERNEL_SIGMAS = 4.0
+
+
+def _linear_bin(values: np.ndarray, lo: float, dx: float, n_bins: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Splits each value between its two neighbouring grid points.
+
+    Returns the left bin index and the weights assigned to the left and right
+    grid points. NaNs receive zero weight. Linear binning keeps the KDE error
+    at O(dx^2) while letting the kernel sum become a convolution.
+    """
+    valid = np.isfinite(values)
+    pos = np.where(valid, (values - lo) / dx, 0.0)
+    pos = np.clip(pos, 0.0, n_bins - 1)
+    left = np.minimum(np.floor(pos).astype(np.int64), n_bins - 2)
+    frac = pos - left
+    w_right = np.where(valid, frac, 0.0)
+    w_left = np.where(valid, 1.0 - frac, 0.0)
+    return left, w_left, w_right
+
+
+def _gaussian_smooth(counts: np.ndarray, dx: float, bandwidth: float) -> np.ndarray:
+    """Convolves binned counts (last axis) with a Gaussian kernel via FFT.
+
+    Zero-padded so the convolution is linear, not circular. Cost is
+    O(grid log grid) per row regardless of how many samples were binned.
+    """
+    n_bins = counts.shape[-1]
+    half = int(min(n_bins - 1, np.ceil(_KERNEL_SIGMAS * bandwidth / dx)))
+    offsets = np.arange(-half, half + 1) * dx
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+
+    n_fft = 1 << int(np.ceil(np.log2(n_bins + 2 * half + 1)))
+    spectrum = np.fft.rfft(counts, n=n_fft, axis=-1) * np.fft.rfft(kernel, n=n_fft)
+    smoothed = np.fft.irfft(spectrum, n=n_fft, axis=-1)[..., half:half + n_bins]
+    # FFT round-off can leave tiny negatives where the true density is zero.
+    return np.maximum(smoothed, 0.0)
+
+
+def _minmax(density: np.ndarray) -> np.ndarray:
+    """Normalizes density to 0-1 along the price axis."""
+    d_min = density.min(axis=-1, keepdims=True)
+    d_max = density.max(axis=-1, keepdims=True)
+    span = d_max - d_min
+    return np.where(span > 0, (density - d_min) / np.where(span > 0, span, 1.0), density)
+
 
 @register_feature("KDE")
 class KernelDensityEstimation(Feature):
@@ -13,7 +58,10 @@ class KernelDensityEstimation(Feature):
 
     @property
     def description(self) -> str:
-        return "Price density estimation using Gaussian kernel density."
+        return (
+            "Price density estimation using a binned Gaussian KDE. 'static' gives one "
+            "profile over the whole history; 'rolling'/'expanding' give a time x price heatmap."
+        )
 
     @property
     def category(self) -> str:
@@ -31,6 +79,9 @@ class KernelDensityEstimation(Feature):
             "bandwidth": 1.0,
             "source": "Close",
             "resolution": 1000,
+            "mode": "static",
+            "window": 500,
+            "time_bins": 300,
         }
 
     @property
@@ -39,34 +90,104 @@ class KernelDensityEstimation(Feature):
             "bandwidth": {"min": 0.1, "max": 10.0, "step": 0.1},
             "source": {"options": ["Close", "High", "Low", "Open"]},
             "resolution": {"min": 100, "max": 2000, "step": 100},
+            "mode": {"options": ["static", "rolling", "expanding"]},
+            "window": {"min": 20, "max": 5000, "step": 10},
+            "time_bins": {"min": 10, "max": 2000, "step": 10},
         }
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        if params.get("mode", "static") != "rolling":
+            return 0
+        return int(params.get("window", 500)) - 1
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         bandwidth = float(params.get("bandwidth", 1.0))
         source_col = params.get("source", "Close")
-        resolution = int(params.get("resolution", 1000))
-
-        prices = df[source_col].dropna().values.reshape(-1, 1)
-
-        kde = KernelDensity(kernel='gaussian', bandwidth=bandwidth)
-        kde.fit(prices)
+        resolution = max(int(params.get("resolution", 1000)), 2)
+        mode = params.get("mode", "static")
 
-        min_price = float(prices.min())
-        max_price = float(prices.max())
-        price_grid = np.linspace(min_price, max_price, resolution).reshape(-1, 1)
+        if source_col not in df.columns:
+            source_col = source_col.lower()
+        values = df[source_col].to_numpy(dtype=np.float64)
 
-        log_density = kde.score_samples(price_grid)
-        density = np.exp(log_density)
+        finite = values[np.isfinite(values)]
+        min_price = float(finite.min())
+        max_price = float(finite.max())
+        price_grid = np.linspace(min_price, max_price, resolution)
+        dx = (max_price - min_price) / (resolution - 1)
 
-        # Normalize density to 0-1
-        d_min, d_max = density.min(), density.max()
-        if d_max > d_min:
-            density = (density - d_min) / (d_max - d_min)
+        if mode == "static":
+            if dx == 0:
+                density = np.ones(resolution)
+            else:
+                left, w_left, w_right = _linear_bin(finite, min_price, dx, resolution)
+                counts = (np.bincount(left, weights=w_left, minlength=resolution)
+                          + np.bincount(left + 1, weights=w_right, minlength=resolution))
+                density = _minmax(_gaussian_smooth(counts, dx, bandwidth))
+            time_index = df.index
+        else:
+            window = int(params.get("window", 500)) if mode == "rolling" else None
+            snapshots = self._snapshot_positions(len(values), int(params.get("time_bins", 300)))
+            if dx == 0:
+                density = np.ones((len(snapshots), resolution))
+            else:
+                counts = self._windowed_counts(values, snapshots, window, min_price, dx, resolution)
+                density = _minmax(_gaussian_smooth(counts, dx, bandwidth))
+            time_index = df.index[snapshots]
 
         return FeatureResult(heatmaps={
             "density": {
-                "price_grid": price_grid.flatten(),
-                "time_index": df.index,
-                "intensity": density.flatten(),
+                "price_grid": price_grid,
+                "time_index": time_index,
+                "intensity": density,
             }
         })
+
+    @staticmethod
+    def _snapshot_positions(n_bars: int, time_bins: int) -> np.ndarray:
+        """Bar positions at which a density column is emitted (last bar of each time bin)."""
+        if n_bars <= time_bins:
+            return np.arange(n_bars)
+        edges = np.ceil(np.linspace(0, n_bars, time_bins + 1)[1:]).astype(np.int64) - 1
+        return np.unique(edges)
+
+    @staticmethod
+    def _windowed_counts(
+        values: np.ndarray,
+        snapshots: np.ndarray,
+        window: Any,
+        lo: float,
+        dx: float,
+        n_bins: int,
+    ) -> np.ndarray:
+        """Binned counts of the trailing window ending at each snapshot bar.
+
+        Each bar adds its binned weight when it enters the window and removes
+        it ``window`` bars later. Events are bucketed by the snapshot segment
+        they fall in and accumulated with a cumulative sum over segments, so
+        every bar is touched twice rather than once per snapshot.
+        """
+        n = len(values)
+        left, w_left, w_right = _linear_bin(values, lo, dx, n_bins)
+        n_seg = len(snapshots)
+        size = n_seg * n_bins
+
+        # Segment s holds bars (snapshots[s-1], snapshots[s]].
+        enter_seg = np.searchsorted(snapshots, np.arange(n), side="left")
+        flat = enter_seg * n_bins + left
+        hist = (np.bincount(flat, weights=w_left, minlength=size)
+                + np.bincount(flat + 1, weights=w_right, minlength=size))
+
+        if window is not None and window < n:
+            leaves = np.arange(n) + window
+            gone = leaves < n
+            leave_seg = np.searchsorted(snapshots, leaves[gone], side="left")
+            in_range = leave_seg < n_seg
+            idx = np.flatnonzero(gone)[in_range]
+            flat = leave_seg[in_range] * n_bins + left[idx]
+            hist -= (np.bincount(flat, weights=w_left[idx], minlength=size)
+                     + np.bincount(flat + 1, weights=w_right[idx], minlength=size))
+
+        counts = np.cumsum(hist.reshape(n_seg, n_bins), axis=0)
+        # Enter/leave cancellation leaves ~1e-12 residue in emptied bins.
+        return np.maximum(counts, 0.0)
@@ -54,6 +54,9 @@ class SupportResistance(Feature):
             G("SupportResistance", params, "second_resistance_level"),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return 2 * int(params.get("window") or 3)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         # Normalize column names: GUI capitalizes, engine uses lowercase
         df = df.rename(columns={'High': 'high', 'Low': 'low', 'Close': 'close',
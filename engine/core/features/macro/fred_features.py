@@ -2,20 +2,10 @@ import logging
 from typing import Dict, Any, List, Optional
 import pandas as pd
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
+from ...exceptions import ValidationError
 
 logger = logging.getLogger("model-engine.features.macro.fred")
 
-_fetcher_instance = None
-
-
-def _get_fetcher():
-    global _fetcher_instance
-    if _fetcher_instance is None:
-        from ...data_broker.fetcher import DataFetcher
-        _fetcher_instance = DataFetcher()
-    return _fetcher_instance
-
-
 class FredFeature(Feature):
     """Base for FRED macro series features.
 
@@ -62,6 +52,10 @@ class FredFeature(Feature):
     def non_stationary_outputs(self, params: Dict[str, Any]) -> List[str]:
         return [self.generate_column_name(self._col_prefix, params, "level")]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # The 252-bar z-score is the longest window.
+        return 251
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         col_level  = self.generate_column_name(self._col_prefix, params, "level")
         col_roc5   = self.generate_column_name(self._col_prefix, params, "roc5")
@@ -72,34 +66,18 @@ class FredFeature(Feature):
         if df.empty:
             return FeatureResult(data={col_level: nan, col_roc5: nan, col_zscore: nan})
 
-        start = df.index.min().strftime("%Y-%m-%d")
-        end   = df.index.max().strftime("%Y-%m-%d")
+        from ...data_broker.macro import get_macro_series
 
         try:
-            raw = _get_fetcher().fetch_macro_data(self.SERIES_ID, start, end)
+            block = get_macro_series().transformed([self.SERIES_ID], df.index)
         except Exception as e:
             logger.warning(f"FRED fetch failed for {self.SERIES_ID}: {e}")
             return FeatureResult(data={col_level: nan, col_roc5: nan, col_zscore: nan})
 
-        if raw.empty:
-            return FeatureResult(data={col_level: nan, col_roc5: nan, col_zscore: nan})
-
-        series = raw.set_index("date")["value"].sort_index()
-        series.index = pd.to_datetime(series.index)
-
-        # Forward-fill weekly/sparse FRED releases onto the daily price index
-        series = series.reindex(df.index.union(series.index)).ffill().reindex(df.index)
-
-        roc5 = series.pct_change(5)
-
-        roll_mean = series.rolling(252, min_periods=63).mean()
-        roll_std  = series.rolling(252, min_periods=63).std()
-        zscore    = (series - roll_mean) / roll_std.replace(0, float("nan"))
-
         return FeatureResult(data={
-            col_level:  series,
-            col_roc5:   roc5,
-            col_zscore: zscore,
+            col_level:  block["level"][self.SERIES_ID],
+            col_roc5:   block["roc5"][self.SERIES_ID],
+            col_zscore: block["zscore"][self.SERIES_ID],
         })
 
 
@@ -150,3 +128,107 @@ class ICSA(FredFeature):
 class DFF(FredFeature):
     SERIES_ID = "DFF"
     LABEL = "Effective Fed Funds Rate"
+
+
+# Every single-series FRED feature, in registration order: {column prefix: series id}.
+FRED_SERIES: Dict[str, str] = {
+    cls.COLUMN_PREFIX or cls.SERIES_ID: cls.SERIES_ID
+    for cls in (NFCI, ANFCI, HYSpread, T10Y2Y, T10Y3M, VIXCLS, ICSA, DFF)
+}
+
+
+@register_feature("MacroBlock")
+class MacroBlock(Feature):
+    """All FRED macro series as one batched block.
+
+    Equivalent to listing every ``FredFeature`` in a manifest, but the series
+    are fetched concurrently in one batch, aligned onto the price index as a
+    single frame, and level / roc5 / zscore are computed column-wise in one
+    pass. The aligned block is shared process-wide, so every ticker in a
+    batch run on the same calendar reuses it.
+
+    Columns are named ``MacroBlock_<PREFIX>_<LEVEL|ROC5|ZSCORE>``, where
+    PREFIX is the upper-cased single-series feature id (e.g. ``HYSPREAD``).
+
+    Parameters:
+        series: Single-series feature ids to include, as a comma-separated
+            string or a list (default: every entry of ``FRED_SERIES``). The
+            selection is not part of the column names, which already carry
+            the series prefix.
+    """
+
+    @property
+    def name(self) -> str:
+        return "FRED Macro Block"
+
+    @property
+    def description(self) -> str:
+        return (
+            "All FRED macro series (" + ", ".join(FRED_SERIES) + ") fetched in one batch. "
+            "Outputs raw level (non-stationary), 5-day ROC, and 252-day z-score per series."
+        )
+
+    @property
+    def category(self) -> str:
+        return "Macro"
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        return {"series": ",".join(FRED_SERIES)}
+
+    @property
+    def output_schema(self) -> List[OutputSchema]:
+        return [
+            OutputSchema(name=f"{prefix}_{kind}", output_type=OutputType.LINE, pane=Pane.NEW)
+            for prefix in FRED_SERIES
+            for kind in ("level", "roc5", "zscore")
+        ]
+
+    @staticmethod
+    def _selected(params: Dict[str, Any]) -> Dict[str, str]:
+        """Resolves the ``series`` param to ``{column prefix: series id}``, in catalogue order."""
+        requested = params.get("series")
+        if requested is None:
+            return dict(FRED_SERIES)
+        if isinstance(requested, str):
+            requested = requested.split(",")
+        wanted = {str(r).strip().upper() for r in requested if str(r).strip()}
+        if not wanted:
+            raise ValidationError("MacroBlock: 'series' selects no FRED series.")
+        unknown = wanted - {p.upper() for p in FRED_SERIES}
+        if unknown:
+            raise ValidationError(
+                f"MacroBlock: unknown series {sorted(unknown)}. Expected any of {list(FRED_SERIES)}."
+            )
+        return {p: sid for p, sid in FRED_SERIES.items() if p.upper() in wanted}
+
+    @staticmethod
+    def _column_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in params.items() if k != "series"}
+
+    def non_stationary_outputs(self, params: Dict[str, Any]) -> List[str]:
+        col_params = self._column_params(params)
+        return [self.generate_column_name("MacroBlock", col_params, f"{p}_level")
+                for p in self._selected(params)]
+
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return 251
+
+    def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
+        selected = self._selected(params)
+        col_params = self._column_params(params)
+        block = None
+        if not df.empty and selected:
+            from ...data_broker.macro import get_macro_series
+
+            try:
+                block = get_macro_series().transformed(list(selected.values()), df.index)
+            except Exception as e:
+                logger.warning(f"FRED block fetch failed: {e}")
+
+        data = {}
+        for prefix, sid in selected.items():
+            for kind in ("level", "roc5", "zscore"):
+                col = self.generate_column_name("MacroBlock", col_params, f"{prefix}_{kind}")
+                data[col] = block[kind][sid] if block is not None else pd.Series(float("nan"), index=df.index)
+        return FeatureResult(data=data)
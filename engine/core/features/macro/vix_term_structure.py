@@ -1,7 +1,6 @@
 import logging
 from typing import Dict, Any, List
 import pandas as pd
-import yfinance as yf
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
 
 logger = logging.getLogger("model-engine.features.macro.vix_term_structure")
@@ -15,7 +14,7 @@ class VIXTermStructure(Feature):
     Above 1.00: backwardation (stress, risk-off).
 
     Outputs: raw ratio and 252-day rolling z-score.
-    Fetches ^VIX and ^VIX3M from yfinance, aligned to the price df's date range.
+    ^VIX and ^VIX3M come from the shared reference-series cache, aligned to the price df's index.
     """
 
     @property
@@ -37,6 +36,9 @@ class VIXTermStructure(Feature):
             OutputSchema(name="zscore",  output_type=OutputType.LINE, pane=Pane.NEW),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return 251
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         col_ratio  = self.generate_column_name("VIXTermStructure", params)
         col_zscore = self.generate_column_name("VIXTermStructure", params, "zscore")
@@ -45,27 +47,16 @@ class VIXTermStructure(Feature):
         if df.empty:
             return FeatureResult(data={col_ratio: nan, col_zscore: nan})
 
-        start = df.index.min().strftime("%Y-%m-%d")
-        end   = df.index.max().strftime("%Y-%m-%d")
-
         try:
-            raw = yf.download(["^VIX", "^VIX3M"], start=start, end=end,
-                               progress=False, auto_adjust=True)
-            if raw.empty:
+            from ...data_broker.reference import align_to_index, get_reference_series
+            ref = get_reference_series()
+            end = df.index.max()
+            vix = ref.series("^VIX", end=end)
+            vix3m = ref.series("^VIX3M", end=end)
+            if vix.empty or vix3m.empty:
                 raise ValueError("empty response")
 
-            if isinstance(raw.columns, pd.MultiIndex):
-                vix   = raw["Close"]["^VIX"].dropna()
-                vix3m = raw["Close"]["^VIX3M"].dropna()
-            else:
-                raise ValueError("unexpected column format from yfinance multi-ticker download")
-
-            # Ensure tz-naive index
-            for s in (vix, vix3m):
-                if s.index.tz is not None:
-                    s.index = s.index.tz_localize(None)
-
-            ratio = (vix / vix3m).reindex(df.index.union(vix.index)).ffill().reindex(df.index)
+            ratio = align_to_index(vix / vix3m, df.index)
 
         except Exception as e:
             logger.warning(f"VIXTermStructure fetch failed: {e}")
@@ -39,6 +39,9 @@ class CandlePatterns(Feature):
             "hammer_ratio": {"min": 1.0, "max": 5.0, "step": 0.5},
         }
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return 0
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         doji_thresh = float(params.get("doji_threshold", 0.1))
         hammer_ratio = float(params.get("hammer_ratio", 2.0))
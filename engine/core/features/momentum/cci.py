@@ -43,6 +43,9 @@ class CCI(Feature):
             "oversold": {"min": -300, "max": -50, "step": 10},
         }
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return int(params.get("period", 20)) - 1 + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 20))
         ob = float(params.get("overbought", 100))
@@ -167,6 +167,10 @@ class FractalFeatures(Feature):
     # Compute
     # ------------------------------------------------------------------
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # A fractal at bar T is only confirmed n bars later.
+        return 2 * int(params.get("fractal_n", 5))
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         n = int(params.get("fractal_n", 5))
         window = 2 * n + 1
@@ -1,6 +1,6 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import pandas as pd
-from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
+from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature, ema_warmup
 
 @register_feature("MACD")
 class MACD(Feature):
@@ -40,6 +40,16 @@ class MACD(Feature):
             "normalize": ["none", "z_score", "pct_distance", "price_ratio"]
         }
 
+    def dependencies(self, params: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        return [
+            ("EMA", {"period": int(params.get("fast_period", 12))}),
+            ("EMA", {"period": int(params.get("slow_period", 26))}),
+        ]
+
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # The signal line smooths the MACD line, which is valid once both EMAs are.
+        return ema_warmup(span=int(params.get("signal_period", 9))) + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         """
         Calculates the MACD components vectorically.
@@ -29,6 +29,9 @@ class ROC(Feature):
             "normalize": ["none", "z_score", "pct_distance", "price_ratio"]
         }
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return int(params.get("period", 12)) + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 12))
         norm_method = params.get("normalize", "none")
@@ -1,7 +1,7 @@
 from typing import Dict, Any, List
 import pandas as pd
 import numpy as np
-from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
+from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature, ema_warmup
 
 @register_feature("RSI")
 class RSI(Feature):
@@ -34,6 +34,11 @@ class RSI(Feature):
             "normalize": ["none", "z_score", "pct_distance", "price_ratio"] # Normalization method to apply to the RSI values.
         }
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # One bar for the diff, then Wilder smoothing (alpha = 1 / period).
+        period = int(params.get("period", 14))
+        return 1 + ema_warmup(alpha=1.0 / period) + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 14))
         ob = float(params.get("overbought", 70))
@@ -33,6 +33,11 @@ class Stochastic(Feature):
             OutputSchema(name="oversold",   output_type=OutputType.LEVEL, pane=Pane.NEW),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        k_period = int(params.get("k_period", 14))
+        d_period = int(params.get("d_period", 3))
+        return (k_period - 1) + (d_period - 1) + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         k_period = int(params.get("k_period", 14))
         d_period = int(params.get("d_period", 3))
@@ -1,44 +1,45 @@
-"""Options-implied features using yfinance live options chains.
+"""Options-implied features read from the local options-snapshot store.
 
-IMPORTANT: yfinance only provides current (live) options data — not historical snapshots.
-These features return NaN for all historical rows and a live value only at the last row
-when the price df ends within 5 calendar days of today.
-
-Intended use: signal generation, not backtesting.
+yfinance only provides the live options chain, so history is built by the
+snapshot recorder (data_broker/options_recorder.py, ``CLI.py options-snapshot``),
+which writes one summary row per ticker per trading day to data/options.db.
+OptionsFlow reads that table and never touches the network; bars on days
+with no recorded snapshot are NaN.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, Any, List
 import pandas as pd
-import yfinance as yf
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
 
 logger = logging.getLogger("model-engine.features.options")
 
+_db_instance = None
 
-def _atm_iv(chain: pd.DataFrame, spot: float) -> float:
-    if chain.empty:
-        return float("nan")
-    idx = (chain["strike"] - spot).abs().idxmin()
-    return float(chain.loc[idx, "impliedVolatility"])
 
+def _get_db():
+    global _db_instance
+    if _db_instance is None:
+        from ...data_broker.options_db import OptionsDatabase
+        _db_instance = OptionsDatabase()
+    return _db_instance
 
-def _otm_put_iv(puts: pd.DataFrame, spot: float, delta_proxy: float = 0.95) -> float:
-    """Approximate 25-delta put IV as the put struck at spot * delta_proxy."""
-    if puts.empty:
-        return float("nan")
-    target = spot * delta_proxy
-    idx = (puts["strike"] - target).abs().idxmin()
-    return float(puts.loc[idx, "impliedVolatility"])
 
+def _align_snapshots(snaps: pd.DataFrame, index: pd.DatetimeIndex) -> pd.DataFrame:
+    """Maps per-day snapshot rows onto price bars without lookahead.
 
-def _nearest_expiry(expirations: tuple, target_days: int) -> str:
-    today = datetime.now()
-    return min(
-        expirations,
-        key=lambda e: abs((datetime.strptime(e, "%Y-%m-%d") - today).days - target_days),
-    )
+    Daily bars take the snapshot recorded for their trading day. Intraday
+    bars take it only from the bar at or after its capture time.
+    """
+    local = index.tz_localize(None) if index.tz is not None else index
+    days = local.normalize()
+    out = snaps.reindex(days)
+    if (local != days).any():
+        # captured_at is naive UTC; compare against the bars' UTC wall-clock.
+        bar_utc = index.tz_convert("UTC").tz_localize(None) if index.tz is not None else index
+        out.loc[~(out["captured_at"] <= bar_utc).to_numpy()] = float("nan")
+    out.index = index
+    return out
 
 
 @register_feature("OptionsFlow")
@@ -57,10 +58,13 @@ class OptionsFlow(Feature):
     Output columns
     --------------
     pcr          : put/call volume ratio (short-term chain, ~30d expiry)
-    pcr_chg5     : 5-day change in pcr
+    pcr_chg5     : change in pcr over the last pcr_window snapshots
     iv_skew      : OTM put IV minus ATM IV (25-delta proxy)
     iv_ts        : short-term ATM IV divided by medium-term ATM IV (~30d / ~90d)
     vol_unusual  : total options volume divided by its 20-day rolling median
+
+    Changes and rolling medians are taken over recorded snapshot days, so a
+    gap in the recording history does not leak into neighbouring values.
     """
 
     @property
@@ -70,8 +74,8 @@ class OptionsFlow(Feature):
     @property
     def description(self) -> str:
         return (
-            "Live options signals: P/C ratio, IV skew, IV term structure, volume unusualness. "
-            "Returns NaN for historical rows — live signal generation only."
+            "Options signals: P/C ratio, IV skew, IV term structure, volume unusualness. "
+            "Reads daily snapshots recorded by `CLI.py options-snapshot`; NaN on unrecorded days."
         )
 
     @property
@@ -96,41 +100,9 @@ class OptionsFlow(Feature):
             OutputSchema(name="vol_unusual", output_type=OutputType.LINE, pane=Pane.NEW),
         ]
 
-    def _is_live(self, df: pd.DataFrame) -> bool:
-        end = df.index.max()
-        if hasattr(end, "tz_localize") and end.tzinfo is not None:
-            end = end.tz_localize(None)
-        return (datetime.now() - end.to_pydatetime()).days <= 5
-
-    def _snapshot(self, ticker_sym: str, spot: float) -> Dict[str, float]:
-        t = yf.Ticker(ticker_sym)
-        expirations = t.options
-        if not expirations:
-            return {}
-
-        exp_short  = _nearest_expiry(expirations, 30)
-        exp_medium = _nearest_expiry(expirations, 90)
-
-        chain_s = t.option_chain(exp_short)
-        chain_m = t.option_chain(exp_medium)
-
-        calls_s, puts_s = chain_s.calls, chain_s.puts
-        calls_m         = chain_m.calls
-
-        put_vol  = float(puts_s["volume"].fillna(0).sum())
-        call_vol = float(calls_s["volume"].fillna(0).sum())
-        total_vol = put_vol + call_vol
-
-        pcr      = put_vol / max(call_vol, 1.0)
-        iv_skew  = _otm_put_iv(puts_s, spot) - _atm_iv(puts_s, spot)
-        iv_ts    = _atm_iv(calls_s, spot) / max(_atm_iv(calls_m, spot), 1e-9)
-
-        return {
-            "pcr":       pcr,
-            "iv_skew":   iv_skew,
-            "iv_ts":     iv_ts,
-            "total_vol": total_vol,
-        }
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # Derived columns are computed over the stored snapshot history, not the bars.
+        return 0
 
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         P = "OptionsFlow"
@@ -148,36 +120,30 @@ class OptionsFlow(Feature):
             logger.warning("OptionsFlow: 'ticker' param is required")
             return FeatureResult(data=empty)
 
-        if not self._is_live(df):
-            return FeatureResult(data=empty)
-
-        close_col = "close" if "close" in df.columns else "Close"
-        spot = float(df[close_col].iloc[-1])
-
-        try:
-            metrics = self._snapshot(ticker_sym, spot)
-        except Exception as e:
-            logger.warning(f"OptionsFlow snapshot failed for {ticker_sym}: {e}")
-            return FeatureResult(data=empty)
-
-        if not metrics:
+        end = df.index.max()
+        if end.tz is not None:
+            end = end.tz_localize(None)
+        snaps = _get_db().get_snapshots(ticker_sym.upper(), end=end)
+        if snaps.empty:
             return FeatureResult(data=empty)
 
-        last = df.index.max()
-
-        pcr_s   = nan.copy(); pcr_s[last]   = metrics["pcr"]
-        skew_s  = nan.copy(); skew_s[last]  = metrics["iv_skew"]
-        ts_s    = nan.copy(); ts_s[last]    = metrics["iv_ts"]
-        vol_s   = nan.copy(); vol_s[last]   = metrics["total_vol"]
-
+        pcr_window     = int(params.get("pcr_window", 5))
         unusual_window = int(params.get("unusual_window", 20))
-        vol_median = vol_s.rolling(unusual_window, min_periods=1).median()
-        vol_unusual = vol_s / vol_median.replace(0, float("nan"))
+        vol_median = snaps["total_vol"].rolling(unusual_window, min_periods=1).median()
+        derived = pd.DataFrame({
+            "captured_at": snaps["captured_at"],
+            "pcr":         snaps["pcr"],
+            "pcr_chg":     snaps["pcr"].diff(pcr_window),
+            "iv_skew":     snaps["iv_skew"],
+            "iv_ts":       snaps["iv_ts"],
+            "vol_unusual": snaps["total_vol"] / vol_median.replace(0, float("nan")),
+        })
+        aligned = _align_snapshots(derived, df.index)
 
         return FeatureResult(data={
-            col_pcr:     pcr_s,
-            col_chg5:    pcr_s.diff(5),
-            col_skew:    skew_s,
-            col_ts:      ts_s,
-            col_unusual: vol_unusual,
+            col_pcr:     aligned["pcr"].astype(float),
+            col_chg5:    aligned["pcr_chg"].astype(float),
+            col_skew:    aligned["iv_skew"].astype(float),
+            col_ts:      aligned["iv_ts"].astype(float),
+            col_unusual: aligned["vol_unusual"].astype(float),
         })
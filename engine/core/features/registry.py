@@ -0,0 +1,200 @@
+"""Lazy feature registry backed by a generated metadata index.
+
+Importing every feature module up front drags in sklearn, scipy, yfinance,
+pytrends and the SQLAlchemy stores, so ``import engine`` used to pay for every
+optional dependency. Instead, ``feature_index.json`` (next to this file) maps
+each feature id to its defining module plus the metadata needed for listing
+and schema introspection. A module is only imported the first time one of its
+classes is requested from the registry.
+
+Regenerate the index after adding or changing a feature's metadata:
+
+    python CLI.py features --reindex
+"""
+
+import importlib
+import json
+import os
+import pkgutil
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+INDEX_PATH = os.path.join(os.path.dirname(__file__), "feature_index.json")
+
+_PACKAGE = "engine.core.features"
+_SKIP_MODULES = (".base", ".features", ".registry")
+
+
+class FeatureRegistry(MutableMapping):
+    """Maps feature ids to Feature classes, importing modules on demand.
+
+    Classes registered through ``@register_feature`` are stored directly.
+    Ids that only appear in the index are resolved by importing the module
+    recorded for them, which runs the decorator. Lookups that miss both fall
+    back to walking the whole features package once, so a feature added
+    without regenerating the index is still found.
+
+    Args:
+        index_path (str): Location of the generated JSON index.
+    """
+
+    def __init__(self, index_path: str = INDEX_PATH):
+        self._index_path = index_path
+        self._classes: Dict[str, Type] = {}
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._fully_loaded = False
+
+    # ------------------------------------------------------------------
+    # Index access
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._index is None:
+            try:
+                with open(self._index_path, "r") as f:
+                    self._index = json.load(f).get("features", {})
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def metadata(self, feature_id: str) -> Dict[str, Any]:
+        """Returns listing metadata for a feature without importing it.
+
+        Features registered outside the index (tests, plugins) are described
+        from their class instead.
+
+        Raises:
+            KeyError: If the feature id is unknown.
+        """
+        entry = self._entries().get(feature_id)
+        if entry is not None:
+            return {"id": feature_id, **entry}
+        return describe_feature(feature_id, self[feature_id])
+
+    def catalog(self) -> List[Dict[str, Any]]:
+        """Returns metadata for every known feature, in registry order."""
+        return [self.metadata(fid) for fid in self]
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load_all(self) -> None:
+        """Imports every feature module in the package (the eager path)."""
+        from ..logger import logger
+
+        base_dir = os.path.dirname(__file__)
+        for _, module_name, is_pkg in pkgutil.walk_packages([base_dir], prefix=f"{_PACKAGE}."):
+            if is_pkg or module_name.endswith(_SKIP_MODULES):
+                continue
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                logger.error(f"Failed to load feature module {module_name}: {e}", exc_info=True)
+        self._fully_loaded = True
+
+    def _resolve(self, feature_id: str) -> Optional[Type]:
+        cls = self._classes.get(feature_id)
+        if cls is not None:
+            return cls
+        entry = self._entries().get(feature_id)
+        if entry is not None:
+            importlib.import_module(entry["module"])
+            cls = self._classes.get(feature_id)
+            if cls is not None:
+                return cls
+        if not self._fully_loaded:
+            self.load_all()
+            return self._classes.get(feature_id)
+        return None
+
+    # ------------------------------------------------------------------
+    # Mapping protocol
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, feature_id: str) -> Type:
+        cls = self._resolve(feature_id)
+        if cls is None:
+            raise KeyError(feature_id)
+        return cls
+
+    def __setitem__(self, feature_id: str, cls: Type) -> None:
+        self._classes[feature_id] = cls
+
+    def __delitem__(self, feature_id: str) -> None:
+        del self._classes[feature_id]
+
+    def __contains__(self, feature_id: object) -> bool:
+        if feature_id in self._classes or feature_id in self._entries():
+            return True
+        if not self._fully_loaded:
+            self.load_all()
+        return feature_id in self._classes
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._entries()
+        for fid in list(self._classes):
+            if fid not in self._entries():
+                yield fid
+
+    def __len__(self) -> int:
+        return len(set(self._entries()) | set(self._classes))
+
+    def __repr__(self) -> str:
+        return f"FeatureRegistry({len(self)} features, {len(self._classes)} loaded)"
+
+
+# ---------------------------------------------------------------------------
+# Index generation
+# ---------------------------------------------------------------------------
+
+def describe_feature(feature_id: str, feature_cls: Type) -> Dict[str, Any]:
+    """Builds the JSON-serializable metadata record for one feature class."""
+    instance = feature_cls()
+    return {
+        "id": feature_id,
+        "module": feature_cls.__module__,
+        "name": instance.name,
+        "description": instance.description,
+        "category": instance.category,
+        "parameters": instance.parameters,
+        "parameter_options": instance.parameter_options,
+        "output_schema": [
+            {
+                "name": s.name,
+                "output_type": s.output_type.value,
+                "pane": s.pane.value,
+                "band_pair": list(s.band_pair) if s.band_pair else None,
+                "y_range": list(s.y_range) if s.y_range else None,
+            }
+            for s in instance.output_schema
+        ],
+    }
+
+
+def build_feature_index() -> Dict[str, Dict[str, Any]]:
+    """Imports every feature module and returns the index contents.
+
+    Only classes defined inside the features package are indexed, so test
+    doubles registered elsewhere never leak into the committed file.
+    """
+    from .base import FEATURE_REGISTRY
+
+    FEATURE_REGISTRY.load_all()
+    features = {}
+    for fid, cls in sorted(FEATURE_REGISTRY._classes.items()):
+        if not cls.__module__.startswith(f"{_PACKAGE}."):
+            continue
+        entry = describe_feature(fid, cls)
+        del entry["id"]
+        features[fid] = entry
+    return features
+
+
+def write_feature_index(path: str = INDEX_PATH) -> int:
+    """Regenerates the index file and returns the number of features written."""
+    features = build_feature_index()
+    with open(path, "w") as f:
+        json.dump({"features": features}, f, indent=2, default=str)
+        f.write("\n")
+    return len(features)
@@ -1,7 +1,7 @@
 from typing import Dict, Any, List
 import pandas as pd
 import numpy as np
-from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
+from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature, ema_warmup
 
 @register_feature("ADX")
 class ADX(Feature):
@@ -32,6 +32,11 @@ class ADX(Feature):
             OutputSchema(name="minus_di", output_type=OutputType.LINE, pane=Pane.NEW),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # Shifted true range, then two chained Wilder smoothings (DI, then ADX).
+        period = int(params.get("period", 14))
+        return 1 + 2 * ema_warmup(alpha=1.0 / period) + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 14))
         norm_method = params.get("normalize", "none")
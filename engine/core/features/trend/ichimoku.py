@@ -61,6 +61,15 @@ class IchimokuCloud(Feature):
             G("Ichimoku", params, "senkou_b"),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        conv = int(params.get("conversion_period", 9))
+        base = int(params.get("base_period", 26))
+        span2 = int(params.get("lagging_span2_period", 52))
+        disp = int(params.get("displacement", 26))
+        senkou_a = max(conv, base) - 1 + disp
+        senkou_b = span2 - 1 + disp
+        return max(senkou_a, senkou_b, disp) + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         conv = int(params.get("conversion_period", 9))
         base = int(params.get("base_period", 26))
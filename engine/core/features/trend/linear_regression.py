@@ -54,6 +54,10 @@ class LinearRegressionChannel(Feature):
             G("LinReg", params, "lower"),
         ]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # Anchored to the last bar: the channel covers exactly the lookback.
+        return self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         lookback = int(params.get("lookback", 100))
         std_dev_mult = float(params.get("std_dev", 2.0))
@@ -1,6 +1,6 @@
 from typing import Dict, Any, List, Optional
 import pandas as pd
-from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
+from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature, ema_warmup
 
 @register_feature("MovingAverage")
 class MovingAverage(Feature):
@@ -49,6 +49,12 @@ class MovingAverage(Feature):
             feat_id = "EMA"
         return [self.generate_column_name(feat_id, params)]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        period = int(params.get("period", 50))
+        if params.get("type", "SMA") == "EMA":
+            return ema_warmup(span=period) + self.normalization_warmup(params)
+        return period - 1 + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 50))
         ma_type = params.get("type", "SMA")
@@ -83,6 +89,9 @@ class EMA(MovingAverage):
     def name(self) -> str:
         return "Exponential Moving Average"
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return super().warmup({**params, "type": "EMA"})
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         params["type"] = "EMA"
         return super().compute(df, params, cache)
@@ -93,6 +102,9 @@ class SMA(MovingAverage):
     def name(self) -> str:
         return "Simple Moving Average"
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return super().warmup({**params, "type": "SMA"})
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         params["type"] = "SMA"
         return super().compute(df, params, cache)
@@ -47,6 +47,9 @@ class Supertrend(Feature):
             return []
         return [self.generate_column_name("Supertrend", params, "line")]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return int(params.get("period", 10)) + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 10))
         multiplier = float(params.get("multiplier", 3.0))
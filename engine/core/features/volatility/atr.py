@@ -39,6 +39,10 @@ class AverageTrueRange(Feature):
             return []
         return [self.generate_column_name("AverageTrueRange", params)]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # Previous close for the true range, then a simple rolling mean.
+        return int(params.get("period", 14)) + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 14))
         norm_method = params.get("normalize", "none")
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
 
@@ -48,6 +48,13 @@ class BollingerBands(Feature):
             G("BollingerBands", params, "lower"),
         ]
 
+    def dependencies(self, params: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        return [("SMA", {"period": int(params.get("period", 20))})]
+
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # The rolling std spans the same window as the SMA dependency.
+        return self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 20))
         std_dev = float(params.get("std_dev", 2.0))
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
@@ -46,6 +46,15 @@ class KeltnerChannels(Feature):
             G("KeltnerChannels", params, "lower"),
         ]
 
+    def dependencies(self, params: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        return [
+            ("EMA", {"period": int(params.get("ema_period", 20))}),
+            ("ATR", {"period": int(params.get("atr_period", 10))}),
+        ]
+
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         ema_period = int(params.get("ema_period", 20))
         atr_period = int(params.get("atr_period", 10))
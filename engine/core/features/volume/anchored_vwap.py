@@ -34,6 +34,10 @@ class AnchoredVWAP(Feature):
             return []
         return [self.generate_column_name("AnchoredVWAP", params)]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # Anchored to a fixed bar back from the end of the frame.
+        return self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         bars_back = int(params.get("anchor_bars_back", 100))
         norm_method = params.get("normalize", "none")
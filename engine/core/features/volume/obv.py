@@ -40,6 +40,16 @@ class OBV(Feature):
             self.generate_column_name("OBV", params, "sma_20"),
         ]
 
+    @property
+    def pinned_dtype(self) -> str:
+        # Running volume totals reach 1e9+ on liquid names; float32 would
+        # swallow the per-bar increments that the signal is built from.
+        return "float64"
+
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # OBV itself is cumulative; the trend line is a 20-bar SMA of it.
+        return 19 + self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         norm_method = params.get("normalize", "none")
         
@@ -36,6 +36,9 @@ class VolumeIndicator(Feature):
             return []
         return [self.generate_column_name("Volume", params)]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         norm_method = params.get("normalize", "none")
 
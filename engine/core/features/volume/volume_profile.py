@@ -1,18 +1,35 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from ..base import Feature, FeatureResult, OutputSchema, OutputType, Pane, register_feature
 
+# Upper bound on the (bars x bins) block materialized at once when replaying
+# the window histogram; ~32 MB of float64.
+_BLOCK_CELLS = 4_000_000
+
 
 @register_feature("VolumeProfile")
 class VolumeProfile(Feature):
+    """Volume-at-price profile with per-bar point of control and value area.
+
+    ``static`` mode (the default) is the original single VPVR heatmap over the
+    last ``lookback`` bars and adds no columns. ``rolling`` and ``session``
+    modes also emit causal POC/VAH/VAL lines: each bar sees only the window
+    ending at that bar (``lookback`` bars, the whole history when 0, or the
+    current session in ``session`` mode). They are binned on a fixed log-price
+    grid of ``bin_pct`` steps so bin edges never depend on future prices.
+    """
+
     @property
     def name(self) -> str:
         return "Volume Profile (VPVR)"
 
     @property
     def description(self) -> str:
-        return "Horizontal volume histogram showing high-volume price nodes."
+        return (
+            "Horizontal volume histogram showing high-volume price nodes, with per-bar "
+            "point of control and value-area high/low over a rolling or session window."
+        )
 
     @property
     def category(self) -> str:
@@ -22,6 +39,9 @@ class VolumeProfile(Feature):
     def output_schema(self) -> List[OutputSchema]:
         return [
             OutputSchema(name="profile", output_type=OutputType.HEATMAP, pane=Pane.OVERLAY),
+            OutputSchema(name="poc", output_type=OutputType.LINE, pane=Pane.OVERLAY),
+            OutputSchema(name="vah", output_type=OutputType.LINE, pane=Pane.OVERLAY),
+            OutputSchema(name="val", output_type=OutputType.LINE, pane=Pane.OVERLAY),
         ]
 
     @property
@@ -29,6 +49,11 @@ class VolumeProfile(Feature):
         return {
             "bins": 100,
             "lookback": 0,
+            "mode": "static",
+            "bin_pct": 0.25,
+            "value_area": 0.7,
+            "time_bins": 300,
+            "normalize": ["none", "pct_distance", "price_ratio"],
         }
 
     @property
@@ -36,12 +61,86 @@ class VolumeProfile(Feature):
         return {
             "bins": {"min": 20, "max": 500, "step": 10},
             "lookback": {"min": 0, "max": 1000, "step": 50},
+            "mode": {"options": ["static", "rolling", "session"]},
+            "bin_pct": {"min": 0.05, "max": 2.0, "step": 0.05},
+            "value_area": {"min": 0.5, "max": 0.95, "step": 0.05},
+            "time_bins": {"min": 10, "max": 2000, "step": 10},
         }
 
+    def non_stationary_outputs(self, params: Dict[str, Any]) -> List[str]:
+        if params.get("mode", "static") == "static" or params.get("normalize", "none") != "none":
+            return []
+        G = self.generate_column_name
+        return [G("VolumeProfile", params, s) for s in ("poc", "vah", "val")]
+
+    def warmup(self, params: Dict[str, Any]) -> int:
+        lookback = int(params.get("lookback", 0))
+        if params.get("mode", "static") != "rolling" or lookback <= 0:
+            return 0
+        return lookback - 1
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         bins = int(params.get("bins", 100))
         lookback = int(params.get("lookback", 0))
+        mode = params.get("mode", "static")
+        bin_pct = float(params.get("bin_pct", 0.25))
+        value_area = float(params.get("value_area", 0.7))
+        time_bins = int(params.get("time_bins", 300))
+        norm_method = params.get("normalize", "none")
+
+        if mode == "static":
+            return FeatureResult(heatmaps={"profile": self._static_profile(df, bins, lookback)})
+
+        close = df['Close'] if 'Close' in df.columns else df['close']
+        volume = df['Volume'] if 'Volume' in df.columns else df['volume']
+        n = len(df)
+
+        # --- Per-bar window histogram on a fixed log-price grid ------------
+        log_step = np.log1p(bin_pct / 100.0)
+        c = close.to_numpy(dtype=np.float64)
+        v = volume.to_numpy(dtype=np.float64)
+        valid = np.isfinite(c) & (c > 0) & np.isfinite(v)
+        raw_bin = np.zeros(n, dtype=np.int64)
+        raw_bin[valid] = np.floor(np.log(c[valid]) / log_step).astype(np.int64)
+        base = int(raw_bin[valid].min()) if valid.any() else 0
+        n_bins = int(raw_bin[valid].max()) - base + 1 if valid.any() else 1
+        bin_idx = np.where(valid, raw_bin - base, 0)
+        weights = np.where(valid, v, 0.0)
+        centres = np.exp((np.arange(n_bins) + base + 0.5) * log_step)
 
+        if mode == "session":
+            leave_at = self._session_ends(df.index)
+        elif lookback > 0:
+            leave_at = np.arange(n) + lookback
+        else:
+            leave_at = np.full(n, n)
+
+        snapshots = self._snapshot_positions(n, time_bins)
+        poc_idx, vah_idx, val_idx, frames = self._replay(
+            bin_idx, weights, leave_at, n_bins, value_area, snapshots
+        )
+
+        empty = poc_idx < 0
+        lines = {}
+        for suffix, idx in (("poc", poc_idx), ("vah", vah_idx), ("val", val_idx)):
+            series = pd.Series(np.where(empty, np.nan, centres[np.maximum(idx, 0)]), index=df.index)
+            if norm_method != "none":
+                series = self.normalize(df, series, norm_method)
+            lines[self.generate_column_name("VolumeProfile", params, suffix)] = series
+
+        # --- Heatmap ----------------------------------------------------------
+        peak = frames.max(axis=1, keepdims=True)
+        profile = {
+            "price_grid": centres,
+            "time_index": df.index[snapshots],
+            "intensity": np.divide(frames, peak, out=np.zeros_like(frames), where=peak > 0),
+        }
+
+        return FeatureResult(data=lines, heatmaps={"profile": profile})
+
+    @staticmethod
+    def _static_profile(df: pd.DataFrame, bins: int, lookback: int) -> Dict[str, Any]:
+        """Single VPVR snapshot over the last ``lookback`` bars (all bars when 0)."""
         if lookback > 0 and len(df) > lookback:
             subset = df.iloc[-lookback:]
         else:
@@ -68,10 +167,158 @@ class VolumeProfile(Feature):
         # Price grid = center of each bin
         price_grid = (bin_edges[:-1] + bin_edges[1:]) / 2
 
-        return FeatureResult(heatmaps={
-            "profile": {
-                "price_grid": price_grid,
-                "time_index": subset.index,
-                "intensity": hist_norm,
-            }
-        })
+        return {
+            "price_grid": price_grid,
+            "time_index": subset.index,
+            "intensity": hist_norm,
+        }
+
+    @staticmethod
+    def _session_ends(index: pd.Index) -> np.ndarray:
+        """Position of the first bar of the next session, for every bar."""
+        dates = np.asarray(index.date)
+        starts = np.flatnonzero(np.r_[True, dates[1:] != dates[:-1]])
+        ends = np.r_[starts[1:], len(dates)]
+        return np.repeat(ends, np.diff(np.r_[starts, len(dates)]))
+
+    @staticmethod
+    def _snapshot_positions(n_bars: int, time_bins: int) -> np.ndarray:
+        """Bar positions at which a heatmap column is emitted (last bar of each time bin)."""
+        if n_bars <= time_bins:
+            return np.arange(n_bars)
+        edges = np.ceil(np.linspace(0, n_bars, time_bins + 1)[1:]).astype(np.int64) - 1
+        return np.unique(edges)
+
+    @staticmethod
+    def _replay(
+        bin_idx: np.ndarray,
+        weights: np.ndarray,
+        leave_at: np.ndarray,
+        n_bins: int,
+        value_area: float,
+        snapshots: Optional[np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """Maintains the window histogram bar by bar and reads off POC/VA.
+
+        Bar ``j`` adds ``weights[j]`` to its bin when it enters and subtracts
+        it at position ``leave_at[j]``. Bars are processed in blocks: the
+        block's enter/leave deltas are scattered into a (bars x bins) matrix
+        and cumulatively summed onto the running histogram, so each bar costs
+        O(bins) and the window length never appears in the cost. Only the
+        price range occupied during the block is materialized, which keeps
+        rolling and session windows far below the full grid width.
+
+        Returns bin indices of the POC, VAH and VAL per bar (-1 when the window
+        holds no volume) and the histograms at ``snapshots``.
+        """
+        n = len(bin_idx)
+        poc = np.full(n, -1, dtype=np.int64)
+        vah = np.full(n, -1, dtype=np.int64)
+        val = np.full(n, -1, dtype=np.int64)
+        frames = np.zeros((len(snapshots), n_bins)) if snapshots is not None else None
+
+        leave_order = np.argsort(leave_at, kind="stable")
+        leave_sorted = leave_at[leave_order]
+        # Subtracting exactly what was added still leaves float residue.
+        eps = 1e-9 * float(weights.max()) if n else 0.0
+
+        # One reusable buffer with a sentinel column on each side of the price
+        # axis (see _value_area); reallocating per block costs more than the
+        # arithmetic.
+        block = max(1, min(n, _BLOCK_CELLS // (n_bins + 2)))
+        buf = np.empty(block * (n_bins + 2))
+        hist = np.zeros(n_bins)
+
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            rows = stop - start
+
+            entering = weights[start:stop] > 0
+            occupied = np.flatnonzero(hist)
+            span = np.concatenate([occupied, bin_idx[start:stop][entering]])
+            if not span.size:
+                continue
+            c_lo, c_hi = int(span.min()), int(span.max())
+            stride = c_hi - c_lo + 3
+            window = buf[:rows * stride].reshape(rows, stride)
+            flat = window.reshape(-1)
+
+            window.fill(0.0)
+            flat[np.arange(rows) * stride + bin_idx[start:stop] - c_lo + 1] = weights[start:stop]
+            lo, hi = np.searchsorted(leave_sorted, [start, stop], side="left")
+            leaving = leave_order[lo:hi]
+            np.subtract.at(
+                flat, (leave_at[leaving] - start) * stride + bin_idx[leaving] - c_lo + 1, weights[leaving]
+            )
+
+            np.cumsum(window, axis=0, out=window)
+            window[:, 1:-1] += hist[c_lo:c_hi + 1]
+            window[window < eps] = 0.0
+            hist[c_lo:c_hi + 1] = window[-1, 1:-1]
+            window[:, 0] = -1.0
+            window[:, -1] = -1.0
+
+            p, h, l = VolumeProfile._value_area(window, value_area)
+            has = p >= 0
+            poc[start:stop] = np.where(has, p + c_lo, -1)
+            vah[start:stop] = np.where(has, h + c_lo, -1)
+            val[start:stop] = np.where(has, l + c_lo, -1)
+
+            if frames is not None:
+                lo, hi = np.searchsorted(snapshots, [start, stop], side="left")
+                frames[lo:hi, c_lo:c_hi + 1] = window[snapshots[lo:hi] - start, 1:-1]
+
+        return poc, vah, val, frames
+
+    @staticmethod
+    def _value_area(window: np.ndarray, value_area: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """POC and value-area bounds for every row of a (bars x bins) block.
+
+        ``window`` carries a -1 sentinel column on each side of the price axis.
+        Classic expansion from the POC: repeatedly add whichever neighbouring
+        bin (above or below, ties go up) holds more volume until
+        ``value_area`` of the window's volume is covered. A side is exhausted
+        once it reaches the lowest/highest bin the window actually traded in,
+        so the area never extends into empty price space. Rows expand in
+        lockstep, so the loop runs at most ``bins`` times per block rather
+        than once per bar. Returned indices exclude the sentinel column.
+        """
+        rows, stride = window.shape
+        inner = window[:, 1:-1]
+        traded = inner > 0
+        total = inner.sum(axis=1)
+        target = total * value_area
+        poc = np.argmax(inner, axis=1)
+        floor_ = np.argmax(traded, axis=1)
+        ceil_ = stride - 3 - np.argmax(traded[:, ::-1], axis=1)
+        lo = poc.copy()
+        hi = poc.copy()
+        acc = inner[np.arange(rows), poc]
+
+        flat = window.reshape(-1)
+        ids = np.flatnonzero((acc < target) & (total > 0))
+        base = ids * stride + 1
+        lo_a, hi_a, acc_a, tgt_a = lo[ids], hi[ids], acc[ids], target[ids]
+        fl_a, cl_a = floor_[ids], ceil_[ids]
+        while ids.size:
+            below = np.where(lo_a > fl_a, flat[base + lo_a - 1], -1.0)
+            above = np.where(hi_a < cl_a, flat[base + hi_a + 1], -1.0)
+            go_up = above >= below
+            hi_a += go_up
+            lo_a -= ~go_up
+            acc_a += np.maximum(above, below)
+
+            keep = (acc_a < tgt_a) & ((lo_a > fl_a) | (hi_a < cl_a))
+            if not keep.all():
+                done = ~keep
+                lo[ids[done]] = lo_a[done]
+                hi[ids[done]] = hi_a[done]
+                ids, base = ids[keep], base[keep]
+                lo_a, hi_a, acc_a, tgt_a = lo_a[keep], hi_a[keep], acc_a[keep], tgt_a[keep]
+                fl_a, cl_a = fl_a[keep], cl_a[keep]
+
+        empty = total <= 0
+        poc[empty] = -1
+        lo[empty] = -1
+        hi[empty] = -1
+        return poc, hi, lo
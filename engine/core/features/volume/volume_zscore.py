@@ -30,6 +30,9 @@ class VolumeZScore(Feature):
             "period": 20
         }
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        return int(params.get("period", 20)) - 1
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         period = int(params.get("period", 20))
         
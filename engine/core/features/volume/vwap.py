@@ -33,6 +33,10 @@ class VWAP(Feature):
             return []
         return [self.generate_column_name("VWAP", params)]
 
+    def warmup(self, params: Dict[str, Any]) -> int:
+        # Session VWAP resets daily; the first bar is already valid.
+        return self.normalization_warmup(params)
+
     def compute(self, df: pd.DataFrame, params: Dict[str, Any], cache: Any = None) -> FeatureResult:
         norm_method = params.get("normalize", "none")
         
@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
 from typing import Dict, Any, Tuple, List, Optional, Iterable
 from ..logger import logger
 
@@ -47,19 +46,21 @@ class MLBridge:
         """Applies fixed-window FFD to a single series.
 
         Produces NaN for the first ``window - 1`` values where there is
-        insufficient history for a full weighted dot product.
+        insufficient history for a full weighted dot product. float32 input
+        stays float32; every other dtype is computed in float64.
         """
-        values = series.to_numpy(dtype=float)
+        dtype = np.float32 if series.dtype == np.float32 else np.float64
+        values = series.to_numpy(dtype=dtype)
         n = len(values)
-        out = np.full(n, np.nan)
+        out = np.full(n, np.nan, dtype=dtype)
         if n < window:
             return pd.Series(out, index=series.index, name=series.name)
-        weights = MLBridge._ffd_weights(d, window)
+        weights = MLBridge._ffd_weights(d, window).astype(dtype)
         for i in range(window - 1, n):
             segment = values[i - window + 1: i + 1]
             if np.isnan(segment).any():
                 continue
-            out[i] = float(np.dot(weights, segment))
+            out[i] = np.dot(weights, segment)
         return pd.Series(out, index=series.index, name=series.name)
 
     @staticmethod
@@ -78,18 +79,31 @@ class MLBridge:
         cols = [c for c in columns if c in df.columns]
         if not cols:
             return df
-        out = df.copy()
+        out = df.copy(deep=False)
         for col in cols:
             out[col] = MLBridge.apply_ffd_series(out[col], d=d, window=window)
         if window > 1:
             out = out.iloc[window - 1:]
         return out
 
+    @staticmethod
+    def cast_matrix(values: np.ndarray, dtype: Optional[Any]) -> np.ndarray:
+        """Casts a scaled feature block to the requested dtype (no-op when None).
+
+        The scaler sees whatever precision the features arrived in — a frame
+        mixing float32 outputs with float64-pinned ones is scaled in float64 —
+        and only the bounded [-1, 1] result is narrowed for the model.
+        """
+        if dtype is None:
+            return values
+        return values.astype(dtype, copy=False)
+
     @staticmethod
     def prepare_training_matrix(
         df: pd.DataFrame,
         feature_cols: List[str],
-        l_max: int
+        l_max: int,
+        dtype: Optional[Any] = None,
     ) -> Tuple[pd.DataFrame, Any]:
         """
         Prepares the historical feature matrix for model training.
@@ -105,6 +119,9 @@ class MLBridge:
                 into the model as features (X).
             l_max (int): The maximum lookback window discovered across all computed 
                 features (e.g., if a 200-SMA is used, l_max is 200).
+            dtype (Optional[Any], optional): Floating-point dtype for the scaled
+                feature columns (e.g. ``"float32"``). Defaults to None, which
+                keeps the scaler's output dtype.
 
         Returns:
             Tuple[pd.DataFrame, Any]: 
@@ -127,11 +144,15 @@ class MLBridge:
             raise ValueError(f"l_max ({l_max}) is larger than the dataset length ({len(df)}).")
 
         # 1. NaN Purge: Drop the top l_max rows safely
-        df_clean = df.iloc[l_max:].copy()
+        df_clean = df.iloc[l_max:]
 
         # 2. Stateful Scaling: Fit and transform
+        from sklearn.preprocessing import MinMaxScaler
+
         scaler = MinMaxScaler(feature_range=(-1.0, 1.0))
-        df_clean[feature_cols] = scaler.fit_transform(df_clean[feature_cols])
+        df_clean[feature_cols] = MLBridge.cast_matrix(
+            scaler.fit_transform(df_clean[feature_cols]), dtype
+        )
 
         logger.info(f"Training matrix prepared. Purged {l_max} rows. Scaler fitted.")
         return df_clean, scaler
@@ -188,7 +209,9 @@ class MLBridge:
             df (pd.DataFrame): The dataset outputted by the FeatureOrchestrator.
             feature_cols (List[str]): The exact list of feature columns used during training.
             l_max (int): The maximum lookback window required to compute current features.
-            artifacts (Dict[str, Any]): The loaded artifact dictionary.
+            artifacts (Dict[str, Any]): The loaded artifact dictionary. An optional
+                ``dtype`` entry (persisted by the trainer) sets the precision of
+                the scaled feature columns.
             is_live (bool, optional): If True, aggressively truncates the DataFrame to 
                 only the single most recent row to optimize live execution latency. 
                 Defaults to False (Backtest mode).
@@ -203,10 +226,10 @@ class MLBridge:
         # 1. Row Selection & Purging
         if is_live:
             # For live execution, we only need the absolute latest row (after ensuring features computed)
-            df_clean = df.iloc[[-1]].copy()
+            df_clean = df.iloc[[-1]]
         else:
             # For backtesting, we purge the top l_max rows just like in training
-            df_clean = df.iloc[l_max:].copy()
+            df_clean = df.iloc[l_max:]
 
         # 2. Replay FFD on non-stationary feature columns using the config
         #    persisted at training time. Must happen before scaling so the
@@ -224,7 +247,9 @@ class MLBridge:
 
         if scaler:
             # Strict TRANSFORM only. Never fit.
-            df_clean[feature_cols] = scaler.transform(df_clean[feature_cols])
+            df_clean[feature_cols] = MLBridge.cast_matrix(
+                scaler.transform(df_clean[feature_cols]), artifacts.get("dtype")
+            )
             logger.debug("Applied loaded scaler to inference matrix.")
         else:
             logger.debug("No system_scaler found in artifacts. Passing unscaled data.")
@@ -257,7 +282,7 @@ class MLBridge:
         if not method or method == "none":
             return df
 
-        df = df.copy()
+        df = df.copy(deep=False)
 
         if method == "log_returns":
             for col in ("open", "high", "low", "close"):
@@ -284,4 +309,29 @@ class MLBridge:
                 f"Unknown price normalization method '{method}'. Skipping."
             )
 
-        return df
\ No newline at end of file
+        return df
+
+    @staticmethod
+    def normalization_warmup(
+        training_config: Optional[Dict[str, Any]],
+        features_config: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """Rows dropped after the feature warmup purge by price/feature normalization.
+
+        Mirrors ``apply_price_normalization`` (one row for ``log_returns``,
+        ``ffd_window - 1`` for ``ffd``) and, when ``features_config`` is given,
+        the extra ``ffd_window - 1`` rows lost by FFD on non-stationary
+        feature columns. Add it to ``resolve_warmup`` to size a data request.
+        """
+        training_config = training_config or {}
+        window = int(training_config.get("ffd_window", DEFAULT_FFD_WINDOW))
+        method = training_config.get("price_normalization", "none")
+
+        rows = 0
+        if method == "log_returns":
+            rows += 1
+        elif method == "ffd":
+            rows += max(window - 1, 0)
+        if features_config and MLBridge.collect_non_stationary_columns(features_config):
+            rows += max(window - 1, 0)
+        return rows
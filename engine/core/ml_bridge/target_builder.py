@@ -50,7 +50,7 @@ class TargetBuilder:
             raise ValueError(f"Unsupported target mode: {mode}. Use 'return' or 'binary'.")
 
         # Drop the "lookforward" tail where targets are inherently NaN
-        df_truncated = df.iloc[:-lookforward].copy()
-        y_truncated = target_series.iloc[:-lookforward].copy()
+        df_truncated = df.iloc[:-lookforward]
+        y_truncated = target_series.iloc[:-lookforward]
 
         return df_truncated, y_truncated
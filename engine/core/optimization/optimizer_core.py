@@ -0,0 +1,479 @@
+"""Hyperparameter search over a strategy's ``parameter_bounds``.
+
+``OptimizerCore`` is Phase A of the training job: it proposes parameter sets
+with Optuna (TPE by default, CMA-ES optionally), scores each one by the mean
+out-of-sample metric across the trainer's CPCV folds, and stops unpromising
+trials after any fold whose running mean falls below the median of earlier
+trials at the same fold. Features, warmup purge, FFD and the fold layout are
+computed once and shared by every trial.
+
+Trials are stored in an Optuna RDB study (``config.OPTIMIZATION_DB_PATH``),
+so repeated searches over identical inputs resume rather than restart, and
+every finished trial is added to the strategy's ``trial_counter`` so the
+Deflated Sharpe Ratio accounts for the configurations that were discarded.
+
+Usage:
+
+    from engine.core.optimization.optimizer_core import OptimizerCore
+
+    result = OptimizerCore("strategies/momentum").optimize(df, n_trials=100)
+    result["best_params"]   # manifest hyperparameters with the best values applied
+"""
+
+import hashlib
+import importlib.util
+import json
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..config import config
+from ..exceptions import StrategyError, ValidationError
+from ..logger import logger
+from ..trainer import LocalTrainer
+
+SAMPLERS = ("tpe", "cmaes")
+
+# A search space entry: ("int" | "float", low, high) or ("categorical", choices).
+SearchSpace = Dict[str, Tuple[Any, ...]]
+
+
+def build_search_space(parameter_bounds: Dict[str, Any]) -> SearchSpace:
+    """Converts manifest ``parameter_bounds`` into an Optuna search space.
+
+    A two-element numeric list is a range: integer when both ends are ints,
+    float otherwise. Any other list is a set of categorical choices.
+
+    Raises:
+        ValidationError: If a bound is not a non-empty list or a range is
+            inverted.
+    """
+    space: SearchSpace = {}
+    for name, bounds in parameter_bounds.items():
+        if not isinstance(bounds, (list, tuple)) or not bounds:
+            raise ValidationError(f"parameter_bounds['{name}'] must be a non-empty list")
+        numeric = all(
+            isinstance(b, (int, float)) and not isinstance(b, bool) for b in bounds
+        )
+        if len(bounds) == 2 and numeric:
+            lo, hi = bounds
+            if lo > hi:
+                raise ValidationError(f"parameter_bounds['{name}'] range is inverted: {bounds}")
+            kind = "int" if all(isinstance(b, int) for b in bounds) else "float"
+            space[name] = (kind, lo, hi)
+        else:
+            space[name] = ("categorical", list(bounds))
+    return space
+
+
+def _suggest(trial, space: SearchSpace) -> Dict[str, Any]:
+    params = {}
+    for name, spec in space.items():
+        if spec[0] == "int":
+            params[name] = trial.suggest_int(name, spec[1], spec[2])
+        elif spec[0] == "float":
+            params[name] = trial.suggest_float(name, float(spec[1]), float(spec[2]))
+        else:
+            params[name] = trial.suggest_categorical(name, spec[1])
+    return params
+
+
+def _in_space(value: Any, spec: Tuple[Any, ...]) -> bool:
+    if spec[0] == "categorical":
+        return value in spec[1]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    if spec[0] == "int" and not float(value).is_integer():
+        return False
+    return spec[1] <= value <= spec[2]
+
+
+class OptimizerCore:
+    """Searches a strategy's ``parameter_bounds`` for the best CPCV score.
+
+    The ``optimization`` block of manifest.json supplies defaults for every
+    ``optimize()`` argument; explicit arguments win.
+
+    Attributes:
+        strategy_dir: Normalized path to the strategy folder.
+        strategy_name: Folder name, used for the study name and trial counts.
+        trainer: ``LocalTrainer`` that prepares data and evaluates folds.
+        space: Search space built from ``parameter_bounds``.
+        optimization_config: Manifest ``optimization`` block over defaults.
+        storage_url: SQLAlchemy URL of the Optuna study storage.
+    """
+
+    DEFAULT_OPTIMIZATION_CONFIG = {
+        "n_trials": 50,
+        "sampler": "tpe",
+        "metric": "Sharpe Ratio",
+        "pruning": True,
+        "seed": None,
+        "timeout": None,
+        # serial | threads | processes; None defers to config.BATCH_EXECUTOR
+        "executor": None,
+        "max_workers": None,
+    }
+
+    # MedianPruner: never prune the first trials (no baseline yet) nor on
+    # the first fold, whose score alone is too noisy to act on.
+    PRUNER_STARTUP_TRIALS = 5
+    PRUNER_WARMUP_FOLDS = 1
+
+    def __init__(self, strategy_dir: str, storage: Optional[str] = None):
+        """Loads the strategy's manifest and search space.
+
+        Args:
+            strategy_dir: Path to the strategy folder.
+            storage: Optuna storage URL or SQLite file path. Defaults to
+                ``config.OPTIMIZATION_DB_PATH``.
+
+        Raises:
+            StrategyError: If the manifest cannot be loaded.
+            ValidationError: If ``parameter_bounds`` is missing or malformed.
+        """
+        self.trainer = LocalTrainer(strategy_dir)
+        self.strategy_dir = self.trainer.strategy_dir
+        self.strategy_name = os.path.basename(self.strategy_dir)
+        manifest = self.trainer.manifest
+
+        bounds = manifest.get("parameter_bounds") or {}
+        if not bounds:
+            raise ValidationError(
+                f"Strategy '{self.strategy_name}' has no parameter_bounds to optimize"
+            )
+        self.space = build_search_space(bounds)
+        self.base_params = dict(manifest.get("hyperparameters", {}))
+        self.optimization_config = {
+            **self.DEFAULT_OPTIMIZATION_CONFIG,
+            **manifest.get("optimization", {}),
+        }
+
+        storage = storage or config.OPTIMIZATION_DB_PATH
+        if "://" not in storage:
+            os.makedirs(os.path.dirname(os.path.abspath(storage)), exist_ok=True)
+            storage = f"sqlite:///{storage}"
+        self.storage_url = storage
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def optimize(
+        self,
+        raw_data: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+        n_trials: Optional[int] = None,
+        sampler: Optional[str] = None,
+        metric: Optional[str] = None,
+        pruning: Optional[bool] = None,
+        seed: Optional[int] = None,
+        timeout: Optional[float] = None,
+        executor: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Runs the search and returns the best parameter set.
+
+        Each trial trains and validates every CPCV fold with the suggested
+        parameters (manifest hyperparameters fill the rest) and is scored by
+        the mean validation ``metric``. A trial that raises is recorded as
+        failed and the search continues.
+
+        Args:
+            raw_data: Raw OHLCV DataFrame, or ``{ticker: DataFrame}``. Only
+                the first ticker of a multi-ticker dict is searched.
+            n_trials: Trials to run in this call (on top of any the stored
+                study already holds).
+            sampler: ``"tpe"`` or ``"cmaes"`` (needs the ``cmaes`` package;
+                categorical parameters are then sampled independently).
+            metric: Validation metric to maximize: ``"Sharpe Ratio"``,
+                ``"Total Return (%)"`` or ``"CAGR (%)"``.
+            pruning: Stop trials whose running fold mean trails the median.
+            seed: Sampler seed for reproducible searches.
+            timeout: Wall-clock limit in seconds for this call.
+            executor: ``"serial"``, ``"threads"`` or ``"processes"``.
+                Process workers each prepare the data once and share the
+                study through its storage.
+            max_workers: Parallel trials. Defaults as in ``run_batch``.
+
+        Returns:
+            Dictionary with ``best_params`` (full hyperparameter dict),
+            ``best_value``, ``metric``, ``study_name``, the counts
+            ``n_trials``/``n_complete``/``n_pruned``/``n_failed`` for this
+            call, and ``total_trials`` stored in the study.
+
+        Raises:
+            ValidationError: On an unknown sampler, metric or executor.
+            StrategyError: If no trial in the study has completed.
+        """
+        from ..backtester import LocalBacktester, SWEEP_RANK_METRICS
+
+        cfg = self.optimization_config
+        n_trials = int(n_trials or cfg["n_trials"])
+        sampler = (sampler or cfg["sampler"]).lower()
+        metric = metric or cfg["metric"]
+        pruning = cfg["pruning"] if pruning is None else pruning
+        seed = cfg["seed"] if seed is None else seed
+        timeout = cfg["timeout"] if timeout is None else timeout
+
+        if sampler not in SAMPLERS:
+            raise ValidationError(f"sampler must be one of {SAMPLERS}, got {sampler!r}")
+        if sampler == "cmaes" and importlib.util.find_spec("cmaes") is None:
+            raise ValidationError(
+                "The cmaes sampler requires the 'cmaes' package (pip install cmaes)"
+            )
+        if metric not in SWEEP_RANK_METRICS:
+            raise ValidationError(f"metric must be one of {SWEEP_RANK_METRICS}, got {metric!r}")
+        try:
+            executor, workers = LocalBacktester._resolve_executor(
+                executor or cfg["executor"], max_workers or cfg["max_workers"], n_trials
+            )
+        except ValueError as e:
+            raise ValidationError(str(e)) from e
+
+        if isinstance(raw_data, dict):
+            if not raw_data:
+                raise StrategyError("No datasets provided to optimizer")
+            ticker = next(iter(raw_data))
+            if len(raw_data) > 1:
+                logger.warning(
+                    f"Hyperparameter search uses {ticker} only; "
+                    f"{len(raw_data) - 1} other ticker(s) are not searched."
+                )
+            raw_data = raw_data[ticker]
+
+        optuna = _import_optuna()
+        study_name = self._study_name(raw_data, metric)
+        study = optuna.create_study(
+            study_name=study_name,
+            storage=self._storage(optuna),
+            direction="maximize",
+            load_if_exists=True,
+        )
+        first_number = len(study.trials)
+        baseline = None
+        if first_number == 0:
+            baseline = {
+                k: self.base_params[k] for k in self.space
+                if k in self.base_params and _in_space(self.base_params[k], self.space[k])
+            }
+            if len(baseline) < len(self.space):
+                baseline = None
+        else:
+            logger.info(f"Resuming study {study_name} ({first_number} stored trials)")
+
+        logger.info(
+            f"Hyperparameter search: {n_trials} trials, sampler={sampler}, "
+            f"metric={metric}, executor={executor} ({workers} workers)"
+        )
+        options = {"sampler": sampler, "metric": metric, "pruning": pruning,
+                   "seed": seed, "timeout": timeout}
+        prepared = None
+        remaining = n_trials
+        if baseline is not None:
+            # The baseline runs alone: parallel workers racing for one
+            # enqueued trial can both claim it on SQLite storage.
+            study.enqueue_trial(baseline)
+            prepared = self.trainer.prepare(raw_data)
+            self._run_study(study_name, prepared, 1, n_jobs=1, worker=0, **options)
+            remaining -= 1
+
+        if remaining and executor == "processes":
+            shares = [remaining // workers + (i < remaining % workers) for i in range(workers)]
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                futures = [
+                    pool.submit(
+                        _run_optimize_worker, self.strategy_dir, self.storage_url,
+                        study_name, raw_data, share, i, options,
+                    )
+                    for i, share in enumerate(shares) if share
+                ]
+                for future in futures:
+                    future.result()
+        elif remaining:
+            self._run_study(
+                study_name, prepared or self.trainer.prepare(raw_data), remaining,
+                n_jobs=workers if executor == "threads" else 1, worker=0, **options,
+            )
+
+        return self._summarize(optuna, study_name, first_number, metric)
+
+    # ------------------------------------------------------------------
+    # Study execution
+    # ------------------------------------------------------------------
+
+    def _run_study(
+        self,
+        study_name: str,
+        prepared: Dict[str, Any],
+        n_trials: int,
+        n_jobs: int,
+        worker: int,
+        sampler: str,
+        metric: str,
+        pruning: bool,
+        seed: Optional[int],
+        timeout: Optional[float],
+    ) -> None:
+        """Runs ``n_trials`` on ``prepared`` (see ``LocalTrainer.prepare``) against the stored study."""
+        optuna = _import_optuna()
+        n_folds = len(prepared["folds"])
+
+        worker_seed = None if seed is None else int(seed) + worker
+        if sampler == "cmaes":
+            sampler_obj = optuna.samplers.CmaEsSampler(seed=worker_seed)
+        else:
+            sampler_obj = optuna.samplers.TPESampler(seed=worker_seed)
+        pruner = (
+            optuna.pruners.MedianPruner(
+                n_startup_trials=self.PRUNER_STARTUP_TRIALS,
+                n_warmup_steps=self.PRUNER_WARMUP_FOLDS,
+            )
+            if pruning and n_folds > 1
+            else optuna.pruners.NopPruner()
+        )
+        study = optuna.load_study(
+            study_name=study_name,
+            storage=self._storage(optuna),
+            sampler=sampler_obj,
+            pruner=pruner,
+        )
+
+        def objective(trial) -> float:
+            params = {**self.base_params, **_suggest(trial, self.space)}
+            scores: List[float] = []
+
+            def on_fold(fold_idx: int, val_metrics: Dict[str, Any]) -> None:
+                value = float(val_metrics.get(metric, float("nan")))
+                scores.append(value if math.isfinite(value) else float("nan"))
+                running = np.nanmean(scores) if not np.isnan(scores).all() else float("nan")
+                if math.isfinite(running):
+                    trial.report(float(running), fold_idx)
+                    if trial.should_prune():
+                        raise optuna.TrialPruned()
+
+            self.trainer.evaluate_folds(prepared, params, on_fold=on_fold)
+            if np.isnan(scores).all():
+                return float("nan")
+            return float(np.nanmean(scores))
+
+        study.optimize(
+            objective,
+            n_trials=n_trials,
+            timeout=timeout,
+            n_jobs=n_jobs,
+            catch=(Exception,),
+            callbacks=[self._log_trial],
+        )
+
+    @staticmethod
+    def _log_trial(study, trial) -> None:
+        value = "n/a" if trial.value is None else f"{trial.value:.4f}"
+        logger.info(
+            f"Trial {trial.number} {trial.state.name.lower()}: "
+            f"value={value} params={trial.params}"
+        )
+
+    def _summarize(self, optuna, study_name: str, first_number: int,
+                   metric: str) -> Dict[str, Any]:
+        study = optuna.load_study(study_name=study_name, storage=self._storage(optuna))
+        states = optuna.trial.TrialState
+        trials = study.get_trials(deepcopy=False)
+        new = [t for t in trials if t.number >= first_number and t.state.is_finished()]
+        counts = {
+            "n_complete": sum(t.state == states.COMPLETE for t in new),
+            "n_pruned": sum(t.state == states.PRUNED for t in new),
+            "n_failed": sum(t.state == states.FAIL for t in new),
+        }
+
+        try:
+            from ..diagnostics.trial_counter import increment
+            if new:
+                increment(self.strategy_name, "optimize", len(new))
+        except Exception:
+            pass
+
+        if not any(t.state == states.COMPLETE for t in trials):
+            raise StrategyError(
+                f"Hyperparameter search for '{self.strategy_name}' produced no "
+                f"completed trials ({counts['n_failed']} failed, {counts['n_pruned']} pruned)"
+            )
+
+        best = study.best_trial
+        logger.info(
+            f"Hyperparameter search finished: best {metric}={best.value:.4f} "
+            f"(trial {best.number}) with {best.params}; "
+            f"{counts['n_complete']} complete, {counts['n_pruned']} pruned, "
+            f"{counts['n_failed']} failed"
+        )
+        return {
+            "study_name": study_name,
+            "metric": metric,
+            "best_value": float(best.value),
+            "best_params": {**self.base_params, **best.params},
+            "n_trials": len(new),
+            **counts,
+            "total_trials": len(trials),
+        }
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _storage(self, optuna):
+        # SQLite serializes writers; parallel workers wait instead of failing.
+        engine_kwargs = (
+            {"connect_args": {"timeout": 60}}
+            if self.storage_url.startswith("sqlite") else None
+        )
+        return optuna.storages.RDBStorage(self.storage_url, engine_kwargs=engine_kwargs)
+
+    def _study_name(self, raw_data: pd.DataFrame, metric: str) -> str:
+        """Names the study after every input that changes a trial's score.
+
+        A stored study is resumed only while the search space, fixed
+        hyperparameters, features, training config, metric, model source and
+        data are all unchanged; any edit starts a fresh study.
+        """
+        digest = hashlib.sha1()
+        manifest = self.trainer.manifest
+        digest.update(json.dumps({
+            "space": self.space,
+            "base": self.base_params,
+            "features": manifest.get("features", []),
+            "training": self.trainer.training_config,
+            "is_ml": self.trainer.is_ml,
+            "metric": metric,
+        }, sort_keys=True, default=str).encode())
+        model_path = os.path.join(self.strategy_dir, "model.py")
+        if os.path.exists(model_path):
+            with open(model_path, "rb") as f:
+                digest.update(f.read())
+        digest.update(pd.util.hash_pandas_object(raw_data, index=True).to_numpy().tobytes())
+        return f"{self.strategy_name}-{digest.hexdigest()[:12]}"
+
+
+def _import_optuna():
+    import optuna
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    return optuna
+
+
+# ---------------------------------------------------------------------------
+# Process-pool worker (module level so it pickles under spawn)
+# ---------------------------------------------------------------------------
+
+def _run_optimize_worker(strategy_dir: str, storage_url: str, study_name: str,
+                         raw_data: pd.DataFrame, n_trials: int, worker: int,
+                         options: Dict[str, Any]) -> None:
+    core = OptimizerCore(strategy_dir, storage=storage_url)
+    core._run_study(
+        study_name, core.trainer.prepare(raw_data), n_trials,
+        n_jobs=1, worker=worker, **options,
+    )
@@ -10,14 +10,23 @@ hits, signal exits, signal-strength-based evictions, or (optionally) when
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+import itertools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
 from .logger import logger
 
+try:
+    from numba import njit as _njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -38,25 +47,153 @@ class PortfolioConfig:
     allow_short:           bool  = True
 
 
+# Metrics PortfolioBacktester.sweep can rank by (higher is better).
+PORTFOLIO_RANK_METRICS = (
+    'Sharpe Ratio', 'Sortino Ratio', 'Calmar Ratio', 'CAGR (%)',
+    'Total Return (%)', 'Max Drawdown (%)',
+)
+
+
 # ---------------------------------------------------------------------------
-# Internal position record
+# Backtester
 # ---------------------------------------------------------------------------
 
+# Trade-record columns emitted by the simulation kernel, and exit-reason codes.
+_T_SLOT, _T_DIR, _T_ENTRY_BAR, _T_ENTRY_PRICE, _T_SHARES, _T_EXIT_PRICE, \
+    _T_EXIT_DATE_BAR, _T_EXIT_BAR, _T_REASON, _T_PNL = range(10)
+_EXIT_REASONS = ('STOP', 'SIGNAL', 'FLIP', 'EVICTED', 'END_OF_DATA')
+_STOP, _SIGNAL, _FLIP, _EVICTED, _END_OF_DATA = range(5)
+# Position-event kinds recorded by the kernel.
+POSITION_EVENTS = ('ENTRY', 'RESIZE', 'EXIT')
+_ENTRY, _RESIZE, _EXIT = range(3)
+
+
 @dataclass
-class _Position:
-    ticker:          str
-    direction:       int            # +1 = long, -1 = short
-    entry_bar:       int            # integer index into unified_index
-    entry_date:      pd.Timestamp
-    entry_price:     float
-    shares:          float
-    stop_price:      float
-    signal_strength: float          # |signal| at last sizing event
+class AlignedUniverse:
+    """
+    Prices and signals of a universe aligned to one bar index.
 
+    Built once by ``PortfolioBacktester.align`` and shared read-only by every
+    simulation over it: arrays are (bars x tickers), column j is ``tickers[j]``.
+    """
+    tickers: List[str]
+    index:   pd.DatetimeIndex
+    opens:   np.ndarray
+    closes:  np.ndarray
+    sigs:    np.ndarray
+    rank:    np.ndarray    # per bar, ticker columns by descending |signal|
+
+    def kernel_inputs(self) -> tuple:
+        """(opens, closes, sigs) in the form ``_simulate`` runs fastest on."""
+        if _NUMBA_AVAILABLE:
+            return self.opens, self.closes, self.sigs
+        if not hasattr(self, '_lists'):
+            # Python lists index several times faster than NumPy scalars.
+            self._lists = (self.opens.tolist(), self.closes.tolist(), self.sigs.tolist())
+        return self._lists
+
+
+@dataclass
+class PositionHistory:
+    """
+    Position changes of a portfolio run, densified to weights on demand.
+
+    One event per entry, resize or exit, in simulation order: from the close
+    of row ``bars[e]`` on, ticker ``slots[e]`` holds ``shares[e]`` shares in
+    ``directions[e]`` (+1/-1; 0 shares after an exit). The orders fill at the
+    next open, which is what the trade log dates. Positions still open at the
+    end are liquidated after the last row and carry no exit event.
+
+    A signed weight is ``shares * close / equity * direction``, so weights are
+    rebuilt from the events, the aligned closes and the equity curve only for
+    the rows and tickers asked for.
+    """
+    tickers:    List[str]
+    index:      pd.DatetimeIndex
+    bars:       np.ndarray
+    slots:      np.ndarray
+    kinds:      np.ndarray
+    shares:     np.ndarray
+    directions: np.ndarray
+    closes:     np.ndarray    # (bars x tickers), shared with the AlignedUniverse
+    equity:     np.ndarray    # per-bar portfolio value weights are taken against
+
+    @classmethod
+    def from_events(cls, events: list, aligned: AlignedUniverse, equity: np.ndarray) -> 'PositionHistory':
+        """Builds the history from the kernel's ``(bar, slot, kind, shares, direction)`` tuples."""
+        arr = np.asarray(events, dtype=float).reshape(-1, 5)
+        return cls(
+            tickers=aligned.tickers,
+            index=aligned.index,
+            bars=arr[:, 0].astype(np.int64),
+            slots=arr[:, 1].astype(np.int32),
+            kinds=arr[:, 2].astype(np.int8),
+            shares=arr[:, 3],
+            directions=arr[:, 4].astype(np.int8),
+            closes=aligned.closes,
+            equity=np.asarray(equity, dtype=float),
+        )
+
+    @property
+    def held_tickers(self) -> List[str]:
+        """Tickers that were ever held, in universe order."""
+        return [self.tickers[s] for s in np.unique(self.slots)]
+
+    def events(self) -> pd.DataFrame:
+        """The events as a table: ``date`` (row the change applies from), ``ticker``,
+        ``event`` (ENTRY/RESIZE/EXIT), ``shares`` (after the event) and ``direction``."""
+        return pd.DataFrame({
+            'date':      self.index[self.bars],
+            'ticker':    np.asarray(self.tickers, dtype=object)[self.slots],
+            'event':     np.asarray(POSITION_EVENTS, dtype=object)[self.kinds],
+            'shares':    self.shares,
+            'direction': np.where(self.directions > 0, 'LONG', 'SHORT').astype(object),
+        })
+
+    def weights(
+        self,
+        start:   Optional[pd.Timestamp] = None,
+        end:     Optional[pd.Timestamp] = None,
+        tickers: Optional[Sequence[str]] = None,
+        step:    int = 1,
+    ) -> pd.DataFrame:
+        """
+        Signed portfolio weights for a window of rows.
+
+        Args:
+            start, end: Inclusive date bounds; default to the whole run.
+            tickers: Columns to build; defaults to every ticker in the universe.
+            step: Keep every ``step``-th row of the window (display downsampling).
+
+        Returns:
+            pd.DataFrame: rows x tickers, 0.0 where the ticker is not held.
+        """
+        lo = 0 if start is None else int(self.index.searchsorted(pd.Timestamp(start)))
+        hi = len(self.index) if end is None else int(self.index.searchsorted(pd.Timestamp(end), side='right'))
+        rows = np.arange(lo, hi, max(1, int(step)))
+        tickers = list(self.tickers if tickers is None else tickers)
+        slot_of = {t: j for j, t in enumerate(self.tickers)}
+
+        out = np.zeros((len(rows), len(tickers)))
+        pv = self.equity[rows]
+        by_slot = np.argsort(self.slots, kind='stable')
+        sorted_slots = self.slots[by_slot]
+        for col, t in enumerate(tickers):
+            s = slot_of[t]
+            ev = by_slot[np.searchsorted(sorted_slots, s):np.searchsorted(sorted_slots, s, side='right')]
+            if not len(ev):
+                continue
+            # Latest event at or before each row (events are in bar order).
+            k = np.searchsorted(self.bars[ev], rows, side='right') - 1
+            held = k >= 0
+            k = ev[np.maximum(k, 0)]
+            c = self.closes[rows, s]
+            valid = held & (self.shares[k] > 0) & (pv > 0) & ~np.isnan(c)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                w = (self.shares[k] * c / pv) * self.directions[k]
+            out[:, col] = np.where(valid, w, 0.0)
+        return pd.DataFrame(out, index=self.index[rows], columns=tickers)
 
-# ---------------------------------------------------------------------------
-# Backtester
-# ---------------------------------------------------------------------------
 
 class PortfolioBacktester:
     """
@@ -68,10 +205,19 @@ class PortfolioBacktester:
 
     Returns a dict with:
         equity_curve            — pd.Series of portfolio value over time
-        position_weights        — {ticker: pd.Series} signed weight in portfolio
+        positions               — PositionHistory: entry/resize/exit events,
+                                  ``.weights(start, end)`` for signed weights
         trade_log               — pd.DataFrame, one row per completed round-trip
         per_ticker_contribution — {ticker: net_pnl float}
         metrics                 — dict of scalar performance statistics
+
+    The simulation state lives in fixed per-ticker arrays (shares, entry and
+    stop price, direction, signal strength) and the bar loop runs in
+    ``_simulate``, which is compiled with Numba when it is installed and
+    runs as plain Python otherwise. Entry candidates are filtered and ranked
+    for every bar at once with NumPy before the loop.
+
+    ``sweep`` aligns the universe once and scores many configs over it.
     """
 
     def run(
@@ -80,216 +226,55 @@ class PortfolioBacktester:
         all_signals: Dict[str, pd.Series],
         config:      PortfolioConfig,
     ) -> dict:
+        aligned = self.align(datasets, all_signals)
+        if aligned is None:
+            return self._empty_result()
+        return self.run_aligned(aligned, config)
+
+    @staticmethod
+    def align(
+        datasets:    Dict[str, pd.DataFrame],
+        all_signals: Dict[str, pd.Series],
+    ) -> Optional[AlignedUniverse]:
+        """
+        Aligns every ticker's opens, closes and signals to the union index.
+
+        Returns:
+            AlignedUniverse, or None when no ticker has both data and signals.
+        """
         valid = [t for t, s in all_signals.items() if not s.empty and t in datasets]
         if not valid:
-            return self._empty_result()
+            return None
 
-        # ------------------------------------------------------------------ #
-        # 0. Build unified datetime index (union of all signal indices)       #
-        # ------------------------------------------------------------------ #
         unified_index: pd.DatetimeIndex = all_signals[valid[0]].index
         for t in valid[1:]:
             unified_index = unified_index.union(all_signals[t].index)
         unified_index = unified_index.sort_values()
         n = len(unified_index)
 
-        # Pre-build numpy arrays aligned to unified_index for fast bar lookup
-        opens:  Dict[str, np.ndarray] = {}
-        closes: Dict[str, np.ndarray] = {}
-        sigs:   Dict[str, np.ndarray] = {}
-
-        for t in valid:
+        opens  = np.empty((n, len(valid)))
+        closes = np.empty((n, len(valid)))
+        sigs   = np.empty((n, len(valid)))
+        for j, t in enumerate(valid):
             df  = datasets[t]
-            sig = all_signals[t]
-            opens[t]  = df['open'].reindex(unified_index).values.astype(float)
-            closes[t] = df['close'].reindex(unified_index).values.astype(float)
-            sigs[t]   = sig.reindex(unified_index).fillna(0.0).values.astype(float)
-
-        # ------------------------------------------------------------------ #
-        # 1. Main simulation loop                                             #
-        # ------------------------------------------------------------------ #
-        cash: float = float(config.starting_capital)
-        open_positions: Dict[str, _Position] = {}
-
-        equity_arr   = np.full(n, np.nan)
-        weight_arrs: Dict[str, np.ndarray] = {t: np.zeros(n) for t in valid}
-        completed_trades: List[dict] = []
-
-        for i in range(n - 1):
-            next_bar = unified_index[i + 1]
-
-            # Mark-to-market at close[i]
-            pos_value = _mtm_value(open_positions, closes, i)
-            portfolio_value = cash + pos_value
-
-            # ---- 1a. Stop-loss & signal exits → execute at open[i+1] ---- #
-            to_close: List[Tuple[str, float, str]] = []
-
-            for t, pos in list(open_positions.items()):
-                nx_open = opens[t][i + 1]
-                if np.isnan(nx_open):
-                    continue
-
-                if pos.direction == 1 and nx_open <= pos.stop_price:
-                    to_close.append((t, nx_open, 'STOP'))
-                    continue
-                if pos.direction == -1 and nx_open >= pos.stop_price:
-                    to_close.append((t, nx_open, 'STOP'))
-                    continue
-
-                sig_val = sigs[t][i]
-                if abs(sig_val) < config.entry_threshold:
-                    to_close.append((t, nx_open, 'SIGNAL'))
-                elif (sig_val > 0) != (pos.direction > 0):
-                    to_close.append((t, nx_open, 'FLIP'))
-
-            for t, exec_price, reason in to_close:
-                if t not in open_positions:
-                    continue
-                trade = _close_position(
-                    open_positions.pop(t), exec_price, next_bar, i, config.friction
-                )
-                trade['exit_reason'] = reason
-                completed_trades.append(trade)
-                cash += trade['_cash_delta']
-
-            # ---- 1b. Optional rebalance on signal strength -------------- #
-            if config.rebalance_on_strength:
-                for t, pos in list(open_positions.items()):
-                    new_abs = abs(sigs[t][i])
-                    if abs(new_abs - pos.signal_strength) < config.rebalance_delta:
-                        continue
-                    nx_open = opens[t][i + 1]
-                    if np.isnan(nx_open) or nx_open <= 0:
-                        continue
-                    new_shares = _size_position(
-                        portfolio_value, nx_open, new_abs, config
-                    )
-                    delta = new_shares - pos.shares
-                    if delta > 0:
-                        cost = delta * nx_open * (1 + config.friction)
-                        if cost <= cash:
-                            cash -= cost
-                            pos.shares += delta
-                    elif delta < 0:
-                        sell = abs(delta)
-                        cash += sell * nx_open * (1 - config.friction)
-                        pos.shares -= sell
-                    pos.signal_strength = new_abs
-
-            # ---- 1c. New entry candidates (sorted strongest first) ------- #
-            candidates: List[Tuple[str, float]] = []
-            for t in valid:
-                if t in open_positions:
-                    continue
-                s = sigs[t][i]
-                if abs(s) < config.entry_threshold:
-                    continue
-                if not config.allow_short and s < 0:
-                    continue
-                nx_open = opens[t][i + 1]
-                if np.isnan(nx_open) or nx_open <= 0:
-                    continue
-                candidates.append((t, s))
-
-            candidates.sort(key=lambda x: abs(x[1]), reverse=True)
-
-            for t, s in candidates:
-                nx_open = opens[t][i + 1]
-
-                if len(open_positions) >= config.max_positions:
-                    if not open_positions:
-                        break
-                    weakest_t = min(
-                        open_positions,
-                        key=lambda x: open_positions[x].signal_strength,
-                    )
-                    weakest_strength = open_positions[weakest_t].signal_strength
-                    if abs(s) < weakest_strength + config.eviction_margin:
-                        continue  # not strong enough to evict
-
-                    evict_price = opens[weakest_t][i + 1]
-                    if np.isnan(evict_price):
-                        continue
-                    trade = _close_position(
-                        open_positions.pop(weakest_t),
-                        evict_price, next_bar, i, config.friction,
-                    )
-                    trade['exit_reason'] = 'EVICTED'
-                    completed_trades.append(trade)
-                    cash += trade['_cash_delta']
-
-                shares = _size_position(portfolio_value, nx_open, s, config)
-                cost   = shares * nx_open * (1 + config.friction)
-                if cost > cash:
-                    shares = cash / (nx_open * (1 + config.friction))
-                if shares <= 0:
-                    continue
+            opens[:, j]  = df['open'].reindex(unified_index).values.astype(float)
+            closes[:, j] = df['close'].reindex(unified_index).values.astype(float)
+            sigs[:, j]   = all_signals[t].reindex(unified_index).fillna(0.0).values.astype(float)
 
-                cash -= shares * nx_open * (1 + config.friction)
-                direction  = 1 if s > 0 else -1
-                stop_price = nx_open * (1 - config.stop_loss_pct * direction)
-
-                open_positions[t] = _Position(
-                    ticker=t,
-                    direction=direction,
-                    entry_bar=i + 1,
-                    entry_date=next_bar,
-                    entry_price=nx_open,
-                    shares=shares,
-                    stop_price=stop_price,
-                    signal_strength=abs(s),
-                )
-
-            # ---- 1d. Record equity and weights for this bar -------------- #
-            pv = cash + _mtm_value(open_positions, closes, i)
-            equity_arr[i] = pv
-
-            if pv > 0:
-                for t, pos in open_positions.items():
-                    c = closes[t][i]
-                    if not np.isnan(c):
-                        weight_arrs[t][i] = (pos.shares * c / pv) * pos.direction
-
-        # ---- 1e. Close all remaining positions at final bar -------------- #
-        for t, pos in list(open_positions.items()):
-            c = closes[t][-1]
-            if np.isnan(c):
-                c = pos.entry_price
-            trade = _close_position(
-                pos, c, unified_index[-1], n - 1, config.friction
-            )
-            trade['exit_reason'] = 'END_OF_DATA'
-            completed_trades.append(trade)
-            cash += trade['_cash_delta']
-
-        equity_arr[-1] = cash
-        for t, pos in open_positions.items():
-            c = closes[t][-1]
-            if not np.isnan(c) and cash > 0:
-                weight_arrs[t][-1] = (pos.shares * c / cash) * pos.direction
-
-        # ------------------------------------------------------------------ #
-        # 2. Assemble result                                                  #
-        # ------------------------------------------------------------------ #
-        equity_curve = (
-            pd.Series(equity_arr, index=unified_index)
-            .ffill()
-            .fillna(config.starting_capital)
-        )
-
-        position_weights = {
-            t: pd.Series(weight_arrs[t], index=unified_index)
-            for t in valid
-        }
+        # Ties in strength keep ticker order (a stable sort).
+        rank = np.argsort(-np.abs(sigs), axis=1, kind="stable")
+        return AlignedUniverse(valid, unified_index, opens, closes, sigs, rank)
 
+    def run_aligned(self, aligned: AlignedUniverse, config: PortfolioConfig) -> dict:
+        """``run`` over a universe already prepared by ``align``."""
+        equity_curve, positions, completed_trades = _simulate_aligned(aligned, config)
         trade_df = _build_trade_df(completed_trades)
 
         per_ticker_contribution = {
             t: round(
                 sum(tr['pnl'] for tr in completed_trades if tr['ticker'] == t), 4
             )
-            for t in valid
+            for t in aligned.tickers
         }
 
         metrics = _calculate_metrics(
@@ -303,49 +288,235 @@ class PortfolioBacktester:
 
         return {
             'equity_curve':            equity_curve,
-            'position_weights':        position_weights,
+            'positions':               positions,
             'trade_log':               trade_df,
             'per_ticker_contribution': per_ticker_contribution,
             'metrics':                 metrics,
         }
 
+    def sweep(
+        self,
+        datasets:    Dict[str, pd.DataFrame],
+        all_signals: Dict[str, pd.Series],
+        configs:     Sequence[PortfolioConfig],
+        rank_by:     str = 'Sharpe Ratio',
+        executor:    Optional[str] = None,
+        max_workers: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> pd.DataFrame:
+        """
+        Scores many configs over one universe and ranks them.
+
+        The universe is aligned once. Configs are independent, so they can be
+        spread over a thread or process pool (see ``LocalBacktester.run_batch``);
+        process workers receive the aligned arrays once, through the pool
+        initializer. Threads only run in parallel when Numba is installed.
+
+        Args:
+            datasets, all_signals: As for ``run``.
+            configs: Configs to evaluate, e.g. from ``portfolio_config_grid``.
+            rank_by: Metric to rank by, one of ``PORTFOLIO_RANK_METRICS``.
+                Higher is better (drawdowns are negative).
+            executor: ``"serial"``, ``"threads"`` or ``"processes"``.
+                Defaults to ``config.BATCH_EXECUTOR``.
+            max_workers: Pool size (defaults as in ``run_batch``).
+            on_progress: Called as ``on_progress(done, total)`` after every config.
+
+        Returns:
+            pd.DataFrame: One row per config, best first, indexed by its
+            position in ``configs``: the config fields that differ between
+            configs, then the ``run`` metrics.
+
+        Raises:
+            ValueError: If ``rank_by`` or ``executor`` is invalid.
+        """
+        from .backtester import LocalBacktester
+
+        if rank_by not in PORTFOLIO_RANK_METRICS:
+            raise ValueError(f"rank_by must be one of {PORTFOLIO_RANK_METRICS}, got {rank_by!r}")
+        configs = list(configs)
+        executor, workers = LocalBacktester._resolve_executor(executor, max_workers, len(configs))
+        aligned = self.align(datasets, all_signals)
+        if aligned is None or not configs:
+            return pd.DataFrame()
+
+        logger.info(
+            f"Portfolio sweep: {len(configs)} configs over {len(aligned.tickers)} tickers "
+            f"x {len(aligned.index)} bars ({executor})."
+        )
+        scores: Dict[int, dict] = {}
+        pool = None
+        try:
+            if executor == "threads":
+                pool = ThreadPoolExecutor(max_workers=workers)
+                futures = [pool.submit(_score_config, aligned, i, c) for i, c in enumerate(configs)]
+            elif executor == "processes":
+                pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_portfolio_sweep_worker,
+                    initargs=(aligned,),
+                )
+                futures = [pool.submit(_run_portfolio_sweep_worker, i, c) for i, c in enumerate(configs)]
+            outcomes = (
+                (_score_config(aligned, i, c) for i, c in enumerate(configs))
+                if pool is None
+                else (f.result() for f in as_completed(futures))
+            )
+            for i, metrics in outcomes:
+                scores[i] = metrics
+                if on_progress is not None:
+                    on_progress(len(scores), len(configs))
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        fields = [
+            f for f in PortfolioConfig.__dataclass_fields__
+            if len({getattr(c, f) for c in configs}) > 1
+        ]
+        table = pd.DataFrame(
+            [{**{f: getattr(configs[i], f) for f in fields}, **scores[i]} for i in range(len(configs))],
+            index=pd.Index(range(len(configs)), name='config'),
+        )
+        if rank_by not in table.columns:
+            return table
+        # Best first; ties and empty results keep config order.
+        return table.sort_values(rank_by, ascending=False, kind='stable', na_position='last')
+
     @staticmethod
     def _empty_result() -> dict:
         return {
             'equity_curve':            pd.Series(dtype=float),
-            'position_weights':        {},
+            'positions':               None,
             'trade_log':               pd.DataFrame(),
             'per_ticker_contribution': {},
             'metrics':                 {},
         }
 
 
+def portfolio_config_grid(
+    grid: Dict[str, Sequence],
+    base: Optional[PortfolioConfig] = None,
+) -> List[PortfolioConfig]:
+    """
+    Every combination of ``grid`` values applied on top of ``base``.
+
+    Example: ``portfolio_config_grid({'max_positions': [5, 10], 'stop_loss_pct': [0.03, 0.05]})``
+    yields four configs.
+
+    Raises:
+        ValueError: If a key is not a PortfolioConfig field or has no values.
+    """
+    base = base or PortfolioConfig()
+    unknown = [k for k in grid if k not in PortfolioConfig.__dataclass_fields__]
+    if unknown:
+        raise ValueError(f"Unknown PortfolioConfig fields: {unknown}")
+    empty = [k for k, v in grid.items() if not len(v)]
+    if empty:
+        raise ValueError(f"No values to sweep for: {empty}")
+    keys = list(grid)
+    return [
+        replace(base, **dict(zip(keys, values)))
+        for values in itertools.product(*grid.values())
+    ]
+
+
+def _simulate_aligned(
+    aligned: AlignedUniverse,
+    config:  PortfolioConfig,
+) -> Tuple[pd.Series, np.ndarray, List[dict]]:
+    """
+    Runs the kernel for one config.
+
+    Returns:
+        (equity_curve, PositionHistory, trade-log rows).
+    """
+    cand_ptr, cand_slots = _entry_candidates(aligned, config)
+    if not _NUMBA_AVAILABLE:
+        cand_ptr, cand_slots = cand_ptr.tolist(), cand_slots.tolist()
+    equity_arr, events, trades = _simulate(
+        *aligned.kernel_inputs(), cand_ptr, cand_slots,
+        float(config.starting_capital), int(config.max_positions),
+        float(config.risk_per_trade_pct), float(config.stop_loss_pct),
+        float(config.max_position_pct), float(config.entry_threshold),
+        float(config.eviction_margin), float(config.friction),
+        bool(config.rebalance_on_strength), float(config.rebalance_delta),
+    )
+    equity_curve = (
+        pd.Series(np.asarray(equity_arr, dtype=float), index=aligned.index)
+        .ffill()
+        .fillna(config.starting_capital)
+    )
+    completed_trades = [
+        _trade_record(tr, aligned.tickers, aligned.index) for tr in trades
+    ]
+    positions = PositionHistory.from_events(events, aligned, equity_arr)
+    return equity_curve, positions, completed_trades
+
+
+def _score_config(aligned: AlignedUniverse, index: int, config: PortfolioConfig) -> Tuple[int, dict]:
+    """Metrics of one sweep config (no contributions)."""
+    equity_curve, _, completed_trades = _simulate_aligned(aligned, config)
+    trade_df = _build_trade_df(completed_trades)
+    return index, _calculate_metrics(equity_curve, trade_df, config.starting_capital)
+
+
+# Per-process state for PortfolioBacktester.sweep(executor="processes"): the
+# aligned universe is sent once, by the pool initializer.
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_portfolio_sweep_worker(aligned: AlignedUniverse) -> None:
+    _worker_state['aligned'] = aligned
+
+
+def _run_portfolio_sweep_worker(index: int, config: PortfolioConfig) -> Tuple[int, dict]:
+    return _score_config(_worker_state['aligned'], index, config)
+
+
 # ---------------------------------------------------------------------------
-# Module-level helpers (keep the class methods short)
+# Simulation kernel
 # ---------------------------------------------------------------------------
 
-def _mtm_value(
-    open_positions: Dict[str, '_Position'],
-    closes: Dict[str, np.ndarray],
-    bar_idx: int,
-) -> float:
-    """Sum of mark-to-market value of all open positions at bar_idx."""
-    total = 0.0
-    for t, pos in open_positions.items():
-        c = closes[t][bar_idx]
-        if not np.isnan(c):
-            total += (
-                pos.shares * pos.entry_price
-                + pos.direction * (c - pos.entry_price) * pos.shares
-            )
-    return total
+def _entry_candidates(
+    aligned: AlignedUniverse,
+    config:  PortfolioConfig,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Entry candidates for every bar, strongest signal first, in CSR form.
 
+    A ticker is a candidate at bar i when |signal| clears ``entry_threshold``,
+    shorts are allowed or the signal is long, and the next open is tradable.
+    Whether the ticker is already held is checked inside the kernel.
 
-def _size_position(
+    Returns:
+        (ptr, slots): bar i's candidates are ``slots[ptr[i]:ptr[i + 1]]``.
+    """
+    opens, sigs = aligned.opens, aligned.sigs
+    n, k = sigs.shape
+    next_open = np.full((n, k), np.nan)
+    next_open[:-1] = opens[1:]
+    eligible = np.abs(sigs) >= config.entry_threshold
+    if not config.allow_short:
+        eligible &= sigs >= 0
+    with np.errstate(invalid="ignore"):
+        eligible &= next_open > 0          # False for NaN
+    eligible[-1] = False                   # the loop never trades off the last bar
+
+    ranked = np.take_along_axis(eligible, aligned.rank, axis=1)
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(ranked.sum(axis=1), out=ptr[1:])
+    return ptr, aligned.rank[ranked].astype(np.int64)
+
+
+def _size_shares(
     portfolio_value: float,
     entry_price:     float,
     signal:          float,
-    config:          PortfolioConfig,
+    risk_pct:        float,
+    stop_pct:        float,
+    max_pos_pct:     float,
 ) -> float:
     """
     Returns share count using the 2% risk rule capped by signal-scaled max size.
@@ -354,53 +525,267 @@ def _size_position(
     Signal cap: shares = (portfolio * max_pos_pct * |signal|) / entry
     Final:      min(rule_shares, cap_shares)
     """
-    if entry_price <= 0 or config.stop_loss_pct <= 0:
+    if entry_price <= 0 or stop_pct <= 0:
         return 0.0
-    risk_dollars = portfolio_value * config.risk_per_trade_pct
-    rule_shares  = risk_dollars / (entry_price * config.stop_loss_pct)
-    cap_shares   = (portfolio_value * config.max_position_pct * abs(signal)) / entry_price
+    risk_dollars = portfolio_value * risk_pct
+    rule_shares  = risk_dollars / (entry_price * stop_pct)
+    cap_shares   = (portfolio_value * max_pos_pct * abs(signal)) / entry_price
     return max(0.0, min(rule_shares, cap_shares))
 
 
-def _close_position(
-    pos:        '_Position',
-    exec_price: float,
-    exit_date:  pd.Timestamp,
-    exit_bar:   int,
-    friction:   float,
-) -> dict:
-    """
-    Compute realised P&L and cash delta for closing a position.
+def _mtm_value(order, n_open, shares, entry_price, direction, close_row) -> float:
+    """Sum of mark-to-market value of the open positions, in entry order."""
+    total = 0.0
+    for q in range(n_open):
+        s = order[q]
+        c = close_row[s]
+        if c == c:
+            total += (
+                shares[s] * entry_price[s]
+                + direction[s] * (c - entry_price[s]) * shares[s]
+            )
+    return total
 
-    Cash model
-    ----------
-    Entry deducted: shares * entry_price * (1 + friction)
-    Exit returned : shares * entry_price + direction*(exit-entry)*shares - exit_friction
-                  = committed_capital + gross_pnl - exit_friction
-    """
-    gross_pnl     = pos.direction * (exec_price - pos.entry_price) * pos.shares
-    exit_friction = pos.shares * exec_price * friction
-    net_pnl       = gross_pnl - exit_friction
-    cash_delta    = pos.shares * pos.entry_price + net_pnl
 
+def _simulate(
+    opens, closes, sigs, cand_ptr, cand_slots,
+    starting_capital, max_positions, risk_pct, stop_pct, max_pos_pct,
+    entry_threshold, eviction_margin, friction, rebalance_on_strength, rebalance_delta,
+):
+    """
+    Event loop over the unified index (T+1 execution).
+
+    Prices and signals are (bars x tickers), indexed ``[bar][slot]`` so the
+    same code runs on NumPy arrays (compiled) or nested lists (Python).
+    Open positions are listed in ``order`` by entry time: marking to market,
+    exits and evictions visit them in that order, so cash accumulates in the
+    same sequence as a dict of positions would.
+
+    Closing a position (stop, signal exit, flip, eviction, end of data):
+        Entry deducted: shares * entry_price * (1 + friction)
+        Exit returned : shares * entry_price + direction*(exit-entry)*shares - exit_friction
+
+    Returns:
+        (equity, events, trades): per-bar portfolio value (bars), one
+        ``(bar, slot, kind, shares, direction)`` tuple per position change
+        (see ``PositionHistory``) and one tuple per round trip with the
+        fields indexed by the ``_T_*`` constants.
+    """
+    n = len(opens)
+    k = len(opens[0])
+    cash = starting_capital
+    equity = np.full(n, np.nan)
+    events = []
+    trades = []
+
+    is_open     = np.zeros(k, dtype=np.bool_)
+    was_open    = np.zeros(k, dtype=np.bool_)
+    direction   = np.zeros(k)
+    entry_bar   = np.zeros(k, dtype=np.int64)
+    entry_price = np.zeros(k)
+    shares      = np.zeros(k)
+    stop_price  = np.zeros(k)
+    strength    = np.zeros(k)
+    order       = np.zeros(k, dtype=np.int64)
+    n_open      = 0
+    exits       = np.zeros(k, dtype=np.int64)
+    exit_price  = np.zeros(k)
+    exit_reason = np.zeros(k, dtype=np.int64)
+
+    for i in range(n - 1):
+        open_next = opens[i + 1]
+        close_row = closes[i]
+        sig_row   = sigs[i]
+
+        # Mark-to-market at close[i]
+        portfolio_value = cash + _mtm_value(order, n_open, shares, entry_price, direction, close_row)
+
+        # ---- 1a. Stop-loss & signal exits → execute at open[i+1] ---- #
+        n_exits = 0
+        for q in range(n_open):
+            s = order[q]
+            nx_open = open_next[s]
+            if nx_open != nx_open:
+                continue
+            reason = -1
+            if direction[s] == 1 and nx_open <= stop_price[s]:
+                reason = _STOP
+            elif direction[s] == -1 and nx_open >= stop_price[s]:
+                reason = _STOP
+            elif abs(sig_row[s]) < entry_threshold:
+                reason = _SIGNAL
+            elif (sig_row[s] > 0) != (direction[s] > 0):
+                reason = _FLIP
+            if reason >= 0:
+                exits[n_exits] = s
+                exit_price[n_exits] = nx_open
+                exit_reason[n_exits] = reason
+                n_exits += 1
+
+        for e in range(n_exits):
+            s = exits[e]
+            px = exit_price[e]
+            gross_pnl = direction[s] * (px - entry_price[s]) * shares[s]
+            net_pnl = gross_pnl - shares[s] * px * friction
+            trades.append((
+                float(s), direction[s], float(entry_bar[s]), entry_price[s], shares[s],
+                px, float(i + 1), float(i), float(exit_reason[e]), net_pnl,
+            ))
+            cash += shares[s] * entry_price[s] + net_pnl
+            is_open[s] = False
+            n_open = _remove_open(order, n_open, s)
+            events.append((float(i), float(s), float(_EXIT), 0.0, direction[s]))
+
+        # ---- 1b. Optional rebalance on signal strength -------------- #
+        if rebalance_on_strength:
+            for q in range(n_open):
+                s = order[q]
+                new_abs = abs(sig_row[s])
+                if abs(new_abs - strength[s]) < rebalance_delta:
+                    continue
+                nx_open = open_next[s]
+                if nx_open != nx_open or nx_open <= 0:
+                    continue
+                new_shares = _size_shares(
+                    portfolio_value, nx_open, new_abs, risk_pct, stop_pct, max_pos_pct
+                )
+                delta = new_shares - shares[s]
+                if delta > 0:
+                    cost = delta * nx_open * (1 + friction)
+                    if cost <= cash:
+                        cash -= cost
+                        shares[s] += delta
+                        events.append((float(i), float(s), float(_RESIZE), shares[s], direction[s]))
+                elif delta < 0:
+                    sell = abs(delta)
+                    cash += sell * nx_open * (1 - friction)
+                    shares[s] -= sell
+                    events.append((float(i), float(s), float(_RESIZE), shares[s], direction[s]))
+                strength[s] = new_abs
+
+        # ---- 1c. New entry candidates (sorted strongest first) ------- #
+        for s in range(k):
+            was_open[s] = is_open[s]
+        for c in range(cand_ptr[i], cand_ptr[i + 1]):
+            s = cand_slots[c]
+            if was_open[s]:
+                continue
+            sig_val = sig_row[s]
+            nx_open = open_next[s]
+
+            if n_open >= max_positions:
+                if n_open == 0:
+                    break
+                weakest = order[0]
+                for q in range(1, n_open):
+                    if strength[order[q]] < strength[weakest]:
+                        weakest = order[q]
+                if abs(sig_val) < strength[weakest] + eviction_margin:
+                    # Candidates are sorted, so none of the rest can evict either.
+                    break
+
+                evict_price = open_next[weakest]
+                if evict_price != evict_price:
+                    continue
+                gross_pnl = direction[weakest] * (evict_price - entry_price[weakest]) * shares[weakest]
+                net_pnl = gross_pnl - shares[weakest] * evict_price * friction
+                trades.append((
+                    float(weakest), direction[weakest], float(entry_bar[weakest]),
+                    entry_price[weakest], shares[weakest], evict_price,
+                    float(i + 1), float(i), float(_EVICTED), net_pnl,
+                ))
+                cash += shares[weakest] * entry_price[weakest] + net_pnl
+                is_open[weakest] = False
+                n_open = _remove_open(order, n_open, weakest)
+                events.append((float(i), float(weakest), float(_EXIT), 0.0, direction[weakest]))
+
+            new_shares = _size_shares(
+                portfolio_value, nx_open, sig_val, risk_pct, stop_pct, max_pos_pct
+            )
+            cost = new_shares * nx_open * (1 + friction)
+            if cost > cash:
+                new_shares = cash / (nx_open * (1 + friction))
+            if new_shares <= 0:
+                continue
+
+            cash -= new_shares * nx_open * (1 + friction)
+            d = 1.0 if sig_val > 0 else -1.0
+            is_open[s]     = True
+            direction[s]   = d
+            entry_bar[s]   = i + 1
+            entry_price[s] = nx_open
+            shares[s]      = new_shares
+            stop_price[s]  = nx_open * (1 - stop_pct * d)
+            strength[s]    = abs(sig_val)
+            order[n_open]  = s
+            n_open += 1
+            events.append((float(i), float(s), float(_ENTRY), new_shares, d))
+
+        # ---- 1d. Record equity for this bar --------------------------- #
+        equity[i] = cash + _mtm_value(order, n_open, shares, entry_price, direction, close_row)
+
+    # ---- 1e. Close all remaining positions at final bar -------------- #
+    last = closes[n - 1]
+    for q in range(n_open):
+        s = order[q]
+        px = last[s]
+        if px != px:
+            px = entry_price[s]
+        gross_pnl = direction[s] * (px - entry_price[s]) * shares[s]
+        net_pnl = gross_pnl - shares[s] * px * friction
+        trades.append((
+            float(s), direction[s], float(entry_bar[s]), entry_price[s], shares[s],
+            px, float(n - 1), float(n - 1), float(_END_OF_DATA), net_pnl,
+        ))
+        cash += shares[s] * entry_price[s] + net_pnl
+
+    equity[n - 1] = cash
+    return equity, events, trades
+
+
+def _remove_open(order, n_open, slot) -> int:
+    """Drops ``slot`` from the entry-ordered open list; returns the new count."""
+    q = 0
+    while order[q] != slot:
+        q += 1
+    for r in range(q, n_open - 1):
+        order[r] = order[r + 1]
+    return n_open - 1
+
+
+if _NUMBA_AVAILABLE:
+    _size_shares = _njit(cache=True)(_size_shares)
+    _mtm_value   = _njit(cache=True)(_mtm_value)
+    _remove_open = _njit(cache=True)(_remove_open)
+    _simulate    = _njit(cache=True, nogil=True)(_simulate)
+
+
+def _trade_record(
+    trade:         tuple,
+    tickers:       List[str],
+    unified_index: pd.DatetimeIndex,
+) -> dict:
+    """Turns one kernel trade tuple into a trade-log row."""
+    direction   = int(trade[_T_DIR])
+    entry_price = float(trade[_T_ENTRY_PRICE])
+    exit_price  = float(trade[_T_EXIT_PRICE])
+    entry_bar   = int(trade[_T_ENTRY_BAR])
     return_pct = (
-        pos.direction * (exec_price - pos.entry_price) / pos.entry_price * 100
-        if pos.entry_price > 0 else 0.0
+        direction * (exit_price - entry_price) / entry_price * 100
+        if entry_price > 0 else 0.0
     )
-
     return {
-        'ticker':      pos.ticker,
-        'direction':   'LONG' if pos.direction == 1 else 'SHORT',
-        'entry_date':  pos.entry_date,
-        'exit_date':   exit_date,
-        'entry_price': round(pos.entry_price, 4),
-        'exit_price':  round(exec_price, 4),
-        'shares':      round(pos.shares, 4),
-        'pnl':         round(net_pnl, 4),
+        'ticker':      tickers[int(trade[_T_SLOT])],
+        'direction':   'LONG' if direction == 1 else 'SHORT',
+        'entry_date':  unified_index[entry_bar],
+        'exit_date':   unified_index[int(trade[_T_EXIT_DATE_BAR])],
+        'entry_price': round(entry_price, 4),
+        'exit_price':  round(exit_price, 4),
+        'shares':      round(float(trade[_T_SHARES]), 4),
+        'pnl':         round(float(trade[_T_PNL]), 4),
         'return_pct':  round(return_pct, 4),
-        'bars_held':   max(0, exit_bar - pos.entry_bar),
-        'exit_reason': '',          # filled by caller
-        '_cash_delta': cash_delta,  # stripped before returning to GUI
+        'bars_held':   max(0, int(trade[_T_EXIT_BAR]) - entry_bar),
+        'exit_reason': _EXIT_REASONS[int(trade[_T_REASON])],
     }
 
 
@@ -412,7 +797,7 @@ def _build_trade_df(trades: List[dict]) -> pd.DataFrame:
     ]
     if not trades:
         return pd.DataFrame(columns=cols)
-    return pd.DataFrame(trades).drop(columns=['_cash_delta'], errors='ignore')[cols]
+    return pd.DataFrame(trades)[cols]
 
 
 def _calculate_metrics(
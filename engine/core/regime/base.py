@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, Optional, Type
 
 import numpy as np
@@ -46,6 +46,16 @@ class RegimeContext:
     n_states: int
     ic_weight: Optional[pd.Series] = None
 
+    def subset(self, index: pd.Index) -> RegimeContext:
+        """Context restricted to ``index``, a subset of the bars it was built for."""
+        return replace(
+            self,
+            proba=self.proba.loc[index],
+            labels=self.labels.loc[index],
+            novelty=self.novelty.loc[index],
+            ic_weight=None if self.ic_weight is None else self.ic_weight.loc[index],
+        )
+
     def current_regime(self) -> int:
         """Most recent regime label."""
         return int(self.labels.iloc[-1])
@@ -3,7 +3,7 @@
 Call ``RegimeOrchestrator().build_context(df, detector_name)`` from the
 backtester immediately after feature computation.  The orchestrator:
 
-  1. Fetches VIX, VIX3M, SPY from yfinance and BAMLH0A0HYM2 (HY OAS) from FRED; aligns to df's index.
+  1. Reads VIX, VIX3M, SPY from the reference-series cache and BAMLH0A0HYM2 (HY OAS) from the FRED macro cache; aligns to df's index.
   2. Computes ADX from the strategy's own OHLCV data.
   3. Assembles a macro_features DataFrame.
   4. Instantiates and fits the requested detector.
@@ -18,16 +18,16 @@ from typing import Optional
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from sklearn.preprocessing import StandardScaler
 
 from .base import REGIME_REGISTRY, RegimeContext
 from .bocpd import BayesianCPD
-from ..data_broker.fetcher import DataFetcher
+from ..data_broker.macro import get_macro_series
+from ..data_broker.reference import get_reference_series
 
 logger = logging.getLogger("model-engine.core.regime.orchestrator")
 
-# External tickers fetched for macro features (HYG removed; credit spread comes from FRED)
+# Reference tickers used for macro features (HYG removed; credit spread comes from FRED)
 _MACRO_TICKERS = ["^VIX", "^VIX3M", "SPY"]
 _CREDIT_SPREAD_SERIES = "BAMLH0A0HYM2"
 
@@ -39,6 +39,7 @@ class RegimeOrchestrator:
         self,
         df: pd.DataFrame,
         detector_name: str = "vix_adx",
+        fit_bars: Optional[int] = None,
     ) -> RegimeContext:
         """Build and return a RegimeContext for the given price DataFrame.
 
@@ -48,6 +49,10 @@ class RegimeOrchestrator:
                 output timeline.
             detector_name: Key into REGIME_REGISTRY (e.g. ``'vix_adx'``,
                 ``'term_structure'``, ``'hmm'``).
+            fit_bars: Fit the detector and the BOCPD standardisation on the
+                first ``fit_bars`` rows only; the rest are labelled with the
+                already-fitted detector, so their context never influences
+                earlier bars. Defaults to all rows.
 
         Returns:
             RegimeContext with proba, labels, novelty aligned to df.index.
@@ -62,12 +67,12 @@ class RegimeOrchestrator:
         macro = self._build_macro_features(df)
 
         detector = REGIME_REGISTRY[detector_name]()
-        detector.fit(macro)
+        detector.fit(macro if fit_bars is None else macro.iloc[:fit_bars])
         proba = detector.predict_proba(macro)
         detector_novelty = detector.novelty_score(macro)
 
         # BOCPD novelty always runs alongside (gives proper structural-break signal)
-        bocpd_novelty = self._run_bocpd(macro)
+        bocpd_novelty = self._run_bocpd(macro, fit_bars)
 
         # For HMM use BOCPD novelty; for rule-based use max of both (usually 0)
         if detector_name == "hmm":
@@ -103,13 +108,10 @@ class RegimeOrchestrator:
     def _build_macro_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """Fetch external macro data and compute internal indicators."""
         idx = df.index
-        start = (idx.min() - pd.Timedelta(days=90)).strftime("%Y-%m-%d")
-        end   = (idx.max() + pd.Timedelta(days=2)).strftime("%Y-%m-%d")
-
         result = pd.DataFrame(index=idx)
 
         # External market data
-        ext = self._fetch_external(start, end, idx)
+        ext = self._fetch_external(idx)
         result = pd.concat([result, ext], axis=1)
 
         # ADX from the strategy's own OHLCV
@@ -121,56 +123,29 @@ class RegimeOrchestrator:
 
         return result
 
-    def _fetch_external(
-        self, start: str, end: str, target_idx: pd.DatetimeIndex
-    ) -> pd.DataFrame:
-        """Download VIX/VIX3M/SPY from yfinance and BAMLH0A0HYM2 from FRED; align to target_idx."""
+    def _fetch_external(self, target_idx: pd.DatetimeIndex) -> pd.DataFrame:
+        """Read VIX/VIX3M/SPY from the reference cache and BAMLH0A0HYM2 from the macro cache; align to target_idx."""
         out = pd.DataFrame(index=target_idx)
 
         try:
-            raw = yf.download(
-                _MACRO_TICKERS, start=start, end=end,
-                progress=False, auto_adjust=True,
-            )
-            if raw.empty:
-                logger.warning("yfinance returned empty data for macro tickers.")
+            aligned = get_reference_series().aligned(_MACRO_TICKERS, target_idx)
+            if aligned.isna().all().all():
+                logger.warning("Reference cache returned no data for macro tickers.")
             else:
-                if isinstance(raw.columns, pd.MultiIndex):
-                    raw = raw["Close"]
-
-                if raw.index.tz is not None:
-                    raw.index = raw.index.tz_localize(None)
-
-                aligned = raw.reindex(
-                    target_idx.union(raw.index)
-                ).sort_index().ffill().reindex(target_idx)
-
-                if "^VIX" in aligned.columns:
-                    out["vix"] = aligned["^VIX"]
-
-                if "^VIX" in aligned.columns and "^VIX3M" in aligned.columns:
-                    out["vix3m"] = aligned["^VIX3M"]
-                    denom = aligned["^VIX3M"].replace(0.0, np.nan)
-                    out["vix_vix3m"] = aligned["^VIX"] / denom
-
-                if "SPY" in aligned.columns:
-                    spy = aligned["SPY"]
-                    out["spy_ret"]  = np.log(spy / spy.shift(1))
-                    out["spy_rvol"] = out["spy_ret"].rolling(21).std() * np.sqrt(252)
+                vix, vix3m, spy = aligned["^VIX"], aligned["^VIX3M"], aligned["SPY"]
+                out["vix"] = vix
+                out["vix3m"] = vix3m
+                out["vix_vix3m"] = vix / vix3m.replace(0.0, np.nan)
+                out["spy_ret"]  = np.log(spy / spy.shift(1))
+                out["spy_rvol"] = out["spy_ret"].rolling(21).std() * np.sqrt(252)
 
         except Exception as e:
-            logger.warning(f"yfinance macro fetch failed: {e}")
+            logger.warning(f"Reference macro fetch failed: {e}")
 
         # ICE BofA HY OAS from FRED — pure credit spread, no duration or fund-flow noise
         try:
-            fetcher = DataFetcher()
-            fred_df = fetcher.fetch_macro_data(_CREDIT_SPREAD_SERIES, start, end)
-            if not fred_df.empty:
-                spread = fred_df.set_index("date")["value"].rename(_CREDIT_SPREAD_SERIES)
-                spread.index = pd.to_datetime(spread.index)
-                spread = spread.reindex(
-                    target_idx.union(spread.index)
-                ).sort_index().ffill().reindex(target_idx)
+            spread = get_macro_series().aligned([_CREDIT_SPREAD_SERIES], target_idx)[_CREDIT_SPREAD_SERIES]
+            if spread.notna().any():
                 out["hy_spread_chg"] = spread.diff(5)
             else:
                 logger.warning(f"FRED returned empty data for {_CREDIT_SPREAD_SERIES}; hy_spread_chg will be NaN.")
@@ -212,13 +187,13 @@ class RegimeOrchestrator:
     # BOCPD novelty scoring
     # ------------------------------------------------------------------
 
-    def _run_bocpd(self, macro: pd.DataFrame) -> pd.Series:
+    def _run_bocpd(self, macro: pd.DataFrame, fit_bars: Optional[int] = None) -> pd.Series:
         """Run BOCPD on standardised VIX and return P(run_length < 5)."""
         try:
-            vix = macro["vix"].ffill().fillna(20.0)
+            vix = macro["vix"].ffill().fillna(20.0).values.reshape(-1, 1)
             # Standardise so the Normal-Gamma prior is meaningful
-            scaler = StandardScaler()
-            vix_std = scaler.fit_transform(vix.values.reshape(-1, 1)).ravel()
+            scaler = StandardScaler().fit(vix if fit_bars is None else vix[:fit_bars])
+            vix_std = scaler.transform(vix).ravel()
             novelty_arr = BayesianCPD().run(vix_std)
             return pd.Series(novelty_arr, index=macro.index)
         except Exception as e:
@@ -13,10 +13,9 @@ import sys
 import importlib.util
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Optional, List, Tuple, Union
-from sklearn.preprocessing import MinMaxScaler
+from typing import Callable, Dict, Any, Optional, List, Tuple, Union
 
-from .features.features import compute_all_features
+from .features.features import compute_all_features, resolve_dtype, FeatureProfiler
 from .ml_bridge.orchestrator import MLBridge
 from .ml_bridge.artifact_manager import ArtifactManager
 from .optimization.cpcv_splitter import CPCVSplitter
@@ -42,6 +41,9 @@ class LocalTrainer:
         training_config: Merged training configuration (manifest defaults
             overlaid on class defaults).
         is_ml: Whether the strategy requires ML preprocessing (scaling).
+        dtype: Floating-point dtype requested by the manifest's top-level
+            ``dtype`` key (``float32`` or ``float64``), or ``None`` to keep
+            feature outputs as emitted.
     """
 
     OHLCV_COLS = frozenset({"open", "high", "low", "close", "volume"})
@@ -92,6 +94,7 @@ class LocalTrainer:
             **self.manifest.get("training", {}),
         }
         self.is_ml = self.manifest.get("is_ml", False)
+        self.dtype = resolve_dtype(self.manifest.get("dtype"))
 
     # ------------------------------------------------------------------
     # Public API
@@ -145,55 +148,19 @@ class LocalTrainer:
             4. For multi-fold (CPCV): retrain on full dataset.
             5. Save final artifacts to disk.
         """
-        # 1. Compute features
-        features_config = self.manifest.get("features", [])
-        df_full, l_max = compute_all_features(raw_data, features_config)
-        df_clean = df_full.iloc[l_max:].copy()
-
-        ffd_d = float(self.training_config.get("ffd_d", 0.4))
-        ffd_window = int(self.training_config.get("ffd_window", 10))
-
-        # Apply price normalization before the model sees OHLCV columns.
-        # Must happen after feature computation (features use raw prices) and
-        # after warmup purge (so log-diff NaN drop only costs 1 row).
-        price_norm = self.training_config.get("price_normalization", "none")
-        if price_norm != "none":
-            df_clean = MLBridge.apply_price_normalization(
-                df_clean, price_norm, ffd_d=ffd_d, ffd_window=ffd_window
-            )
-            logger.info(f"Price normalization applied: {price_norm}")
-
-        # Apply FFD to features self-declared as non-stationary. Must happen on
-        # the contiguous df_clean (FFD is path-dependent) before any splitting
-        # or scaling. Features that inherit the default [] are untouched.
-        ffd_columns = MLBridge.collect_non_stationary_columns(features_config)
-        ffd_columns = [c for c in ffd_columns if c in df_clean.columns]
-        if ffd_columns:
-            df_clean = MLBridge.apply_ffd_to_dataframe(
-                df_clean, ffd_columns, d=ffd_d, window=ffd_window
-            )
-            logger.info(
-                f"FFD applied to {len(ffd_columns)} non-stationary feature "
-                f"columns (d={ffd_d}, window={ffd_window})."
-            )
-
-        # Identify computed feature columns (everything beyond raw OHLCV)
-        feature_cols = [
-            c for c in df_clean.columns if c.lower() not in self.OHLCV_COLS
-        ]
-        self._audit_features(df_clean, features_config)
-
-        # 2. Load model and context
-        model_class, context_class = self._load_user_model_and_context()
+        prepared = self.prepare(raw_data)
+        df_clean = prepared["df_clean"]
+        feature_cols = prepared["feature_cols"]
+        folds = prepared["folds"]
+        ffd_columns = prepared["ffd_columns"]
+        ffd_d, ffd_window = prepared["ffd_d"], prepared["ffd_window"]
+        model_class, context_class = prepared["model_class"], prepared["context_class"]
         hyperparams = (
             params
             if params is not None
             else self.manifest.get("hyperparameters", {})
         )
 
-        # 3. Generate splits
-        folds = self._generate_splits(df_clean, l_max)
-
         # 4. Train and evaluate each fold
         fold_results: List[Dict[str, Any]] = []
         for fold_idx, (train_idx, val_idx) in enumerate(folds):
@@ -234,18 +201,144 @@ class LocalTrainer:
             artifacts["ffd_columns"] = ffd_columns
             artifacts["ffd_d"] = ffd_d
             artifacts["ffd_window"] = ffd_window
+        if self.dtype is not None:
+            artifacts["dtype"] = self.dtype.name
 
         # 6. Persist artifacts
         ArtifactManager.save_artifacts(self.strategy_dir, artifacts)
 
         # 7. Build and return report
         results = self._build_results(fold_results, folds, df_clean, hyperparams)
+        results["feature_profile"] = prepared["profiler"].summary()
         feature_analysis = artifacts.get("feature_analysis")
         if feature_analysis:
             self._print_feature_analysis(feature_analysis)
             results["feature_analysis"] = feature_analysis
         return results
 
+    def prepare(self, raw_data: pd.DataFrame) -> Dict[str, Any]:
+        """Runs the single-ticker data pipeline up to (but excluding) training.
+
+        Computes features, purges the warmup, applies price normalization
+        and FFD, loads the user's model/context classes, and generates the
+        train/validation folds. The result depends only on the data and the
+        manifest, so callers that train many parameter sets on the same
+        data (see ``OptimizerCore``) prepare once and reuse it.
+
+        Args:
+            raw_data: Raw OHLCV DataFrame with a ``DatetimeIndex``.
+
+        Returns:
+            Dictionary with ``raw_data``, ``df_clean``, ``l_max``,
+            ``feature_cols``, ``folds``, ``ffd_columns``, ``ffd_d``,
+            ``ffd_window``, ``model_class``, ``context_class`` and the
+            ``profiler`` that timed feature computation.
+        """
+        # 1. Compute features
+        features_config = self.manifest.get("features", [])
+        profiler = FeatureProfiler()
+        df_full, l_max = compute_all_features(
+            raw_data, features_config, dtype=self.dtype, profiler=profiler
+        )
+        profiler.log_report()
+        df_clean = df_full.iloc[l_max:]
+
+        ffd_d = float(self.training_config.get("ffd_d", 0.4))
+        ffd_window = int(self.training_config.get("ffd_window", 10))
+
+        # Apply price normalization before the model sees OHLCV columns.
+        # Must happen after feature computation (features use raw prices) and
+        # after warmup purge (so log-diff NaN drop only costs 1 row).
+        price_norm = self.training_config.get("price_normalization", "none")
+        if price_norm != "none":
+            df_clean = MLBridge.apply_price_normalization(
+                df_clean, price_norm, ffd_d=ffd_d, ffd_window=ffd_window
+            )
+            logger.info(f"Price normalization applied: {price_norm}")
+
+        # Apply FFD to features self-declared as non-stationary. Must happen on
+        # the contiguous df_clean (FFD is path-dependent) before any splitting
+        # or scaling. Features that inherit the default [] are untouched.
+        ffd_columns = MLBridge.collect_non_stationary_columns(features_config)
+        ffd_columns = [c for c in ffd_columns if c in df_clean.columns]
+        if ffd_columns:
+            df_clean = MLBridge.apply_ffd_to_dataframe(
+                df_clean, ffd_columns, d=ffd_d, window=ffd_window
+            )
+            logger.info(
+                f"FFD applied to {len(ffd_columns)} non-stationary feature "
+                f"columns (d={ffd_d}, window={ffd_window})."
+            )
+
+        # Identify computed feature columns (everything beyond raw OHLCV)
+        feature_cols = [
+            c for c in df_clean.columns if c.lower() not in self.OHLCV_COLS
+        ]
+        self._audit_features(df_clean, features_config)
+
+        # 2. Load model and context
+        model_class, context_class = self._load_user_model_and_context()
+
+        # 3. Generate splits
+        folds = self._generate_splits(df_clean, l_max)
+
+        return {
+            "raw_data": raw_data,
+            "df_clean": df_clean,
+            "l_max": l_max,
+            "feature_cols": feature_cols,
+            "folds": folds,
+            "ffd_columns": ffd_columns,
+            "ffd_d": ffd_d,
+            "ffd_window": ffd_window,
+            "model_class": model_class,
+            "context_class": context_class,
+            "profiler": profiler,
+        }
+
+    def evaluate_folds(
+        self,
+        prepared: Dict[str, Any],
+        hyperparams: Dict[str, Any],
+        on_fold: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        metrics_level: str = "fitness",
+    ) -> List[Dict[str, Any]]:
+        """Trains and validates every fold of ``prepared`` without persisting.
+
+        This is the inner loop of hyperparameter search: no final retrain,
+        no artifacts written, and only validation signals are generated.
+
+        Args:
+            prepared: Output of ``prepare()``.
+            hyperparams: Strategy hyperparameters for this evaluation.
+            on_fold: Optional ``on_fold(fold_idx, val_metrics)`` called after
+                each fold. Raising from it stops the remaining folds (this is
+                how the optimizer prunes a trial).
+            metrics_level: ``Tearsheet`` metrics level for the validation
+                metrics.
+
+        Returns:
+            List of per-fold validation metric dicts, in fold order.
+        """
+        val_metrics: List[Dict[str, Any]] = []
+        for fold_idx, (train_idx, val_idx) in enumerate(prepared["folds"]):
+            result = self._train_fold(
+                model_class=prepared["model_class"],
+                context_class=prepared["context_class"],
+                df_clean=prepared["df_clean"],
+                raw_data=prepared["raw_data"],
+                train_idx=train_idx,
+                val_idx=val_idx,
+                feature_cols=prepared["feature_cols"],
+                hyperparams=hyperparams,
+                metrics_level=metrics_level,
+                evaluate_train=False,
+            )
+            val_metrics.append(result["val_metrics"])
+            if on_fold is not None:
+                on_fold(fold_idx, result["val_metrics"])
+        return val_metrics
+
     # ------------------------------------------------------------------
     # Data splitting
     # ------------------------------------------------------------------
@@ -320,6 +413,8 @@ class LocalTrainer:
         val_idx: np.ndarray,
         feature_cols: List[str],
         hyperparams: Dict[str, Any],
+        metrics_level: str = "standard",
+        evaluate_train: bool = True,
     ) -> Dict[str, Any]:
         """Trains on one fold and evaluates on held-out validation data.
 
@@ -337,6 +432,9 @@ class LocalTrainer:
             val_idx: Positional indices for the validation set.
             feature_cols: List of computed feature column names to scale.
             hyperparams: Strategy hyperparameters.
+            metrics_level: ``Tearsheet`` metrics level for both metric dicts.
+            evaluate_train: When False, skips in-sample signal generation
+                and returns empty ``train_metrics``.
 
         Returns:
             Dictionary with keys ``artifacts``, ``train_metrics``, and
@@ -344,19 +442,19 @@ class LocalTrainer:
         """
         from .backtester import Tearsheet, SignalValidator
 
-        df_train = df_clean.iloc[train_idx].copy()
-        df_val = df_clean.iloc[val_idx].copy()
+        df_train = df_clean.iloc[train_idx]
+        df_val = df_clean.iloc[val_idx]
 
         # Scale features for ML strategies
         scaler = None
         if self.is_ml and feature_cols:
             # l_max=0 because data is already warmup-purged
             df_train, scaler = MLBridge.prepare_training_matrix(
-                df_train, feature_cols, l_max=0
+                df_train, feature_cols, l_max=0, dtype=self.dtype
             )
             df_val = MLBridge.prepare_inference_matrix(
                 df_val, feature_cols, l_max=0,
-                artifacts={"system_scaler": scaler},
+                artifacts={"system_scaler": scaler, "dtype": self.dtype},
             )
 
         # Train
@@ -383,7 +481,15 @@ class LocalTrainer:
             val_signals, df_val.index, comp_mode
         )
         raw_val = raw_data.loc[raw_data.index.isin(df_val.index)]
-        val_metrics = Tearsheet.calculate_metrics(raw_val, val_signals)
+        val_metrics = Tearsheet.calculate_metrics(
+            raw_val, val_signals, metrics_level=metrics_level
+        )
+        if not evaluate_train:
+            return {
+                "artifacts": artifacts,
+                "train_metrics": {},
+                "val_metrics": val_metrics,
+            }
 
         train_signals = model.generate_signals(
             df_train, context, hyperparams, artifacts
@@ -392,7 +498,9 @@ class LocalTrainer:
             train_signals, df_train.index, comp_mode
         )
         raw_train = raw_data.loc[raw_data.index.isin(df_train.index)]
-        train_metrics = Tearsheet.calculate_metrics(raw_train, train_signals)
+        train_metrics = Tearsheet.calculate_metrics(
+            raw_train, train_signals, metrics_level=metrics_level
+        )
 
         return {
             "artifacts": artifacts,
@@ -425,12 +533,12 @@ class LocalTrainer:
             Dictionary with an ``artifacts`` key containing the final
             trained artifacts (including the scaler, if ML).
         """
-        df_full = df_clean.copy()
+        df_full = df_clean.copy(deep=False)
         scaler = None
 
         if self.is_ml and feature_cols:
             df_full, scaler = MLBridge.prepare_training_matrix(
-                df_full, feature_cols, l_max=0
+                df_full, feature_cols, l_max=0, dtype=self.dtype
             )
 
         model = model_class()
@@ -882,9 +990,12 @@ class LocalTrainer:
         prepared: Dict[str, Dict[str, Any]] = {}
         feature_cols: Optional[List[str]] = None
         applied_ffd_cols: List[str] = []
+        profiler = FeatureProfiler()
         for ticker, raw in datasets.items():
-            df_full, l_max = compute_all_features(raw, features_config)
-            df_clean = df_full.iloc[l_max:].copy()
+            df_full, l_max = compute_all_features(
+                raw, features_config, dtype=self.dtype, profiler=profiler
+            )
+            df_clean = df_full.iloc[l_max:]
             if price_norm != "none":
                 df_clean = MLBridge.apply_price_normalization(
                     df_clean, price_norm, ffd_d=ffd_d, ffd_window=ffd_window
@@ -918,6 +1029,7 @@ class LocalTrainer:
 
         if feature_cols is None:
             raise StrategyError("No tickers produced any feature data")
+        profiler.log_report()
 
         logger.info(
             f"Multi-ticker prep complete: {len(prepared)} tickers, "
@@ -966,6 +1078,8 @@ class LocalTrainer:
             artifacts["ffd_columns"] = applied_ffd_cols
             artifacts["ffd_d"] = ffd_d
             artifacts["ffd_window"] = ffd_window
+        if self.dtype is not None:
+            artifacts["dtype"] = self.dtype.name
 
         # 6. Persist
         ArtifactManager.save_artifacts(self.strategy_dir, artifacts)
@@ -976,6 +1090,7 @@ class LocalTrainer:
             fold_results, date_folds, prepared, hyperparams,
             n_groups=n_groups, k_test_groups=k_test,
         )
+        results["feature_profile"] = profiler.summary()
         feature_analysis = artifacts.get("feature_analysis")
         if feature_analysis:
             self._print_feature_analysis(feature_analysis)
@@ -1129,9 +1244,10 @@ class LocalTrainer:
         y_train = np.concatenate(train_y_parts, axis=0)
 
         # Fit scaler on pooled X, keep DataFrame shape so feature names flow through to fit_model.
+        from sklearn.preprocessing import MinMaxScaler
         scaler = MinMaxScaler(feature_range=(-1.0, 1.0))  # type: ignore[arg-type]
         X_train_scaled = pd.DataFrame(
-            scaler.fit_transform(X_train_df),
+            MLBridge.cast_matrix(scaler.fit_transform(X_train_df), self.dtype),
             index=X_train_df.index,
             columns=X_train_df.columns,
         )
@@ -1154,9 +1270,9 @@ class LocalTrainer:
             if raw_val.empty:
                 continue
 
-            df_val_scaled = df_val_t.copy()
-            df_val_scaled[feature_cols] = scaler.transform(
-                df_val_t[feature_cols]
+            df_val_scaled = df_val_t.copy(deep=False)
+            df_val_scaled[feature_cols] = MLBridge.cast_matrix(
+                scaler.transform(df_val_t[feature_cols]), self.dtype
             )
             signals = model.generate_signals(
                 df_val_scaled, context, hyperparams, artifacts
@@ -1165,7 +1281,7 @@ class LocalTrainer:
                 signals, df_val_scaled.index, comp_mode
             )
             val_metrics_list.append(
-                Tearsheet.calculate_metrics(raw_val, signals)
+                Tearsheet.calculate_metrics(raw_val, signals, metrics_level="standard")
             )
 
         for ticker, df_train_t in train_slices.items():
@@ -1176,9 +1292,9 @@ class LocalTrainer:
             if raw_train.empty:
                 continue
 
-            df_train_scaled = df_train_t.copy()
-            df_train_scaled[feature_cols] = scaler.transform(
-                df_train_t[feature_cols]
+            df_train_scaled = df_train_t.copy(deep=False)
+            df_train_scaled[feature_cols] = MLBridge.cast_matrix(
+                scaler.transform(df_train_t[feature_cols]), self.dtype
             )
             signals = model.generate_signals(
                 df_train_scaled, context, hyperparams, artifacts
@@ -1187,7 +1303,7 @@ class LocalTrainer:
                 signals, df_train_scaled.index, comp_mode
             )
             train_metrics_list.append(
-                Tearsheet.calculate_metrics(raw_train, signals)
+                Tearsheet.calculate_metrics(raw_train, signals, metrics_level="standard")
             )
 
         return {
@@ -1234,9 +1350,10 @@ class LocalTrainer:
         X_df = pd.concat(X_parts, axis=0)
         y_full = np.concatenate(y_parts, axis=0)
 
+        from sklearn.preprocessing import MinMaxScaler
         scaler = MinMaxScaler(feature_range=(-1.0, 1.0))  # type: ignore[arg-type]
         X_scaled = pd.DataFrame(
-            scaler.fit_transform(X_df),
+            MLBridge.cast_matrix(scaler.fit_transform(X_df), self.dtype),
             index=X_df.index,
             columns=X_df.columns,
         )
@@ -4,7 +4,7 @@ import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import redis
 from rq import Queue
 from rq.job import Job
@@ -60,6 +60,9 @@ class JobPayloadRequest(BaseModel):
     mode: ExecutionMode
     timeframe: Optional[TimeframeRequest] = None
     multi_asset_mode: MultiAssetMode = MultiAssetMode.BATCH
+    optimize: Optional[bool] = None
+    n_trials: Optional[int] = None
+    walk_forward: Optional[Dict[str, Any]] = None
 
 
 def _strategy_path(strategy_name: str) -> str:
@@ -110,7 +110,7 @@ def test_unsupported_mode_raises():
 # _handle_backtest — empty data returns empty dict
 # ---------------------------------------------------------------------------
 
-@patch("engine.core.controller.DataBroker.get_data")
+@patch("engine.core.data_broker.data_broker.DataBroker.get_data")
 @patch("os.path.exists")
 def test_handle_backtest_empty_data_returns_empty(mock_exists, mock_get_data):
     mock_exists.return_value = True
@@ -132,7 +132,7 @@ def test_handle_backtest_empty_data_returns_empty(mock_exists, mock_get_data):
 # ---------------------------------------------------------------------------
 
 @patch("engine.core.controller.LocalBacktester")
-@patch("engine.core.controller.DataBroker.get_data")
+@patch("engine.core.data_broker.data_broker.DataBroker.get_data")
 @patch("os.path.exists")
 def test_handle_backtest_partial_failure(mock_exists, mock_get_data, mock_backtester):
     mock_exists.return_value = True
@@ -175,7 +175,7 @@ def test_handle_backtest_partial_failure(mock_exists, mock_get_data, mock_backte
 # _handle_signal_only — no data returns error dict
 # ---------------------------------------------------------------------------
 
-@patch("engine.core.controller.DataBroker.get_data")
+@patch("engine.core.data_broker.data_broker.DataBroker.get_data")
 @patch("os.path.exists")
 def test_handle_signal_only_no_data_returns_error(mock_exists, mock_get_data):
     mock_exists.return_value = True
@@ -198,7 +198,7 @@ def test_handle_signal_only_no_data_returns_error(mock_exists, mock_get_data):
 # ---------------------------------------------------------------------------
 
 @patch("engine.core.controller.LocalBacktester")
-@patch("engine.core.controller.DataBroker.get_data")
+@patch("engine.core.data_broker.data_broker.DataBroker.get_data")
 @patch("os.path.exists")
 def test_handle_signal_only_single_string_asset(mock_exists, mock_get_data,
                                                  mock_backtester, mock_data_broker):
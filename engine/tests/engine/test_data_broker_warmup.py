@@ -0,0 +1,97 @@
+import json
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.controller import ApplicationController
+from engine.core.data_broker.data_broker import DataBroker
+from engine.core.data_broker.database import Database
+
+
+class FakeFetcher:
+    """Serves business-day bars for whatever range is requested."""
+
+    def __init__(self, first="2020-01-01"):
+        self.first = pd.Timestamp(first)
+        self.requests = []
+
+    def fetch_ohlcv(self, ticker, interval, start, end):
+        self.requests.append((pd.Timestamp(start), pd.Timestamp(end)))
+        idx = pd.date_range(max(pd.Timestamp(start), self.first), pd.Timestamp(end),
+                            freq="B", inclusive="left")
+        close = np.arange(len(idx), dtype=float) + 1.0
+        return pd.DataFrame({"timestamp": idx, "open": close, "high": close,
+                             "low": close, "close": close, "volume": 100.0})
+
+
+@pytest.fixture
+def broker(tmp_path):
+    b = DataBroker.__new__(DataBroker)
+    b.db = Database(str(tmp_path / "ohlcv.db"))
+    b.fetcher = FakeFetcher()
+    return b
+
+
+def test_daily_warmup_prepends_exact_bar_count(broker):
+    start, end = datetime(2022, 3, 1), datetime(2022, 3, 31)
+    plain = broker.get_data("AAA", "1d", start, end)
+    padded = broker.get_data("AAA", "1d", start, end, warmup_bars=37)
+
+    assert plain.index.min() >= pd.Timestamp(start)
+    assert len(padded) == len(plain) + 37
+    assert padded.iloc[37:].index.equals(plain.index)
+    assert (padded.index[:37] < pd.Timestamp(start)).all()
+
+
+def test_warmup_is_capped_by_available_history(broker):
+    broker.fetcher.first = pd.Timestamp("2022-02-21")
+    start, end = datetime(2022, 3, 1), datetime(2022, 3, 10)
+    df = broker.get_data("BBB", "1d", start, end, warmup_bars=500)
+    assert df.index.min() == pd.Timestamp("2022-02-21")
+
+
+def test_intraday_fetch_reaches_back_for_warmup(broker):
+    end = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=30)
+    broker.get_data("CCC", "1h", start, end, warmup_bars=70)
+    fetched_from = broker.fetcher.requests[0][0]
+    # 70 hourly bars are ~10 trading days: the fetch must start well before `start`.
+    assert fetched_from <= pd.Timestamp(start) - timedelta(days=14)
+
+
+def test_get_padding_is_conservative():
+    b = DataBroker.__new__(DataBroker)
+    start = datetime(2024, 1, 2)
+    for interval, bars_per_day in (("1d", 1), ("1h", 7), ("4h", 2)):
+        padded = b._get_padding(start, interval, 252)
+        business_days = len(pd.bdate_range(padded, start, inclusive="left"))
+        assert business_days * bars_per_day >= 252
+    assert b._get_padding(start, "1d", 0) == start
+
+
+def test_signal_only_requests_warmup_and_keeps_declared_tail(tmp_path):
+    strat = tmp_path / "s"
+    strat.mkdir()
+    (strat / "manifest.json").write_text(json.dumps({
+        "features": [{"id": "SMA", "params": {"period": 30}}],
+        "signal_history": 5,
+    }))
+    idx = pd.date_range("2022-01-03", periods=400, freq="B")
+    raw = pd.DataFrame({c: 1.0 for c in ("open", "high", "low", "close", "volume")}, index=idx)
+
+    controller = ApplicationController.__new__(ApplicationController)
+    controller.broker = MagicMock()
+    controller.broker.get_data.return_value = raw
+    with patch("engine.core.controller.LocalBacktester") as bt:
+        bt.return_value.run_batch.side_effect = lambda d: {
+            t: pd.Series(0.0, index=df.index) for t, df in d.items()
+        }
+        controller._handle_signal_only(str(strat), "AAA", "1d", "2023-01-02", None)
+
+    assert controller.broker.get_data.call_args.kwargs["warmup_bars"] == 29
+    passed = bt.return_value.run_batch.call_args.args[0]["AAA"]
+    assert len(passed) == 29 + 5 + 1
+    assert passed.index[-1] == idx[-1]
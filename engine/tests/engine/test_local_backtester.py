@@ -110,3 +110,345 @@ def test_backtester_grid_search(temp_strategy_dir):
         # threshold has 3 values in parameter_bounds
         assert len(results) == 3
         assert all(isinstance(r, pd.Series) for r in results)
+
+
+def _batch_datasets(n_tickers=5):
+    dates = pd.date_range('2023-01-01', periods=30)
+    datasets = {}
+    for i in range(n_tickers):
+        close = np.linspace(10, 10 + (i - 2) * 3, 30)
+        datasets[f"T{i}"] = pd.DataFrame({
+            'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 100,
+        }, index=dates)
+    return datasets
+
+
+@pytest.fixture
+def featureless_strategy_dir(temp_strategy_dir):
+    with open(os.path.join(temp_strategy_dir, "manifest.json"), "w") as f:
+        json.dump({**MOCK_MANIFEST, "features": []}, f)
+    return temp_strategy_dir
+
+
+@pytest.mark.parametrize("executor", ["threads", "processes"])
+def test_run_batch_executors_match_serial(featureless_strategy_dir, executor):
+    backtester = LocalBacktester(featureless_strategy_dir)
+    datasets = _batch_datasets()
+    datasets["BAD"] = pd.DataFrame({'Open': [1.0]}, index=pd.date_range('2023-01-01', periods=1))
+
+    serial = backtester.run_batch(datasets, executor="serial")
+    seen = []
+    parallel = backtester.run_batch(
+        datasets, executor=executor, max_workers=3,
+        on_result=lambda ticker, signals, done, total: seen.append((ticker, done, total)),
+    )
+
+    assert list(parallel) == list(datasets)
+    for ticker in datasets:
+        pd.testing.assert_series_equal(parallel[ticker], serial[ticker])
+    assert parallel["BAD"].empty and not parallel["T0"].empty
+    assert sorted(t for t, _, _ in seen) == sorted(datasets)
+    assert [d for _, d, _ in seen] == list(range(1, len(datasets) + 1))
+    assert {total for _, _, total in seen} == {len(datasets)}
+
+
+def test_run_batch_rejects_unknown_executor(featureless_strategy_dir):
+    backtester = LocalBacktester(featureless_strategy_dir)
+    with pytest.raises(ValueError, match="executor"):
+        backtester.run_batch(_batch_datasets(2), executor="gpu")
+
+
+SWEEP_MODEL_CONTENT = """
+from engine.core.controller import SignalModel
+import numpy as np
+
+class TrendStrategy(SignalModel):
+    def train(self, df, context, params):
+        return {}
+
+    def generate_signals(self, df, context, params, artifacts):
+        if params["window"] == 13:
+            raise ValueError("unsupported window")
+        trend = df['Close'] - df['Close'].rolling(params["window"], min_periods=1).mean()
+        return np.sign(trend) * params["scale"]
+"""
+
+
+@pytest.fixture
+def sweep_strategy_dir(featureless_strategy_dir):
+    with open(os.path.join(featureless_strategy_dir, "model.py"), "w") as f:
+        f.write(SWEEP_MODEL_CONTENT)
+    return featureless_strategy_dir
+
+
+def _sweep_data(n=400, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, n)))
+    return pd.DataFrame({
+        'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 100,
+        'open': close, 'close': close,
+    }, index=pd.bdate_range('2020-01-01', periods=n))
+
+
+SWEEP_BOUNDS = {"window": [3, 5, 8, 13, 21, 34], "scale": [0.5, 1.0]}
+
+
+@pytest.mark.parametrize("executor", ["serial", "threads", "processes"])
+def test_run_sweep_keeps_top_k_by_fitness(sweep_strategy_dir, executor):
+    from engine.core.backtester import Tearsheet
+    backtester = LocalBacktester(sweep_strategy_dir)
+    df = _sweep_data()
+    progress = []
+    out = backtester.run_sweep(df, SWEEP_BOUNDS, top_k=3, executor=executor, max_workers=2,
+                               on_progress=lambda done, total: progress.append((done, total)))
+
+    board = out["leaderboard"]
+    assert out["n_permutations"] == 12 and out["n_evaluations"] == 12 and len(board) == 12
+    assert progress[-1] == (12, 12)
+    assert board[board["window"] == 13]["Sharpe Ratio"].isna().all()
+    assert board["Sharpe Ratio"].iloc[:-2].is_monotonic_decreasing
+
+    # Scores agree with a plain per-permutation backtest.
+    best = board.iloc[0]
+    params = {"window": int(best["window"]), "scale": float(best["scale"])}
+    expected = Tearsheet.calculate_metrics(df, backtester.run(df, params=params))
+    assert best["Sharpe Ratio"] == expected["Sharpe Ratio"]
+
+    assert len(out["top_signals"]) == 3
+    assert out["top_signals"][0].name.endswith(f"(window={params['window']}, scale={params['scale']})")
+
+
+def test_run_sweep_successive_halving_prunes_on_short_history(sweep_strategy_dir):
+    backtester = LocalBacktester(sweep_strategy_dir)
+    df = _sweep_data()
+    full = backtester.run_sweep(df, SWEEP_BOUNDS, top_k=2)
+    halved = backtester.run_sweep(df, SWEEP_BOUNDS, top_k=2, successive_halving=True,
+                                  halving_eta=2, min_fraction=0.25)
+
+    board = halved["leaderboard"]
+    # Rungs of 100, 200 and 400 bars with 12 -> 6 -> 3 permutations.
+    assert halved["n_evaluations"] == 12 + 6 + 3
+    assert list(board["bars"].value_counts().sort_index()) == [6, 3, 3]
+    assert (board["bars"].iloc[:3] == len(df)).all()
+    finalists = board[board["bars"] == len(df)]
+    assert set(finalists.index) <= set(full["leaderboard"].index)
+    assert len(halved["top_signals"]) == 2
+    assert all(len(s) == len(df) for s in halved["top_signals"])
+
+
+@pytest.mark.parametrize("bounds", [None, {}])
+def test_run_sweep_without_bounds_scores_manifest_defaults(sweep_strategy_dir, bounds):
+    from engine.core.backtester import Tearsheet
+    with open(os.path.join(sweep_strategy_dir, "manifest.json"), "w") as f:
+        json.dump({**MOCK_MANIFEST, "features": [], "parameter_bounds": {},
+                   "hyperparameters": {"window": 8, "scale": 1.0}}, f)
+    backtester = LocalBacktester(sweep_strategy_dir)
+    df = _sweep_data()
+    out = backtester.run_sweep(df, bounds)
+
+    board = out["leaderboard"]
+    assert out["n_permutations"] == 1 and len(board) == 1
+    assert board.iloc[0][["window", "scale"]].tolist() == [8, 1.0]
+    expected = Tearsheet.calculate_metrics(df, backtester.run(df, params={"window": 8, "scale": 1.0}))
+    assert board.iloc[0]["Sharpe Ratio"] == expected["Sharpe Ratio"]
+
+
+def test_feature_profile_logged_by_every_entry_point(sweep_strategy_dir):
+    from engine.core.features.features import FeatureProfiler
+    backtester = LocalBacktester(sweep_strategy_dir)
+    df = _sweep_data(100)
+    bounds = {"window": [3, 5], "scale": [1.0]}
+    with patch.object(FeatureProfiler, "log_report") as log_report:
+        backtester.run(df, params={"window": 3, "scale": 1.0})
+        backtester.run_grid_search(df, bounds)
+        backtester.run_sweep(df, bounds)
+        # A feature-cache hit reports nothing new.
+        backtester.run(df, params={"window": 5, "scale": 1.0})
+    assert log_report.call_count == 3
+    assert backtester.feature_profile["n_invocations"] == 0
+
+
+def test_run_sweep_rejects_unknown_rank_metric(sweep_strategy_dir):
+    with pytest.raises(ValueError, match="rank_by"):
+        LocalBacktester(sweep_strategy_dir).run_sweep(_sweep_data(50), SWEEP_BOUNDS, rank_by="Sortino Ratio")
+
+
+def test_run_reuses_features_when_only_params_change(sweep_strategy_dir):
+    from engine.core import backtester as backtester_module
+    backtester = LocalBacktester(sweep_strategy_dir)
+    df = _sweep_data()
+    calls = []
+    real_compute = backtester_module.compute_all_features
+
+    def counting_compute(*args, **kwargs):
+        calls.append(len(args[0]))
+        return real_compute(*args, **kwargs)
+
+    with patch('engine.core.backtester.compute_all_features', side_effect=counting_compute):
+        first = backtester.run(df, params={"window": 5, "scale": 1.0})
+        second = backtester.run(df.copy(), params={"window": 21, "scale": 0.5})
+        assert len(calls) == 1
+        backtester.run(df.iloc[:-1], params={"window": 5, "scale": 1.0})
+        assert len(calls) == 2
+
+    # Cached results match a cold backtester.
+    cold = LocalBacktester(sweep_strategy_dir)
+    pd.testing.assert_series_equal(first, cold.run(df, params={"window": 5, "scale": 1.0}))
+    pd.testing.assert_series_equal(second, cold.run(df, params={"window": 21, "scale": 0.5}))
+
+
+def test_run_feature_cache_is_not_mutated_by_model(sweep_strategy_dir):
+    with open(os.path.join(sweep_strategy_dir, "model.py"), "a") as f:
+        f.write(
+            "\n\nclass MutatingStrategy(TrendStrategy):\n"
+            "    def generate_signals(self, df, context, params, artifacts):\n"
+            "        df['Close'] = df['Close'] * 0\n"
+            "        df['scratch'] = 1.0\n"
+            "        return super().generate_signals(df, context, params, artifacts)\n"
+        )
+    backtester = LocalBacktester(sweep_strategy_dir)
+    model_class, _ = backtester._load_user_model_and_context()
+    assert model_class.__name__ == "MutatingStrategy"
+    df = _sweep_data()
+    backtester.run(df, params={"window": 5, "scale": 1.0})
+    (cached, _, _, _), = backtester._feature_cache.values()
+    assert "scratch" not in cached.columns
+    pd.testing.assert_series_equal(cached["Close"], df["Close"], check_names=False)
+
+
+def test_strategy_classes_cached_until_files_change(sweep_strategy_dir):
+    model_class, context_class = LocalBacktester(sweep_strategy_dir)._load_user_model_and_context()
+    again, _ = LocalBacktester(sweep_strategy_dir)._load_user_model_and_context()
+    assert again is model_class
+
+    model_path = os.path.join(sweep_strategy_dir, "model.py")
+    with open(model_path, "a") as f:
+        f.write("\n# edited\n")
+    reloaded, _ = LocalBacktester(sweep_strategy_dir)._load_user_model_and_context()
+    assert reloaded is not model_class and reloaded.__name__ == "TrendStrategy"
+
+
+WALK_FORWARD_MODEL_CONTENT = """
+from engine.core.controller import SignalModel
+import pandas as pd
+
+class WindowStrategy(SignalModel):
+    def train(self, df, context, params):
+        return {"n_train": len(df), "train_end": df.index[-1]}
+
+    def generate_signals(self, df, context, params, artifacts):
+        # Encodes the training window length so the test can see which model
+        # produced each bar; look-ahead past the training window is a bug.
+        assert artifacts["train_end"] < df.index[-1]
+        return pd.Series(artifacts["n_train"] / 1000.0, index=df.index)
+"""
+
+
+@pytest.fixture
+def walk_forward_strategy_dir(featureless_strategy_dir):
+    with open(os.path.join(featureless_strategy_dir, "model.py"), "w") as f:
+        f.write(WALK_FORWARD_MODEL_CONTENT)
+    return featureless_strategy_dir
+
+
+def test_run_walk_forward_anchored_and_rolling_windows(walk_forward_strategy_dir):
+    backtester = LocalBacktester(walk_forward_strategy_dir)
+    df = _sweep_data(n=250)
+
+    anchored = backtester.run_walk_forward(df, train_bars=100, retrain_every=40)
+    windows = backtester.walk_forward_windows
+    assert anchored.index.equals(df.index[100:])
+    assert list(windows["train_bars"]) == [100, 140, 180, 220]
+    assert list(windows["test_start"]) == list(df.index[[100, 140, 180, 220]])
+    assert windows["test_end"].iloc[-1] == df.index[-1]
+    # Each block is scored by the model trained on the bars before it.
+    np.testing.assert_allclose(anchored.iloc[[0, 39, 40, 149]], [0.1, 0.1, 0.14, 0.22])
+
+    rolling = backtester.run_walk_forward(df, train_bars=100, retrain_every=40, anchored=False)
+    assert rolling.index.equals(anchored.index)
+    assert (rolling == 0.1).all()
+    assert list(backtester.walk_forward_windows["train_start"]) == list(df.index[[0, 40, 80, 120]])
+
+
+@pytest.mark.parametrize("executor", ["threads", "processes"])
+def test_run_walk_forward_executors_match_serial(walk_forward_strategy_dir, executor):
+    backtester = LocalBacktester(walk_forward_strategy_dir)
+    df = _sweep_data(n=250)
+    serial = backtester.run_walk_forward(df, train_bars=50, retrain_every=20, executor="serial")
+    progress = []
+    parallel = backtester.run_walk_forward(
+        df, train_bars=50, retrain_every=20, executor=executor, max_workers=2,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    pd.testing.assert_series_equal(parallel, serial)
+    assert progress[-1] == (10, 10) and len(progress) == 10
+
+
+def test_run_walk_forward_computes_features_once(walk_forward_strategy_dir):
+    from engine.core import backtester as backtester_module
+    calls = []
+    real_compute = backtester_module.compute_all_features
+
+    def counting_compute(*args, **kwargs):
+        calls.append(1)
+        return real_compute(*args, **kwargs)
+
+    with patch('engine.core.backtester.compute_all_features', side_effect=counting_compute):
+        LocalBacktester(walk_forward_strategy_dir).run_walk_forward(
+            _sweep_data(n=300), train_bars=20, retrain_every=5)
+    assert len(calls) == 1
+
+
+def test_run_walk_forward_rejects_bad_windows(walk_forward_strategy_dir):
+    backtester = LocalBacktester(walk_forward_strategy_dir)
+    df = _sweep_data(n=50)
+    with pytest.raises(ValueError, match="train_bars"):
+        backtester.run_walk_forward(df, train_bars=50)
+    with pytest.raises(ValueError, match="retrain_every"):
+        backtester.run_walk_forward(df, train_bars=10, retrain_every=0)
+
+
+REGIME_MODEL_CONTENT = """
+from engine.core.controller import SignalModel
+
+class RegimeStrategy(SignalModel):
+    def train(self, df, context, params):
+        return {}
+
+    def generate_signals(self, df, context, params, artifacts, regime_context=None):
+        return regime_context.proba[0] - regime_context.proba[1] + regime_context.novelty
+"""
+
+
+def test_run_walk_forward_regime_context_is_out_of_sample(featureless_strategy_dir, monkeypatch):
+    from engine.core.regime.orchestrator import RegimeOrchestrator
+    with open(os.path.join(featureless_strategy_dir, "model.py"), "w") as f:
+        f.write(REGIME_MODEL_CONTENT)
+    with open(os.path.join(featureless_strategy_dir, "manifest.json"), "w") as f:
+        json.dump({**MOCK_MANIFEST, "features": [], "regime_aware": True,
+                   "regime_detector": "hmm"}, f)
+
+    df = _sweep_data(n=300)
+    rng = np.random.default_rng(3)
+    macro = pd.DataFrame({
+        "vix": 20 + np.cumsum(rng.normal(0, 1, len(df))),
+        "spy_ret": rng.normal(0, 0.01, len(df)),
+        "spy_rvol": 0.15 + np.abs(rng.normal(0, 0.05, len(df))),
+        "hy_spread_chg": rng.normal(0, 0.1, len(df)),
+    }, index=df.index)
+    monkeypatch.setattr(RegimeOrchestrator, "_fetch_external",
+                        lambda self, idx: macro.reindex(idx).copy())
+
+    backtester = LocalBacktester(featureless_strategy_dir)
+    base = backtester.run_walk_forward(df, train_bars=150, retrain_every=50, executor="serial")
+    assert base.notna().all() and base.std() > 0
+
+    # Rewrite everything after the first test block, prices and macro alike.
+    cut = df.index[200]
+    shocked = df.copy()
+    shocked.loc[cut:, ["Open", "High", "Low", "Close", "open", "close"]] *= 3.0
+    macro.loc[cut:] = macro.loc[cut:].to_numpy()[::-1] * 5.0
+    moved = backtester.run_walk_forward(shocked, train_bars=150, retrain_every=50,
+                                        executor="serial")
+    pd.testing.assert_series_equal(moved.loc[:df.index[199]], base.loc[:df.index[199]])
+    assert not moved.loc[cut:].equals(base.loc[cut:])
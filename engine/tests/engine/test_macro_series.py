@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.data_broker.macro import MacroSeriesCache
+
+
+class FakeFredFetcher:
+    """Serves a deterministic weekly series per id and records every request."""
+
+    def __init__(self):
+        self.calls = []
+
+    def fetch_macro_data(self, series_id, start, end):
+        self.calls.append((series_id, start, end))
+        if series_id == "MISSING":
+            return pd.DataFrame()
+        dates = pd.date_range("2018-01-05", "2024-12-27", freq="W-FRI")
+        dates = dates[(dates >= pd.Timestamp(start) - pd.Timedelta(days=6)) & (dates <= end)]
+        values = np.sin(np.arange(len(dates)) / 7.0) + len(series_id)
+        return pd.DataFrame({"date": dates, "value": values, "indicator_name": series_id})
+
+
+@pytest.fixture
+def fetcher():
+    return FakeFredFetcher()
+
+
+@pytest.fixture
+def cache(fetcher):
+    return MacroSeriesCache(fetcher_factory=lambda: fetcher)
+
+
+def _ids(fetcher):
+    return sorted(c[0] for c in fetcher.calls)
+
+
+def test_block_fetched_once_and_reused_across_tickers(cache, fetcher):
+    idx = pd.bdate_range("2020-01-01", "2022-12-30")
+    first = cache.transformed(["NFCI", "T10Y2Y", "DFF"], idx)
+    for _ in range(3):
+        again = cache.transformed(["NFCI", "T10Y2Y", "DFF"], pd.DatetimeIndex(list(idx)))
+    assert again is first
+    assert _ids(fetcher) == ["DFF", "NFCI", "T10Y2Y"]
+
+    # A shorter history inside the covered range needs no new fetch.
+    cache.transformed(["NFCI"], idx[100:300])
+    assert len(fetcher.calls) == 3
+
+
+def test_longer_history_refetches_union_range(cache, fetcher):
+    cache.aligned(["NFCI"], pd.bdate_range("2021-01-01", "2021-12-31"))
+    cache.aligned(["NFCI"], pd.bdate_range("2019-06-03", "2021-06-30"))
+    assert [c[1:] for c in fetcher.calls] == [
+        ("2021-01-01", "2021-12-31"),
+        ("2019-06-03", "2021-12-31"),
+    ]
+
+
+def test_block_matches_per_series_computation(cache, fetcher):
+    idx = pd.bdate_range("2019-01-01", "2023-06-30")
+    block = cache.transformed(["NFCI", "ICSA"], idx)
+    for sid in ("NFCI", "ICSA"):
+        raw = fetcher.fetch_macro_data(sid, "2019-01-01", "2023-06-30").set_index("date")["value"]
+        level = raw.reindex(idx.union(raw.index)).ffill().reindex(idx)
+        zscore = (level - level.rolling(252, min_periods=63).mean()) / level.rolling(252, min_periods=63).std()
+        pd.testing.assert_series_equal(block["level"][sid], level, check_names=False, check_freq=False)
+        pd.testing.assert_series_equal(block["roc5"][sid], level.pct_change(5), check_names=False, check_freq=False)
+        pd.testing.assert_series_equal(block["zscore"][sid], zscore, check_names=False, check_freq=False)
+
+
+def test_missing_series_is_nan_and_not_retried_during_cooldown(cache, fetcher):
+    idx = pd.bdate_range("2020-01-01", periods=50, tz="America/New_York")
+    out = cache.aligned(["MISSING", "NFCI"], idx)
+    assert out.index.equals(idx)
+    assert out["MISSING"].isna().all()
+    assert out["NFCI"].iloc[5:].notna().all()
+    cache.aligned(["MISSING"], idx)
+    assert _ids(fetcher).count("MISSING") == 1
+
+
+def test_failed_fetch_is_retried_and_keeps_cached_data(fetcher):
+    cache = MacroSeriesCache(fetcher_factory=lambda: fetcher, retry_cooldown=0.0)
+    idx = pd.bdate_range("2021-01-01", "2021-12-31")
+    good = cache.aligned(["NFCI"], idx)
+
+    # Widening the range fails: the cached observations survive, and the
+    # failed range is not recorded as covered.
+    real = fetcher.fetch_macro_data
+    fetcher.fetch_macro_data = lambda *a: pd.DataFrame()
+    wider = pd.bdate_range("2019-01-01", "2021-12-31")
+    out = cache.aligned(["NFCI"], wider)
+    pd.testing.assert_series_equal(out["NFCI"].loc[idx], good["NFCI"], check_freq=False)
+
+    # Once the source is back, the next request refetches the wider range.
+    fetcher.fetch_macro_data = real
+    out = cache.aligned(["NFCI"], wider)
+    assert out["NFCI"].loc["2019-02-01":].notna().all()
+    assert fetcher.calls[-1][1:] == ("2019-01-01", "2021-12-31")
+
+    # A series that was never available is retried too.
+    cache.aligned(["MISSING"], idx)
+    cache.aligned(["MISSING"], idx)
+    assert _ids(fetcher).count("MISSING") == 2
+
+
+def test_invalidate_forces_refetch(cache, fetcher):
+    idx = pd.bdate_range("2020-01-01", periods=30)
+    cache.aligned(["NFCI", "DFF"], idx)
+    cache.invalidate("NFCI")
+    assert "NFCI" not in cache and "DFF" in cache
+    cache.aligned(["NFCI", "DFF"], idx)
+    assert _ids(fetcher) == ["DFF", "NFCI", "NFCI"]
+
+
+def test_macro_block_feature_matches_single_series_features(cache, fetcher, monkeypatch):
+    from engine.core.data_broker import macro
+    from engine.core.features.base import FEATURE_REGISTRY
+    from engine.core.features.macro.fred_features import FRED_SERIES
+
+    monkeypatch.setattr(macro, "_MACRO_CACHE", cache)
+    idx = pd.bdate_range("2020-01-01", "2022-06-30")
+    df = pd.DataFrame({"close": np.linspace(10.0, 20.0, len(idx))}, index=idx)
+
+    block = FEATURE_REGISTRY["MacroBlock"]().compute(df, {}).data
+    assert len(block) == 3 * len(FRED_SERIES)
+    # The whole catalogue was requested as one batch.
+    assert len(fetcher.calls) == len(FRED_SERIES)
+
+    for prefix in FRED_SERIES:
+        single = FEATURE_REGISTRY[prefix]().compute(df, {}).data
+        for kind in ("LEVEL", "ROC5", "ZSCORE"):
+            pd.testing.assert_series_equal(
+                block[f"MacroBlock_{prefix.upper()}_{kind}"], single[f"{prefix}_{kind}"],
+                check_names=False, check_freq=False,
+            )
+    assert len(fetcher.calls) == len(FRED_SERIES)
+
+
+def test_macro_block_series_param_selects_a_subset(cache, fetcher, monkeypatch):
+    from engine.core.data_broker import macro
+    from engine.core.exceptions import ValidationError
+    from engine.core.features.base import FEATURE_REGISTRY
+
+    monkeypatch.setattr(macro, "_MACRO_CACHE", cache)
+    idx = pd.bdate_range("2020-01-01", "2022-06-30")
+    df = pd.DataFrame({"close": np.linspace(10.0, 20.0, len(idx))}, index=idx)
+    feature = FEATURE_REGISTRY["MacroBlock"]()
+
+    params = {"series": "HYSpread, vixcls"}
+    block = feature.compute(df, params).data
+    assert sorted(block) == sorted(
+        f"MacroBlock_{p}_{k}" for p in ("HYSPREAD", "VIXCLS") for k in ("LEVEL", "ROC5", "ZSCORE")
+    )
+    assert _ids(fetcher) == ["BAMLH0A0HYM2", "VIXCLS"]
+    assert feature.non_stationary_outputs(params) == ["MacroBlock_HYSPREAD_LEVEL", "MacroBlock_VIXCLS_LEVEL"]
+
+    # A list works too, and the default is the whole catalogue.
+    assert len(feature.compute(df, {"series": ["DFF"]}).data) == 3
+    assert len(feature.compute(df, feature.parameters).data) == len(block) * 4
+
+    with pytest.raises(ValidationError):
+        feature.compute(df, {"series": "HYSpread,NOPE"})
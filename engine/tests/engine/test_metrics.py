@@ -293,3 +293,236 @@ class TestTearsheetEdgeCases:
         signals = pd.Series(1.0, index=df.index)
         metrics = Tearsheet.calculate_metrics(df, signals)
         Tearsheet.print_summary(metrics)
+
+
+# ---------------------------------------------------------------------------
+# Trade log construction
+# ---------------------------------------------------------------------------
+
+def _reference_trade_log(position: pd.Series, df: pd.DataFrame) -> pd.DataFrame:
+    """Straightforward per-entry loop the vectorized builder must reproduce."""
+    opens, closes = df["open"], df["close"]
+    changes = position.diff().fillna(position.iloc[0]) != 0
+    trades = []
+    for entry_bar in position.index[changes & (position != 0)]:
+        direction = int(position.loc[entry_bar])
+        later = position.index[(position.index > entry_bar) & (position.diff().fillna(0) != 0)]
+        entry_loc = opens.index.get_loc(entry_bar)
+        if entry_loc + 1 >= len(opens):
+            continue
+        entry_price = float(opens.iloc[entry_loc + 1])
+        exit_loc, exit_price = len(opens) - 1, float(closes.iloc[-1])
+        if len(later) and opens.index.get_loc(later[0]) + 1 < len(opens):
+            exit_loc = opens.index.get_loc(later[0]) + 1
+            exit_price = float(opens.iloc[exit_loc])
+        if entry_price <= 0:
+            continue
+        trades.append({
+            "entry_date": opens.index[entry_loc + 1], "exit_date": opens.index[exit_loc],
+            "direction": "LONG" if direction == 1 else "SHORT",
+            "entry_price": round(entry_price, 4), "exit_price": round(exit_price, 4),
+            "return_pct": round((exit_price - entry_price) / entry_price * direction * 100, 4),
+            "bars_held": max(1, exit_loc - (entry_loc + 1)),
+        })
+    return pd.DataFrame(trades)
+
+
+class TestTradeLogConstruction:
+    @pytest.mark.parametrize("seed", range(6))
+    def test_matches_reference_loop(self, seed):
+        rng = np.random.default_rng(seed)
+        df = _make_df(400, seed=seed)
+        signals = pd.Series(rng.choice([-1.0, -0.5, 0.0, 0.1, 0.5, 1.0], len(df)), index=df.index)
+        # Long runs as well as bar-by-bar flips.
+        signals = signals.where(rng.random(len(df)) < 0.3).ffill().fillna(0.0)
+        position = pd.Series(0.0, index=df.index)
+        position[signals >= 0.2] = 1.0
+        position[signals <= -0.2] = -1.0
+        # Signals computed on a warmup-purged slice of the frame.
+        for pos in (position, position.iloc[37:]):
+            pd.testing.assert_frame_equal(
+                Tearsheet._build_trade_log(pos, df), _reference_trade_log(pos, df)
+            )
+
+    @pytest.mark.parametrize("values", [
+        [1, 1, 1, 1, 1],            # open to the end: exits at the last close
+        [0, 0, 0, 0, -1],           # entry signal on the last bar: skipped
+        [1, -1, 1, -1, 0],          # a flip every bar
+        [0, 1, 1, 0, 1],            # re-entry whose exit signal is the final bar
+        [-1, 0, 0, 0, 0],           # position on the very first bar
+    ])
+    def test_edge_positions_match_reference(self, values):
+        df = _make_df(len(values))
+        position = pd.Series(np.array(values, dtype=float), index=df.index)
+        expected = _reference_trade_log(position, df)
+        actual = Tearsheet._build_trade_log(position, df)
+        if expected.empty:
+            assert actual.empty
+        else:
+            pd.testing.assert_frame_equal(actual, expected)
+
+    def test_non_positive_entry_price_is_skipped(self):
+        df = _make_df(6)
+        df.iloc[2, df.columns.get_loc("open")] = 0.0
+        position = pd.Series([0, 1, 0, -1, -1, 0], index=df.index, dtype=float)
+        tl = Tearsheet._build_trade_log(position, df)
+        assert tl["direction"].tolist() == ["SHORT"]
+
+    def test_columnar_trade_log(self):
+        df = _make_df()
+        signals = pd.Series([1.0, 1.0, -1.0, 0.0, 0.0] * (len(df) // 5), index=df.index)
+        tl = Tearsheet.calculate_metrics(df, signals)["trade_log"]
+        cols = Tearsheet.trade_log_columns(tl)
+        assert list(cols) == list(tl.columns)
+        assert all(len(v) == len(tl) for v in cols.values())
+        assert cols["entry_date"] == tl["entry_date"].astype(str).tolist()
+        assert cols["return_pct"] == tl["return_pct"].tolist()
+        assert isinstance(cols["bars_held"][0], int)
+
+        empty = Tearsheet.trade_log_columns(Tearsheet._build_trade_log(pd.Series(0.0, index=df.index), df))
+        assert set(empty) == set(cols) and not any(empty.values())
+
+
+# ---------------------------------------------------------------------------
+# Batched scoring
+# ---------------------------------------------------------------------------
+
+def _scalars(metrics: dict) -> dict:
+    return {k: v for k, v in metrics.items()
+            if k not in ("equity_curve", "portfolio", "bh_portfolio", "trade_log")}
+
+
+class TestCalculateMetricsBatch:
+    def _variants(self, df, n_variants=12, seed=3):
+        rng = np.random.default_rng(seed)
+        cols = {}
+        for i in range(n_variants):
+            raw = rng.normal(0, 0.6, len(df)).clip(-1, 1)
+            span = 1 + i % 4
+            cols[f"v{i}"] = pd.Series(raw, index=df.index).rolling(span, min_periods=1).mean()
+        cols["flat"] = pd.Series(0.0, index=df.index)
+        cols["long"] = pd.Series(1.0, index=df.index)
+        return pd.DataFrame(cols)
+
+    def test_matches_per_variant_calculate_metrics(self):
+        df = _make_df(300)
+        variants = self._variants(df)
+        table = Tearsheet.calculate_metrics_batch(df, variants, n_trials=7)
+
+        assert list(table.index) == list(variants.columns)
+        for name, signals in variants.items():
+            expected = _scalars(Tearsheet.calculate_metrics(df, signals, n_trials=7))
+            assert list(table.columns) == list(expected)
+            for key, value in expected.items():
+                assert table.loc[name, key] == pytest.approx(value, rel=1e-9, abs=1e-9, nan_ok=True), (name, key)
+
+    def test_ndarray_input_on_warmup_purged_slice(self):
+        df = _make_df(200)
+        variants = self._variants(df, n_variants=4).iloc[40:]
+        table = Tearsheet.calculate_metrics_batch(
+            df, variants.to_numpy().T, index=variants.index, names=list(variants.columns),
+        )
+        for name, signals in variants.items():
+            expected = _scalars(Tearsheet.calculate_metrics(df, signals))
+            assert table.loc[name, "Sharpe Ratio"] == expected["Sharpe Ratio"]
+            assert table.loc[name, "Discrete Trades"] == expected["Discrete Trades"]
+
+    def test_nan_signals_and_shape_check(self):
+        df = _make_df(60)
+        signals = np.tile(np.linspace(-1, 1, 60), (2, 1))
+        signals[1, :10] = np.nan
+        table = Tearsheet.calculate_metrics_batch(df, signals)
+        expected = _scalars(Tearsheet.calculate_metrics(df, pd.Series(signals[1], index=df.index)))
+        assert table.loc[1, "Total Return (%)"] == expected["Total Return (%)"]
+        assert table.loc[1, "Total Trades"] == expected["Total Trades"]
+
+        with pytest.raises(ValueError, match="bars"):
+            Tearsheet.calculate_metrics_batch(df, signals[:, :-1])
+
+
+# ---------------------------------------------------------------------------
+# Metrics levels
+# ---------------------------------------------------------------------------
+
+class TestMetricsLevels:
+    def _signals(self, df, seed=5):
+        rng = np.random.default_rng(seed)
+        signals = pd.Series(rng.normal(0, 0.6, len(df)).clip(-1, 1), index=df.index)
+        signals.iloc[[3, 17]] = np.nan
+        return signals
+
+    @pytest.mark.parametrize("start", [0, 30])
+    def test_fitness_matches_full(self, start):
+        df = _make_df(250)
+        signals = self._signals(df).iloc[start:]
+        full = Tearsheet.calculate_metrics(df, signals)
+        fit = Tearsheet.calculate_metrics(df, signals, metrics_level="fitness")
+
+        assert list(fit) == ["Total Return (%)", "CAGR (%)", "Sharpe Ratio"]
+        for key, value in fit.items():
+            assert value == full[key]
+
+    def test_standard_is_full_without_time_series(self):
+        df = _make_df(250)
+        signals = self._signals(df).iloc[20:]
+        full = Tearsheet.calculate_metrics(df, signals, n_trials=4)
+        std = Tearsheet.calculate_metrics(df, signals, n_trials=4, metrics_level="standard")
+        assert std == pytest.approx(_scalars(full), nan_ok=True)
+        assert list(std) == list(_scalars(full))
+
+    def test_batch_fitness_and_unknown_level(self):
+        df = _make_df(120)
+        variants = pd.DataFrame({"a": self._signals(df, 1), "b": self._signals(df, 2)})
+        table = Tearsheet.calculate_metrics_batch(df, variants, metrics_level="fitness")
+        assert list(table.columns) == ["Total Return (%)", "CAGR (%)", "Sharpe Ratio"]
+        assert table.loc["b", "Sharpe Ratio"] == Tearsheet.calculate_metrics(df, variants["b"])["Sharpe Ratio"]
+
+        with pytest.raises(ValueError, match="metrics_level"):
+            Tearsheet.calculate_metrics(df, variants["a"], metrics_level="fast")
+
+
+class TestCostSurface:
+    def _inputs(self, n=300):
+        df = _make_df(n, seed=3)
+        return df, pd.Series(np.sin(np.arange(n) / 7), index=df.index)
+
+    def test_rows_match_calculate_metrics_and_discrete_portfolio(self):
+        df, signals = self._inputs()
+        surface = Tearsheet.calculate_cost_surface(
+            df, signals, frictions=[0.0005, 0.002], entry_thresholds=[None, 0.3]
+        )
+        assert len(surface) == 4
+        assert surface["entry_threshold"].isna().tolist() == [True, True, False, False]
+        for i, friction in enumerate([0.0005, 0.002]):
+            expected = Tearsheet.calculate_metrics(df, signals, friction=friction, entry_threshold=0.3)
+            for key in ("Total Return (%)", "CAGR (%)", "Sharpe Ratio", "Max Drawdown (%)"):
+                assert surface[key].iloc[i] == expected[key]
+            discrete_return = (expected["portfolio"].iloc[-1] / 10_000 - 1) * 100
+            assert surface["Total Return (%)"].iloc[2 + i] == round(discrete_return, 2)
+            assert surface["Avg Cost (bps)"].iloc[i] == pytest.approx(friction * 1e4)
+        # Higher cost never helps.
+        assert (surface["Total Return (%)"].iloc[[0, 2]].to_numpy()
+                >= surface["Total Return (%)"].iloc[[1, 3]].to_numpy()).all()
+
+    def test_spread_and_volume_slippage_raise_costs(self):
+        df, signals = self._inputs()
+        base = Tearsheet.calculate_cost_surface(df, signals, frictions=[0.001])
+        spread = Tearsheet.calculate_cost_surface(df, signals, frictions=[0.001], spread=0.002)
+        assert spread["Avg Cost (bps)"].iloc[0] == pytest.approx(20.0)
+        assert spread["Total Return (%)"].iloc[0] < base["Total Return (%)"].iloc[0]
+
+        thin = df.copy()
+        thin.loc[thin.index[::2], "volume"] = 250_000   # alternate thin bars
+        slip = Tearsheet.calculate_cost_surface(thin, signals, frictions=[0.0], slippage=0.001)
+        flat = Tearsheet.calculate_cost_surface(df, signals, frictions=[0.0], slippage=0.001)
+        assert flat["Avg Cost (bps)"].iloc[0] == pytest.approx(10.0)
+        assert slip["Avg Cost (bps)"].iloc[0] > 10.0
+
+    def test_high_low_spread_model(self):
+        df, signals = self._inputs()
+        est = Tearsheet.high_low_spread(df)
+        assert est.index.equals(df.index) and (est.dropna() >= 0).all()
+        surface = Tearsheet.calculate_cost_surface(df, signals, frictions=[0.0], spread="high_low")
+        assert surface["Avg Cost (bps)"].iloc[0] > 0
+        with pytest.raises(ValueError, match="spread"):
+            Tearsheet.calculate_cost_surface(df, signals, spread="roll")
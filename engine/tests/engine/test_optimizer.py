@@ -0,0 +1,146 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.exceptions import ValidationError
+from engine.core.optimization.optimizer_core import OptimizerCore, build_search_space
+
+# Out-of-sample quality peaks at window=60: the signal blends the next bar's
+# direction with a fixed noise pattern, weighted by distance from the peak.
+PEAKED_MODEL_CONTENT = """
+from engine.core.controller import SignalModel
+import numpy as np
+
+class PeakedStrategy(SignalModel):
+    def train(self, df, context, params):
+        return {}
+
+    def generate_signals(self, df, context, params, artifacts):
+        fwd = df['open'].shift(-2) / df['open'].shift(-1) - 1
+        perfect = np.sign(fwd).fillna(0.0)
+        noise = np.sign(np.sin(np.arange(len(df)) * 7.1))
+        weight = np.exp(-((params["window"] - 60) / 25.0) ** 2)
+        return (weight * perfect + (1 - weight) * noise) * params["scale"]
+"""
+
+CONTEXT_CONTENT = """
+class Context:
+    pass
+"""
+
+PEAKED_MANIFEST = {
+    "name": "Peaked",
+    "features": [],
+    "hyperparameters": {"window": 10, "scale": 1.0, "fixed": "kept"},
+    "parameter_bounds": {"window": [2, 200], "scale": [0.5, 1.0]},
+    "training": {"split_method": "cpcv", "n_groups": 4, "k_test_groups": 1},
+}
+
+
+@pytest.fixture
+def peaked_strategy_dir(tmp_path):
+    strat_dir = tmp_path / "peaked"
+    strat_dir.mkdir()
+    (strat_dir / "model.py").write_text(PEAKED_MODEL_CONTENT)
+    (strat_dir / "context.py").write_text(CONTEXT_CONTENT)
+    (strat_dir / "manifest.json").write_text(json.dumps(PEAKED_MANIFEST))
+    return str(strat_dir)
+
+
+@pytest.fixture
+def trial_db(tmp_path, monkeypatch):
+    from engine.core.diagnostics import trial_counter
+    monkeypatch.setattr(trial_counter, "_DB_PATH", tmp_path / "diagnostics.db")
+    return trial_counter
+
+
+def _ohlcv(n=600, seed=3):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    return pd.DataFrame({
+        "open": close, "high": close, "low": close, "close": close, "volume": 1000.0,
+    }, index=pd.bdate_range("2020-01-01", periods=n))
+
+
+def test_build_search_space():
+    space = build_search_space({
+        "window": [5, 50], "threshold": [0.1, 0.9], "mode": ["fast", "slow"],
+        "levels": [1, 2, 3], "flag": [True, False],
+    })
+    assert space["window"] == ("int", 5, 50)
+    assert space["threshold"] == ("float", 0.1, 0.9)
+    assert space["mode"] == ("categorical", ["fast", "slow"])
+    assert space["levels"] == ("categorical", [1, 2, 3])
+    assert space["flag"] == ("categorical", [True, False])
+    with pytest.raises(ValidationError):
+        build_search_space({"window": [50, 5]})
+    with pytest.raises(ValidationError):
+        build_search_space({"window": 5})
+
+
+def test_optimize_finds_peak_prunes_and_persists(peaked_strategy_dir, trial_db, tmp_path):
+    storage = str(tmp_path / "optimization.db")
+    df = _ohlcv()
+    out = OptimizerCore(peaked_strategy_dir, storage=storage).optimize(df, n_trials=30, seed=0)
+
+    # 30 trials over a 199-value range land near the peak.
+    assert 40 <= out["best_params"]["window"] <= 80
+    assert out["best_params"]["fixed"] == "kept"
+    assert out["n_trials"] == 30 and out["total_trials"] == 30
+    assert out["n_pruned"] > 0
+    assert out["n_complete"] + out["n_pruned"] + out["n_failed"] == 30
+    assert trial_db.get_total_trials("peaked") == 30
+
+    # The baseline trial scored the manifest defaults.
+    import optuna
+    study = optuna.load_study(study_name=out["study_name"], storage=f"sqlite:///{storage}")
+    assert study.trials[0].params == {"window": 10, "scale": 1.0}
+
+    # An identical rerun resumes the stored study.
+    again = OptimizerCore(peaked_strategy_dir, storage=storage).optimize(df, n_trials=4, seed=1)
+    assert again["study_name"] == out["study_name"]
+    assert again["n_trials"] == 4 and again["total_trials"] == 34
+    assert again["best_value"] >= out["best_value"]
+    assert trial_db.get_total_trials("peaked") == 34
+
+    # Different data is a different study.
+    other = OptimizerCore(peaked_strategy_dir, storage=storage).optimize(
+        df.iloc[:-20], n_trials=2)
+    assert other["study_name"] != out["study_name"] and other["total_trials"] == 2
+
+
+@pytest.mark.parametrize("executor", ["threads", "processes"])
+def test_optimize_parallel_trials(peaked_strategy_dir, trial_db, tmp_path, executor):
+    out = OptimizerCore(peaked_strategy_dir, storage=str(tmp_path / "opt.db")).optimize(
+        _ohlcv(), n_trials=6, executor=executor, max_workers=2, seed=0,
+    )
+    assert out["n_trials"] == 6 and out["total_trials"] == 6
+    assert trial_db.get_total_trials("peaked") == 6
+
+
+def test_optimize_rejects_bad_options(peaked_strategy_dir, tmp_path):
+    core = OptimizerCore(peaked_strategy_dir, storage=str(tmp_path / "opt.db"))
+    with pytest.raises(ValidationError, match="sampler"):
+        core.optimize(_ohlcv(), n_trials=1, sampler="random")
+    with pytest.raises(ValidationError, match="metric"):
+        core.optimize(_ohlcv(), n_trials=1, metric="Sortino Ratio")
+
+
+def test_trial_counter_migrates_optimize_column(trial_db):
+    import sqlite3
+    trial_db._DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(str(trial_db._DB_PATH)) as conn:
+        conn.execute("""
+            CREATE TABLE trial_counts (
+                strategy_name TEXT PRIMARY KEY, backtest_count INTEGER DEFAULT 0,
+                train_count INTEGER DEFAULT 0, last_run_at TEXT)
+        """)
+        conn.execute("INSERT INTO trial_counts VALUES ('old', 3, 2, NULL)")
+
+    trial_db.increment("old", "optimize", 5)
+    trial_db.increment("old", "backtest")
+    assert trial_db.get_total_trials("old") == 11
+    row = trial_db.get_all()[0]
+    assert (row["backtest_count"], row["train_count"], row["optimize_count"]) == (4, 2, 5)
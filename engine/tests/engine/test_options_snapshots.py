@@ -0,0 +1,150 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.data_broker.options_db import OptionsDatabase
+from engine.core.data_broker.options_recorder import OptionsSnapshotRecorder, summarize_chains
+
+
+class FakeSnapshots:
+    """Returns a deterministic summary per ticker and tracks concurrency."""
+
+    def __init__(self, date="2024-03-01", delay=0.0):
+        self.date = pd.Timestamp(date)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, ticker):
+        with self._lock:
+            self.calls.append(ticker)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if ticker == "NOOPT":
+            return None
+        if ticker == "BROKEN":
+            raise ConnectionError("offline")
+        base = float(len(ticker))
+        return {
+            "date": self.date, "spot": 100.0, "pcr": base / 10, "iv_skew": 0.02, "iv_ts": 0.9,
+            "atm_iv_short": 0.25, "atm_iv_medium": 0.28, "put_vol": base * 100,
+            "call_vol": 1000.0, "total_vol": base * 100 + 1000.0,
+            "exp_short": "2024-03-28", "exp_medium": "2024-05-31",
+        }
+
+
+@pytest.fixture
+def db(tmp_path):
+    return OptionsDatabase(str(tmp_path / "options.db"))
+
+
+def _seed(db, ticker, days, captured_hour=21):
+    rows = []
+    for i, day in enumerate(days):
+        rows.append({
+            "ticker": ticker, "date": day, "captured_at": day + pd.Timedelta(hours=captured_hour),
+            "spot": 100.0, "pcr": 0.5 + 0.1 * i, "iv_skew": 0.01 * i, "iv_ts": 1.0,
+            "atm_iv_short": 0.2, "atm_iv_medium": 0.2, "put_vol": 500.0, "call_vol": 1000.0,
+            "total_vol": 1000.0 + 100 * i,
+        })
+    db.save_snapshots(pd.DataFrame(rows))
+
+
+def test_summarize_chains():
+    strikes = np.arange(80.0, 121.0, 5.0)
+    calls_s = pd.DataFrame({"strike": strikes, "impliedVolatility": 0.20, "volume": 10.0})
+    puts_s = pd.DataFrame({"strike": strikes, "impliedVolatility": np.linspace(0.40, 0.20, 9),
+                           "volume": [5.0, np.nan] + [5.0] * 7})
+    calls_m = pd.DataFrame({"strike": strikes, "impliedVolatility": 0.25, "volume": 1.0})
+    out = summarize_chains(calls_s, puts_s, calls_m, spot=100.0)
+
+    assert out["put_vol"] == 40.0 and out["call_vol"] == 90.0
+    assert out["pcr"] == pytest.approx(40 / 90)
+    assert out["iv_skew"] == pytest.approx(puts_s["impliedVolatility"][3] - puts_s["impliedVolatility"][4])
+    assert out["iv_ts"] == pytest.approx(0.20 / 0.25)
+
+
+def test_record_universe_concurrently_and_persist(db):
+    snap = FakeSnapshots(delay=0.05)
+    recorder = OptionsSnapshotRecorder(db=db, snapshot_fn=snap, max_workers=4)
+    tickers = ["AAPL", "MSFT", "NVDA", "AMZN", "NOOPT", "BROKEN", "aapl"]
+    df = recorder.record(tickers)
+
+    assert sorted(df["ticker"]) == ["AAPL", "AMZN", "MSFT", "NVDA"]
+    assert sorted(snap.calls) == sorted({t.upper() for t in tickers})
+    assert snap.peak > 1
+    stored = db.get_snapshots("MSFT")
+    assert list(stored.index) == [pd.Timestamp("2024-03-01")]
+    assert stored["pcr"].iloc[0] == pytest.approx(0.4)
+
+
+def test_already_captured_today_is_skipped_unless_forced(db):
+    snap = FakeSnapshots()
+    recorder = OptionsSnapshotRecorder(db=db, snapshot_fn=snap)
+    recorder.record(["AAPL", "MSFT"])
+    assert recorder.record(["AAPL", "MSFT", "NVDA"])["ticker"].tolist() == ["NVDA"]
+    assert snap.calls.count("AAPL") == 1
+
+    recorder.record(["AAPL"], force=True)
+    assert snap.calls.count("AAPL") == 2
+    # Same trading day replaces, never duplicates.
+    assert len(db.get_snapshots("AAPL")) == 1
+
+
+def test_feature_reads_store_without_network(db, monkeypatch):
+    from engine.core.features.base import FEATURE_REGISTRY
+    from engine.core.features.options import options_features
+
+    days = pd.bdate_range("2024-01-02", periods=30)
+    recorded = days.delete([10, 11])        # two days the recorder did not run
+    _seed(db, "AAPL", recorded)
+    monkeypatch.setattr(options_features, "_db_instance", db)
+    assert not hasattr(options_features, "yf")
+
+    df = pd.DataFrame({"close": np.linspace(100.0, 110.0, len(days))}, index=days)
+    out = FEATURE_REGISTRY["OptionsFlow"]().compute(df, {"ticker": "aapl", "pcr_window": 5}).data
+    pcr = next(v for k, v in out.items() if k.endswith("_PCR"))
+    chg = next(v for k, v in out.items() if k.endswith("_PCR_CHG5"))
+
+    assert pcr.index.equals(days)
+    assert pcr.iloc[[10, 11]].isna().all()
+    assert pcr.notna().sum() == 28
+    np.testing.assert_allclose(pcr.dropna().to_numpy(), 0.5 + 0.1 * np.arange(28))
+    # Changes are over recorded snapshots, so the gap does not widen them.
+    np.testing.assert_allclose(chg.dropna().to_numpy(), 0.5)
+    assert chg.notna().sum() == 23
+
+
+def test_intraday_bars_see_snapshot_only_after_capture(db, monkeypatch):
+    from engine.core.features.base import FEATURE_REGISTRY
+    from engine.core.features.options import options_features
+
+    _seed(db, "SPY", pd.DatetimeIndex(["2024-03-04", "2024-03-05"]), captured_hour=20)
+    monkeypatch.setattr(options_features, "_db_instance", db)
+
+    idx = pd.date_range("2024-03-05 09:30", "2024-03-05 15:30", freq="h", tz="America/New_York")
+    df = pd.DataFrame({"close": 100.0}, index=idx)
+    out = FEATURE_REGISTRY["OptionsFlow"]().compute(df, {"ticker": "SPY"}).data
+    pcr = next(v for k, v in out.items() if k.endswith("_PCR"))
+    # Captured 20:00 UTC = 15:00 New York: only the 15:30 bar may use it.
+    assert pcr.iloc[:-1].isna().all()
+    assert pcr.iloc[-1] == pytest.approx(0.6)
+
+
+def test_feature_without_snapshots_is_nan(db, monkeypatch):
+    from engine.core.features.base import FEATURE_REGISTRY
+    from engine.core.features.options import options_features
+
+    monkeypatch.setattr(options_features, "_db_instance", db)
+    idx = pd.bdate_range("2024-01-02", periods=10)
+    out = FEATURE_REGISTRY["OptionsFlow"]().compute(pd.DataFrame({"close": 1.0}, index=idx),
+                                                    {"ticker": "XYZ"}).data
+    assert len(out) == 5 and all(s.isna().all() for s in out.values())
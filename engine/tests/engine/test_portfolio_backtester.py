@@ -0,0 +1,259 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.portfolio_backtester import (
+    PortfolioBacktester, PortfolioConfig, portfolio_config_grid,
+)
+
+
+def _universe(n=300, k=6, seed=0, gaps=True):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2020-01-01", periods=n)
+    datasets, signals = {}, {}
+    for j in range(k):
+        close = 50 * np.exp(np.cumsum(rng.normal(0.0, 0.02, n)))
+        opens = close * np.exp(rng.normal(0.0, 0.005, n))
+        df = pd.DataFrame({"open": opens, "close": close}, index=index)
+        sig = pd.Series(np.round(np.sin(np.arange(n) / (5 + 3 * j) + j), 1), index=index)
+        if gaps and j % 2:
+            # Late listing and a data hole.
+            df, sig = df.iloc[20 * j:], sig.iloc[20 * j:]
+            df = df.drop(df.index[40:45])
+        datasets[f"T{j}"] = df
+        signals[f"T{j}"] = sig
+    return datasets, signals
+
+
+def _reference(datasets, all_signals, cfg):
+    """Dict-of-positions loop the array kernel must reproduce."""
+    tickers = list(all_signals)
+    index = all_signals[tickers[0]].index
+    for t in tickers[1:]:
+        index = index.union(all_signals[t].index)
+    n = len(index)
+    o = {t: datasets[t]["open"].reindex(index).to_numpy(float) for t in tickers}
+    c = {t: datasets[t]["close"].reindex(index).to_numpy(float) for t in tickers}
+    s = {t: all_signals[t].reindex(index).fillna(0.0).to_numpy(float) for t in tickers}
+
+    def size(pv, price, sig):
+        rule = pv * cfg.risk_per_trade_pct / (price * cfg.stop_loss_pct)
+        return max(0.0, min(rule, pv * cfg.max_position_pct * abs(sig) / price))
+
+    def mtm(i):
+        return sum(p["sh"] * p["px"] + p["d"] * (c[t][i] - p["px"]) * p["sh"]
+                   for t, p in pos.items() if not np.isnan(c[t][i]))
+
+    def close(t, price, exit_bar, bar, reason):
+        p = pos.pop(t)
+        pnl = p["d"] * (price - p["px"]) * p["sh"] - p["sh"] * price * cfg.friction
+        trades.append((t, p["entry"], index[exit_bar], round(price, 4), round(p["sh"], 4),
+                       round(pnl, 4), max(0, bar - p["entry"]), reason))
+        return p["sh"] * p["px"] + pnl
+
+    cash, pos, trades, equity = cfg.starting_capital, {}, [], np.full(n, np.nan)
+    weights = pd.DataFrame(0.0, index=index, columns=tickers)
+
+    def record(i, pv):
+        for t, p in pos.items():
+            if pv > 0 and not np.isnan(c[t][i]):
+                weights.iloc[i, tickers.index(t)] = (p["sh"] * c[t][i] / pv) * p["d"]
+    for i in range(n - 1):
+        pv = cash + mtm(i)
+        exits = []
+        for t, p in pos.items():
+            nx = o[t][i + 1]
+            if np.isnan(nx):
+                continue
+            if (p["d"] == 1 and nx <= p["stop"]) or (p["d"] == -1 and nx >= p["stop"]):
+                exits.append((t, nx, "STOP"))
+            elif abs(s[t][i]) < cfg.entry_threshold:
+                exits.append((t, nx, "SIGNAL"))
+            elif (s[t][i] > 0) != (p["d"] > 0):
+                exits.append((t, nx, "FLIP"))
+        for t, nx, reason in exits:
+            cash += close(t, nx, i + 1, i, reason)
+        if cfg.rebalance_on_strength:
+            for t, p in pos.items():
+                new_abs, nx = abs(s[t][i]), o[t][i + 1]
+                if abs(new_abs - p["str"]) < cfg.rebalance_delta or not nx > 0:
+                    continue
+                delta = size(pv, nx, new_abs) - p["sh"]
+                if delta > 0 and delta * nx * (1 + cfg.friction) <= cash:
+                    cash -= delta * nx * (1 + cfg.friction)
+                    p["sh"] += delta
+                elif delta < 0:
+                    cash -= delta * nx * (1 - cfg.friction)
+                    p["sh"] += delta
+                p["str"] = new_abs
+        cands = [(t, s[t][i]) for t in tickers if t not in pos
+                 and abs(s[t][i]) >= cfg.entry_threshold
+                 and (cfg.allow_short or s[t][i] >= 0) and o[t][i + 1] > 0]
+        for t, sig in sorted(cands, key=lambda x: abs(x[1]), reverse=True):
+            nx = o[t][i + 1]
+            if len(pos) >= cfg.max_positions:
+                if not pos:
+                    break
+                weakest = min(pos, key=lambda x: pos[x]["str"])
+                if abs(sig) < pos[weakest]["str"] + cfg.eviction_margin:
+                    continue
+                if np.isnan(o[weakest][i + 1]):
+                    continue
+                cash += close(weakest, o[weakest][i + 1], i + 1, i, "EVICTED")
+            sh = size(pv, nx, sig)
+            if sh * nx * (1 + cfg.friction) > cash:
+                sh = cash / (nx * (1 + cfg.friction))
+            if sh <= 0:
+                continue
+            cash -= sh * nx * (1 + cfg.friction)
+            d = 1 if sig > 0 else -1
+            pos[t] = {"d": d, "entry": i + 1, "px": nx, "sh": sh,
+                      "stop": nx * (1 - cfg.stop_loss_pct * d), "str": abs(sig)}
+        equity[i] = cash + mtm(i)
+        record(i, equity[i])
+    held = dict(pos)
+    for t in list(pos):
+        px = c[t][-1] if not np.isnan(c[t][-1]) else pos[t]["px"]
+        cash += close(t, px, n - 1, n - 1, "END_OF_DATA")
+    equity[-1] = cash
+    pos = held
+    record(n - 1, cash)
+    return pd.Series(equity, index=index).ffill(), trades, weights
+
+
+CONFIGS = [
+    PortfolioConfig(),
+    PortfolioConfig(max_positions=2, eviction_margin=0.05, friction=0.002),
+    PortfolioConfig(max_positions=3, rebalance_on_strength=True, rebalance_delta=0.1),
+    PortfolioConfig(allow_short=False, entry_threshold=0.4, stop_loss_pct=0.02),
+    PortfolioConfig(max_positions=0),
+]
+
+
+def _assert_matches_reference(seed, config):
+    datasets, signals = _universe(seed=seed)
+    result = PortfolioBacktester().run(datasets, signals, config)
+    equity, trades, weights = _reference(datasets, signals, config)
+
+    pd.testing.assert_series_equal(result["equity_curve"], equity, check_exact=True,
+                                   check_freq=False)
+    log = result["trade_log"]
+    actual = list(zip(log["ticker"], log["entry_date"], log["exit_date"], log["exit_price"],
+                      log["shares"], log["pnl"], log["bars_held"], log["exit_reason"]))
+    index = equity.index
+    expected = [(t, index[e], *rest) for t, e, *rest in trades]
+    assert actual == expected
+    for t in signals:
+        assert result["per_ticker_contribution"][t] == round(
+            sum(tr[5] for tr in trades if tr[0] == t), 4)
+    pd.testing.assert_frame_equal(result["positions"].weights(), weights, check_exact=True,
+                                  check_freq=False)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("config", CONFIGS)
+def test_matches_reference_loop(seed, config):
+    _assert_matches_reference(seed, config)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("config", CONFIGS)
+def test_compiled_kernel_matches_reference_loop(seed, config):
+    pytest.importorskip("numba")
+    from engine.core import portfolio_backtester
+
+    # The njit dispatcher keeps the Python original as py_func.
+    assert hasattr(portfolio_backtester._simulate, "py_func")
+    _assert_matches_reference(seed, config)
+
+
+def test_eviction_and_weights():
+    index = pd.bdate_range("2021-01-01", periods=6)
+    flat = pd.DataFrame({"open": 10.0, "close": 10.0}, index=index)
+    datasets = {"A": flat, "B": flat * 2}
+    signals = {
+        "A": pd.Series([0.5, 0.5, 0.5, 0.5, 0.5, 0.5], index=index),
+        "B": pd.Series([0.0, 0.0, 0.9, 0.9, 0.9, 0.9], index=index),
+    }
+    config = PortfolioConfig(starting_capital=1000.0, max_positions=1, friction=0.0)
+    result = PortfolioBacktester().run(datasets, signals, config)
+
+    log = result["trade_log"]
+    assert log["ticker"].tolist() == ["A", "B"]
+    assert log["exit_reason"].tolist() == ["EVICTED", "END_OF_DATA"]
+    assert log["entry_date"].tolist() == [index[1], index[3]]
+    assert (result["equity_curve"] == 1000.0).all()
+    # Capped at max_position_pct * |signal| of the book.
+    weights = result["positions"].weights()
+    assert weights["A"].iloc[1] == pytest.approx(0.2 * 0.5)
+    assert weights["B"].iloc[3] == pytest.approx(0.2 * 0.9)
+    assert weights["A"].iloc[3] == 0.0
+
+    # Events are dated by the signal bar; the fills are at the next open.
+    events = result["positions"].events()
+    assert events[["date", "ticker", "event", "direction"]].values.tolist() == [
+        [index[0], "A", "ENTRY", "LONG"],
+        [index[2], "A", "EXIT", "LONG"],
+        [index[2], "B", "ENTRY", "LONG"],
+    ]
+    assert events["shares"].tolist() == pytest.approx([10.0, 0.0, 9.0])
+
+
+def test_position_history_window_and_resizes():
+    datasets, signals = _universe(seed=2, k=12)
+    config = PortfolioConfig(max_positions=3, rebalance_on_strength=True, rebalance_delta=0.1)
+    positions = PortfolioBacktester().run(datasets, signals, config)["positions"]
+    full = positions.weights()
+
+    kinds = positions.events()["event"].value_counts()
+    assert kinds["ENTRY"] > 0 and kinds["RESIZE"] > 0 and kinds["EXIT"] > 0
+    # 3 of 12 names held at most: the events are far smaller than the matrix.
+    assert len(positions.bars) < full.size / 10
+    assert (full.ne(0).sum(axis=1) <= 3).all()
+
+    start, end = full.index[50], full.index[120]
+    held = positions.held_tickers[:4]
+    window = positions.weights(start, end, tickers=held, step=7)
+    pd.testing.assert_frame_equal(window, full.loc[start:end, held].iloc[::7], check_freq=False)
+
+
+def test_empty_inputs():
+    result = PortfolioBacktester().run({}, {"A": pd.Series(dtype=float)}, PortfolioConfig())
+    assert result["equity_curve"].empty and result["trade_log"].empty
+
+
+def test_config_grid():
+    base = PortfolioConfig(friction=0.0)
+    configs = portfolio_config_grid({"max_positions": [2, 5], "stop_loss_pct": [0.03, 0.05, 0.1]}, base)
+    assert len(configs) == 6
+    assert {(c.max_positions, c.stop_loss_pct) for c in configs} == {
+        (m, s) for m in (2, 5) for s in (0.03, 0.05, 0.1)}
+    assert all(c.friction == 0.0 for c in configs)
+    with pytest.raises(ValueError, match="Unknown"):
+        portfolio_config_grid({"max_pos": [1]})
+    with pytest.raises(ValueError, match="No values"):
+        portfolio_config_grid({"max_positions": []})
+
+
+@pytest.mark.parametrize("executor", ["serial", "threads", "processes"])
+def test_sweep_ranks_configs_like_individual_runs(executor):
+    datasets, signals = _universe(seed=4)
+    configs = portfolio_config_grid({
+        "max_positions": [2, 4], "eviction_margin": [0.05, 0.3], "entry_threshold": [0.2, 0.5],
+    })
+    table = PortfolioBacktester().sweep(
+        datasets, signals, configs, executor=executor, max_workers=2)
+
+    assert sorted(table.index) == list(range(len(configs)))
+    assert list(table.columns[:3]) == ["max_positions", "entry_threshold", "eviction_margin"]
+    assert table["Sharpe Ratio"].is_monotonic_decreasing
+    for i, row in table.iterrows():
+        metrics = PortfolioBacktester().run(datasets, signals, configs[i])["metrics"]
+        assert row[list(metrics)].to_dict() == metrics
+        assert row["max_positions"] == configs[i].max_positions
+
+
+def test_sweep_rejects_bad_rank_metric():
+    datasets, signals = _universe()
+    with pytest.raises(ValueError, match="rank_by"):
+        PortfolioBacktester().sweep(datasets, signals, [PortfolioConfig()], rank_by="Win Rate (%)")
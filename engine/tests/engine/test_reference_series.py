@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.data_broker.reference import ReferenceSeriesCache, align_to_index
+
+
+class FakeBroker:
+    """Serves deterministic daily OHLCV and counts get_data calls per ticker."""
+
+    def __init__(self, n_bars=300):
+        self.calls = {}
+        self.n_bars = n_bars
+
+    def get_data(self, ticker, interval, start=None, end=None):
+        self.calls[ticker] = self.calls.get(ticker, 0) + 1
+        if ticker == "MISSING":
+            return pd.DataFrame()
+        if ticker == "BROKEN":
+            raise ConnectionError("offline")
+        idx = pd.date_range("2020-01-01", periods=self.n_bars, freq="B", name="timestamp")
+        base = float(len(ticker))
+        close = base + np.arange(self.n_bars, dtype=float)
+        return pd.DataFrame(
+            {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1000.0},
+            index=idx,
+        )
+
+
+@pytest.fixture
+def broker():
+    return FakeBroker()
+
+
+@pytest.fixture
+def cache(broker):
+    return ReferenceSeriesCache(broker_factory=lambda: broker)
+
+
+def test_series_loaded_once_per_process(cache, broker):
+    for _ in range(5):
+        cache.series("spy")
+    cache.frame("SPY", "1d", start="2020-03-01", end="2020-04-01")
+    assert broker.calls == {"SPY": 1}
+    assert ("SPY", "1d") in cache
+
+
+def test_stale_frame_reloaded_when_target_runs_past_it(broker, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("engine.core.data_broker.reference.time.monotonic", lambda: clock[0])
+    cache = ReferenceSeriesCache(broker_factory=lambda: broker, refresh_after=60)
+    assert cache.frame("SPY").index[-1] == pd.Timestamp("2021-02-23")
+
+    broker.n_bars = 310
+    target = pd.bdate_range("2021-02-01", "2021-03-05")
+    # Within the refresh window the resident frame is served as-is.
+    assert cache.aligned("SPY", target).iloc[-1] == 3 + 299
+    assert broker.calls == {"SPY": 1}
+
+    clock[0] += 61
+    assert cache.aligned("SPY", target).iloc[-1] == 3 + 307
+    assert broker.calls == {"SPY": 2}
+    # Requests the frame already covers never trigger a reload.
+    clock[0] += 61
+    cache.frame("SPY", end="2021-03-01")
+    cache.aligned("SPY", target[:-5])
+    assert broker.calls == {"SPY": 2}
+
+
+def test_frame_slices_by_date_range(cache):
+    full = cache.frame("SPY")
+    sliced = cache.frame("SPY", start="2020-02-03", end="2020-02-07")
+    assert list(sliced.columns) == ["open", "high", "low", "close", "volume"]
+    assert sliced.index.min() == pd.Timestamp("2020-02-03")
+    assert sliced.index.max() == pd.Timestamp("2020-02-07")
+    assert len(sliced) == 5
+    assert len(full) == 300
+
+    # tz-aware bounds are matched against the tz-naive store
+    aware = cache.frame("SPY", end=pd.Timestamp("2020-01-03", tz="UTC"))
+    assert aware.index.max() == pd.Timestamp("2020-01-03")
+
+
+def test_aligned_forward_fills_without_lookahead(cache):
+    # Hourly target bars: each must see the last daily close at or before it.
+    target = pd.date_range("2020-01-06 09:00", periods=60, freq="h")
+    aligned = cache.aligned("SPY", target)
+    ref = cache.series("SPY")
+    expected = [ref[ref.index <= t].iloc[-1] for t in target]
+    assert aligned.index.equals(target)
+    np.testing.assert_array_equal(aligned.to_numpy(), expected)
+
+
+def test_aligned_multiple_tickers_and_tz_aware_target(cache):
+    target = pd.date_range("2019-12-30", periods=10, freq="D", tz="America/New_York")
+    out = cache.aligned(["SPY", "^VIX"], target)
+    assert list(out.columns) == ["SPY", "^VIX"]
+    assert out.index.equals(target)
+    # Bars before the first reference print have nothing to carry forward.
+    assert out.loc[target[:2]].isna().all().all()
+    assert out.loc[target[2:]].notna().all().all()
+
+
+def test_align_to_index_skips_source_nans():
+    src = pd.Series([1.0, np.nan, 3.0], index=pd.date_range("2021-01-01", periods=3))
+    out = align_to_index(src, pd.date_range("2021-01-01", periods=4))
+    np.testing.assert_array_equal(out.to_numpy(), [1.0, 1.0, 3.0, 3.0])
+
+
+def test_memory_budget_evicts_least_recently_used(broker):
+    one_frame = ReferenceSeriesCache(broker_factory=lambda: broker)
+    one_frame.frame("AAA")
+    budget = int(one_frame.nbytes * 2.5)
+
+    cache = ReferenceSeriesCache(max_bytes=budget, broker_factory=lambda: broker)
+    cache.frame("AAA")
+    cache.frame("BBB")
+    cache.frame("AAA")   # touch: BBB is now least recently used
+    cache.frame("CCC")
+    assert len(cache) == 2
+    assert cache.nbytes <= budget
+    assert ("AAA", "1d") in cache and ("CCC", "1d") in cache
+    assert ("BBB", "1d") not in cache
+
+    cache.frame("BBB")
+    assert broker.calls["BBB"] == 2
+
+
+def test_empty_results_cached_and_errors_not(cache, broker):
+    assert cache.frame("MISSING").empty
+    assert cache.aligned("MISSING", pd.date_range("2020-01-01", periods=3)).isna().all()
+    assert broker.calls["MISSING"] == 1
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            cache.frame("BROKEN")
+    assert broker.calls["BROKEN"] == 2
+
+
+def test_invalidate(cache, broker):
+    cache.frame("SPY")
+    cache.frame("QQQ")
+    cache.invalidate("spy")
+    assert ("SPY", "1d") not in cache and ("QQQ", "1d") in cache
+    cache.invalidate()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_consumers_share_the_process_cache(cache, broker, monkeypatch):
+    from engine.core.data_broker import reference
+    from engine.core.features.base import FEATURE_REGISTRY
+    from engine.core.regime.orchestrator import RegimeOrchestrator
+
+    monkeypatch.setattr(reference, "_REFERENCE_CACHE", cache)
+    idx = pd.date_range("2020-03-02", periods=120, freq="B")
+    df = pd.DataFrame({"close": np.linspace(50.0, 80.0, len(idx))}, index=idx)
+
+    compare = FEATURE_REGISTRY["TICKER_COMPARE"]()
+    for _ in range(3):
+        res = compare.compute(df, {"compare_ticker": "SPY", "window": 20})
+    ratio = next(v for k, v in res.data.items() if k.endswith("RATIO"))
+    assert ratio.notna().all()
+
+    vix = FEATURE_REGISTRY["VIXTermStructure"]().compute(df, {})
+    ratio = next(iter(vix.data.values()))
+    np.testing.assert_allclose(ratio.to_numpy(), cache.aligned("^VIX", idx) / cache.aligned("^VIX3M", idx))
+
+    monkeypatch.setattr("engine.core.data_broker.fetcher.DataFetcher.fetch_macro_data",
+                        lambda self, *a, **k: pd.DataFrame())
+    ext = RegimeOrchestrator()._fetch_external(idx)
+    assert {"vix", "vix3m", "vix_vix3m", "spy_ret", "spy_rvol"} <= set(ext.columns)
+    assert ext["vix"].notna().all()
+
+    assert broker.calls == {"SPY": 1, "^VIX": 1, "^VIX3M": 1}
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.backtester import Tearsheet
+from engine.core.diagnostics.robustness import (
+    ROBUSTNESS_METRICS, inputs_from_portfolio, inputs_from_tearsheet, path_metrics,
+    robustness_report, run_robustness, stationary_bootstrap_indices,
+)
+
+
+def _backtest(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, n)))
+    df = pd.DataFrame({"open": close, "high": close, "low": close, "close": close, "volume": 1.0},
+                      index=pd.bdate_range("2015-01-01", periods=n))
+    signals = pd.Series(np.sign(np.sin(np.arange(n) / 15)), index=df.index)
+    return Tearsheet.calculate_metrics(df, signals)
+
+
+def test_stationary_bootstrap_indices_form_wrapping_blocks():
+    idx = stationary_bootstrap_indices(50, 200, mean_block=5, rng=np.random.default_rng(0))
+    assert idx.shape == (200, 50) and idx.min() >= 0 and idx.max() < 50
+    continues = np.diff(idx, axis=1) % 50 == 1
+    # A new block starts with probability 1/5 per bar (plus rare chance continuations).
+    assert 0.75 < continues.mean() < 0.85
+
+
+def test_point_estimates_match_tearsheet():
+    metrics = _backtest()
+    returns, trades = inputs_from_tearsheet(metrics)
+    out = run_robustness(returns, trades, n_paths=500, seed=1)
+    for name in ROBUSTNESS_METRICS:
+        assert out["metrics"][name]["point"] == pytest.approx(metrics[name], abs=0.006)
+        s = out["metrics"][name]
+        assert s["lower"] <= s["mean"] <= s["upper"]
+    assert out["n_obs"] == len(returns.dropna())
+    assert 0.0 <= out["prob_loss"] <= 1.0
+
+
+def test_chunking_does_not_change_results():
+    returns, trades = inputs_from_tearsheet(_backtest())
+    whole = run_robustness(returns, method="noise", n_paths=300, seed=4)
+    chunked = run_robustness(returns, method="noise", n_paths=300, seed=4, chunk_mb=0.01)
+    assert chunked == whole
+
+
+def test_trade_shuffle_only_moves_drawdown():
+    returns, trades = inputs_from_tearsheet(_backtest())
+    out = run_robustness(returns, trades, method="trade_shuffle", n_paths=2000, seed=2)
+    assert out["n_obs"] == len(trades)
+    for name in ("Sharpe Ratio", "CAGR (%)"):
+        s = out["metrics"][name]
+        assert s["std"] == pytest.approx(0.0, abs=1e-9) and s["percentile"] == 100.0
+    dd = out["metrics"]["Max Drawdown (%)"]
+    assert dd["std"] > 0 and dd["lower"] < dd["upper"]
+
+
+def test_path_metrics_rows_are_independent():
+    R = np.random.default_rng(3).normal(0.001, 0.01, (4, 300))
+    batch = path_metrics(R, 252, 420)
+    for i in range(4):
+        row = path_metrics(R[i], 252, 420)
+        for name in ROBUSTNESS_METRICS:
+            assert batch[name][i] == pytest.approx(row[name][0])
+
+
+def test_report_skips_trade_shuffle_without_trades_and_rejects_bad_options():
+    returns, _ = inputs_from_tearsheet(_backtest())
+    report = robustness_report(returns, [], n_paths=50, seed=0)
+    assert list(report) == ["block_bootstrap", "noise"]
+    with pytest.raises(ValueError, match="method"):
+        run_robustness(returns, method="jackknife")
+    with pytest.raises(ValueError, match="confidence"):
+        run_robustness(returns, confidence=1.5)
+    with pytest.raises(ValueError, match="trades"):
+        run_robustness(returns, [0.01], method="trade_shuffle")
+
+
+def test_inputs_from_portfolio():
+    from engine.core.portfolio_backtester import PortfolioBacktester, PortfolioConfig
+    n = 300
+    rng = np.random.default_rng(5)
+    index = pd.bdate_range("2020-01-01", periods=n)
+    datasets, signals = {}, {}
+    for t in ("A", "B", "C"):
+        close = 50 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+        datasets[t] = pd.DataFrame({"open": close, "close": close}, index=index)
+        signals[t] = pd.Series(np.sin(np.arange(n) / 10 + len(t)), index=index)
+    config = PortfolioConfig(starting_capital=10_000.0)
+    result = PortfolioBacktester().run(datasets, signals, config)
+
+    returns, trades = inputs_from_portfolio(result, config.starting_capital)
+    equity = config.starting_capital * (1 + returns).cumprod()
+    np.testing.assert_allclose(equity.to_numpy(), result["equity_curve"].to_numpy())
+    assert len(trades) == len(result["trade_log"])
+    report = robustness_report(returns, trades, n_paths=100, seed=0)
+    assert set(report) == {"block_bootstrap", "trade_shuffle", "noise"}
@@ -0,0 +1,239 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.data_broker.trends_db import TrendsDatabase
+from engine.core.data_broker.trends_fetcher import (
+    OVERLAP_DAYS, TrendsFetchQueue, plan_windows, stitch_windows,
+)
+
+# Ground-truth weekly interest; every window Google returns is this slice
+# rescaled so its own maximum is 100 (and rounded, as Google does).
+TRUTH = pd.Series(
+    50 + 40 * np.sin(np.arange(1200) / 15.0) + np.arange(1200) / 30.0,
+    index=pd.date_range("2004-01-04", periods=1200, freq="W-SUN"),
+)
+
+
+class FakeTrends:
+    """Serves TRUTH per window, optionally failing the first few calls."""
+
+    def __init__(self, fail_first=0, gate=None):
+        self.calls = []
+        self.fail_first = fail_first
+        self.gate = gate
+
+    def __call__(self, keyword, start, end):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.calls.append((keyword, start, end))
+        if len(self.calls) <= self.fail_first:
+            raise ConnectionError("429 Too Many Requests")
+        if keyword == "NODATA":
+            return pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+        window = TRUTH[(TRUTH.index >= start) & (TRUTH.index <= end)]
+        return (window * 100 / window.max()).round()
+
+
+@pytest.fixture
+def db(tmp_path):
+    return TrendsDatabase(str(tmp_path / "trends.db"))
+
+
+def _assert_proportional(series, truth, rtol=0.05):
+    truth = truth.reindex(series.index)
+    ratio = (series / truth).to_numpy()
+    np.testing.assert_allclose(ratio, np.median(ratio), rtol=rtol)
+
+
+def test_plan_windows_overlap_and_cover_range():
+    windows = plan_windows("2005-01-01", "2020-06-30")
+    assert windows[0][0] == pd.Timestamp("2005-01-01")
+    assert windows[-1][1] == pd.Timestamp("2020-06-30")
+    for (_, prev_end), (next_start, _) in zip(windows, windows[1:]):
+        assert prev_end - next_start == pd.Timedelta(days=OVERLAP_DAYS)
+    assert plan_windows("2020-01-01", "2020-03-01") == [
+        (pd.Timestamp("2020-01-01"), pd.Timestamp("2020-03-01"))
+    ]
+
+
+def test_stitch_recovers_one_scale_across_windows():
+    fetch = FakeTrends()
+    start, end = TRUTH.index[0], TRUTH.index[-1]
+    windows = [fetch("KW", lo, hi) for lo, hi in plan_windows(start, end)]
+    assert len(windows) >= 4
+    stitched = stitch_windows(windows)
+
+    assert stitched.index.equals(TRUTH.index)
+    assert stitched.max() == pytest.approx(100.0)
+    _assert_proportional(stitched, TRUTH)
+
+
+def test_queue_fetches_in_background_and_persists(db):
+    fetch = FakeTrends()
+    q = TrendsFetchQueue(db=db, fetch_fn=fetch, min_interval=0)
+    assert q.request("AAPL", "2010-01-01", "2016-12-31")
+    q.join()
+
+    stored = db.get_series("AAPL")
+    assert stored.index.min() >= pd.Timestamp("2010-01-01")
+    assert stored.index.max() <= pd.Timestamp("2016-12-31")
+    _assert_proportional(stored, TRUTH)
+
+    # Covered now, also for a fresh process reading the same file.
+    fresh = TrendsFetchQueue(db=TrendsDatabase(str(db.engine.url.database)), fetch_fn=fetch)
+    assert not fresh.request("AAPL", "2011-01-01", "2016-12-31")
+    assert "AAPL" not in fresh
+
+
+def test_extension_is_stitched_onto_stored_scale(db):
+    fetch = FakeTrends()
+    q = TrendsFetchQueue(db=db, fetch_fn=fetch, min_interval=0)
+    q.fetch("AAPL", "2012-01-01", "2015-12-31")
+    n_calls = len(fetch.calls)
+
+    q.fetch("AAPL", "2008-01-01", "2019-12-31")
+    new_calls = fetch.calls[n_calls:]
+    # Only the missing ends are requested, each overlapping the stored history.
+    assert all(lo < pd.Timestamp("2012-01-01") + pd.Timedelta(days=OVERLAP_DAYS + 1)
+               or hi > pd.Timestamp("2015-12-31") - pd.Timedelta(days=OVERLAP_DAYS + 1)
+               for _, lo, hi in new_calls)
+    assert db.get_coverage("AAPL") == (pd.Timestamp("2008-01-01"), pd.Timestamp("2019-12-31"))
+    _assert_proportional(db.get_series("AAPL"), TRUTH)
+
+
+def test_duplicate_requests_merge_into_one_job(db):
+    gate = threading.Event()
+    fetch = FakeTrends(gate=gate)
+    q = TrendsFetchQueue(db=db, fetch_fn=fetch, min_interval=0)
+    q.request("MSFT", "2018-01-01", "2019-12-31")
+    q.request("MSFT", "2017-01-01", "2019-06-30")
+    assert "MSFT" in q
+    gate.set()
+    q.join()
+
+    assert "MSFT" not in q
+    assert db.get_coverage("MSFT")[0] == pd.Timestamp("2017-01-01")
+    assert not q.request("MSFT", "2017-01-01", "2019-12-31")
+
+
+def test_retries_with_backoff_then_cools_down(db, monkeypatch):
+    from engine.core.data_broker import trends_fetcher
+    monkeypatch.setattr(trends_fetcher, "MAX_RETRIES", 2)
+    q = TrendsFetchQueue(db=db, fetch_fn=FakeTrends(fail_first=1), min_interval=0)
+    monkeypatch.setattr(q._stop, "wait", lambda *_: False)
+    q.fetch("TSLA", "2020-01-01", "2020-12-31")
+    assert not db.get_series("TSLA").empty
+
+    failing = FakeTrends(fail_first=10)
+    q = TrendsFetchQueue(db=db, fetch_fn=failing, min_interval=0)
+    monkeypatch.setattr(q._stop, "wait", lambda *_: False)
+    q.request("GME", "2020-01-01", "2020-12-31")
+    q.join()
+    assert len(failing.calls) == 2
+    assert db.get_coverage("GME") == (None, None)
+    assert not q.request("GME", "2020-01-01", "2020-12-31")
+
+
+class DropsAfter(FakeTrends):
+    """Serves the first ``n`` windows, then the connection dies for good."""
+
+    def __init__(self, n):
+        super().__init__()
+        self.n = n
+
+    def __call__(self, keyword, start, end):
+        if len(self.calls) >= self.n:
+            self.calls.append((keyword, start, end))
+            raise ConnectionError("connection reset")
+        return super().__call__(keyword, start, end)
+
+
+def test_interrupted_fetch_keeps_finished_windows(db, monkeypatch):
+    from engine.core.data_broker import trends_fetcher
+    monkeypatch.setattr(trends_fetcher, "MAX_RETRIES", 1)
+    q = TrendsFetchQueue(db=db, fetch_fn=DropsAfter(2), min_interval=0)
+    windows = plan_windows("2005-01-01", "2020-12-31")
+    assert len(windows) > 2
+    with pytest.raises(ConnectionError):
+        q.fetch("AAPL", "2005-01-01", "2020-12-31")
+
+    assert db.get_coverage("AAPL") == (windows[0][0], windows[1][1])
+    stored = db.get_series("AAPL")
+    assert stored.index.max() <= windows[1][1]
+    _assert_proportional(stored, TRUTH)
+
+    # A later run only asks for what is missing.
+    fetch = FakeTrends()
+    TrendsFetchQueue(db=db, fetch_fn=fetch, min_interval=0).fetch("AAPL", "2005-01-01", "2020-12-31")
+    assert all(lo >= windows[1][1] - pd.Timedelta(days=OVERLAP_DAYS) for _, lo, _ in fetch.calls)
+    assert db.get_coverage("AAPL") == (pd.Timestamp("2005-01-01"), pd.Timestamp("2020-12-31"))
+    _assert_proportional(db.get_series("AAPL"), TRUTH)
+
+
+def test_fill_blocks_skips_stored_and_reports_failures(db, monkeypatch):
+    from engine.core.data_broker import trends_fetcher
+    monkeypatch.setattr(trends_fetcher, "MAX_RETRIES", 1)
+    fetch = FakeTrends()
+    q = TrendsFetchQueue(db=db, fetch_fn=fetch, min_interval=0)
+    q.fetch("MSFT", "2018-01-01", "2019-12-31")
+    n_calls = len(fetch.calls)
+
+    class Flaky(FakeTrends):
+        def __call__(self, keyword, start, end):
+            if keyword == "DOWN":
+                raise ConnectionError("503")
+            return super().__call__(keyword, start, end)
+
+    q._fetch_fn = flaky = Flaky()
+    stored = q.fill(["MSFT", "DOWN", "AAPL"], "2018-01-01", "2019-12-31")
+    assert stored["MSFT"] == len(db.get_series("MSFT")) > 0
+    assert stored["DOWN"] == -1
+    assert stored["AAPL"] == len(db.get_series("AAPL")) > 0
+    assert [c[0] for c in flaky.calls] == ["AAPL"] and len(fetch.calls) == n_calls
+
+
+def test_join_with_timeout(db):
+    gate = threading.Event()
+    q = TrendsFetchQueue(db=db, fetch_fn=FakeTrends(gate=gate), min_interval=0)
+    q.request("NVDA", "2019-01-01", "2019-12-31")
+    assert not q.join(timeout=0.05)
+    gate.set()
+    assert q.join(timeout=5)
+    assert not db.get_series("NVDA").empty
+
+
+def test_empty_keyword_is_recorded_as_covered(db):
+    fetch = FakeTrends()
+    q = TrendsFetchQueue(db=db, fetch_fn=fetch, min_interval=0)
+    q.fetch("NODATA", "2020-01-01", "2020-12-31")
+    assert db.get_series("NODATA").empty
+    assert not q.request("NODATA", "2020-01-01", "2020-12-31")
+
+
+def test_feature_reads_store_without_blocking(db, monkeypatch):
+    from engine.core.data_broker import trends_fetcher
+    from engine.core.features.base import FEATURE_REGISTRY
+
+    gate = threading.Event()
+    q = TrendsFetchQueue(db=db, fetch_fn=FakeTrends(gate=gate), min_interval=0)
+    monkeypatch.setattr(trends_fetcher, "_TRENDS_QUEUE", q)
+
+    idx = pd.bdate_range("2015-01-01", "2018-12-31")
+    df = pd.DataFrame({"close": np.linspace(10.0, 20.0, len(idx))}, index=idx)
+    feature = FEATURE_REGISTRY["GoogleTrends"]()
+    params = {"ticker": "NVDA", "median_window": 8}
+
+    first = feature.compute(df, params).data
+    assert all(s.isna().all() for s in first.values())
+    assert "NVDA" in q
+
+    gate.set()
+    q.join()
+    second = feature.compute(df, params).data
+    ratio = next(v for k, v in second.items() if not k.endswith("ZSCORE"))
+    assert ratio.index.equals(idx)
+    assert ratio.iloc[60:].notna().all()
+    assert "NVDA" not in q
@@ -0,0 +1,66 @@
+import numpy as np
+
+from engine.benchmarks.feature_bench import (
+    compare_to_baseline,
+    default_params,
+    load_baseline,
+    make_synthetic_ohlcv,
+    run_benchmarks,
+    save_baseline,
+)
+from engine.core.features.features import FEATURE_REGISTRY
+
+
+def test_synthetic_ohlcv_is_reproducible_and_consistent():
+    a = make_synthetic_ohlcv(500)
+    b = make_synthetic_ohlcv(500)
+    assert a.equals(b)
+    assert list(a.columns) == ["open", "high", "low", "close", "volume"]
+    assert (a["high"] >= a[["open", "close"]].max(axis=1)).all()
+    assert (a["low"] <= a[["open", "close"]].min(axis=1)).all()
+
+
+def test_default_params_picks_first_list_option():
+    params = default_params(FEATURE_REGISTRY["RSI"]())
+    assert params["normalize"] == "none"
+    assert params["period"] == 14
+
+
+def test_run_benchmarks_records_every_size():
+    results = run_benchmarks(sizes=[200, 400], feature_ids=["RSI", "SMA"], repeat=1)
+    assert set(results) == {"RSI", "SMA"}
+    for by_size in results.values():
+        assert set(by_size) == {"200", "400"}
+        for entry in by_size.values():
+            assert entry["status"] == "ok"
+            assert entry["ms"] >= 0
+            assert entry["peak_bytes"] >= 0
+
+
+def test_over_budget_skips_larger_sizes():
+    results = run_benchmarks(sizes=[200, 400], feature_ids=["RSI"], repeat=1, max_seconds=0.0)
+    assert results["RSI"]["200"]["status"] == "ok"
+    assert results["RSI"]["400"]["status"] == "skipped"
+
+
+def test_compare_to_baseline_flags_only_real_regressions():
+    baseline = {"RSI": {"1000": {"ms": 10.0, "peak_bytes": 1_000_000, "status": "ok"}}}
+    noisy = {"RSI": {"1000": {"ms": 11.0, "peak_bytes": 1_100_000, "status": "ok"}}}
+    assert compare_to_baseline(noisy, baseline, threshold=0.25) == []
+
+    slow = {"RSI": {"1000": {"ms": 20.0, "peak_bytes": 4_000_000, "status": "ok"}}}
+    regressions = compare_to_baseline(slow, baseline, threshold=0.25)
+    assert {r["metric"] for r in regressions} == {"ms", "peak_bytes"}
+    assert np.isclose(next(r for r in regressions if r["metric"] == "ms")["ratio"], 2.0)
+
+    errored = {"RSI": {"1000": {"ms": None, "peak_bytes": None, "status": "error: x"}}}
+    assert compare_to_baseline(errored, baseline) == []
+
+
+def test_save_baseline_merges(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    save_baseline(path, {"RSI": {"1000": {"ms": 1.0, "peak_bytes": 10, "status": "ok"}}})
+    save_baseline(path, {"SMA": {"1000": {"ms": 2.0, "peak_bytes": 20, "status": "ok"}}})
+    stored = load_baseline(path)
+    assert set(stored) == {"RSI", "SMA"}
+    assert load_baseline(str(tmp_path / "missing.json")) == {}
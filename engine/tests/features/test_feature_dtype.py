@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.features.features import FeatureOrchestrator, resolve_dtype
+from engine.core.ml_bridge.orchestrator import MLBridge
+from engine.core.exceptions import ValidationError
+
+
+def _make_ohlcv(n=300):
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    idx = pd.date_range("2022-01-01", periods=n, freq="D")
+    return pd.DataFrame({
+        "open": close + rng.normal(0, 0.5, n),
+        "high": close + 1.0,
+        "low": close - 1.0,
+        "close": close,
+        "volume": rng.integers(1_000_000, 5_000_000, n).astype(float),
+    }, index=idx)
+
+
+def test_resolve_dtype():
+    assert resolve_dtype(None) is None
+    assert resolve_dtype("float32") == np.float32
+    with pytest.raises(ValidationError):
+        resolve_dtype("int8")
+    with pytest.raises(ValidationError):
+        resolve_dtype("not_a_dtype")
+
+
+def test_float32_outputs_with_pinned_obv():
+    config = [
+        {"id": "RSI", "params": {"period": 14}},
+        {"id": "OBV", "params": {}},
+    ]
+    df, _ = FeatureOrchestrator().compute_features(_make_ohlcv(), config, dtype="float32")
+
+    assert df["RSI_14"].dtype == np.float32
+    assert df["OBV"].dtype == np.float64
+    # Raw OHLCV is not touched
+    assert df["close"].dtype == np.float64
+
+
+def test_default_dtype_unchanged():
+    config = [{"id": "RSI", "params": {"period": 14}}]
+    df, _ = FeatureOrchestrator().compute_features(_make_ohlcv(), config)
+    assert df["RSI_14"].dtype == np.float64
+
+
+def test_training_matrix_float32_end_to_end():
+    config = [
+        {"id": "RSI", "params": {"period": 14}},
+        {"id": "OBV", "params": {}},
+    ]
+    df, l_max = FeatureOrchestrator().compute_features(_make_ohlcv(), config, dtype="float32")
+    df = MLBridge.apply_ffd_to_dataframe(df.iloc[l_max:], ["OBV"])
+    cols = ["RSI_14", "OBV", "OBV_SMA_20"]
+    df = df.dropna(subset=cols)
+
+    df_train, scaler = MLBridge.prepare_training_matrix(df, cols, l_max=0, dtype="float32")
+    assert all(df_train[c].dtype == np.float32 for c in cols)
+
+    df_inf = MLBridge.prepare_inference_matrix(
+        df, cols, l_max=0, artifacts={"system_scaler": scaler, "dtype": "float32"}
+    )
+    assert all(df_inf[c].dtype == np.float32 for c in cols)
+    np.testing.assert_allclose(df_inf[cols].values, df_train[cols].values, atol=1e-6)
+
+
+def test_ffd_preserves_float32():
+    s = pd.Series(np.linspace(1, 2, 50, dtype=np.float32))
+    out = MLBridge.apply_ffd_series(s)
+    assert out.dtype == np.float32
+    ref = MLBridge.apply_ffd_series(s.astype(np.float64))
+    np.testing.assert_allclose(out.values, ref.values, atol=1e-5, equal_nan=True)
@@ -0,0 +1,71 @@
+"""Tests for the lazy feature registry and its generated index."""
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+from engine.core.features.base import FEATURE_REGISTRY, Feature
+from engine.core.features.registry import INDEX_PATH, build_feature_index
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+def _run(code: str) -> str:
+    out = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return out.stdout.strip()
+
+
+def test_committed_index_is_current():
+    with open(INDEX_PATH) as f:
+        committed = json.load(f)["features"]
+    assert committed == json.loads(json.dumps(build_feature_index(), default=str)), (
+        "feature_index.json is stale; run `python CLI.py features --reindex`"
+    )
+
+
+def test_metadata_matches_feature_class():
+    meta = FEATURE_REGISTRY.metadata("RSI")
+    feat = FEATURE_REGISTRY["RSI"]()
+    assert meta["id"] == "RSI"
+    assert meta["name"] == feat.name
+    assert meta["category"] == feat.category
+    assert [s["name"] for s in meta["output_schema"]] == [s.name for s in feat.output_schema]
+
+
+def test_registered_test_features_are_visible():
+    # Mocks registered by other test modules are not in the index but must resolve.
+    ids = set(FEATURE_REGISTRY)
+    assert {"RSI", "KDE"} <= ids
+    for fid in ids:
+        assert issubclass(FEATURE_REGISTRY[fid], Feature)
+
+
+def test_listing_does_not_import_feature_modules(tmp_path):
+    out = _run(f"""
+        import sys
+        from engine import ModelEngine
+        eng = ModelEngine(workspace_dir={str(tmp_path)!r}, db_path={str(tmp_path / 'x.db')!r})
+        feats = eng.get_available_features()
+        heavy = [m for m in ("sklearn", "yfinance", "sqlalchemy", "engine.core.features.levels.kde")
+                 if m in sys.modules]
+        print(len(feats), heavy)
+    """)
+    n, heavy = out.split(" ", 1)
+    assert int(n) >= 40
+    assert heavy == "[]"
+
+
+def test_module_imported_on_first_lookup():
+    out = _run("""
+        import sys
+        from engine.core.features.base import FEATURE_REGISTRY
+        before = "engine.core.features.levels.kde" in sys.modules
+        FEATURE_REGISTRY["KDE"]
+        after = "engine.core.features.levels.kde" in sys.modules
+        print(before, after, "engine.core.features.momentum.rsi" in sys.modules)
+    """)
+    assert out == "False True False"
@@ -2,7 +2,7 @@ import pytest
 import pandas as pd
 import numpy as np
 from engine.core.features.base import Feature, FeatureResult, register_feature
-from engine.core.features.features import compute_all_features
+from engine.core.features.features import compute_all_features, read_only_view
 from engine.core.exceptions import FeatureError
 
 @register_feature("MemoryViolator")
@@ -62,3 +62,42 @@ def test_feature_dependency_memory_violation_catch():
         compute_all_features(df, feature_config)
     
     assert "Feature computation failed for DependencyViolator" in str(excinfo.value)
+
+@register_feature("ValueOverwriter")
+class ValueOverwriter(Feature):
+    @property
+    def name(self): return "ValueOverwriter"
+    @property
+    def description(self): return "Writes into an input column"
+    @property
+    def category(self): return "Test"
+
+    def compute(self, df: pd.DataFrame, params: dict, cache) -> FeatureResult:
+        df.loc[df.index[0], "close"] = 0.0
+        return FeatureResult(data={"overwritten": df["close"]})
+
+def test_in_place_value_write_caught_by_numpy():
+    df = pd.DataFrame({"close": np.arange(1.0, 101.0)})
+
+    with pytest.raises(FeatureError, match="attempted to mutate the input DataFrame in place"):
+        compute_all_features(df, [{"id": "ValueOverwriter", "params": {}}])
+
+    # The caller's frame is untouched and stays writable.
+    assert df["close"].iloc[0] == 1.0
+    df.loc[0, "close"] = 5.0
+    assert df["close"].iloc[0] == 5.0
+
+def test_read_only_view_shares_buffers():
+    df = pd.DataFrame({
+        "close": np.arange(10.0),
+        "volume": np.arange(10),
+        "ticker": pd.Series(["AAA"] * 10, dtype="string"),
+    })
+    view = read_only_view(df)
+
+    assert list(view.columns) == list(df.columns)
+    assert view.index.equals(df.index)
+    assert np.shares_memory(view["close"].to_numpy(), df["close"].to_numpy())
+    assert np.shares_memory(view["volume"].to_numpy(), df["volume"].to_numpy())
+    with pytest.raises(ValueError, match="read-only"):
+        view.iloc[0, 0] = 1.0
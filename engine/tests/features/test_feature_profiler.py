@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.features.features import FeatureOrchestrator, FeatureProfiler, format_profile_report
+from engine.core.features.base import Feature, FeatureResult, register_feature
+
+
+@register_feature("profiled_base")
+class ProfiledBase(Feature):
+    @property
+    def name(self): return "ProfiledBase"
+    @property
+    def description(self): return "Profiled base"
+    @property
+    def category(self): return "Test"
+
+    def compute(self, df, params, cache=None):
+        window = params.get("window", 5)
+        return FeatureResult(data={f"profiled_base_{window}": df["close"].rolling(window).mean()})
+
+
+@register_feature("profiled_dependent")
+class ProfiledDependent(Feature):
+    @property
+    def name(self): return "ProfiledDependent"
+    @property
+    def description(self): return "Pulls profiled_base twice through the cache"
+    @property
+    def category(self): return "Test"
+
+    def compute(self, df, params, cache=None):
+        a = cache.get_series("profiled_base", {"window": 5}, df)
+        b = cache.get_series("profiled_base", {"window": 5}, df)
+        return FeatureResult(data={"profiled_dependent": a + b})
+
+
+@pytest.fixture
+def sample_df():
+    idx = pd.date_range("2023-01-01", periods=500)
+    return pd.DataFrame({"close": np.linspace(1.0, 2.0, 500)}, index=idx)
+
+
+def _by_feature(summary):
+    return {f["feature"]: f for f in summary["features"]}
+
+
+def test_profiler_records_invocations_and_cache_hits(sample_df):
+    profiler = FeatureProfiler()
+    config = [
+        {"id": "profiled_base", "params": {"window": 3}},
+        {"id": "profiled_dependent", "params": {}},
+    ]
+    FeatureOrchestrator().compute_features(sample_df, config, profiler=profiler)
+
+    summary = profiler.summary()
+    feats = _by_feature(summary)
+
+    # One manifest call for window=3, one dependency compute for window=5
+    assert feats["profiled_base"]["calls"] == 2
+    assert feats["profiled_base"]["cache_hits"] == 1
+    assert feats["profiled_dependent"]["calls"] == 1
+    assert feats["profiled_dependent"]["output_bytes"] == 500 * 8
+    assert feats["profiled_base"]["alloc_bytes"] is None
+
+    assert summary["n_invocations"] == 3
+    assert summary["n_cache_hits"] == 1
+    assert summary["total_ms"] >= feats["profiled_dependent"]["wall_ms"]
+
+
+def test_profiler_aggregates_across_batch(sample_df):
+    profiler = FeatureProfiler()
+    config = [{"id": "profiled_base", "params": {"window": 3}}]
+    orch = FeatureOrchestrator()
+    for _ in range(3):
+        orch.compute_features(sample_df, config, profiler=profiler)
+    assert _by_feature(profiler.summary())["profiled_base"]["calls"] == 3
+
+
+def test_profiler_tracks_memory(sample_df):
+    profiler = FeatureProfiler(track_memory=True)
+    profiler.start()
+    try:
+        config = [{"id": "profiled_dependent", "params": {}}]
+        FeatureOrchestrator().compute_features(sample_df, config, profiler=profiler)
+    finally:
+        profiler.stop()
+
+    feats = _by_feature(profiler.summary())
+    assert feats["profiled_dependent"]["alloc_bytes"] >= feats["profiled_base"]["alloc_bytes"] > 0
+
+    lines = format_profile_report(profiler.summary())
+    assert any("profiled_dependent" in line for line in lines)
+
+
+def test_no_profiler_is_default(sample_df):
+    config = [{"id": "profiled_base", "params": {"window": 3}}]
+    df_out, _ = FeatureOrchestrator().compute_features(sample_df, config)
+    assert "profiled_base_3" in df_out.columns
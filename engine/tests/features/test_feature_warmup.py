@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.features.base import FEATURE_REGISTRY, Feature, FeatureResult, ema_warmup, register_feature
+from engine.core.features.features import FeatureCache, FeatureOrchestrator, feature_warmup, resolve_warmup
+from engine.core.exceptions import FeatureError
+
+# Offline features whose outputs are defined by trailing windows.
+TRAILING_FEATURES = [
+    ("ADX", {}),
+    ("ATR", {}),
+    ("BollingerBands", {}),
+    ("BollingerBands", {"normalize": "z_score"}),
+    ("CCI", {}),
+    ("EMA", {"period": 20}),
+    ("SMA", {"period": 50}),
+    ("Ichimoku", {}),
+    ("KeltnerChannels", {}),
+    ("MACD", {}),
+    ("MACD", {"normalize": "z_score"}),
+    ("OBV", {}),
+    ("ROC", {}),
+    ("RSI", {}),
+    ("Stochastic", {}),
+    ("Supertrend", {}),
+    ("VolumeZScore", {}),
+    ("VWAP", {}),
+    ("Volume", {}),
+]
+
+# Cumulative (OBV) or recursive-state (Supertrend) outputs depend on where the
+# frame starts; their warmup only guarantees defined values.
+PATH_DEPENDENT = {"OBV", "Supertrend"}
+
+
+@pytest.fixture(scope="module")
+def ohlcv():
+    rng = np.random.default_rng(7)
+    n = 600
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = close * rng.uniform(0.002, 0.02, n)
+    return pd.DataFrame({
+        "open": close * (1 + rng.normal(0, 0.003, n)),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.integers(1_000, 10_000, n).astype(float),
+    }, index=pd.date_range("2021-01-01", periods=n, freq="B"))
+
+
+def _outputs(df, feature_id, params):
+    cache = FeatureCache()
+    return FEATURE_REGISTRY[feature_id]().compute(df, dict(params), cache).data
+
+
+@pytest.mark.parametrize("feature_id, params", TRAILING_FEATURES)
+def test_declared_warmup_covers_leading_nans(ohlcv, feature_id, params):
+    warmup = feature_warmup(feature_id, params)
+    for col, series in _outputs(ohlcv, feature_id, params).items():
+        valid = series.notna().to_numpy()
+        leading = int(np.argmax(valid)) if valid.any() else len(series)
+        assert leading <= warmup, f"{col}: {leading} leading NaNs > warmup {warmup}"
+
+
+@pytest.mark.parametrize(
+    "feature_id, params", [f for f in TRAILING_FEATURES if f[0] not in PATH_DEPENDENT]
+)
+def test_tail_recompute_matches_full_history(ohlcv, feature_id, params):
+    # Computing on just warmup + k bars must reproduce the last k values.
+    k = 50
+    warmup = feature_warmup(feature_id, params)
+    tail = ohlcv.iloc[-(warmup + k):]
+    full = _outputs(ohlcv, feature_id, params)
+    short = _outputs(tail, feature_id, params)
+    for col, series in full.items():
+        expected = series.iloc[-k:].to_numpy(dtype=float)
+        actual = short[col].iloc[-k:].to_numpy(dtype=float)
+        scale = np.nanmax(np.abs(expected)) or 1.0
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=0.02 * scale, equal_nan=True, err_msg=col)
+
+
+def test_ema_warmup_matches_seed_tolerance():
+    assert ema_warmup(span=1) == 0
+    n = ema_warmup(span=26)
+    alpha = 2 / 27
+    assert (1 - alpha) ** n <= 0.01 < (1 - alpha) ** (n - 1)
+    assert ema_warmup(alpha=1 / 14) == ema_warmup(span=27)
+
+
+def test_warmups_compose_through_dependencies():
+    slow_ema = feature_warmup("EMA", {"period": 26})
+    assert feature_warmup("MACD", {}) == slow_ema + ema_warmup(span=9)
+    assert feature_warmup("BollingerBands", {"period": 30}) == 29
+    assert feature_warmup("KeltnerChannels", {"ema_period": 5, "atr_period": 40}) == 40
+    assert feature_warmup("MovingAverage", {"period": 10, "normalize": "z_score"}) == 9 + 19
+
+    config = [{"id": "RSI", "params": {}}, {"id": "SMA", "params": {"period": 200}}]
+    assert resolve_warmup(config) == 199
+    assert resolve_warmup([]) == 0
+
+
+def test_orchestrator_reports_resolved_warmup(ohlcv):
+    config = [{"id": "SMA", "params": {"period": 30}}, {"id": "MACD", "params": {}}]
+    df, l_max = FeatureOrchestrator().compute_features(ohlcv, config)
+    assert l_max == resolve_warmup(config)
+    assert not df.iloc[l_max:].filter(like="SMA").isna().any().any()
+
+
+@register_feature("warmup_cycle_a")
+class _CycleA(Feature):
+    name = description = category = "Test"
+
+    def dependencies(self, params):
+        return [("warmup_cycle_b", {})]
+
+    def compute(self, df, params, cache=None):
+        return FeatureResult()
+
+
+@register_feature("warmup_cycle_b")
+class _CycleB(_CycleA):
+    def dependencies(self, params):
+        return [("warmup_cycle_a", {})]
+
+
+def test_dependency_cycle_raises():
+    with pytest.raises(FeatureError, match="Circular"):
+        feature_warmup("warmup_cycle_a", {})
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.features.base import FEATURE_REGISTRY
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(3)
+    idx = pd.date_range("2023-01-01", periods=2000, freq="h")
+    close = 100 + np.cumsum(rng.normal(0, 0.5, 2000))
+    return pd.DataFrame({"close": close}, index=idx)
+
+
+def _exact(grid, samples, bandwidth):
+    d = np.exp(-0.5 * ((grid[:, None] - samples[None, :]) / bandwidth) ** 2).sum(axis=1)
+    return (d - d.min()) / (d.max() - d.min())
+
+
+def test_static_matches_exact_gaussian_kde(prices):
+    kde = FEATURE_REGISTRY["KDE"]()
+    hm = kde.compute(prices, {"bandwidth": 1.0, "resolution": 500}).heatmaps["density"]
+
+    assert hm["intensity"].shape == (500,)
+    assert hm["time_index"].equals(prices.index)
+    expected = _exact(hm["price_grid"], prices["close"].to_numpy(), 1.0)
+    np.testing.assert_allclose(hm["intensity"], expected, atol=1e-3)
+
+
+def test_source_resolves_lowercase_columns(prices):
+    # Default source is "Close"; broker frames are lowercase.
+    kde = FEATURE_REGISTRY["KDE"]()
+    result = kde.compute(prices, kde.parameters)
+    assert np.isfinite(result.heatmaps["density"]["intensity"]).all()
+
+
+@pytest.mark.parametrize("mode,window", [("rolling", 250), ("expanding", None)])
+def test_windowed_heatmap_matches_bruteforce(prices, mode, window):
+    kde = FEATURE_REGISTRY["KDE"]()
+    params = {"mode": mode, "window": window or 0, "time_bins": 40, "resolution": 300, "bandwidth": 1.5}
+    hm = kde.compute(prices, params).heatmaps["density"]
+
+    assert hm["intensity"].shape == (40, 300)
+    assert len(hm["time_index"]) == 40
+    assert hm["time_index"][-1] == prices.index[-1]
+
+    close = prices["close"].to_numpy()
+    for row, ts in zip(hm["intensity"], hm["time_index"]):
+        end = prices.index.get_loc(ts) + 1
+        start = 0 if window is None else max(0, end - window)
+        np.testing.assert_allclose(row, _exact(hm["price_grid"], close[start:end], 1.5), atol=5e-3)
+
+
+def test_windowed_heatmap_emits_every_bar_when_short(prices):
+    short = prices.iloc[:30]
+    hm = FEATURE_REGISTRY["KDE"]().compute(
+        short, {"mode": "rolling", "window": 10, "time_bins": 100}
+    ).heatmaps["density"]
+    assert hm["time_index"].equals(short.index)
+
+
+def test_flat_prices_do_not_divide_by_zero():
+    flat = pd.DataFrame({"close": np.full(50, 10.0)}, index=pd.date_range("2023-01-01", periods=50))
+    hm = FEATURE_REGISTRY["KDE"]().compute(flat, {"mode": "rolling", "window": 5}).heatmaps["density"]
+    assert np.isfinite(hm["intensity"]).all()
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.core.features.base import FEATURE_REGISTRY
+import engine.core.features.volume.volume_profile as volume_profile
+
+
+@pytest.fixture
+def intraday():
+    rng = np.random.default_rng(11)
+    idx = pd.date_range("2024-01-02 09:30", periods=1200, freq="15min")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, len(idx))))
+    volume = rng.integers(1_000, 50_000, len(idx)).astype(float)
+    return pd.DataFrame({
+        "open": close, "high": close * 1.001, "low": close * 0.999,
+        "close": close, "volume": volume,
+    }, index=idx)
+
+
+def _bruteforce(df, params):
+    """Rebuilds every bar's window histogram from scratch."""
+    step = np.log1p(params["bin_pct"] / 100)
+    b = np.floor(np.log(df["close"].to_numpy()) / step).astype(int)
+    base = b.min()
+    b -= base
+    n_bins = b.max() + 1
+    centres = np.exp((np.arange(n_bins) + base + 0.5) * step)
+    vol = df["volume"].to_numpy()
+    dates = np.asarray(df.index.date)
+
+    out = []
+    for t in range(len(df)):
+        if params["mode"] == "session":
+            s = int(np.argmax(dates == dates[t]))
+        elif params["lookback"] > 0:
+            s = max(0, t - params["lookback"] + 1)
+        else:
+            s = 0
+        h = np.bincount(b[s:t + 1], weights=vol[s:t + 1], minlength=n_bins)
+        traded = np.flatnonzero(h)
+        floor_, ceil_ = traded.min(), traded.max()
+        poc = lo = hi = int(np.argmax(h))
+        acc, target = h[poc], h.sum() * params["value_area"]
+        while acc < target and (lo > floor_ or hi < ceil_):
+            below = h[lo - 1] if lo > floor_ else -1
+            above = h[hi + 1] if hi < ceil_ else -1
+            if above >= below:
+                hi += 1
+                acc += above
+            else:
+                lo -= 1
+                acc += below
+        out.append((centres[poc], centres[hi], centres[lo]))
+    return np.array(out)
+
+
+@pytest.mark.parametrize("mode,lookback", [("rolling", 40), ("session", 0), ("rolling", 0)])
+@pytest.mark.parametrize("block_cells", [4_000_000, 2_000])
+def test_incremental_lines_match_bruteforce(intraday, monkeypatch, mode, lookback, block_cells):
+    monkeypatch.setattr(volume_profile, "_BLOCK_CELLS", block_cells)
+    feat = FEATURE_REGISTRY["VolumeProfile"]()
+    params = {**feat.parameters, "mode": mode, "lookback": lookback, "normalize": "none"}
+
+    result = feat.compute(intraday, params)
+    got = np.column_stack([
+        result.data[feat.generate_column_name("VolumeProfile", params, s)].to_numpy()
+        for s in ("poc", "vah", "val")
+    ])
+    np.testing.assert_allclose(got, _bruteforce(intraday, params))
+    assert (got[:, 1] >= got[:, 0]).all() and (got[:, 2] <= got[:, 0]).all()
+
+
+def test_lines_are_causal(intraday):
+    feat = FEATURE_REGISTRY["VolumeProfile"]()
+    params = {**feat.parameters, "mode": "rolling", "lookback": 100, "normalize": "none"}
+    split = 900
+
+    noisy = intraday.copy()
+    rng = np.random.default_rng(0)
+    noisy.iloc[split:, noisy.columns.get_loc("close")] *= rng.uniform(0.5, 2.0, len(noisy) - split)
+    a = feat.compute(intraday, params).data
+    b = feat.compute(noisy, params).data
+    for col in a:
+        pd.testing.assert_series_equal(a[col].iloc[:split], b[col].iloc[:split])
+
+
+def test_static_heatmap_is_single_profile(intraday):
+    feat = FEATURE_REGISTRY["VolumeProfile"]()
+    hm = feat.compute(intraday, {"bins": 50, "lookback": 200}).heatmaps["profile"]
+    assert hm["intensity"].shape == (50,)
+    assert len(hm["time_index"]) == 200
+    assert hm["intensity"].max() == pytest.approx(1.0)
+
+
+def test_static_mode_adds_no_columns(intraday):
+    feat = FEATURE_REGISTRY["VolumeProfile"]()
+    params = {**feat.parameters, "lookback": 200, "normalize": "none"}
+    result = feat.compute(intraday, params)
+    assert not result.data
+    assert set(result.heatmaps) == {"profile"}
+    assert feat.non_stationary_outputs(params) == []
+    assert feat.warmup(params) == 0
+
+
+def test_session_heatmap_is_time_by_price(intraday):
+    feat = FEATURE_REGISTRY["VolumeProfile"]()
+    hm = feat.compute(intraday, {"mode": "session", "time_bins": 60}).heatmaps["profile"]
+    assert hm["intensity"].shape == (60, len(hm["price_grid"]))
+    assert hm["time_index"][-1] == intraday.index[-1]
+    np.testing.assert_allclose(hm["intensity"].max(axis=1), 1.0)
+
+
+def test_normalized_lines_are_stationary(intraday):
+    feat = FEATURE_REGISTRY["VolumeProfile"]()
+    params = {"mode": "rolling", "lookback": 50, "normalize": "pct_distance"}
+    assert feat.non_stationary_outputs(params) == []
+    raw = {"mode": "rolling", "lookback": 50, "normalize": "none"}
+    assert len(feat.non_stationary_outputs(raw)) == 3
+    data = feat.compute(intraday, params).data
+    assert all(s.abs().max() < 0.1 for s in data.values())
@@ -18,8 +18,8 @@ import pyqtgraph as pg
 from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QComboBox, QCheckBox
 
-from ..features.base import LineOutput, LevelOutput, MarkerOutput, FeatureResult
-from ..gui_components.plots import UnifiedPlot, LineOverlay, LevelOverlay
+from ..features.base import LineOutput, LevelOutput, MarkerOutput, HeatmapOutput, FeatureResult
+from ..gui_components.plots import UnifiedPlot, LineOverlay, LevelOverlay, HeatmapOverlay
 from ..colors import BG_MAIN, CHART_CROSSHAIR
 from ..config import MAX_CHART_BARS
 
@@ -263,6 +263,14 @@ class FeatureManager(QObject):
                     brush=pg.mkBrush(res.color), symbol=sym, size=10)
                 plot.addItem(item)
                 data.setdefault("temp_items", []).append(item)
+            elif isinstance(res, HeatmapOutput):
+                # Rebuilt on every update; the stale overlay is removed below.
+                o = HeatmapOverlay(res.price_grid, res.density, res.time_positions,
+                                   res.start_position, color_map=res.color_map)
+                o._feat_key = ("heatmap", res.name)
+                plot.add_overlay(o)
+                o.update(df)
+                new_overlay_list.append(o)
 
         # Remove overlays that weren't reused
         for key, o in old_overlays.items():
@@ -48,10 +48,18 @@ class MarkerOutput(FeatureOutput):
 
 @dataclass
 class HeatmapOutput(FeatureOutput):
-    """A price-density heatmap overlay."""
-    price_grid: List[float] = field(default_factory=list)
-    density: List[float] = field(default_factory=list)
-    color_map: str = "blue"
+    """A price-density heatmap overlay.
+
+    ``density`` is either 1-D over ``price_grid`` (one profile for the whole
+    window) or 2-D ``[time, price]`` with one row per entry of
+    ``time_positions``. Positions are chart bar indices: each row ends at its
+    position, and the first row starts at ``start_position``.
+    """
+    price_grid: Any = field(default_factory=list)
+    density: Any = field(default_factory=list)
+    time_positions: Any = field(default_factory=list)
+    start_position: int = 0
+    color_map: str = "viridis"
 
 
 @dataclass
@@ -20,7 +20,7 @@ from engine.core.features.base import (
     Pane,
     FEATURE_REGISTRY,
 )
-from engine.core.features.features import load_features as engine_load_features, FeatureCache
+from engine.core.features.features import FeatureCache
 
 from .base import (
     Feature as GUIFeature,
@@ -73,23 +73,31 @@ class AdaptedFeature(GUIFeature):
     engine feature's output_schema and computed data.
     """
 
-    def __init__(self, feature_id: str, engine_feat: EngineFeature):
+    def __init__(self, feature_id: str, engine_feat: Optional[EngineFeature] = None):
         self._id = feature_id
-        self._engine = engine_feat
+        self._engine_feat = engine_feat
+
+    @property
+    def _engine(self) -> EngineFeature:
+        # The engine module is imported on first real use; menus and
+        # labels are served from the registry index below.
+        if self._engine_feat is None:
+            self._engine_feat = FEATURE_REGISTRY[self._id]()
+        return self._engine_feat
 
     # --- Properties the GUI reads ---
 
     @property
     def name(self) -> str:
-        return self._engine.name
+        return FEATURE_REGISTRY.metadata(self._id)["name"]
 
     @property
     def description(self) -> str:
-        return self._engine.description
+        return FEATURE_REGISTRY.metadata(self._id)["description"]
 
     @property
     def category(self) -> str:
-        return self._engine.category
+        return FEATURE_REGISTRY.metadata(self._id)["category"]
 
     @property
     def parameters(self) -> Dict[str, Any]:
@@ -248,12 +256,9 @@ class AdaptedFeature(GUIFeature):
             elif schema.output_type == OutputType.HEATMAP:
                 if engine_result.heatmaps:
                     for hm_name, hm_data in engine_result.heatmaps.items():
-                        visuals.append(HeatmapOutput(
-                            name=hm_name,
-                            price_grid=hm_data.get("price_grid", []),
-                            density=hm_data.get("intensity", []),
-                            color_map="viridis",
-                        ))
+                        heatmap = _heatmap_output(hm_name, hm_data, df.index)
+                        if heatmap is not None:
+                            visuals.append(heatmap)
 
             elif schema.output_type == OutputType.ZONE:
                 # Zones need a ZoneOverlay in the GUI — skip for now, data is
@@ -266,21 +271,54 @@ class AdaptedFeature(GUIFeature):
         return GUIResult(visuals=visuals, data=raw_data)
 
 
+def _heatmap_output(name: str, hm_data: Dict[str, Any], index: pd.Index) -> Optional[HeatmapOutput]:
+    """Maps an engine heatmap's ``time_index`` onto chart bar positions.
+
+    Rows whose timestamp is not on the chart are dropped; returns None when
+    nothing is left to draw.
+    """
+    density = np.asarray(hm_data.get("intensity", []), dtype=np.float64)
+    time_index = hm_data.get("time_index")
+    if density.size == 0 or time_index is None or len(time_index) == 0:
+        return None
+    positions = index.get_indexer(pd.Index(time_index))
+    on_chart = positions >= 0
+    if not on_chart.any():
+        return None
+    if density.ndim == 1:
+        # A single profile spans its whole window.
+        start, rows = int(positions[on_chart][0]), positions[on_chart][-1:]
+    else:
+        # Rows are snapshots every few bars; the first one covers the bars
+        # leading up to it just like the rest.
+        density, rows = density[on_chart], positions[on_chart]
+        step = (rows[-1] - rows[0]) / (len(rows) - 1) if len(rows) > 1 else 1
+        start = max(0, int(round(rows[0] - step + 1)))
+    return HeatmapOutput(
+        name=name,
+        price_grid=np.asarray(hm_data.get("price_grid", []), dtype=np.float64),
+        density=density,
+        time_positions=rows,
+        start_position=start,
+        color_map="viridis",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Loader — replaces the old gui/features/loader.py discovery
 # ---------------------------------------------------------------------------
 def load_engine_features() -> Dict[str, AdaptedFeature]:
-    """Load all engine features and wrap them for GUI consumption.
+    """Wrap every registered engine feature for GUI consumption.
+
+    Feature modules are not imported here; each AdaptedFeature loads its
+    engine class the first time it is computed or its schema is needed.
 
     Returns:
         Dict keyed by feature display name → AdaptedFeature instance.
     """
-    engine_load_features()
-
     features = {}
-    for feature_id, feature_cls in FEATURE_REGISTRY.items():
-        engine_instance = feature_cls()
-        adapted = AdaptedFeature(feature_id, engine_instance)
+    for feature_id in FEATURE_REGISTRY:
+        adapted = AdaptedFeature(feature_id)
         features[adapted.name] = adapted
 
     return features
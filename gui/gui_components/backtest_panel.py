@@ -29,6 +29,14 @@ from engine import ModelEngine
 from .plots import UnifiedPlot, CandleOverlay
 
 
+def _trade_rows(columns: dict) -> list:
+    """Expands the engine's columnar trade log into one dict per trade."""
+    if not columns:
+        return []
+    keys = list(columns)
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
 # ---------------------------------------------------------------------------
 # Background worker
 # ---------------------------------------------------------------------------
@@ -680,7 +688,7 @@ class BacktestPanel(QWidget):
     def _populate_trade_log(self, ticker: str):
         self.trade_table.setSortingEnabled(False)
         self.trade_table.setRowCount(0)
-        trades = self._result.get("trade_logs", {}).get(ticker, [])
+        trades = _trade_rows(self._result.get("trade_logs", {}).get(ticker, {}))
 
         for t in trades:
             row = self.trade_table.rowCount()
@@ -743,7 +751,7 @@ class BacktestPanel(QWidget):
         # Date → integer index lookup for trade markers
         ts_index = {str(ts): i for i, ts in enumerate(df.index)}
 
-        trades = self._result.get("trade_logs", {}).get(ticker, [])
+        trades = _trade_rows(self._result.get("trade_logs", {}).get(ticker, {}))
         entry_x, entry_y = [], []
         exit_x,  exit_y  = [], []
 
@@ -235,6 +235,46 @@ class LevelOverlay(BaseOverlay):
     def get_y_range(self, x_min, x_max):
         return self.price, self.price
 
+class HeatmapOverlay(BaseOverlay):
+    def __init__(self, price_grid, density, time_positions, start_position=0,
+                 color_map='viridis', opacity=0.45, z_value=-50):
+        """
+        Price-density image drawn behind the candles (see HeatmapOutput).
+        Rows are spread evenly between start_position and the last time
+        position, and a non-uniform price grid (e.g. log-spaced bins) is
+        resampled onto a linear one, since ImageItem pixels are equal-sized.
+        """
+        super().__init__(z_value=z_value)
+        self.price_grid = np.asarray(price_grid, dtype=np.float64)
+        self.density = np.atleast_2d(np.asarray(density, dtype=np.float64))
+        self.time_positions = np.asarray(time_positions, dtype=np.float64)
+        self.start_position = start_position
+        self.color_map = color_map
+        self.opacity = opacity
+
+    def update(self, df):
+        self.clear_items()
+        prices, density = self.price_grid, self.density
+        if len(prices) < 2 or density.size == 0 or len(self.time_positions) == 0:
+            return
+
+        linear = np.linspace(prices[0], prices[-1], len(prices))
+        if not np.allclose(linear, prices):
+            density = np.stack([np.interp(linear, prices, row) for row in density])
+        step = (linear[-1] - linear[0]) / (len(linear) - 1)
+        x0 = self.start_position - 0.5
+        x1 = self.time_positions[-1] + 0.5
+
+        # col-major: image[x, y] -> rows are time, columns are price.
+        item = pg.ImageItem(np.nan_to_num(density), levels=(0.0, 1.0))
+        item.setColorMap(pg.colormap.get(self.color_map))
+        item.setOpacity(self.opacity)
+        item.setRect(QRectF(x0, linear[0] - step / 2, x1 - x0, linear[-1] - linear[0] + step))
+        item.setEnabled(False)
+        self.items = [item]
+        if self.plot_item:
+            self.add_to_plot(self.plot_item)
+
 class ScoreOverlay(BaseOverlay):
     def __init__(self, scores, pos_color='#00ff00', neg_color='#ff0000', alpha=0.3, z_value=-100):
         """
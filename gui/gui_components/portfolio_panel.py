@@ -640,40 +640,18 @@ class PortfolioPanel(QWidget):
         self.heatmap_plot.clear()
         self.heatmap_plot.addItem(self._heatmap_img)
 
-        if not position_weights:
+        # {"index": [...], "tickers": [...], "weights": rows x tickers}, already
+        # downsampled by the engine and limited to tickers that were held.
+        if not position_weights or not position_weights.get("weights"):
             return
 
-        tickers = sorted(position_weights.keys())
-        n_t     = len(tickers)
-
-        # Build a common time index (union of all series)
-        all_series = [
-            s for s in position_weights.values()
-            if isinstance(s, pd.Series) and not s.empty
-        ]
-        if not all_series:
-            return
-
-        time_idx = all_series[0].index
-        for s in all_series[1:]:
-            time_idx = time_idx.union(s.index)
-        time_idx = time_idx.sort_values()
-
-        # Downsample time axis for display (max 800 bars)
-        max_bars = 800
-        if len(time_idx) > max_bars:
-            step     = len(time_idx) // max_bars
-            time_idx = time_idx[::step]
-
-        n_bars = len(time_idx)
+        tickers  = position_weights["tickers"]
+        time_idx = position_weights["index"]
+        n_t      = len(tickers)
+        n_bars   = len(time_idx)
 
         # Weight matrix: shape (n_bars, n_tickers)
-        matrix = np.zeros((n_bars, n_t), dtype=np.float32)
-        for j, t in enumerate(tickers):
-            s = position_weights[t]
-            if isinstance(s, pd.Series) and not s.empty:
-                aligned = s.reindex(time_idx).fillna(0.0).values
-                matrix[:, j] = aligned.astype(np.float32)
+        matrix = np.asarray(position_weights["weights"], dtype=np.float32)
 
         self._heatmap_img.setImage(matrix, levels=(-1.0, 1.0))
 
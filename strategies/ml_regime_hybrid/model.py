@@ -21,60 +21,37 @@ from regime import classify_regime, RISK_OFF, RISK_ON
 from confirmations import check_entry_confirmations, check_exit_conditions
 
 # ---------------------------------------------------------------------------
-# SPY market regime guard — module-level cache to avoid redundant fetches
+# SPY market regime guard — SPY served by the shared reference-series cache
 # ---------------------------------------------------------------------------
 
-_SPY_EMA_CACHE: dict = {}
-
-
 def _fetch_spy_ema(index: pd.DatetimeIndex, ema_period: int = 50):
     """Return (spy_close, spy_ema) arrays aligned to *index*.
 
-    Fetches SPY daily OHLCV via yfinance with a warmup buffer so the EMA is
-    fully primed at the start of *index*.  Results are cached per
-    (start, end, period) so batch runs across many tickers only hit the
-    network once.
+    SPY daily closes come from the engine's shared reference-series cache,
+    which holds the full history, so the EMA is fully primed at the start of
+    *index* and batch runs across many tickers only load SPY once.
 
     If the fetch fails for any reason both arrays are filled with +inf so
     the guard becomes a no-op (fail-open) rather than silently blocking all
     signals.
     """
-    import yfinance as yf
-
-    start_ts = pd.Timestamp(index[0]).tz_localize(None) if index.tz is not None else pd.Timestamp(index[0])
-    end_ts   = pd.Timestamp(index[-1]).tz_localize(None) if index.tz is not None else pd.Timestamp(index[-1])
-
-    buffer_days = max(ema_period * 3, 200)
-    fetch_start = (start_ts - pd.Timedelta(days=buffer_days)).strftime("%Y-%m-%d")
-    fetch_end   = (end_ts   + pd.Timedelta(days=5)).strftime("%Y-%m-%d")
-
-    cache_key = (fetch_start, fetch_end, ema_period)
-    if cache_key not in _SPY_EMA_CACHE:
-        try:
-            raw = yf.download("SPY", start=fetch_start, end=fetch_end,
-                              interval="1d", progress=False, auto_adjust=True)
-            if isinstance(raw.columns, pd.MultiIndex):
-                raw.columns = raw.columns.droplevel(1)
-            if raw.empty:
-                raise ValueError("Empty SPY response")
-            raw.index = pd.to_datetime(raw.index).tz_localize(None)
-            spy_close = raw["Close"].astype(float)
-            spy_ema   = spy_close.ewm(span=ema_period, adjust=False).mean()
-            _SPY_EMA_CACHE[cache_key] = (spy_close, spy_ema)
-        except Exception:
-            _SPY_EMA_CACHE[cache_key] = None
-
-    cached = _SPY_EMA_CACHE[cache_key]
+    from engine.core.data_broker.reference import align_to_index, get_reference_series
+
     n = len(index)
-    if cached is None:
+    try:
+        # end= lets the cache reload SPY when it stops short of *index*
+        end = index.max() if n else None
+        spy_close_s = get_reference_series().series("SPY", "close", "1d", end=end).astype(float)
+        if spy_close_s.empty:
+            raise ValueError("Empty SPY response")
+    except Exception:
         # Fail-open: return +inf so spy_close >= spy_ema is always True
         inf = np.full(n, np.inf)
         return inf, inf
 
-    spy_close_s, spy_ema_s = cached
-    idx = index.tz_localize(None) if index.tz is not None else index
-    aligned_close = spy_close_s.reindex(idx, method="ffill").to_numpy(dtype=np.float64).copy()
-    aligned_ema   = spy_ema_s.reindex(idx,   method="ffill").to_numpy(dtype=np.float64).copy()
+    spy_ema_s = spy_close_s.ewm(span=ema_period, adjust=False).mean()
+    aligned_close = align_to_index(spy_close_s, index).to_numpy(dtype=np.float64)
+    aligned_ema   = align_to_index(spy_ema_s, index).to_numpy(dtype=np.float64)
     # Any still-NaN slots (before SPY history): treat as above EMA (fail-open)
     nan_mask = np.isnan(aligned_close) | np.isnan(aligned_ema)
     aligned_close[nan_mask] = np.inf